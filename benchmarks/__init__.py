@@ -0,0 +1,15 @@
+"""Send-pipeline benchmark suite.
+
+Times the stages that dominate a send against a synthetic database, a
+local SMTP sink and a stub LLM, and writes the per-stage timings as JSON
+so results can be compared release to release::
+
+    python -m benchmarks --subscribers 5000 --output bench.json
+    python -m benchmarks --compare bench.json      # exit 1 on regression
+
+* :mod:`benchmarks.dataset` — scalable synthetic dataset builder
+* :mod:`benchmarks.smtp_sink` — local STARTTLS/AUTH SMTP server that
+  counts and discards messages
+* :mod:`benchmarks.stub_llm` — stands in for the Anthropic/OpenAI clients
+* :mod:`benchmarks.run` — the stages, timing and JSON report
+"""
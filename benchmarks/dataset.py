@@ -0,0 +1,146 @@
+"""Synthetic dataset builder for the benchmark suite.
+
+``build_dataset(db_path, subscribers=N, issues=M, events=K)`` creates a
+fresh SQLite database with the real schema and seed data, then bulk
+inserts N active subscribers (each on one or more editions, with genre
+preferences and section interest profiles), M published issues with
+eight approved drafts each, and K open/click tracking events spread over
+the last 60 days. Everything is drawn from a seeded RNG, so a given
+size and seed always produce the same data.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from weeklyamp.core.database import get_connection, init_database, seed_editions, seed_sections
+
+_WORDS = (
+    "touring merch streaming vinyl playlist label indie festival radio sync "
+    "royalties producer mixing mastering songwriter venue booking fans album "
+    "single release press campaign budget analog synth guitar drums bass "
+    "chorus bridge verse hook demo studio session engineer manager agent"
+).split()
+_GENRES = ["Americana", "Country", "Folk", "Indie", "Jazz", "Pop", "Rock", "Soul", "Hip-Hop", "Electronic"]
+_SECTIONS_PER_ISSUE = 8
+
+
+@dataclass
+class Dataset:
+    """What :func:`build_dataset` created."""
+
+    db_path: str
+    subscriber_ids: list[int]
+    issue_ids: list[int]
+    section_slugs: list[str]
+    events: int
+    build_seconds: float = 0.0
+    sizes: dict = field(default_factory=dict)
+
+
+def _paragraphs(rng: random.Random, count: int) -> str:
+    paras = []
+    for _ in range(count):
+        words = rng.choices(_WORDS, k=rng.randint(40, 90))
+        words[0] = words[0].capitalize()
+        paras.append(" ".join(words) + ".")
+    return "\n\n".join(paras)
+
+
+def _draft(rng: random.Random) -> str:
+    title = " ".join(rng.choices(_WORDS, k=5)).title()
+    link = f"[{rng.choice(_WORDS)}](https://example.com/{rng.choice(_WORDS)}/{rng.randint(1, 9999)})"
+    items = "\n".join(f"- **{rng.choice(_WORDS)}** {' '.join(rng.choices(_WORDS, k=8))}" for _ in range(4))
+    return f"## {title}\n\n{_paragraphs(rng, 2)} {link}\n\n{items}\n\n{_paragraphs(rng, 1)}"
+
+
+def build_dataset(
+    db_path: str, *, subscribers: int = 2000, issues: int = 4, events: int = 20000, seed: int = 0,
+) -> Dataset:
+    """Create ``db_path`` and fill it with a synthetic send-day workload."""
+    started = time.perf_counter()
+    rng = random.Random(seed)
+    init_database(db_path)
+    seed_sections(db_path)
+    seed_editions(db_path)
+    now = datetime.now(timezone.utc)
+
+    conn = get_connection(db_path)
+    editions = [dict(r) for r in conn.execute("SELECT id, slug FROM newsletter_editions WHERE is_active = 1").fetchall()]
+    slugs = [r["slug"] for r in conn.execute(
+        "SELECT slug FROM section_definitions WHERE is_active = 1 ORDER BY sort_order"
+    ).fetchall()]
+
+    conn.executemany(
+        "INSERT INTO subscribers (email, first_name, status, unsubscribe_token, subscribed_at) "
+        "VALUES (?, ?, 'active', ?, ?)",
+        [
+            (f"reader{i}@bench.test", rng.choice(_WORDS).title(), f"tok{i:08d}",
+             (now - timedelta(days=rng.randint(0, 700))).strftime("%Y-%m-%d %H:%M:%S"))
+            for i in range(subscribers)
+        ],
+    )
+    sub_ids = [r["id"] for r in conn.execute(
+        "SELECT id FROM subscribers WHERE email LIKE '%@bench.test' ORDER BY id"
+    ).fetchall()]
+    conn.executemany(
+        "INSERT OR IGNORE INTO subscriber_editions (subscriber_id, edition_id, send_days) VALUES (?, ?, ?)",
+        [(sid, ed["id"], "monday,wednesday,saturday")
+         for sid in sub_ids for ed in rng.sample(editions, rng.randint(1, len(editions)))],
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO subscriber_genres (subscriber_id, genre, priority) VALUES (?, ?, ?)",
+        [(sid, genre, prio) for sid in sub_ids
+         for prio, genre in enumerate(rng.sample(_GENRES, rng.randint(0, 3)), start=1)],
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO section_genres (section_slug, genre, relevance_weight) VALUES (?, ?, ?)",
+        [(slug, genre, round(rng.uniform(0.2, 1.0), 2)) for slug in slugs for genre in rng.sample(_GENRES, 2)],
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO subscriber_interest_profiles (subscriber_id, section_slug, engagement_score, click_count) "
+        "VALUES (?, ?, ?, ?)",
+        [(sid, slug, round(rng.random(), 3), rng.randint(0, 20))
+         for sid in sub_ids for slug in rng.sample(slugs, min(len(slugs), rng.randint(0, 4)))],
+    )
+    conn.commit()
+
+    issue_ids = []
+    for n in range(issues):
+        edition = editions[n % len(editions)]
+        issue_id = conn.execute(
+            "INSERT INTO issues (issue_number, title, status, send_day, edition_slug) "
+            "VALUES (?, ?, 'published', 'monday', ?)",
+            (n + 1, f"Bench issue {n + 1}", edition["slug"]),
+        ).lastrowid
+        conn.executemany(
+            "INSERT INTO drafts (issue_id, section_slug, content, ai_model, status) VALUES (?, ?, ?, 'stub', 'approved')",
+            [(issue_id, slug, _draft(rng)) for slug in rng.sample(slugs, min(_SECTIONS_PER_ISSUE, len(slugs)))],
+        )
+        issue_ids.append(issue_id)
+    conn.commit()
+
+    if sub_ids and issue_ids:
+        conn.executemany(
+            "INSERT INTO email_tracking_events (subscriber_id, issue_id, event_type, created_at) VALUES (?, ?, ?, ?)",
+            [
+                (rng.choice(sub_ids), rng.choice(issue_ids), "click" if rng.random() < 0.25 else "open",
+                 (now - timedelta(seconds=rng.randint(0, 60 * 86400))).isoformat())
+                for _ in range(events)
+            ],
+        )
+        conn.commit()
+    conn.close()
+
+    return Dataset(
+        db_path=db_path,
+        subscriber_ids=sub_ids,
+        issue_ids=issue_ids,
+        section_slugs=slugs,
+        events=events if sub_ids and issue_ids else 0,
+        build_seconds=time.perf_counter() - started,
+        sizes={"subscribers": subscribers, "issues": issues, "events": events, "seed": seed},
+    )
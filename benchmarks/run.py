@@ -0,0 +1,266 @@
+"""Run the send-pipeline stages and report per-stage timings.
+
+Each stage is a callable doing a fixed amount of work (``ops``) against
+the synthetic dataset. It is run once to warm caches, then ``repeat``
+times; the report keeps the min and median wall time and the median
+throughput. ``--output`` writes the report as JSON and ``--compare``
+checks it against an earlier one, exiting 1 when any stage's median got
+slower than ``--tolerance`` allows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable
+from unittest import mock
+
+from benchmarks.dataset import Dataset, build_dataset
+from benchmarks.smtp_sink import SMTPSink
+from benchmarks.stub_llm import stub_llm
+
+SUITE = "weeklyamp-send-pipeline"
+REPORT_VERSION = 1
+SITE = "https://bench.example.com"
+
+_QUICK = {"subscribers": 60, "issues": 2, "events": 300, "repeat": 1}
+# Admin review page renders per review_page op.
+_PAGE_VIEWS = 10
+
+
+def _git_sha() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def _time(fn: Callable[[], int], repeat: int) -> dict:
+    ops = fn()  # warm-up; also tells us how much work one run does
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    median = statistics.median(samples)
+    return {
+        "ops": ops,
+        "repeat": repeat,
+        "min_s": round(min(samples), 6),
+        "median_s": round(median, 6),
+        "ops_per_s": round(ops / median, 2) if median else None,
+    }
+
+
+def _stages(data: Dataset, sink: SMTPSink, sample: int) -> dict[str, Callable[[], int]]:
+    from weeklyamp.content import rendering
+    from weeklyamp.content.assembly import assemble_issues, assemble_newsletter
+    from weeklyamp.content.generator import generate_draft
+    from weeklyamp.content.genre_engine import GenreEngine
+    from weeklyamp.core.models import AppConfig, EmailConfig, GenrePreferencesConfig, TrackingConfig
+    from weeklyamp.db.repository import Repository
+    from weeklyamp.delivery import smtp_sender
+    from weeklyamp.delivery.css_inliner import inline_css
+    from weeklyamp.delivery.tracking import SUBSCRIBER_SLOT, TrackingProcessor
+    from weeklyamp.web.routes.review import review_page
+
+    repo = Repository(data.db_path)
+    config = AppConfig()
+    personalized = AppConfig(genre_preferences=GenrePreferencesConfig(enabled=True, weight_sections_by_genre=True))
+    rng = random.Random(0)
+    readers = rng.sample(data.subscriber_ids, min(sample, len(data.subscriber_ids)))
+    issue_id = data.issue_ids[0]
+    html, plain = assemble_newsletter(repo, issue_id, config)
+    tracker = TrackingProcessor(TrackingConfig(open_tracking=True, click_tracking=True), repo)
+    genres = GenreEngine(repo, personalized.genre_preferences)
+    sections = [{"slug": slug} for slug in data.section_slugs]
+
+    conn = repo._conn()
+    recipients = [dict(r) for r in conn.execute(
+        "SELECT id, email, unsubscribe_token FROM subscribers WHERE status = 'active' ORDER BY id"
+    ).fetchall()]
+    conn.close()
+    sender = smtp_sender.SMTPSender(EmailConfig(
+        enabled=True, smtp_host=sink.host, smtp_port=sink.port,
+        smtp_user="bench", smtp_password="bench", from_address="bench@bench.test",
+    ))
+    prepared = tracker.prepare_issue_html(html, issue_id, SITE)
+    # Tracked links are registered once per issue; keep the send stage
+    # about SMTP, not link registration.
+    send_html = inline_css(prepared)
+
+    def generate() -> int:
+        for n in range(sample):
+            generate_draft(f"Write a 120-word news brief about topic {n}.", config)
+        return sample
+
+    def assemble() -> int:
+        for iid in data.issue_ids:
+            assemble_newsletter(repo, iid, config)
+        return len(data.issue_ids)
+
+    def assemble_batch() -> int:
+        assemble_issues(repo, data.issue_ids, config)
+        return len(data.issue_ids)
+
+    def assemble_personalized() -> int:
+        for sid in readers:
+            assemble_newsletter(repo, issue_id, personalized, subscriber_id=sid)
+        return len(readers)
+
+    def review() -> int:
+        for _ in range(_PAGE_VIEWS):
+            asyncio.run(review_page())
+        return _PAGE_VIEWS
+
+    def review_cold() -> int:
+        # A freshly started worker: nothing in the in-process render cache.
+        for _ in range(_PAGE_VIEWS):
+            rendering.clear_cache()
+            asyncio.run(review_page())
+        return _PAGE_VIEWS
+
+    def rank() -> int:
+        for sid in readers:
+            genres.rank_sections_for_subscriber(sections, sid)
+        return len(readers)
+
+    def inline() -> int:
+        for _ in range(sample):
+            inline_css(html)
+        return sample
+
+    def inject() -> int:
+        for sid in readers:
+            tracker.inject_tracking(html, issue_id, sid, SITE)
+        return len(readers)
+
+    def prepare_and_fill() -> int:
+        parts = tracker.prepare_issue_html(html, issue_id, SITE).split(SUBSCRIBER_SLOT)
+        for sid in readers:
+            str(sid).join(parts)
+        return len(readers)
+
+    def send() -> int:
+        sink.reset()
+        result = sender.send_bulk(recipients, "Bench issue", send_html, plain, SITE)
+        if result["sent"] != len(recipients) or sink.messages != len(recipients):
+            raise RuntimeError(f"send_bulk delivered {sink.messages}/{len(recipients)}: {result['errors'][:3]}")
+        return len(recipients)
+
+    smtp_sender._BATCH_DELAY = 0  # the sink has no rate limit to respect
+    return {
+        "generate_draft": generate,
+        "assemble_newsletter": assemble,
+        "assemble_issues": assemble_batch,
+        "assemble_newsletter_personalized": assemble_personalized,
+        "rank_sections_for_subscriber": rank,
+        "review_page": review,
+        "review_page_cold_cache": review_cold,
+        "inline_css": inline,
+        "inject_tracking_per_recipient": inject,
+        "prepare_issue_html_and_fill": prepare_and_fill,
+        "send_bulk": send,
+    }
+
+
+def run(
+    *, subscribers: int, issues: int, events: int, repeat: int,
+    sample: int = 50, llm_latency: float = 0.0, only: list[str] | None = None,
+) -> dict:
+    """Build a dataset in a temp dir, time every stage and return the report."""
+    with tempfile.TemporaryDirectory() as tmp, SMTPSink() as sink, stub_llm(llm_latency) as llm, \
+            mock.patch.dict(os.environ):
+        db_path = os.path.join(tmp, "bench.db")
+        data = build_dataset(db_path, subscribers=subscribers, issues=issues, events=events)
+        # Web routes resolve their repository from the environment.
+        os.environ["WEEKLYAMP_DB_PATH"] = db_path
+        stages = {}
+        for name, fn in _stages(data, sink, sample).items():
+            if only and name not in only:
+                continue
+            stages[name] = _time(fn, repeat)
+            print(f"{name:34} {stages[name]['median_s'] * 1000:10.2f} ms  {stages[name]['ops_per_s']:>12} ops/s",
+                  file=sys.stderr)
+        llm_calls = llm.calls
+
+    return {
+        "suite": SUITE,
+        "version": REPORT_VERSION,
+        "meta": {
+            "git_sha": _git_sha(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "dataset": data.sizes,
+            "build_seconds": round(data.build_seconds, 3),
+            "sample": sample,
+            "llm_latency_s": llm_latency,
+            "llm_calls": llm_calls,
+        },
+        "stages": stages,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return a line per stage whose median regressed beyond ``tolerance``."""
+    regressions = []
+    for name, stage in report["stages"].items():
+        before = baseline.get("stages", {}).get(name)
+        if not before or not before.get("median_s"):
+            continue
+        ratio = stage["median_s"] / before["median_s"]
+        if ratio > 1 + tolerance:
+            regressions.append(
+                f"{name}: {before['median_s'] * 1000:.2f} ms -> {stage['median_s'] * 1000:.2f} ms ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--subscribers", type=int, default=2000)
+    parser.add_argument("--issues", type=int, default=4)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--sample", type=int, default=50, help="subscribers/calls per per-recipient stage")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="seconds the stub LLM sleeps per call")
+    parser.add_argument("--only", action="append", help="run just this stage (repeatable)")
+    parser.add_argument("--quick", action="store_true", help="tiny dataset, one repeat; for smoke tests")
+    parser.add_argument("--output", help="write the JSON report here (default: stdout)")
+    parser.add_argument("--compare", metavar="PATH", help="baseline report to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown, e.g. 0.2 for 20%%")
+    args = parser.parse_args(argv)
+
+    sizes = {k: getattr(args, k) for k in ("subscribers", "issues", "events", "repeat")}
+    if args.quick:
+        sizes.update(_QUICK)
+        args.sample = min(args.sample, 10)
+    report = run(**sizes, sample=args.sample, llm_latency=args.llm_latency, only=args.only)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
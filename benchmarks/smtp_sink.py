@@ -0,0 +1,161 @@
+"""A local SMTP server that accepts and discards everything.
+
+:class:`SMTPSender` always upgrades with ``STARTTLS`` and logs in, so the
+sink speaks just enough SMTP for that: ``EHLO`` advertising STARTTLS and
+AUTH, a TLS upgrade with a throwaway self-signed certificate, any
+credentials, and ``MAIL``/``RCPT``/``DATA``. It counts messages and bytes
+so a benchmark can check that everything it sent arrived::
+
+    with SMTPSink() as sink:
+        sender = SMTPSender(EmailConfig(smtp_host=sink.host, smtp_port=sink.port, ...))
+        ...
+        assert sink.messages == len(recipients)
+"""
+
+from __future__ import annotations
+
+import datetime
+import os
+import socket
+import socketserver
+import ssl
+import tempfile
+import threading
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+
+def _self_signed_context() -> ssl.SSLContext:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    # load_cert_chain only takes paths; the files live just long enough to load.
+    with tempfile.TemporaryDirectory() as tmp:
+        cert_path, key_path = os.path.join(tmp, "cert.pem"), os.path.join(tmp, "key.pem")
+        with open(cert_path, "wb") as f:
+            f.write(cert.public_bytes(serialization.Encoding.PEM))
+        with open(key_path, "wb") as f:
+            f.write(key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            ))
+        ctx.load_cert_chain(cert_path, key_path)
+    return ctx
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "_Server"
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(line.encode() + b"\r\n")
+        self.wfile.flush()
+
+    def _read_data(self) -> int:
+        size = 0
+        for raw in self.rfile:
+            if raw in (b".\r\n", b".\n"):
+                break
+            size += len(raw)
+            self._quickack()
+        return size
+
+    def _quickack(self) -> None:
+        # The client's last, short TLS record of a message waits (Nagle)
+        # for an ACK that Linux would otherwise delay by ~40 ms; that delay
+        # would be most of what a send_bulk benchmark measures.
+        if hasattr(socket, "TCP_QUICKACK"):
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+
+    def handle(self) -> None:
+        self._reply("220 localhost benchmark sink")
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            verb = raw.split(b" ", 1)[0].strip().upper().decode("ascii", "replace")
+            if verb in ("EHLO", "HELO"):
+                self.wfile.write(
+                    b"250-localhost\r\n250-8BITMIME\r\n250-STARTTLS\r\n250 AUTH PLAIN LOGIN\r\n"
+                )
+                self.wfile.flush()
+            elif verb == "STARTTLS":
+                self._reply("220 ready for TLS")
+                tls = self.server.tls.wrap_socket(self.connection, server_side=True)
+                self.connection = tls
+                self.rfile = tls.makefile("rb")
+                self.wfile = tls.makefile("wb")
+            elif verb == "AUTH":
+                self._reply("235 authenticated")
+            elif verb == "DATA":
+                self._reply("354 end with <CRLF>.<CRLF>")
+                self.server.record(self._read_data())
+                self._reply("250 queued")
+            elif verb == "QUIT":
+                self._reply("221 bye")
+                return
+            else:  # MAIL, RCPT, RSET, NOOP
+                self._reply("250 ok")
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.tls = _self_signed_context()
+        self.lock = threading.Lock()
+        self.messages = 0
+        self.bytes = 0
+
+    def record(self, size: int) -> None:
+        with self.lock:
+            self.messages += 1
+            self.bytes += size
+
+
+class SMTPSink:
+    """Run the sink on an ephemeral localhost port for the ``with`` block."""
+
+    host = "127.0.0.1"
+
+    def __init__(self) -> None:
+        self._server = _Server()
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="smtp-sink", daemon=True)
+
+    @property
+    def messages(self) -> int:
+        return self._server.messages
+
+    @property
+    def bytes(self) -> int:
+        return self._server.bytes
+
+    def reset(self) -> None:
+        with self._server.lock:
+            self._server.messages = 0
+            self._server.bytes = 0
+
+    def __enter__(self) -> "SMTPSink":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,81 @@
+"""Stand-in for the Anthropic and OpenAI clients.
+
+Inside ``stub_llm()`` every ``anthropic.Anthropic()`` / ``openai.OpenAI()``
+the generator creates is a fake that returns canned prose after an
+optional fixed latency, so benchmarks exercise the real prompt building
+and response handling without network calls, keys or cost. ``calls``
+on the returned stub counts the requests made.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from typing import Iterator
+from unittest import mock
+
+_TEXT = (
+    "This week the stories that matter most for working musicians: what "
+    "changed in streaming payouts, which festivals opened submissions, and "
+    "one practical tip you can use before Friday."
+)
+
+
+class StubLLM:
+    """Shared state for the fake clients: latency and a call counter."""
+
+    def __init__(self, latency: float = 0.0, text: str = _TEXT) -> None:
+        self.latency = latency
+        self.text = text
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _respond(self, kwargs: dict) -> str:
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return self.text
+
+    def anthropic_client(self, *args, **kwargs) -> SimpleNamespace:
+        def create(**kw):
+            text = self._respond(kw)
+            return SimpleNamespace(
+                content=[SimpleNamespace(type="text", text=text)],
+                usage=SimpleNamespace(input_tokens=len(str(kw.get("messages"))) // 4, output_tokens=len(text) // 4),
+            )
+
+        return SimpleNamespace(messages=SimpleNamespace(create=create))
+
+    def openai_client(self, *args, **kwargs) -> SimpleNamespace:
+        def create(**kw):
+            text = self._respond(kw)
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content=text))],
+                usage=SimpleNamespace(total_tokens=(len(str(kw.get("messages"))) + len(text)) // 4),
+            )
+
+        return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+@contextlib.contextmanager
+def stub_llm(latency: float = 0.0) -> Iterator[StubLLM]:
+    """Patch the provider SDK constructors for the duration of the block."""
+    stub = StubLLM(latency)
+    with contextlib.ExitStack() as stack:
+        for module, attr, factory in (
+            ("anthropic", "Anthropic", stub.anthropic_client),
+            ("openai", "OpenAI", stub.openai_client),
+        ):
+            try:
+                __import__(module)
+            except ImportError:
+                # The generator imports the SDK lazily; install a stand-in
+                # module so the stub works without the package installed.
+                stack.enter_context(mock.patch.dict(sys.modules, {module: SimpleNamespace(**{attr: factory})}))
+                continue
+            stack.enter_context(mock.patch(f"{module}.{attr}", factory))
+        yield stub
@@ -0,0 +1,95 @@
+"""Benchmark archive search on a synthetic 5,000-issue archive.
+
+Compares the old approach (load every published issue's assembled text
+and substring-match it in Python) with ``Repository.search_archive``.
+
+    python scripts/bench_archive_search.py [--issues 5000] [--runs 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from weeklyamp.core.database import get_connection, init_database
+from weeklyamp.db.repository import Repository
+
+_WORDS = (
+    "touring merch streaming vinyl playlist label indie festival radio sync "
+    "royalties producer mixing mastering songwriter venue booking fans album "
+    "single release press campaign budget analog synth guitar drums bass"
+).split()
+
+
+def _seed(db_path: str, count: int) -> None:
+    rng = random.Random(42)
+    conn = get_connection(db_path)
+    conn.executemany(
+        "INSERT INTO issues (issue_number, title, status, edition_slug) VALUES (?, ?, 'published', ?)",
+        [
+            (n, " ".join(rng.choices(_WORDS, k=4)), rng.choice(("fan", "artist", "industry")))
+            for n in range(1, count + 1)
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    repo = Repository(db_path)
+    for issue_id in range(1, count + 1):
+        # Mostly common words, plus a few rare names so selective queries
+        # have realistic hit counts.
+        words = rng.choices(_WORDS, k=900) + [f"artist{rng.randrange(3000)}" for _ in range(5)]
+        rng.shuffle(words)
+        body = " ".join(words)
+        repo.save_assembled(issue_id, f"<p>{body}</p>", body)
+
+
+def _substring_search(repo: Repository, q: str) -> int:
+    issues = repo.get_published_issues(limit=100_000)
+    needle = q.lower()
+    hits = 0
+    for issue in issues:
+        assembled = repo.get_assembled(issue["id"]) or {}
+        haystack = " ".join((
+            (issue.get("title") or "").lower(),
+            (assembled.get("plain_text") or "")[:5000].lower(),
+        ))
+        hits += needle in haystack
+    return hits
+
+
+def _time(fn, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "bench.db")
+        init_database(db_path)
+        print(f"Seeding {args.issues} issues...")
+        _seed(db_path, args.issues)
+        repo = Repository(db_path)
+
+        for q in ("artist1234", "royalties", "analog synth"):
+            old = _time(lambda: _substring_search(repo, q), max(1, args.runs // 10))
+            new = _time(lambda: repo.search_archive(q), args.runs)
+            _, total = repo.search_archive(q)
+            print(f"{q!r:22} substring {old:9.1f} ms   fts {new:7.2f} ms   ({total} hits)")
+
+
+if __name__ == "__main__":
+    main()
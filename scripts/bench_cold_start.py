@@ -0,0 +1,78 @@
+"""Benchmark app cold start: time from a fresh interpreter to the first response.
+
+Each sample runs in a new Python process so imports are cold. Reports
+import, ``create_app`` and startup (lifespan) time plus the total
+time-to-first-request for:
+
+* first boot   — empty database, full schema init and seeding
+* warm boot    — fingerprints match, schema and seed work skipped
+* eager routes — warm boot with WEEKLYAMP_LAZY_ADMIN_ROUTES=false
+
+    python scripts/bench_cold_start.py [--runs 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+_CHILD = """
+import json, time
+t0 = time.perf_counter()
+from weeklyamp.web.app import create_app
+from starlette.testclient import TestClient
+t1 = time.perf_counter()
+app = create_app()
+t2 = time.perf_counter()
+with TestClient(app) as client:
+    t3 = time.perf_counter()
+    status = client.get("/health").status_code
+    t4 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "create": t2 - t1, "startup": t3 - t2,
+                  "total": t4 - t0, "status": status}))
+"""
+
+
+def _boot(db_path: str, **env: str) -> dict:
+    child_env = {**os.environ, "WEEKLYAMP_DB_PATH": db_path, "WEEKLYAMP_ENV": "development", **env}
+    child_env.pop("WEEKLYAMP_ADMIN_HASH", None)
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD], env=child_env, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def _report(label: str, samples: list[dict]) -> None:
+    med = {k: statistics.median(s[k] for s in samples) * 1000 for k in ("import", "create", "startup", "total")}
+    print(
+        f"{label:13} import {med['import']:7.0f} ms   create_app {med['create']:6.0f} ms   "
+        f"startup {med['startup']:6.0f} ms   first request at {med['total']:7.0f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        first = []
+        for n in range(args.runs):
+            first.append(_boot(str(Path(tmp) / f"fresh{n}.db")))
+        warm_db = str(Path(tmp) / "fresh0.db")
+        warm = [_boot(warm_db) for _ in range(args.runs)]
+        eager = [_boot(warm_db, WEEKLYAMP_LAZY_ADMIN_ROUTES="false") for _ in range(args.runs)]
+
+    _report("first boot", first)
+    _report("warm boot", warm)
+    _report("eager routes", eager)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark the Postgres adapter's per-statement overhead.
+
+Always runs the client-side parts, which need no server:
+
+* SQL translation (``?`` → ``%s`` and ``RETURNING id``), uncached vs cached
+* row materialization, a dict per row vs :class:`PgRow` tuples
+
+With ``WEEKLYAMP_DATABASE_URL`` set it also times hot repository reads
+against that database with each combination of ``PG_PREPARE_THRESHOLD``
+and ``PG_TUPLE_ROWS``.
+
+    python scripts/bench_pg_adapter.py [--n 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import timeit
+
+from weeklyamp.db import postgres, repository
+
+_SQL = (
+    "SELECT s.*, t.name FROM subscribers s JOIN tiers t ON t.id = s.tier_id "
+    "WHERE s.status = ? AND s.edition_id = ? ORDER BY s.id LIMIT ?"
+)
+
+
+def _uncached(sql: str) -> tuple[str, bool]:
+    return repository._translate.__wrapped__(sql)
+
+
+def _rate(label: str, seconds: float, n: int) -> None:
+    print(f"{label:34} {seconds / n * 1e9:8.0f} ns/op")
+
+
+def bench_client(n: int) -> None:
+    _rate("translate, uncached", timeit.timeit(lambda: _uncached(_SQL), number=n), n)
+    _rate("translate, cached", timeit.timeit(lambda: repository._translate(_SQL), number=n), n)
+
+    # RealDictCursor builds a dict per row and PgCursor copies it; tuple
+    # mode wraps the driver's tuple in the per-shape PgRow class.
+    columns = tuple(f"col{i}" for i in range(12))
+    raw = [tuple(range(12))] * 100
+    reps = max(n // 100, 1)
+
+    def as_dicts():
+        return [dict(dict(zip(columns, r))) for r in raw]
+
+    def as_rows():
+        cls = postgres._row_class(columns)
+        return [cls(r) for r in raw]
+
+    _rate("100 rows as dicts", timeit.timeit(as_dicts, number=reps), reps)
+    _rate("100 rows as PgRow", timeit.timeit(as_rows, number=reps), reps)
+
+
+def bench_server(url: str, n: int) -> None:
+    repo = repository.Repository(database_url=url, backend="postgres")
+    for threshold, tuple_rows in ((0, False), (5, False), (0, True), (5, True)):
+        postgres._PREPARE_THRESHOLD = threshold
+        postgres._TUPLE_ROWS = tuple_rows
+        repo.get_current_issue()
+        seconds = timeit.timeit(lambda: (repo.get_current_issue(), repo.get_subscriber_count()), number=n)
+        _rate(f"repo reads, prepare={threshold} tuples={tuple_rows}", seconds, n)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=100_000)
+    args = parser.parse_args()
+
+    bench_client(args.n)
+    url = os.environ.get("WEEKLYAMP_DATABASE_URL")
+    if url:
+        bench_server(url, max(args.n // 100, 100))
+    else:
+        print("WEEKLYAMP_DATABASE_URL not set; skipping server round trips")
+
+
+if __name__ == "__main__":
+    main()
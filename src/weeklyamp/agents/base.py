@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 from typing import Optional
 
+from weeklyamp.core import metrics
 from weeklyamp.core.config import load_config
 from weeklyamp.core.models import AppConfig
 from weeklyamp.db.repository import Repository
@@ -78,7 +79,8 @@ class AgentBase:
         """Run the agent's logic for a task. Override in subclasses."""
         self.repo.update_task_state(task_id, "working")
         try:
-            result = self._run(task_id)
+            with metrics.llm_caller(self.agent_type):
+                result = self._run(task_id)
             output_json = json.dumps(result or {})
 
             if self.config.agents.review_required:
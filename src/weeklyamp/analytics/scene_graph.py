@@ -84,6 +84,57 @@ def _get_cities() -> set[str]:
     return _ALL_CITIES
 
 
+class _CityMatcher:
+    """Every gazetteer city compiled into one case-insensitive pattern.
+
+    The alternation sits inside a lookahead, so ``finditer`` tries it at
+    every word boundary and overlapping names ("York" inside "New York")
+    are all found in a single pass. Longest names are listed first;
+    a shorter city that is a whole-word prefix of a longer one at the
+    same position ("Kansas" / "Kansas City") is recovered from
+    ``_prefixes``. The result equals testing each city's ``\\bcity\\b``
+    pattern separately.
+    """
+
+    def __init__(self, cities: set[str]) -> None:
+        ordered = sorted(cities, key=lambda c: (-len(c), c))
+        self._canonical = {c.lower(): c for c in ordered}
+        self._pattern = re.compile(
+            r"(?=\b(" + "|".join(re.escape(c) for c in ordered) + r")\b)",
+            re.IGNORECASE,
+        ) if ordered else None
+        self._prefixes: dict[str, list[str]] = {}
+        for city in ordered:
+            for other in ordered:
+                if other != city and re.match(r"\b" + re.escape(other) + r"\b", city, re.IGNORECASE):
+                    self._prefixes.setdefault(city, []).append(other)
+
+    def find(self, text: str) -> list[str]:
+        """Canonical names of the cities mentioned in ``text``, in order
+        of first appearance."""
+        if self._pattern is None:
+            return []
+        found: dict[str, None] = {}
+        for match in self._pattern.finditer(text):
+            city = self._canonical.get(match.group(1).lower())
+            if city is None:
+                continue
+            found.setdefault(city)
+            for prefix in self._prefixes.get(city, ()):
+                found.setdefault(prefix)
+        return list(found)
+
+
+_CITY_MATCHER: _CityMatcher | None = None
+
+
+def _get_city_matcher() -> _CityMatcher:
+    global _CITY_MATCHER
+    if _CITY_MATCHER is None:
+        _CITY_MATCHER = _CityMatcher(_get_cities())
+    return _CITY_MATCHER
+
+
 # ---------------------------------------------------------------------------
 # HTML text extraction
 # ---------------------------------------------------------------------------
@@ -100,41 +151,43 @@ def _strip_tags(text: str) -> str:
     return _MULTI_SPACE.sub(" ", _TAG_RE.sub(" ", text)).strip()
 
 
+_HEADING_RE = re.compile(r'<h[1-3][^>]*>(.*?)</h[1-3]>', re.IGNORECASE | re.DOTALL)
+
+
 def _html_to_sections(html_content: str) -> list[dict]:
-    """Split HTML into rough sections. Each dict has 'slug' and 'text'."""
+    """Split HTML into rough sections on h1-h3 headings.
+
+    Each dict has 'slug', 'text' (tag-stripped body) and 'html' — the raw
+    slice from the section's heading up to the next heading, so tag
+    based extraction can be limited to the section.
+    """
     if not html_content:
         return []
 
-    # Try to split on headings
-    heading_re = re.compile(
-        r'<h[1-3][^>]*>(.*?)</h[1-3]>',
-        re.IGNORECASE | re.DOTALL,
-    )
-    parts = heading_re.split(html_content)
     sections = []
     current_slug = "intro"
-    current_text = ""
+    current_start = 0
+    body_start = 0
+
+    def _flush(end: int) -> None:
+        text = _strip_tags(html_content[body_start:end])
+        if text:
+            sections.append({
+                "slug": current_slug,
+                "text": text,
+                "html": html_content[current_start:end],
+            })
 
-    for i, part in enumerate(parts):
-        if i % 2 == 0:
-            # Content block
-            current_text += " " + _strip_tags(part)
-        else:
-            # Heading — flush previous section
-            if current_text.strip():
-                sections.append({
-                    "slug": current_slug,
-                    "text": current_text.strip(),
-                })
-            current_slug = slugify(_strip_tags(part)) or "section"
-            current_text = ""
-
-    if current_text.strip():
-        sections.append({"slug": current_slug, "text": current_text.strip()})
+    for match in _HEADING_RE.finditer(html_content):
+        _flush(match.start())
+        current_slug = slugify(_strip_tags(match.group(1))) or "section"
+        current_start = match.start()
+        body_start = match.end()
+    _flush(len(html_content))
 
     if not sections:
         # Fallback: whole thing as one section
-        sections.append({"slug": "full", "text": _strip_tags(html_content)})
+        sections.append({"slug": "full", "text": _strip_tags(html_content), "html": html_content})
 
     return sections
 
@@ -222,27 +275,39 @@ def _clean_name(name: str) -> str:
     return name
 
 
+def _tagged_names(section_html: str) -> list[str]:
+    """Bold and link texts in a section that look like artist names."""
+    names = []
+    for regex in (_BOLD_RE, _LINK_RE):
+        for match in regex.finditer(section_html):
+            text = _clean_name(match.group(1))
+            # Check if it looks like a name (starts with uppercase words)
+            if _is_valid_entity_name(text) and len(text.split()) <= 5 and text[0].isupper():
+                names.append(text)
+    return names
+
+
 def extract_entities_from_html(html_content: str) -> list[dict]:
     """Parse newsletter HTML and extract entities.
 
     Returns a list of dicts with keys: name, entity_type, section_slug,
     context_snippet.
+
+    Bold/link artists are taken from each section's own HTML slice, so
+    a name is attributed to the section it appears in and the document
+    is scanned once overall rather than once per section.
     """
     if not html_content:
         return []
 
     entities: list[dict] = []
     seen: set[tuple[str, str, str]] = set()  # (name_lower, type, section)
-    cities = _get_cities()
-
-    sections = _html_to_sections(html_content)
+    city_matcher = _get_city_matcher()
 
-    for section in sections:
+    for section in _html_to_sections(html_content):
         section_slug = section["slug"]
         text = section["text"]
-        # Also search the raw HTML for this section for bold/link tags
-        # Find the raw HTML segment corresponding to this section text
-        section_html_raw = html_content  # fallback: search whole doc
+        text_lower = text.lower()
 
         def _add(name: str, etype: str):
             name = _clean_name(name)
@@ -253,7 +318,7 @@ def extract_entities_from_html(html_content: str) -> list[dict]:
                 return
             seen.add(key)
             # Build context snippet: surrounding 60 chars
-            idx = text.lower().find(name.lower())
+            idx = text_lower.find(name.lower())
             if idx >= 0:
                 start = max(0, idx - 30)
                 end = min(len(text), idx + len(name) + 30)
@@ -271,41 +336,25 @@ def extract_entities_from_html(html_content: str) -> list[dict]:
                 "context_snippet": snippet,
             })
 
-        # --- Artists: bold text and link text in the HTML ---
-        for match in _BOLD_RE.finditer(html_content):
-            bold_text = _clean_name(match.group(1))
-            if _is_valid_entity_name(bold_text) and len(bold_text.split()) <= 5:
-                # Check if it looks like a name (starts with uppercase words)
-                if bold_text[0].isupper():
-                    _add(bold_text, "artist")
-
-        for match in _LINK_RE.finditer(html_content):
-            link_text = _clean_name(match.group(1))
-            if _is_valid_entity_name(link_text) and len(link_text.split()) <= 5:
-                if link_text[0].isupper():
-                    _add(link_text, "artist")
+        # --- Artists: bold text and link text in the section's HTML ---
+        for name in _tagged_names(section["html"]):
+            _add(name, "artist")
 
         # --- Venues ---
         for match in _VENUE_RE.finditer(text):
-            venue = match.group(1).strip()
-            _add(venue, "venue")
+            _add(match.group(1).strip(), "venue")
 
         # --- Labels ---
         for match in _LABEL_RE.finditer(text):
-            label = match.group(1).strip()
-            _add(label, "label")
+            _add(match.group(1).strip(), "label")
 
         # --- Producers ---
         for match in _PRODUCER_RE.finditer(text):
-            producer = match.group(1).strip()
-            _add(producer, "producer")
+            _add(match.group(1).strip(), "producer")
 
         # --- Cities ---
-        for city in cities:
-            # Match whole word only
-            pattern = r'\b' + re.escape(city) + r'\b'
-            if re.search(pattern, text, re.IGNORECASE):
-                _add(city, "city")
+        for city in city_matcher.find(text):
+            _add(city, "city")
 
     return entities
 
@@ -419,28 +468,15 @@ def build_connections(entities: list[dict]) -> list[dict]:
 # Issue indexing
 # ---------------------------------------------------------------------------
 
-def index_issue(repo, issue_id: int) -> dict:
-    """Extract entities from a published issue, upsert to DB, build connections.
-
-    Returns summary stats: {entities_found, connections_found, new_entities, new_connections}.
-    """
-    # Get assembled HTML for this issue
-    assembled = repo.get_assembled(issue_id)
-    if not assembled:
-        logger.warning("No assembled HTML for issue %d", issue_id)
-        return {"entities_found": 0, "connections_found": 0, "new_entities": 0, "new_connections": 0}
+_EMPTY_RESULT = {"entities_found": 0, "connections_found": 0}
 
-    html_content = assembled.get("html_content", "")
-    if not html_content:
-        return {"entities_found": 0, "connections_found": 0, "new_entities": 0, "new_connections": 0}
 
-    entities = extract_entities_from_html(html_content)
+def _store_issue_entities(repo, issue_id: int, entities: list[dict]) -> dict:
+    """Upsert extracted entities and their connections for one issue."""
     connections = build_connections(entities)
 
     # Track entity name -> entity_id mapping for connection building
     entity_ids: dict[str, int] = {}
-    new_entities = 0
-    new_connections = 0
 
     for ent in entities:
         slug = slugify(ent["name"])
@@ -482,6 +518,79 @@ def index_issue(repo, issue_id: int) -> dict:
     }
 
 
+def index_issue(repo, issue_id: int) -> dict:
+    """Extract entities from a published issue, upsert to DB, build connections.
+
+    Returns summary stats: {entities_found, connections_found}.
+    """
+    # Get assembled HTML for this issue
+    assembled = repo.get_assembled(issue_id)
+    if not assembled:
+        logger.warning("No assembled HTML for issue %d", issue_id)
+        return dict(_EMPTY_RESULT)
+
+    html_content = assembled.get("html_content", "")
+    if not html_content:
+        return dict(_EMPTY_RESULT)
+
+    return _store_issue_entities(repo, issue_id, extract_entities_from_html(html_content))
+
+
+def _context():
+    # Called from web worker threads: a plain fork would copy their held
+    # locks into the children. forkserver children start from a clean
+    # process that has already imported this module.
+    import multiprocessing
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload([__name__])
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+def index_issues(repo, issue_ids: list[int], workers: int | None = None) -> dict[int, dict]:
+    """Index many issues, extracting entities in parallel worker processes.
+
+    Assembled HTML is loaded in one query and extraction (pure CPU) is
+    spread over a process pool; the database writes stay in this process,
+    one issue at a time, so SQLite sees a single writer. ``workers=1``
+    (or a single issue) runs everything in-process, as does any failure
+    to start the pool.
+
+    Returns ``{issue_id: stats}`` with the same stats as ``index_issue``.
+    """
+    import os
+
+    assembled = repo.get_assembled_for_issues(issue_ids)
+    results: dict[int, dict] = {}
+    todo: list[tuple[int, str]] = []
+    for issue_id in issue_ids:
+        html_content = (assembled.get(issue_id) or {}).get("html_content", "")
+        if html_content:
+            todo.append((issue_id, html_content))
+        else:
+            logger.warning("No assembled HTML for issue %d", issue_id)
+            results[issue_id] = dict(_EMPTY_RESULT)
+
+    workers = workers or min(len(todo), os.cpu_count() or 1)
+    htmls = [h for _, h in todo]
+    extracted = None
+    if workers > 1 and len(todo) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        chunksize = max(1, len(todo) // (workers * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_context()) as pool:
+                extracted = list(pool.map(extract_entities_from_html, htmls, chunksize=chunksize))
+        except Exception:
+            logger.warning("Scene graph process pool unavailable — extracting inline", exc_info=True)
+    if extracted is None:
+        extracted = map(extract_entities_from_html, htmls)
+
+    for (issue_id, _), entities in zip(todo, extracted):
+        results[issue_id] = _store_issue_entities(repo, issue_id, entities)
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Graph queries (thin wrappers around repo methods)
 # ---------------------------------------------------------------------------
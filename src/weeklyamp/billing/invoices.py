@@ -27,38 +27,20 @@ class InvoiceManager:
         self.config = config
 
     def _next_invoice_number(self, prefix: str = "INV") -> str:
-        """Generate a sequential invoice number."""
-        existing = self.repo.get_invoices()
-        seq = len(existing) + 1
-        now = _utcnow()
-        return f"{prefix}-{now.strftime('%Y%m')}-{seq:05d}"
+        """Allocate the next invoice number from the per-prefix sequence."""
+        return self.repo.next_invoice_number(prefix, _utcnow().strftime("%Y%m"))
 
-    # ---- Licensee Invoices ----
-
-    def generate_licensee_invoice(self, licensee_id: int, month: str = "") -> Optional[int]:
-        """Generate a monthly invoice for a city edition licensee.
-
-        Includes: license fee + platform revenue share.
-        """
-        if not self.config.licensing.enabled:
-            return None
-
-        licensee = self.repo.get_licensee(licensee_id)
-        if not licensee or licensee.get("status") != "active":
-            return None
-
-        if not month:
-            month = _utcnow().strftime("%Y-%m")
+    def _create_invoices(self, prefix: str, invoices: list[dict]) -> list[int]:
+        return self.repo.create_invoices(prefix, _utcnow().strftime("%Y%m"), invoices)
 
-        fee_cents = licensee.get("license_fee_cents", self.config.licensing.default_monthly_fee_cents)
-        rev_share_pct = licensee.get("revenue_share_pct", self.config.licensing.default_revenue_share_pct)
+    # ---- Licensee Invoices ----
 
-        # Get licensee's revenue for the month
-        revenues = self.repo.get_license_revenue(licensee_id)
-        month_rev = next((r for r in revenues if r.get("month") == month), None)
-        platform_share = month_rev.get("platform_share_cents", 0) if month_rev else 0
+    def _licensee_invoice(self, row: dict, month: str) -> dict:
+        """Invoice fields for one licensee billing row: license fee + platform revenue share."""
+        fee_cents = row.get("license_fee_cents", self.config.licensing.default_monthly_fee_cents)
+        rev_share_pct = row.get("revenue_share_pct", self.config.licensing.default_revenue_share_pct)
+        platform_share = row.get("platform_share_cents") or 0
 
-        total_cents = fee_cents + platform_share
         line_items = [
             {"description": f"License fee ({month})", "amount_cents": fee_cents},
         ]
@@ -67,36 +49,40 @@ class InvoiceManager:
                 "description": f"Platform revenue share ({rev_share_pct}%)",
                 "amount_cents": platform_share,
             })
+        return {
+            "entity_type": "licensee",
+            "entity_id": row["id"],
+            "amount_cents": fee_cents + platform_share,
+            "line_items_json": json.dumps(line_items),
+            "due_date": (_utcnow() + timedelta(days=30)).strftime("%Y-%m-%d"),
+            "notes": f"City edition license invoice for {month}",
+            "billing_period": month,
+        }
 
-        due_date = (_utcnow() + timedelta(days=30)).strftime("%Y-%m-%d")
-        invoice_number = self._next_invoice_number("LIC")
-
-        return self.repo.create_invoice(
-            invoice_number=invoice_number,
-            entity_type="licensee",
-            entity_id=licensee_id,
-            amount_cents=total_cents,
-            line_items_json=json.dumps(line_items),
-            due_date=due_date,
-            notes=f"City edition license invoice for {month}",
-        )
-
-    # ---- Artist Newsletter Invoices ----
-
-    def generate_artist_newsletter_invoice(self, newsletter_id: int, month: str = "") -> Optional[int]:
-        """Generate a monthly invoice for an artist newsletter platform fee."""
-        if not self.config.artist_newsletters.enabled:
-            return None
+    def generate_licensee_invoice(self, licensee_id: int, month: str = "") -> Optional[int]:
+        """Generate a monthly invoice for a city edition licensee.
 
-        newsletter = self.repo.get_artist_newsletter(newsletter_id)
-        if not newsletter or newsletter.get("status") not in ("active", "setup"):
+        Includes: license fee + platform revenue share. Returns None when
+        the licensee is not active or already has an invoice for ``month``.
+        """
+        if not self.config.licensing.enabled:
             return None
 
         if not month:
             month = _utcnow().strftime("%Y-%m")
 
-        # Determine plan tier by subscriber count
-        sub_count = self.repo.get_artist_nl_subscriber_count(newsletter_id)
+        rows = self.repo.get_licensee_billing_rows(month, licensee_id=licensee_id)
+        if not rows:
+            return None
+        ids = self._create_invoices("LIC", [self._licensee_invoice(rows[0], month)])
+        return ids[0] if ids else None
+
+    # ---- Artist Newsletter Invoices ----
+
+    @staticmethod
+    def _artist_newsletter_invoice(row: dict, month: str) -> dict:
+        """Invoice fields for one artist newsletter; plan tier follows subscriber count."""
+        sub_count = row.get("subscriber_count") or 0
         if sub_count <= 1000:
             plan_name, fee_cents = "Starter", 3000
         elif sub_count <= 5000:
@@ -108,19 +94,29 @@ class InvoiceManager:
             {"description": f"Artist Newsletter — {plan_name} plan ({month})", "amount_cents": fee_cents},
             {"description": f"Subscribers: {sub_count}", "amount_cents": 0},
         ]
+        return {
+            "entity_type": "artist_newsletter",
+            "entity_id": row["id"],
+            "amount_cents": fee_cents,
+            "line_items_json": json.dumps(line_items),
+            "due_date": (_utcnow() + timedelta(days=30)).strftime("%Y-%m-%d"),
+            "notes": f"Artist newsletter platform fee for {month}",
+            "billing_period": month,
+        }
+
+    def generate_artist_newsletter_invoice(self, newsletter_id: int, month: str = "") -> Optional[int]:
+        """Generate a monthly invoice for an artist newsletter platform fee."""
+        if not self.config.artist_newsletters.enabled:
+            return None
 
-        due_date = (_utcnow() + timedelta(days=30)).strftime("%Y-%m-%d")
-        invoice_number = self._next_invoice_number("ART")
+        if not month:
+            month = _utcnow().strftime("%Y-%m")
 
-        return self.repo.create_invoice(
-            invoice_number=invoice_number,
-            entity_type="artist_newsletter",
-            entity_id=newsletter_id,
-            amount_cents=fee_cents,
-            line_items_json=json.dumps(line_items),
-            due_date=due_date,
-            notes=f"Artist newsletter platform fee for {month}",
-        )
+        rows = self.repo.get_artist_newsletter_billing_rows(month, newsletter_id=newsletter_id)
+        if not rows:
+            return None
+        ids = self._create_invoices("ART", [self._artist_newsletter_invoice(rows[0], month)])
+        return ids[0] if ids else None
 
     # ---- Subscriber Invoices ----
 
@@ -255,34 +251,32 @@ class InvoiceManager:
         return ok
 
     # ---- Bulk Operations ----
+    #
+    # One query picks every entity still unbilled for the month, and one
+    # transaction numbers and inserts all of their invoices. The
+    # billing_period unique index makes a re-run (or an overlapping run
+    # in another worker) a no-op rather than a second bill.
 
     def generate_all_licensee_invoices(self, month: str = "") -> list[int]:
-        """Generate invoices for all active licensees."""
+        """Generate invoices for all active licensees not yet billed for ``month``."""
+        if not self.config.licensing.enabled:
+            return []
         if not month:
             month = _utcnow().strftime("%Y-%m")
-        licensees = self.repo.get_licensees(status="active")
-        invoice_ids = []
-        for lic in licensees:
-            inv_id = self.generate_licensee_invoice(lic["id"], month)
-            if inv_id:
-                invoice_ids.append(inv_id)
+        rows = self.repo.get_licensee_billing_rows(month)
+        invoice_ids = self._create_invoices("LIC", [self._licensee_invoice(r, month) for r in rows])
         logger.info("Generated %d licensee invoices for %s", len(invoice_ids), month)
         return invoice_ids
 
     def generate_all_artist_newsletter_invoices(self, month: str = "") -> list[int]:
-        """Generate invoices for all active artist newsletters."""
+        """Generate invoices for all active artist newsletters not yet billed for ``month``."""
+        if not self.config.artist_newsletters.enabled:
+            return []
         if not month:
             month = _utcnow().strftime("%Y-%m")
-        # Get all active artist newsletters
-        conn = self.repo._conn()
-        rows = conn.execute(
-            "SELECT id FROM artist_newsletters WHERE status = 'active'"
-        ).fetchall()
-        conn.close()
-        invoice_ids = []
-        for row in rows:
-            inv_id = self.generate_artist_newsletter_invoice(row["id"], month)
-            if inv_id:
-                invoice_ids.append(inv_id)
+        rows = self.repo.get_artist_newsletter_billing_rows(month)
+        invoice_ids = self._create_invoices(
+            "ART", [self._artist_newsletter_invoice(r, month) for r in rows]
+        )
         logger.info("Generated %d artist newsletter invoices for %s", len(invoice_ids), month)
         return invoice_ids
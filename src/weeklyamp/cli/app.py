@@ -18,7 +18,13 @@ from weeklyamp.cli.agents import agent_app
 from weeklyamp.cli.security import security_app
 from weeklyamp.cli.submissions import submissions_app
 from weeklyamp.core.config import load_config
-from weeklyamp.core.database import get_schema_version, init_database, seed_sections
+from weeklyamp.core.database import (
+    get_schema_version,
+    prepare_database,
+    seed_database,
+    seed_fingerprint,
+    set_startup_state,
+)
 from weeklyamp.db.repository import Repository
 
 console = Console()
@@ -51,20 +57,14 @@ def init() -> None:
     console.print(f"[bold]Initializing TrueFans DISPATCH...[/bold]")
     console.print(f"  Backend: [cyan]{backend}[/cyan]")
 
-    # Create DB
-    init_database(db_path, database_url, backend)
+    # Create DB, seed defaults and record the startup fingerprints so the
+    # next app boot can skip both.
+    prepare_database(db_path, database_url, backend, features=cfg.features, force=True)
     if backend == "postgres":
         console.print(f"  Database initialized (PostgreSQL)")
     else:
         console.print(f"  Database created at [cyan]{db_path}[/cyan]")
 
-    # Seed sections
-    count = seed_sections(db_path, database_url, backend)
-    if count > 0:
-        console.print(f"  Seeded [green]{count}[/green] default sections")
-    else:
-        console.print("  Sections already exist")
-
     # Show schema version
     ver = get_schema_version(db_path, database_url, backend)
     console.print(f"  Schema version: [cyan]{ver}[/cyan]")
@@ -72,6 +72,20 @@ def init() -> None:
     console.print("\n[bold green]Ready![/bold green] Run [cyan]weeklyamp status[/cyan] to see the dashboard.")
 
 
+@app.command()
+def seed() -> None:
+    """Seed default sections, editions, agents, content and sources.
+
+    Idempotent. Deploys that set WEEKLYAMP_SEED_ON_BOOT=false run this as
+    a one-shot release step instead of seeding on every app boot.
+    """
+    cfg = load_config()
+    counts = seed_database(cfg.db_path, cfg.database_url, cfg.db_backend, features=cfg.features)
+    set_startup_state("seed", seed_fingerprint(cfg.features), cfg.db_path, cfg.database_url, cfg.db_backend)
+    for name, count in counts.items():
+        console.print(f"  {name.replace('_', ' ').capitalize()}: [green]{count}[/green] added")
+
+
 @app.command()
 def status() -> None:
     """Show the current issue dashboard."""
@@ -9,7 +9,7 @@ from pathlib import Path
 import typer
 from rich.console import Console
 
-from weeklyamp.content.assembly import assemble_newsletter
+from weeklyamp.content.assembly import assemble_issues, assemble_newsletter
 from weeklyamp.core.config import load_config
 from weeklyamp.db.repository import Repository
 from weeklyamp.delivery.smtp_sender import SMTPSender
@@ -19,11 +19,18 @@ publish_app = typer.Typer(name="publish", help="Assemble and publish newsletter.
 
 
 @publish_app.command("assemble")
-def assemble() -> None:
+def assemble(
+    week: str = typer.Option("", "--week", help="Assemble every edition issue of this week (e.g. 2026-W14)"),
+    day: str = typer.Option("", "--day", help="With --week, only this send day (monday, wednesday, saturday)"),
+) -> None:
     """Build the final HTML from approved drafts."""
     cfg = load_config()
     repo = Repository(cfg.db_path)
 
+    if week:
+        _assemble_week(repo, cfg, week, day)
+        return
+
     issue = repo.get_current_issue()
     if not issue:
         console.print("[red]No current issue.[/red]")
@@ -45,6 +52,44 @@ def assemble() -> None:
     console.print("Run [cyan]weeklyamp publish preview[/cyan] to view, or [cyan]weeklyamp publish push[/cyan] to send.")
 
 
+def _assemble_week(repo: Repository, cfg, week: str, day: str) -> None:
+    """Batch-assemble a send day's (or whole week's) edition issues."""
+    issues = [
+        i for i in repo.get_issues_for_week(week)
+        if not day or i.get("send_day") == day.lower()
+    ]
+    if not issues:
+        console.print(f"[red]No issues for {week}{' ' + day if day else ''}.[/red]")
+        raise typer.Exit(1)
+
+    console.print(f"[bold]Assembling {len(issues)} issues for {week}...[/bold]")
+
+    try:
+        result = assemble_issues(repo, [i["id"] for i in issues], cfg)
+    except Exception as exc:
+        console.print(f"[red]Assembly failed:[/red] {exc}")
+        raise typer.Exit(1)
+
+    for issue in issues:
+        built = result["issues"][issue["id"]]
+        repo.save_assembled(issue["id"], built["html"], built["plain"])
+        repo.update_issue_status(issue["id"], "assembled")
+        label = issue.get("edition_slug") or "dispatch"
+        timings = built["timings"]
+        console.print(
+            f"  #{issue['issue_number']} {label} {issue.get('send_day', '')}: "
+            f"HTML {len(built['html'])} chars "
+            f"(sections {timings['sections_s']:.2f}s, intro {timings['intro_s']:.2f}s, "
+            f"PS {timings['ps_s']:.2f}s, finish {timings['finish_s']:.2f}s)"
+        )
+
+    batch = result["timings"]
+    console.print(
+        f"[green]Assembled![/green] {len(issues)} issues in {batch['total_s']:.2f}s "
+        f"(load {batch['load_s']:.2f}s, markdown {batch['markdown_s']:.2f}s, LLM {batch['llm_s']:.2f}s)"
+    )
+
+
 @publish_app.command("preview")
 def preview() -> None:
     """Open the assembled newsletter in a web browser."""
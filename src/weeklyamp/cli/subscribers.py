@@ -15,7 +15,9 @@ subs_app = typer.Typer(name="subs", help="Subscriber management.")
 
 
 @subs_app.command("sync")
-def sync() -> None:
+def sync(
+    full: bool = typer.Option(False, "--full", help="Ignore the saved cursor and re-read every contact."),
+) -> None:
     """Pull subscribers from GoHighLevel into local database."""
     cfg = load_config()
 
@@ -27,8 +29,8 @@ def sync() -> None:
     console.print("[bold]Syncing subscribers from GoHighLevel...[/bold]")
 
     try:
-        result = sync_subscribers(repo, cfg.ghl)
-        console.print(f"[green]Synced![/green] {result['synced']} processed, {result['new']} new, {result['total']} total active")
+        result = sync_subscribers(repo, cfg.ghl, full=full)
+        console.print(f"[green]Synced![/green] {result['synced']} processed, {result['new']} new, {result['unsubscribed']} unsubscribed, {result['total']} total active")
     except Exception as exc:
         console.print(f"[red]Sync failed:[/red] {exc}")
         raise typer.Exit(1)
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
+import contextvars
 import json
 import logging
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-import markdown
-
+from weeklyamp.content.rendering import markdown_to_html, markdown_to_html_many, split_headline
 from weeklyamp.content.sections import get_section_map
-from weeklyamp.web.sanitize import sanitize_html
 from weeklyamp.core.models import AppConfig
 from weeklyamp.db.repository import Repository
 from weeklyamp.delivery.templates import (
@@ -184,48 +185,74 @@ Requirements:
         return f"PS — Thanks for reading Issue #{issue['issue_number']}{edition_context}. See you next time."
 
 
-def assemble_newsletter(
-    repo: Repository, issue_id: int, config: AppConfig,
-    subscriber_id: int | None = None,
-    preheader_text: str = "",
-) -> tuple[str, str]:
-    """Assemble approved drafts into final HTML.
-
-    When ``subscriber_id`` is provided AND
-    ``config.genre_preferences.weight_sections_by_genre`` is on, sections
-    are reordered by the subscriber's combined genre + click affinity
-    via :class:`GenreEngine.rank_sections_for_subscriber`. Otherwise the
-    static editorial ``sort_order`` is used. Per-subscriber assembly is
-    cheap (~one GenreEngine call) but only worth doing in delivery code
-    paths that already loop per-subscriber (e.g. SMTP single-send) —
-    bulk-sender APIs that fan out one HTML to many recipients can stick
-    with the unpersonalized form.
+class _SharedData:
+    """Reference data an assembly run reads, loaded once per run.
 
-    Returns (html_content, plain_text).
+    Lookups that used to be one query per draft (guest article,
+    submission, editorial inputs) are bulk-loaded for every draft in the
+    run; per-section and per-edition lookups are memoized, so a batch of
+    editions that share sections only asks once.
     """
-    issue = repo.get_issue(issue_id)
-    if not issue:
-        raise ValueError(f"Issue {issue_id} not found")
-
-    # Resolve edition name for edition-aware prompts
-    edition_slug = issue.get("edition_slug", "")
-    edition_name = ""
-    edition_audience = ""
-    if edition_slug:
-        edition = repo.get_edition_by_slug(edition_slug)
-        if edition:
-            edition_name = edition.get("name", "")
-            edition_audience = edition.get("audience", "") or ""
 
-    drafts = repo.get_drafts_for_issue(issue_id)
-    section_map = get_section_map(repo)
+    def __init__(self, repo: Repository, config: AppConfig, drafts_by_issue: dict[int, list[dict]]) -> None:
+        self.repo = repo
+        self.config = config
+        self.section_map = get_section_map(repo)
+        draft_ids = [d["id"] for drafts in drafts_by_issue.values() for d in drafts]
+        self.guests = repo.get_guest_articles_by_drafts(draft_ids)
+        self.submissions = repo.get_submissions_by_drafts(draft_ids)
+        self.editorial_inputs = repo.get_editorial_inputs_for_issues(list(drafts_by_issue))
+        self._editions: dict[str, dict | None] = {}
+        self._writers: dict[str, dict | None] = {}
+        self._unused: dict[str, list[dict]] = {}
+        self._edition_blocks: dict[tuple[str, int], list[dict]] = {}
+        self._promo_cfg = None
+
+    def edition(self, slug: str) -> dict | None:
+        if slug not in self._editions:
+            self._editions[slug] = self.repo.get_edition_by_slug(slug)
+        return self._editions[slug]
+
+    def writer(self, slug: str) -> dict | None:
+        if slug not in self._writers:
+            self._writers[slug] = self.repo.get_writer_for_section(slug)
+        return self._writers[slug]
+
+    def unused_content(self, slug: str) -> list[dict]:
+        if slug not in self._unused:
+            self._unused[slug] = self.repo.get_unused_content(section_slug=slug, limit=5)
+        return self._unused[slug]
+
+    def edition_sponsor_blocks(self, slug: str, number: int) -> list[dict]:
+        key = (slug, number)
+        if key not in self._edition_blocks:
+            self._edition_blocks[key] = self.repo.get_sponsor_blocks_for_edition(slug, number)
+        return self._edition_blocks[key]
+
+    def promo_config(self):
+        if self._promo_cfg is None:
+            import os
+            from weeklyamp.content.promo import effective_promo_config
+            # Overlay any runtime admin edits (copy/routing/targets) stored in
+            # admin_settings; env kill-switch still wins on `enabled`.
+            env_forced = os.getenv("WEEKLYAMP_PROMO_ENABLED", "").lower() in ("1", "true", "yes")
+            self._promo_cfg = effective_promo_config(self.repo, self.config.promo, env_forced=env_forced)
+        return self._promo_cfg
+
+
+def _ordered_drafts(
+    repo: Repository, drafts: list[dict], config: AppConfig, shared: _SharedData,
+    subscriber_id: int | None = None,
+) -> list[dict]:
+    """Approved/revised drafts in editorial order, optionally reranked per subscriber."""
+    section_map = shared.section_map
 
     # Sort drafts by section sort_order
     def sort_key(d: dict) -> int:
         sec = section_map.get(d["section_slug"], {})
         return sec.get("sort_order", 99)
 
-    drafts.sort(key=sort_key)
+    drafts = sorted(drafts, key=sort_key)
 
     # Per-subscriber reranking layered on top of the editorial sort.
     # The genre engine is a no-op when its config flag is off, so this
@@ -242,17 +269,25 @@ def assemble_newsletter(
         )
         drafts = [item["_draft"] for item in ranked]
 
-    # Render each section and collect summaries for intro/PS generation
+    return [d for d in drafts if d["status"] in ("approved", "revised")]
+
+
+def _build_sections(
+    issue: dict, drafts: list[dict], shared: _SharedData, rendered: dict[str, str],
+) -> tuple[list[dict], list[str], list[dict]]:
+    """Render each draft: (sections_html, plain_parts, section_summaries).
+
+    ``rendered`` maps markdown bodies to their sanitized HTML (see
+    :func:`_render_bodies`); bodies not in it are converted here.
+    """
+    issue_id = issue["id"]
     sections_html: list[dict] = []
     plain_parts: list[str] = []
     section_summaries: list[dict] = []
 
     for draft in drafts:
-        if draft["status"] not in ("approved", "revised"):
-            continue
-
         slug = draft["section_slug"]
-        sec = section_map.get(slug, {})
+        sec = shared.section_map.get(slug, {})
         display_name = sec.get("display_name", slug.upper())
 
         # Collect a short summary for the welcome intro and PS
@@ -264,29 +299,16 @@ def assemble_newsletter(
         section_summaries.append({"display_name": display_name, "summary": summary})
 
         # Extract headline from content (first markdown heading) and body
-        raw_content = draft["content"] or ""
-        headline = ""
-        body_content = raw_content
-        # Look for a markdown heading on the first non-empty line
-        for line in raw_content.split("\n"):
-            stripped = line.strip()
-            if not stripped:
-                continue
-            heading_match = re.match(r"^#{1,3}\s+(.+)$", stripped)
-            if heading_match:
-                headline = heading_match.group(1).strip()
-                # Remove the heading line from body
-                body_content = raw_content.replace(line, "", 1).strip()
-            break  # Only check the first non-empty line
+        headline, body_content = split_headline(draft["content"] or "")
 
         # Convert markdown body to HTML (sanitized against XSS)
-        content_html = sanitize_html(markdown.markdown(body_content, extensions=["extra"]))
+        content_html = rendered[body_content] if body_content in rendered else markdown_to_html(body_content)
         # Safety: also strip any leading HTML heading that slipped through
         content_html = re.sub(r"^\s*<h[1-3][^>]*>.*?</h[1-3]>\s*", "", content_html, count=1)
 
         # Check if this draft came from a guest article or artist submission
-        guest = repo.get_guest_article_by_draft(draft["id"])
-        submission = repo.get_submission_by_draft(draft["id"])
+        guest = shared.guests.get(draft["id"])
+        submission = shared.submissions.get(draft["id"])
 
         if guest:
             section_html = render_guest_section(
@@ -305,7 +327,7 @@ def assemble_newsletter(
             )
         else:
             # Look up the writer or editor who produced this section
-            writer = repo.get_writer_for_section(slug)
+            writer = shared.writer(slug)
             if writer:
                 byline = f"Written by {writer['name']}, {writer['agent_type'].replace('_', ' ').title()}"
             else:
@@ -313,14 +335,12 @@ def assemble_newsletter(
 
             # Gather source citations from editorial inputs and raw content
             sources: list[dict] = []
-            editorial_inputs = repo.get_editorial_inputs(issue_id, section_slug=slug)
-            for ei in editorial_inputs:
+            for ei in shared.editorial_inputs.get((issue_id, slug), []):
                 for url in (ei.get("reference_urls") or "").split("\n"):
                     url = url.strip()
                     if url:
                         sources.append({"title": url, "url": url, "author": ""})
-            used_content = repo.get_unused_content(section_slug=slug, limit=5)
-            for rc in used_content:
+            for rc in shared.unused_content(slug):
                 if rc.get("url"):
                     sources.append({
                         "title": rc.get("title") or rc["url"],
@@ -339,12 +359,37 @@ def assemble_newsletter(
         headline_plain = f" — {headline}" if headline else ""
         plain_parts.append(f"=== {display_name}{headline_plain} ===\n\n{draft['content']}\n")
 
-    # Generate AI welcome intro and PS closing (edition-aware)
-    welcome_intro = _generate_welcome_intro(issue, section_summaries, config, edition_name)
-    ps_closing = _generate_ps_closing(issue, section_summaries, config, edition_name)
+    return sections_html, plain_parts, section_summaries
+
+
+def _render_bodies(repo: Repository, drafts: list[dict], processes: int | None = None) -> dict[str, str]:
+    """Sanitized HTML for every draft body, through the render cache."""
+    bodies = [split_headline(d["content"] or "")[1] for d in drafts]
+    return dict(zip(bodies, markdown_to_html_many(bodies, processes, repo=repo)))
+
+
+def _edition_context(issue: dict, shared: _SharedData) -> tuple[str, str]:
+    """(edition_name, edition_audience) for edition-aware prompts."""
+    edition_slug = issue.get("edition_slug", "")
+    if edition_slug:
+        edition = shared.edition(edition_slug)
+        if edition:
+            return edition.get("name", ""), edition.get("audience", "") or ""
+    return "", ""
+
+
+def _finish(
+    repo: Repository, issue: dict, config: AppConfig, shared: _SharedData,
+    sections_html: list[dict], plain_parts: list[str],
+    welcome_intro: str, ps_closing: str, preheader_text: str = "",
+) -> tuple[str, str]:
+    """Add engagement, sponsor and promo blocks and render the final newsletter."""
+    issue_id = issue["id"]
+    edition_slug = issue.get("edition_slug", "")
+    _edition_name, edition_audience = _edition_context(issue, shared)
 
     # Convert welcome intro to HTML
-    welcome_html = sanitize_html(markdown.markdown(welcome_intro, extensions=["extra"]))
+    welcome_html = markdown_to_html(welcome_intro)
 
     # Inject engagement blocks — one poll and one trivia question.
     #
@@ -401,7 +446,7 @@ def assemble_newsletter(
         send_day = issue.get("send_day", "")
         day_to_number = {"monday": 1, "wednesday": 2, "saturday": 3}
         ed_number = day_to_number.get(send_day, 1)
-        edition_blocks = repo.get_sponsor_blocks_for_edition(edition_slug, ed_number)
+        edition_blocks = shared.edition_sponsor_blocks(edition_slug, ed_number)
         # Merge: edition blocks fill in positions not already taken by issue blocks
         existing_positions = {b["position"] for b in sponsor_blocks}
         for eb in edition_blocks:
@@ -436,14 +481,9 @@ def assemble_newsletter(
     # Config-driven and disabled by default; renders one positioned CTA
     # routed by edition. Licensee/city editions inherit it automatically
     # since they flow through this same assembly path.
-    promo_cfg = getattr(config, "promo", None)
-    if promo_cfg is not None:
-        import os
-        from weeklyamp.content.promo import build_promo_block, effective_promo_config
-        # Overlay any runtime admin edits (copy/routing/targets) stored in
-        # admin_settings; env kill-switch still wins on `enabled`.
-        env_forced = os.getenv("WEEKLYAMP_PROMO_ENABLED", "").lower() in ("1", "true", "yes")
-        promo_cfg = effective_promo_config(repo, promo_cfg, env_forced=env_forced)
+    if getattr(config, "promo", None) is not None:
+        from weeklyamp.content.promo import build_promo_block
+        promo_cfg = shared.promo_config()
         click_base = config.site_domain if promo_cfg.track_clicks else ""
         promo = build_promo_block(
             promo_cfg, edition_slug, audience=edition_audience,
@@ -485,6 +525,147 @@ def assemble_newsletter(
     return html, plain_text
 
 
+def assemble_newsletter(
+    repo: Repository, issue_id: int, config: AppConfig,
+    subscriber_id: int | None = None,
+    preheader_text: str = "",
+) -> tuple[str, str]:
+    """Assemble approved drafts into final HTML.
+
+    When ``subscriber_id`` is provided AND
+    ``config.genre_preferences.weight_sections_by_genre`` is on, sections
+    are reordered by the subscriber's combined genre + click affinity
+    via :class:`GenreEngine.rank_sections_for_subscriber`. Otherwise the
+    static editorial ``sort_order`` is used. Per-subscriber assembly is
+    cheap (~one GenreEngine call) but only worth doing in delivery code
+    paths that already loop per-subscriber (e.g. SMTP single-send) —
+    bulk-sender APIs that fan out one HTML to many recipients can stick
+    with the unpersonalized form.
+
+    To assemble several issues at once (a multi-edition send day), use
+    :func:`assemble_issues`.
+
+    Returns (html_content, plain_text).
+    """
+    issue = repo.get_issue(issue_id)
+    if not issue:
+        raise ValueError(f"Issue {issue_id} not found")
+
+    drafts = repo.get_drafts_for_issue(issue_id)
+    shared = _SharedData(repo, config, {issue_id: drafts})
+    drafts = _ordered_drafts(repo, drafts, config, shared, subscriber_id)
+    # Inline: per-subscriber assembly calls this once per recipient, and
+    # after the first call every body is a cache hit.
+    rendered = _render_bodies(repo, drafts, processes=1)
+    sections_html, plain_parts, section_summaries = _build_sections(issue, drafts, shared, rendered)
+
+    # Generate AI welcome intro and PS closing (edition-aware)
+    edition_name, _audience = _edition_context(issue, shared)
+    welcome_intro = _generate_welcome_intro(issue, section_summaries, config, edition_name)
+    ps_closing = _generate_ps_closing(issue, section_summaries, config, edition_name)
+
+    return _finish(
+        repo, issue, config, shared, sections_html, plain_parts,
+        welcome_intro, ps_closing, preheader_text,
+    )
+
+
+def assemble_issues(
+    repo: Repository, issue_ids: list[int], config: AppConfig,
+    *,
+    preheader_text: str = "",
+    processes: int | None = None,
+    llm_workers: int = 8,
+) -> dict:
+    """Assemble several issues in one pass — every edition of a send day.
+
+    Produces the same output as calling :func:`assemble_newsletter` per
+    issue, but:
+
+    * reference data (section map, editions, writers, sources, promo
+      config, guest/submission/editorial lookups) is loaded once for the
+      whole batch instead of per issue and per draft;
+    * draft bodies not already in the render cache are converted and
+      sanitized in one :func:`markdown_to_html_many` call, on a process
+      pool when the batch is big enough and there are cores to spare
+      (``processes``);
+    * the intro and PS prompts for all issues run concurrently on up to
+      ``llm_workers`` threads.
+
+    Returns ``{"issues": {issue_id: {"html", "plain", "timings"}},
+    "timings": {...}}``; timings are seconds. Raises ValueError before
+    doing any work if an issue does not exist.
+    """
+    started = time.perf_counter()
+    issues = {issue_id: repo.get_issue(issue_id) for issue_id in issue_ids}
+    missing = [issue_id for issue_id, issue in issues.items() if not issue]
+    if missing:
+        raise ValueError(f"Issues not found: {missing}")
+
+    drafts_by_issue = repo.get_drafts_for_issues(list(issues))
+    shared = _SharedData(repo, config, {i: drafts_by_issue.get(i, []) for i in issues})
+    ordered = {i: _ordered_drafts(repo, drafts_by_issue.get(i, []), config, shared) for i in issues}
+    loaded = time.perf_counter()
+
+    rendered = _render_bodies(repo, [d for drafts in ordered.values() for d in drafts], processes)
+    converted = time.perf_counter()
+
+    timings: dict[int, dict] = {i: {} for i in issues}
+    built: dict[int, tuple] = {}
+    for issue_id, issue in issues.items():
+        t = time.perf_counter()
+        built[issue_id] = _build_sections(issue, ordered[issue_id], shared, rendered)
+        timings[issue_id]["sections_s"] = time.perf_counter() - t
+
+    def _timed(fn, issue_id: int, key: str):
+        issue = issues[issue_id]
+        edition_name, _audience = _edition_context(issue, shared)
+        t = time.perf_counter()
+        try:
+            return fn(issue, built[issue_id][2], config, edition_name)
+        finally:
+            timings[issue_id][key] = time.perf_counter() - t
+
+    # Editions are looked up above, on this thread, so the prompt threads
+    # only call the LLM.
+    with ThreadPoolExecutor(max_workers=max(1, llm_workers), thread_name_prefix="weeklyamp-assembly") as pool:
+        intros = {
+            i: pool.submit(contextvars.copy_context().run, _timed, _generate_welcome_intro, i, "intro_s")
+            for i in issues
+        }
+        closings = {
+            i: pool.submit(contextvars.copy_context().run, _timed, _generate_ps_closing, i, "ps_s")
+            for i in issues
+        }
+        intros = {i: f.result() for i, f in intros.items()}
+        closings = {i: f.result() for i, f in closings.items()}
+    prompted = time.perf_counter()
+
+    results: dict[int, dict] = {}
+    for issue_id, issue in issues.items():
+        t = time.perf_counter()
+        sections_html, plain_parts, _summaries = built[issue_id]
+        html, plain = _finish(
+            repo, issue, config, shared, sections_html, plain_parts,
+            intros[issue_id], closings[issue_id], preheader_text,
+        )
+        timings[issue_id]["finish_s"] = time.perf_counter() - t
+        results[issue_id] = {"html": html, "plain": plain, "timings": timings[issue_id]}
+
+    finished = time.perf_counter()
+    batch = {
+        "load_s": loaded - started,
+        "markdown_s": converted - loaded,
+        "llm_s": prompted - converted,
+        "total_s": finished - started,
+    }
+    logger.info(
+        "Assembled %d issues in %.2fs (load %.2fs, markdown %.2fs for %d bodies, llm %.2fs)",
+        len(results), batch["total_s"], batch["load_s"], batch["markdown_s"], len(rendered), batch["llm_s"],
+    )
+    return {"issues": results, "timings": batch}
+
+
 def get_subscriber_segments(repo) -> dict:
     """Group subscribers into segments by genre preference and engagement level.
 
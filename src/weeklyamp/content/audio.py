@@ -1,13 +1,30 @@
 """Audio newsletter generation via Text-to-Speech.
 
 DISABLED by default — requires audio.enabled=true and configured TTS provider.
-Supports OpenAI TTS API. ElevenLabs support is placeholder for future.
+Supports OpenAI TTS API, plus an offline ``stub`` provider that renders
+silence of the right length (dev/tests). ElevenLabs support is
+placeholder for future.
+
+The whole issue is read, not a truncated excerpt: the assembled plain
+text is split on its ``=== Section ===`` headings, each section is packed
+into provider-sized chunks on sentence boundaries, and the chunks are
+synthesized concurrently. Chunk audio is cached on disk by a hash of
+(provider, voice, text), so regenerating after a one-section edit only
+re-synthesizes that section. The chunks are concatenated into one MP3
+whose ID3 tag carries a chapter (CHAP) per section; the same chapters
+are written alongside as Podcasting 2.0 JSON.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
+import re
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -17,14 +34,351 @@ from weeklyamp.db.repository import Repository
 logger = logging.getLogger(__name__)
 
 AUDIO_DIR = Path(__file__).parent.parent.parent.parent / "data" / "audio"
+# A render still marked processing after this long lost its worker, and
+# the issue is picked up again.
+AUDIO_STALE_SECONDS = 30 * 60
+# Cached chunks unused for this long are pruned; a render touches every
+# chunk it reuses.
+CHUNK_CACHE_MAX_AGE_DAYS = 30
+
+
+# ---------------------------------------------------------------------------
+# Providers
+# ---------------------------------------------------------------------------
+
+class OpenAITTSProvider:
+    """OpenAI ``tts-1``. One client is shared by the worker threads."""
+
+    name = "openai"
+    max_chars = 4096
+    model = "tts-1"
+
+    def __init__(self, config: AppConfig) -> None:
+        self.voice = config.audio.voice_id or "alloy"
+        import openai
+        self._client = openai.OpenAI()
+
+    @property
+    def cache_tag(self) -> str:
+        return f"{self.name}:{self.model}:{self.voice}"
+
+    def synthesize(self, text: str) -> bytes:
+        response = self._client.audio.speech.create(
+            model=self.model,
+            voice=self.voice,
+            input=text,
+            response_format="mp3",
+        )
+        return response.content
+
+
+class StubTTSProvider:
+    """Offline provider: silent MP3 frames lasting the text's reading time.
+
+    Output is valid MPEG-1 Layer III (32 kbps, 44.1 kHz, mono), so the
+    concatenation, duration and chapter code paths run exactly as they
+    do for real audio.
+    """
+
+    name = "stub"
+    chars_per_second = 15
+
+    _FRAME_HEADER = b"\xff\xfb\x10\xc0"
+    _FRAME_BYTES = 104  # 144 * 32000 // 44100
+    _FRAME_MS = 1152 / 44100 * 1000
+
+    def __init__(self, max_chars: int = 1000) -> None:
+        self.max_chars = max_chars
+        self.calls = 0
+
+    @property
+    def cache_tag(self) -> str:
+        return f"{self.name}:{self.max_chars}"
+
+    def synthesize(self, text: str) -> bytes:
+        self.calls += 1
+        seconds = max(1.0, len(text) / self.chars_per_second)
+        frames = int(seconds * 1000 / self._FRAME_MS) + 1
+        frame = self._FRAME_HEADER + b"\x00" * (self._FRAME_BYTES - 4)
+        return frame * frames
+
+
+def get_tts_provider(config: AppConfig):
+    """Return the configured provider, or None if it is unknown."""
+    provider = config.audio.tts_provider
+    if provider == "openai":
+        return OpenAITTSProvider(config)
+    if provider == "stub":
+        return StubTTSProvider()
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Chunking
+# ---------------------------------------------------------------------------
+
+_SECTION_HEADING_RE = re.compile(r"^=== (.+?) ===[ \t]*$", re.MULTILINE)
+_RULE_LINE_RE = re.compile(r"^[ \t]*[=\-_*]{3,}[ \t]*$", re.MULTILINE)
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?…])\s+")
+
+
+def split_sections(plain_text: str) -> list[tuple[str, str]]:
+    """Split assembled plain text into ``(chapter_title, text)`` pairs.
+
+    Text before the first heading becomes "Introduction". Decorative
+    rule lines are dropped; empty sections are skipped.
+    """
+    text = _RULE_LINE_RE.sub("", plain_text or "")
+    parts = _SECTION_HEADING_RE.split(text)
+    sections = []
+    if parts[0].strip():
+        sections.append(("Introduction", parts[0].strip()))
+    for i in range(1, len(parts), 2):
+        body = parts[i + 1].strip()
+        if body:
+            sections.append((parts[i].strip(), f"{parts[i].strip()}.\n\n{body}"))
+    return sections
+
+
+def _sentences(paragraph: str, max_chars: int):
+    """Sentences of a paragraph, hard-split at whitespace if over ``max_chars``."""
+    for sentence in _SENTENCE_SPLIT_RE.split(paragraph):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            yield sentence[:cut]
+            sentence = sentence[cut:].lstrip()
+        if sentence:
+            yield sentence
+
+
+def chunk_text(text: str, max_chars: int) -> list[str]:
+    """Pack ``text`` into chunks of at most ``max_chars``.
+
+    Breaks fall between paragraphs or sentences, and only inside a
+    sentence (at whitespace) when a single sentence is too long.
+    """
+    chunks: list[str] = []
+    current = ""
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = " ".join(paragraph.split())
+        sep = "\n\n"
+        for sentence in _sentences(paragraph, max_chars):
+            if current and len(current) + len(sep) + len(sentence) > max_chars:
+                chunks.append(current)
+                current = ""
+            current = f"{current}{sep}{sentence}" if current else sentence
+            sep = " "
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def build_chunks(plain_text: str, max_chars: int) -> list[dict]:
+    """Chunks for a whole issue: ``[{"chapter", "text"}]`` in reading order.
+
+    Chunks never span sections, so an edit in one section leaves every
+    other section's chunks (and their cache keys) unchanged.
+    """
+    return [
+        {"chapter": title, "text": chunk}
+        for title, body in split_sections(plain_text)
+        for chunk in chunk_text(body, max_chars)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# MP3 helpers
+# ---------------------------------------------------------------------------
+
+_MP3_BITRATES = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def _strip_id3(data: bytes) -> bytes:
+    """Drop a leading ID3v2 tag so chunks concatenate as plain frames."""
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        footer = 10 if data[5] & 0x10 else 0
+        return data[10 + size + footer:]
+    return data
+
+
+def mp3_duration_ms(data: bytes) -> int:
+    """Duration of MPEG Layer III audio, by walking its frame headers."""
+    pos, total_ms, n = 0, 0.0, len(data)
+    while pos + 4 <= n:
+        if data[pos] != 0xFF or (data[pos + 1] & 0xE0) != 0xE0:
+            pos += 1
+            continue
+        version = (data[pos + 1] >> 3) & 0x03  # 3 = MPEG1, 2 = MPEG2, 0 = MPEG2.5
+        layer = (data[pos + 1] >> 1) & 0x03     # 1 = Layer III
+        bitrate_idx = data[pos + 2] >> 4
+        rate_idx = (data[pos + 2] >> 2) & 0x03
+        if version == 1 or layer != 1 or bitrate_idx in (0, 15) or rate_idx == 3:
+            pos += 1
+            continue
+        bitrate = _MP3_BITRATES[1 if version == 3 else 2][bitrate_idx] * 1000
+        sample_rate = _MP3_SAMPLE_RATES[version][rate_idx]
+        padding = (data[pos + 2] >> 1) & 0x01
+        samples = 1152 if version == 3 else 576
+        frame_len = samples // 8 * bitrate // sample_rate + padding
+        total_ms += samples * 1000 / sample_rate
+        pos += frame_len
+    return int(total_ms)
+
+
+def _id3_frame(frame_id: bytes, payload: bytes) -> bytes:
+    return frame_id + struct.pack(">IH", len(payload), 0) + payload
+
+
+def _id3_title(title: str) -> bytes:
+    return _id3_frame(b"TIT2", b"\x01" + title.encode("utf-16") + b"\x00\x00")
+
+
+def _id3_chapters_tag(chapters: list[dict]) -> bytes:
+    """ID3v2.3 tag with a CHAP frame per chapter and a CTOC listing them."""
+    chapters = chapters[:255]
+    frames = []
+    ids = []
+    for i, ch in enumerate(chapters):
+        element_id = f"ch{i}".encode("latin-1")
+        ids.append(element_id)
+        frames.append(_id3_frame(
+            b"CHAP",
+            element_id + b"\x00"
+            + struct.pack(">IIII", ch["start_ms"], ch["end_ms"], 0xFFFFFFFF, 0xFFFFFFFF)
+            + _id3_title(ch["title"]),
+        ))
+    toc = (
+        b"toc\x00" + b"\x03" + bytes([len(ids)])
+        + b"".join(e + b"\x00" for e in ids)
+    )
+    body = _id3_frame(b"CTOC", toc) + b"".join(frames)
+    size = len(body)
+    syncsafe = bytes(((size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F))
+    return b"ID3\x03\x00\x00" + syncsafe + body
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+def _chunk_key(provider, text: str) -> str:
+    return hashlib.sha256(f"{provider.cache_tag}\0{text}".encode("utf-8")).hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def render_audio(
+    plain_text: str,
+    provider,
+    output_path: Path,
+    *,
+    cache_dir: Path,
+    max_workers: int = 4,
+) -> dict:
+    """Synthesize ``plain_text`` into a chaptered MP3 at ``output_path``.
+
+    Uncached chunks are synthesized on up to ``max_workers`` threads; any
+    chunk failure raises after the others finish, leaving the successful
+    ones cached for the retry. Returns ``{"duration_ms", "chapters",
+    "chunks", "synthesized"}``.
+    """
+    chunks = build_chunks(plain_text, provider.max_chars)
+    if not chunks:
+        raise ValueError("no speakable text")
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for chunk in chunks:
+        chunk["path"] = cache_dir / f"{_chunk_key(provider, chunk['text'])}.mp3"
+
+    missing: dict[Path, str] = {}
+    for chunk in chunks:
+        try:
+            os.utime(chunk["path"])
+        except FileNotFoundError:
+            missing.setdefault(chunk["path"], chunk["text"])
+
+    def _synthesize(item: tuple[Path, str]) -> None:
+        path, text = item
+        _write_atomic(path, _strip_id3(provider.synthesize(text)))
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            # list() re-raises the first failure once every call returns.
+            list(pool.map(_synthesize, missing.items()))
+
+    # Chapter times come from the chunk durations, so the tag (which
+    # precedes the audio) can be written before streaming the frames.
+    chapters: list[dict] = []
+    elapsed = 0
+    for chunk in chunks:
+        duration = mp3_duration_ms(chunk["path"].read_bytes())
+        if chapters and chapters[-1]["title"] == chunk["chapter"]:
+            chapters[-1]["end_ms"] = elapsed + duration
+        else:
+            chapters.append({"title": chunk["chapter"], "start_ms": elapsed, "end_ms": elapsed + duration})
+        elapsed += duration
+
+    tmp = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as out:
+        out.write(_id3_chapters_tag(chapters))
+        for chunk in chunks:
+            out.write(chunk["path"].read_bytes())
+    os.replace(tmp, output_path)
+
+    return {
+        "duration_ms": elapsed,
+        "chapters": chapters,
+        "chunks": len(chunks),
+        "synthesized": len(missing),
+    }
+
+
+def prune_chunk_cache(max_age_days: int = CHUNK_CACHE_MAX_AGE_DAYS) -> int:
+    """Delete cached chunks no render has used in ``max_age_days``; returns how many."""
+    cache_dir = AUDIO_DIR / "chunks"
+    if not cache_dir.is_dir():
+        return 0
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for path in cache_dir.iterdir():
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
+
+
+def _write_chapters_json(path: Path, chapters: list[dict]) -> None:
+    """Podcasting 2.0 JSON chapters (https://github.com/Podcastindex-org/podcast-namespace)."""
+    doc = {
+        "version": "1.2.0",
+        "chapters": [
+            {"startTime": ch["start_ms"] / 1000, "endTime": ch["end_ms"] / 1000, "title": ch["title"]}
+            for ch in chapters
+        ],
+    }
+    _write_atomic(path, json.dumps(doc, ensure_ascii=False).encode("utf-8"))
 
 
 def generate_audio_newsletter(
-    repo: Repository, config: AppConfig, issue_id: int
+    repo: Repository, config: AppConfig, issue_id: int, provider=None,
 ) -> Optional[int]:
     """Convert assembled newsletter plain text to speech.
 
-    Uses OpenAI TTS API to generate an MP3 file.
+    Renders the full issue through the chunked pipeline (see module
+    docstring) using the configured provider, or ``provider`` if given.
     Creates an audio_issues record in the database.
     Returns the audio_issue ID on success, None on failure.
     """
@@ -50,61 +404,40 @@ def generate_audio_newsletter(
     audio_id = repo.create_audio_issue(issue_id, edition_slug, config.audio.tts_provider)
 
     try:
-        # Ensure audio directory exists
-        AUDIO_DIR.mkdir(parents=True, exist_ok=True)
-
-        # Truncate text if too long for TTS (OpenAI limit is ~4096 chars per request)
-        max_chars = 4000
-        if len(plain_text) > max_chars:
-            plain_text = plain_text[:max_chars] + "\n\n...Content truncated for audio version."
-
-        if config.audio.tts_provider == "openai":
-            audio_path = _generate_openai_tts(plain_text, issue_id, config)
-        else:
+        if provider is None:
+            provider = get_tts_provider(config)
+        if provider is None:
             logger.warning("Unknown TTS provider: %s", config.audio.tts_provider)
             repo.update_audio_issue(audio_id, status="failed")
             return None
 
-        if audio_path and audio_path.exists():
-            file_size = audio_path.stat().st_size
-            audio_url = f"/audio/{issue_id}"
-            repo.update_audio_issue(
-                audio_id,
-                audio_url=audio_url,
-                file_size_bytes=file_size,
-                status="complete",
-            )
-            logger.info("Audio generated for issue %d: %s (%d bytes)", issue_id, audio_path, file_size)
-            return audio_id
-        else:
-            repo.update_audio_issue(audio_id, status="failed")
-            return None
-
-    except Exception:
-        logger.exception("Audio generation failed for issue %d", issue_id)
-        repo.update_audio_issue(audio_id, status="failed")
-        return None
-
-
-def _generate_openai_tts(text: str, issue_id: int, config: AppConfig) -> Optional[Path]:
-    """Generate audio using OpenAI's TTS API."""
-    try:
-        import openai
-        client = openai.OpenAI()
-        voice = config.audio.voice_id or "alloy"
-
-        response = client.audio.speech.create(
-            model="tts-1",
-            voice=voice,
-            input=text,
+        repo.update_audio_issue(audio_id, status="processing")
+        AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+        audio_path = AUDIO_DIR / f"issue_{issue_id}.mp3"
+        result = render_audio(
+            plain_text, provider, audio_path,
+            cache_dir=AUDIO_DIR / "chunks",
+            max_workers=config.audio.max_concurrency,
         )
+        _write_chapters_json(AUDIO_DIR / f"issue_{issue_id}.chapters.json", result["chapters"])
 
-        output_path = AUDIO_DIR / f"issue_{issue_id}.mp3"
-        response.stream_to_file(str(output_path))
-        return output_path
+        file_size = audio_path.stat().st_size
+        repo.update_audio_issue(
+            audio_id,
+            audio_url=f"/audio/{issue_id}",
+            file_size_bytes=file_size,
+            duration_seconds=result["duration_ms"] // 1000,
+            status="complete",
+        )
+        logger.info(
+            "Audio generated for issue %d: %s (%d bytes, %d chunks, %d synthesized)",
+            issue_id, audio_path, file_size, result["chunks"], result["synthesized"],
+        )
+        return audio_id
 
     except Exception:
-        logger.exception("OpenAI TTS generation failed")
+        logger.exception("Audio generation failed for issue %d", issue_id)
+        repo.update_audio_issue(audio_id, status="failed")
         return None
 
 
@@ -112,3 +445,9 @@ def get_audio_file_path(issue_id: int) -> Optional[Path]:
     """Get the file path for an audio issue if it exists."""
     path = AUDIO_DIR / f"issue_{issue_id}.mp3"
     return path if path.exists() else None
+
+
+def get_chapters_path(issue_id: int) -> Optional[Path]:
+    """Get the JSON chapters file for an audio issue if it exists."""
+    path = AUDIO_DIR / f"issue_{issue_id}.chapters.json"
+    return path if path.exists() else None
@@ -111,6 +111,11 @@ _WEEKDAY_NAMES = [
 
 EDITION_SLUG = "daily-action"
 
+# Stand-in for the subscriber token in a shared render. Tokens are
+# URL-safe, so swapping this out after rendering is equivalent to
+# rendering with the real token.
+_TOKEN_SLOT = "__DA_SUBSCRIBER_TOKEN__"
+
 
 # ---------------------------------------------------------------------
 # Date helpers
@@ -471,6 +476,29 @@ def mark_done(
         conn.close()
 
 
+# How far back a streak can reach. A year and change of daily actions is
+# well past anyone's real streak, and it bounds both the per-subscriber
+# and the bulk query.
+_STREAK_WINDOW_DAYS = 400
+# Subscriber ids per IN (...) list in the bulk streak query.
+_STREAK_CHUNK = 500
+
+
+def _streak_from_dates(done: set[str], today: date) -> int:
+    """Count consecutive completed days in ``done`` ending at ``today``."""
+    streak = 0
+    cursor = today
+    # Walk backwards; a day with no send scheduled can't break a streak.
+    for _ in range(_STREAK_WINDOW_DAYS):
+        iso = _iso(cursor)
+        if iso in done:
+            streak += 1
+        elif cursor != today:
+            break
+        cursor -= timedelta(days=1)
+    return streak
+
+
 def streak_for_subscriber(
     repo: Repository, subscriber_id: int, today: Optional[date] = None
 ) -> int:
@@ -488,24 +516,56 @@ def streak_for_subscriber(
             """SELECT action_date FROM daily_action_completions
                WHERE subscriber_id = ?
                ORDER BY action_date DESC
-               LIMIT 400""",
-            (subscriber_id,),
+               LIMIT ?""",
+            (subscriber_id, _STREAK_WINDOW_DAYS),
         ).fetchall()
     finally:
         conn.close()
 
-    done = {dict(r)["action_date"] for r in rows}
-    streak = 0
-    cursor = today
-    # Walk backwards; a day with no send scheduled can't break a streak.
-    for _ in range(400):
-        iso = _iso(cursor)
-        if iso in done:
-            streak += 1
-        elif cursor != today:
-            break
-        cursor -= timedelta(days=1)
-    return streak
+    return _streak_from_dates({dict(r)["action_date"] for r in rows}, today)
+
+
+def streaks_for_subscribers(
+    repo: Repository, subscriber_ids, today: Optional[date] = None
+) -> dict[int, int]:
+    """Return ``{subscriber_id: streak}`` for many subscribers in one query.
+
+    The send path used to call :func:`streak_for_subscriber` once per
+    recipient, which is one round-trip per inbox. Here the completions in
+    the streak window are read for the given subscribers only, in
+    ``IN (...)`` chunks of ``_STREAK_CHUNK`` ids, and grouped in Python.
+    The window bound is an ISO string computed here, so the query still
+    does no date maths of its own. Subscribers with no completions are
+    present in the result with a streak of 0.
+    """
+    today = today or date.today()
+    wanted = {int(sid) for sid in subscriber_ids if sid}
+    streaks = {sid: 0 for sid in wanted}
+    if not wanted:
+        return streaks
+
+    since = _iso(today - timedelta(days=_STREAK_WINDOW_DAYS))
+    ids = sorted(wanted)
+    done_by_sub: dict[int, set[str]] = {}
+    conn = repo._conn()
+    try:
+        for i in range(0, len(ids), _STREAK_CHUNK):
+            chunk = ids[i:i + _STREAK_CHUNK]
+            rows = conn.execute(
+                f"""SELECT subscriber_id, action_date FROM daily_action_completions
+                    WHERE subscriber_id IN ({", ".join("?" * len(chunk))})
+                      AND action_date >= ? AND action_date <= ?""",
+                (*chunk, since, _iso(today)),
+            ).fetchall()
+            for row in rows:
+                row = dict(row)
+                done_by_sub.setdefault(row["subscriber_id"], set()).add(row["action_date"])
+    finally:
+        conn.close()
+
+    for sid, done in done_by_sub.items():
+        streaks[sid] = _streak_from_dates(done, today)
+    return streaks
 
 
 def completion_count(repo: Repository, issue_id: int) -> int:
@@ -535,10 +595,12 @@ def send_daily_action(
     Refuses to send twice for the same day, and refuses to send a draft
     that has not been approved while ``require_approval`` is on.
 
-    Each recipient gets their own render so the "Mark it done" link and
-    streak count are personal. That personalization runs through
-    :meth:`SMTPSender.send_bulk`'s ``personalize`` hook, which falls back
-    to the stored bulk HTML if one recipient's render raises.
+    The "Mark it done" link and streak count are personal. Streaks are
+    loaded for every recipient up front, the body is rendered once per
+    distinct streak value, and each recipient's token is slotted into that
+    render through :meth:`SMTPSender.send_bulk`'s ``personalize`` hook,
+    which falls back to the stored bulk HTML if one recipient's render
+    raises.
     """
     on_date = on_date or date.today()
     da_cfg = config.daily_action
@@ -569,18 +631,33 @@ def send_daily_action(
     }
     pillar = issue["pillar"]
 
+    # Streaks for the whole list in one grouped query, not one per inbox.
+    streaks: dict[int, int] = {}
+    if da_cfg.show_streak:
+        try:
+            streaks = streaks_for_subscribers(
+                repo, [r.get("id") for r in recipients], on_date
+            )
+        except Exception:
+            logger.exception("daily_action: bulk streak lookup failed")
+
+    # The body is identical for every reader who shares a streak count, so
+    # it is rendered once per distinct streak with a slot where the
+    # subscriber token goes. Per recipient that leaves a string replace.
+    rendered: dict[int, tuple[str, str]] = {}
+
     def _personalize(recipient: dict) -> tuple[str, str]:
         token = recipient.get("unsubscribe_token", "") or ""
-        streak = 0
-        if da_cfg.show_streak and recipient.get("id"):
-            try:
-                streak = streak_for_subscriber(repo, recipient["id"], on_date)
-            except Exception:
-                logger.exception("daily_action: streak lookup failed")
-        return render_daily_action(
-            composed, pillar, on_date, config,
-            issue_id=issue["id"], subscriber_token=token, streak=streak,
-        )
+        streak = streaks.get(recipient.get("id") or 0, 0)
+        if streak not in rendered:
+            rendered[streak] = render_daily_action(
+                composed, pillar, on_date, config,
+                issue_id=issue["id"], subscriber_token=_TOKEN_SLOT, streak=streak,
+            )
+        html, text = rendered[streak]
+        # No token means the anonymous link: no ``?s=`` at all.
+        slot, fill = (_TOKEN_SLOT, token) if token else (f"?s={_TOKEN_SLOT}", "")
+        return html.replace(slot, fill), text.replace(slot, fill)
 
     from weeklyamp.delivery.smtp_sender import SMTPSender
 
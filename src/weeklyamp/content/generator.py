@@ -15,8 +15,10 @@ Two public entry points:
 from __future__ import annotations
 
 import logging
+import time
 from typing import Optional
 
+from weeklyamp.core import metrics
 from weeklyamp.core.models import AIProvider, AppConfig
 
 logger = logging.getLogger(__name__)
@@ -108,16 +110,22 @@ def generate_draft_with_usage(
     attributes tokens to the right price tier.
     """
     if config.ai.provider == AIProvider.ANTHROPIC:
-        return _generate_anthropic(
-            prompt, config, max_tokens_override, system_prompt, model_override
-        )
+        provider, generate = "anthropic", _generate_anthropic
     elif config.ai.provider == AIProvider.OPENAI:
-        return _generate_openai(
-            prompt, config, max_tokens_override, system_prompt, model_override
-        )
+        provider, generate = "openai", _generate_openai
     else:
         raise ValueError(f"Unknown AI provider: {config.ai.provider}")
 
+    started = time.perf_counter()
+    content, model, tokens_used = generate(
+        prompt, config, max_tokens_override, system_prompt, model_override
+    )
+    # The provider helpers swallow API errors and return empty content.
+    metrics.record_llm_call(
+        provider, model, time.perf_counter() - started, tokens_used, ok=bool(content),
+    )
+    return content, model, tokens_used
+
 
 def _generate_anthropic(
     prompt: str, config: AppConfig, max_tokens_override: Optional[int] = None,
@@ -0,0 +1,183 @@
+"""Markdown → sanitized HTML for draft bodies.
+
+Every draft body goes through ``markdown.markdown(..., extensions=["extra"])``
+and then bleach's html5lib-based :func:`sanitize_html`, several ms of pure
+Python per section. Results are cached by :func:`content_hash`:
+
+* in-process, in an LRU shared by assembly and the web ``markdown``
+  filter;
+* in the ``rendered_markdown`` table, written when a draft is created or
+  its content updated (:func:`renders_for_storage`) and read in bulk by
+  :func:`markdown_to_html_many` when it is given a repository.
+
+:func:`markdown_to_html_many` converts whatever is left of a batch,
+de-duplicated, and spreads large batches over a process pool (the work
+holds the GIL, so threads would not help).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import multiprocessing
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import markdown
+
+from weeklyamp.web.sanitize import sanitize_html
+
+logger = logging.getLogger(__name__)
+
+# Below this many documents per worker, process start-up and pickling
+# cost more than the conversion itself.
+_MIN_PER_PROCESS = 8
+
+# Part of every content hash. Bump it when the markdown extensions or the
+# sanitizer allow-list change, so cached and persisted HTML is re-rendered.
+_RENDERER = "markdown-extra+bleach:1"
+
+# Persisted renderings older than this are pruned by the scheduler's
+# cache_maintenance job; anything still in use is re-rendered and stored.
+PERSISTED_MAX_AGE_DAYS = 30
+
+_CACHE_SIZE = 1024
+_cache: OrderedDict[str, str] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def content_hash(text: str) -> str:
+    """Cache key for ``text``'s rendering."""
+    return hashlib.sha256(f"{_RENDERER}\0{text}".encode()).hexdigest()
+
+
+def _cached(digest: str) -> Optional[str]:
+    with _cache_lock:
+        html = _cache.get(digest)
+        if html is not None:
+            _cache.move_to_end(digest)
+        return html
+
+
+def _remember(digest: str, html: str) -> None:
+    with _cache_lock:
+        _cache[digest] = html
+        _cache.move_to_end(digest)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def clear_cache() -> None:
+    """Drop the in-process cache (tests)."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def _render(text: str) -> str:
+    return sanitize_html(markdown.markdown(text, extensions=["extra"]))
+
+
+def markdown_to_html(text: str) -> str:
+    """Render one markdown document to sanitized HTML."""
+    digest = content_hash(text)
+    html = _cached(digest)
+    if html is None:
+        html = _render(text)
+        _remember(digest, html)
+    return html
+
+
+def split_headline(raw_content: str) -> tuple[str, str]:
+    """(headline, body): a markdown heading on the first non-empty line is the headline."""
+    for line in raw_content.split("\n"):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        heading_match = re.match(r"^#{1,3}\s+(.+)$", stripped)
+        if heading_match:
+            # Remove the heading line from body
+            return heading_match.group(1).strip(), raw_content.replace(line, "", 1).strip()
+        break  # Only check the first non-empty line
+    return "", raw_content
+
+
+def renders_for_storage(content: str) -> list[tuple[str, str]]:
+    """``(content_hash, html)`` rows to persist for a draft's content.
+
+    Covers both renderings that get asked for: the whole draft (review
+    and draft pages) and the body under its headline (assembly).
+    """
+    texts = dict.fromkeys([content, split_headline(content)[1]])
+    return [(content_hash(text), markdown_to_html(text)) for text in texts]
+
+
+def _workers(processes: Optional[int], count: int) -> int:
+    if processes is None:
+        processes = int(os.environ.get("WEEKLYAMP_RENDER_PROCESSES") or os.cpu_count() or 1)
+    return max(1, min(processes, count // _MIN_PER_PROCESS))
+
+
+def _context():
+    # forkserver children fork from a clean process that already imported
+    # this module, so they start fast without inheriting the web worker's
+    # threads and locks the way a plain fork would.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload([__name__])
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+def markdown_to_html_many(texts: list[str], processes: Optional[int] = None, repo=None) -> list[str]:
+    """Render many documents; results are in input order.
+
+    Cached renderings are reused. With ``repo``, the rest are looked up
+    in the persisted ``rendered_markdown`` rows first, and anything
+    rendered here is saved there. ``processes`` caps the pool (default
+    ``WEEKLYAMP_RENDER_PROCESSES``, else the CPU count); small batches and
+    ``processes=1`` run inline. If the pool can't be used the batch is
+    rendered inline instead.
+    """
+    digests = {text: content_hash(text) for text in texts}
+    by_text: dict[str, str] = {}
+    for text, digest in digests.items():
+        html = _cached(digest)
+        if html is not None:
+            by_text[text] = html
+    missing = [text for text in digests if text not in by_text]
+
+    if missing and repo is not None:
+        stored = repo.get_rendered_markdown([digests[text] for text in missing])
+        for text in missing:
+            html = stored.get(digests[text])
+            if html is not None:
+                by_text[text] = html
+                _remember(digests[text], html)
+        missing = [text for text in missing if text not in by_text]
+
+    if missing:
+        workers = _workers(processes, len(missing))
+        rendered: Optional[list[str]] = None
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=_context()) as pool:
+                    rendered = list(pool.map(_render, missing, chunksize=max(1, len(missing) // (workers * 4))))
+            except Exception:
+                logger.warning("Markdown process pool unavailable — rendering inline", exc_info=True)
+        if rendered is None:
+            rendered = [_render(text) for text in missing]
+        for text, html in zip(missing, rendered):
+            by_text[text] = html
+            _remember(digests[text], html)
+        if repo is not None:
+            try:
+                repo.save_rendered_markdown([(digests[text], by_text[text]) for text in missing])
+            except Exception:
+                # The cache is an optimisation; a read-only or busy DB must not fail the render.
+                logger.warning("Could not persist rendered markdown", exc_info=True)
+
+    return [by_text[text] for text in texts]
@@ -9,15 +9,66 @@ from __future__ import annotations
 
 import json
 import logging
-from collections import defaultdict
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
 
 from weeklyamp.core.models import AppConfig
 from weeklyamp.db.repository import Repository
 
 logger = logging.getLogger(__name__)
 
+# slug -> (segment name, description). Segments are looked up by name.
+ENGAGEMENT_SEGMENTS: dict[str, tuple[str, str]] = {
+    "power_readers": ("Power Readers", "High engagement — opens and clicks consistently"),
+    "casual_readers": ("Casual Readers", "Moderate engagement — opens sometimes"),
+    "at_risk": ("At Risk", "Declining engagement — haven't opened recently"),
+    "dormant": ("Dormant", "No engagement in 30+ days"),
+    "new_subscribers": ("New Subscribers", "Subscribed in the last 14 days"),
+}
+
+# Clicks are worth three opens. "Within N days" below means fewer than
+# N + 1 whole days ago: the same boundaries as counting elapsed days.
+_CLASSIFY_SQL = """
+SELECT subscriber_id, score,
+       CASE
+           WHEN subscribed_at > ? THEN 'new_subscribers'
+           WHEN score >= 20 AND last_event_at > ? THEN 'power_readers'
+           WHEN score >= 5 AND last_event_at > ? THEN 'casual_readers'
+           WHEN last_event_at IS NULL OR last_event_at <= ? THEN 'dormant'
+           WHEN last_event_at <= ? THEN 'at_risk'
+           ELSE 'casual_readers'
+       END AS segment
+FROM (
+    SELECT s.id AS subscriber_id, s.subscribed_at, e.last_event_at,
+           COALESCE(e.opens, 0) * 1.0 + COALESCE(e.clicks, 0) * 3.0 AS score
+    FROM subscribers s
+    LEFT JOIN subscriber_engagement e ON e.subscriber_id = s.id
+    WHERE s.status = 'active'{where}
+) engagement
+"""
+_NEW_DAYS = 15  # subscribed within 14 days
+_ACTIVITY_CUTOFFS = (8, 15, 31)  # power/casual within 7 and 14 days, dormant after 30
+_CHUNK = 500
+
+
+def _ts(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _marks(items) -> str:
+    return ", ".join("?" * len(items))
+
+
+def _scoped(column: str, scope: Optional[set[int]]) -> Iterator[tuple[str, list[int]]]:
+    """``(extra WHERE clause, params)`` restricting ``column`` to ``scope`` in chunks."""
+    if scope is None:
+        yield "", []
+        return
+    ids = sorted(scope)
+    for i in range(0, len(ids), _CHUNK):
+        chunk = ids[i:i + _CHUNK]
+        yield f" AND {column} IN ({_marks(chunk)})", chunk
+
 
 class SegmentationEngine:
     """Cluster subscribers by engagement patterns for personalization."""
@@ -73,100 +124,220 @@ class SegmentationEngine:
 
     # ---- AI Auto-Segmentation ----
 
-    def compute_engagement_segments(self) -> dict:
+    def compute_engagement_segments(self, incremental: bool = False) -> dict:
         """Cluster subscribers into engagement-based segments using behavioral data.
 
         Creates/updates segments: power_readers, casual_readers, at_risk, dormant, new_subscribers
+
+        Counts come from the ``subscriber_engagement`` rollup, subscribers
+        are classified in one query, and memberships are diffed against
+        what is stored, so only changed rows are written — all in one
+        transaction. A full run rebuilds the rollup. ``incremental``
+        reclassifies only subscribers whose segment can have changed since
+        the last run: new events, a cutoff crossed with time, or a status
+        change. Falls back to a full run the first time.
+
+        Returns the member count per segment slug.
         """
+        now = datetime.utcnow()
         conn = self.repo._conn()
+        try:
+            seg_ids, last_run = self._engagement_segments(conn)
+            incremental = incremental and last_run is not None
+            changed = self._fold_tracking_events(conn, full=not incremental)
+            scope = self._reclassify_candidates(conn, changed, last_run, now, seg_ids) if incremental else None
+            desired = self._classify(conn, now, scope)
+            diff = self._apply_memberships(conn, seg_ids, desired, scope, now)
+            conn.commit()
+            counts = conn.execute(
+                f"SELECT id, subscriber_count FROM subscriber_segments WHERE id IN ({_marks(seg_ids)})",
+                list(seg_ids.values()),
+            ).fetchall()
+        finally:
+            conn.close()
 
-        # Get all active subscribers with engagement data
-        subscribers = conn.execute(
-            """SELECT s.id, s.email, s.created_at,
-                      COUNT(CASE WHEN ete.event_type = 'open' THEN 1 END) as opens,
-                      COUNT(CASE WHEN ete.event_type = 'click' THEN 1 END) as clicks,
-                      MAX(ete.created_at) as last_engagement
-               FROM subscribers s
-               LEFT JOIN email_tracking_events ete ON ete.subscriber_id = s.id
-               WHERE s.status = 'active'
-               GROUP BY s.id""",
-        ).fetchall()
-        conn.close()
-
-        # Define segment criteria
-        segments = {
-            "power_readers": {"name": "Power Readers", "desc": "High engagement — opens and clicks consistently", "members": []},
-            "casual_readers": {"name": "Casual Readers", "desc": "Moderate engagement — opens sometimes", "members": []},
-            "at_risk": {"name": "At Risk", "desc": "Declining engagement — haven't opened recently", "members": []},
-            "dormant": {"name": "Dormant", "desc": "No engagement in 30+ days", "members": []},
-            "new_subscribers": {"name": "New Subscribers", "desc": "Subscribed in the last 14 days", "members": []},
-        }
+        by_id = {r["id"]: r["subscriber_count"] for r in counts}
+        result = {slug: by_id.get(seg_id, 0) for slug, seg_id in seg_ids.items()}
+        logger.info(
+            "Engagement segments computed (%s, %s subscribers classified, +%d -%d ~%d): %s",
+            "incremental" if incremental else "full",
+            "all" if scope is None else len(scope), *diff, result,
+        )
+        return result
 
-        now = datetime.utcnow()
-        for sub in subscribers:
-            sub = dict(sub)
-            opens = sub.get("opens", 0)
-            clicks = sub.get("clicks", 0)
-            created = sub.get("created_at", "")
-
-            # Calculate days since last engagement
-            last_eng = sub.get("last_engagement")
-            days_inactive = 999
-            if last_eng:
-                try:
-                    last_dt = datetime.fromisoformat(str(last_eng).replace("Z", "+00:00").split("+")[0])
-                    days_inactive = (now - last_dt).days
-                except (ValueError, TypeError):
-                    pass
-
-            # Calculate days since subscription
-            days_subscribed = 999
-            if created:
-                try:
-                    created_dt = datetime.fromisoformat(str(created).replace("Z", "+00:00").split("+")[0])
-                    days_subscribed = (now - created_dt).days
-                except (ValueError, TypeError):
-                    pass
-
-            # Classify
-            score = opens * 1.0 + clicks * 3.0  # clicks are worth more
-            if days_subscribed <= 14:
-                segments["new_subscribers"]["members"].append((sub["id"], score))
-            elif score >= 20 and days_inactive <= 7:
-                segments["power_readers"]["members"].append((sub["id"], score))
-            elif score >= 5 and days_inactive <= 14:
-                segments["casual_readers"]["members"].append((sub["id"], score))
-            elif days_inactive > 30:
-                segments["dormant"]["members"].append((sub["id"], score))
-            elif days_inactive > 14:
-                segments["at_risk"]["members"].append((sub["id"], score))
-            else:
-                segments["casual_readers"]["members"].append((sub["id"], score))
-
-        # Persist segments
-        result = {}
-        for slug, seg_data in segments.items():
-            conn = self.repo._conn()
-            existing = conn.execute("SELECT id FROM subscriber_segments WHERE name = ?", (seg_data["name"],)).fetchone()
-            if existing:
-                seg_id = existing["id"]
-                conn.execute("DELETE FROM subscriber_segment_members WHERE segment_id = ?", (seg_id,))
-            else:
+    def _engagement_segments(self, conn) -> tuple[dict[str, int], Optional[datetime]]:
+        """Ids of the engagement segments (created if missing) and when they were last computed."""
+        names = {name: slug for slug, (name, _) in ENGAGEMENT_SEGMENTS.items()}
+        rows = conn.execute(
+            f"SELECT id, name, last_computed_at FROM subscriber_segments WHERE name IN ({_marks(names)})",
+            list(names),
+        ).fetchall()
+        seg_ids: dict[str, int] = {}
+        computed = []
+        for row in rows:
+            seg_ids.setdefault(names[row["name"]], row["id"])
+            computed.append(row["last_computed_at"])
+        for slug, (name, desc) in ENGAGEMENT_SEGMENTS.items():
+            if slug not in seg_ids:
                 cur = conn.execute(
                     "INSERT INTO subscriber_segments (name, description, segment_type, criteria_json) VALUES (?, ?, 'ai', ?)",
-                    (seg_data["name"], seg_data["desc"], json.dumps({"type": slug})),
+                    (name, desc, json.dumps({"type": slug})),
                 )
-                seg_id = cur.lastrowid
-            conn.commit()
-            conn.close()
+                seg_ids[slug] = cur.lastrowid
+                computed.append(None)
+        if any(c is None for c in computed):
+            return seg_ids, None
+        return seg_ids, min(datetime.fromisoformat(str(c)[:19]) for c in computed)
 
-            for sub_id, score in seg_data["members"]:
-                self.add_to_segment(seg_id, sub_id, score)
+    def _fold_tracking_events(self, conn, full: bool) -> set[int]:
+        """Add tracking events past the high-water mark to the rollup.
 
-            result[slug] = len(seg_data["members"])
+        ``full`` clears the rollup first and refolds every event. Returns
+        the subscribers that had new events. On Postgres an event whose id
+        was drawn before, but committed after, a run's high-water mark is
+        skipped until the next full run.
+        """
+        hi = conn.execute("SELECT MAX(id) AS hi FROM email_tracking_events").fetchone()["hi"] or 0
+        if full:
+            conn.execute("DELETE FROM subscriber_engagement WHERE subscriber_id <> 0")
+            lo = 0
+        else:
+            lo = conn.execute(
+                "SELECT last_event_id FROM subscriber_engagement WHERE subscriber_id = 0"
+            ).fetchone()["last_event_id"]
+        if hi <= lo:
+            return set()
 
-        logger.info("Engagement segments computed: %s", result)
-        return result
+        changed = {
+            r["subscriber_id"] for r in conn.execute(
+                "SELECT DISTINCT subscriber_id FROM email_tracking_events WHERE id > ? AND id <= ? AND subscriber_id > 0",
+                (lo, hi),
+            ).fetchall()
+        }
+        # SQLite stores event times in mixed formats; datetime() makes them comparable.
+        latest = "MAX(created_at)" if self.repo._is_pg else "MAX(datetime(created_at))"
+        returning = " RETURNING subscriber_id" if self.repo._is_pg else ""
+        conn.execute(
+            f"""INSERT INTO subscriber_engagement (subscriber_id, opens, clicks, last_event_at, last_event_id)
+               SELECT subscriber_id,
+                      SUM(CASE WHEN event_type = 'open' THEN 1 ELSE 0 END),
+                      SUM(CASE WHEN event_type = 'click' THEN 1 ELSE 0 END),
+                      {latest}, MAX(id)
+               FROM email_tracking_events
+               WHERE id > ? AND id <= ? AND subscriber_id > 0
+               GROUP BY subscriber_id
+               ON CONFLICT (subscriber_id) DO UPDATE SET
+                   opens = subscriber_engagement.opens + excluded.opens,
+                   clicks = subscriber_engagement.clicks + excluded.clicks,
+                   last_event_at = CASE
+                       WHEN subscriber_engagement.last_event_at IS NULL
+                         OR excluded.last_event_at > subscriber_engagement.last_event_at
+                       THEN excluded.last_event_at ELSE subscriber_engagement.last_event_at END,
+                   last_event_id = excluded.last_event_id{returning}""",
+            (lo, hi),
+        )
+        conn.execute("UPDATE subscriber_engagement SET last_event_id = ? WHERE subscriber_id = 0", (hi,))
+        return changed
+
+    def _reclassify_candidates(
+        self, conn, changed: set[int], last_run: datetime, now: datetime, seg_ids: dict[str, int],
+    ) -> set[int]:
+        """Subscribers whose segment may differ from the last run's."""
+        ids = set(changed)
+
+        def collect(sql: str, params: list) -> None:
+            ids.update(r["sid"] for r in conn.execute(sql, params).fetchall())
+
+        # Engagement that aged past one of the classification cutoffs.
+        for days in _ACTIVITY_CUTOFFS:
+            collect(
+                "SELECT subscriber_id AS sid FROM subscriber_engagement "
+                "WHERE subscriber_id <> 0 AND last_event_at > ? AND last_event_at <= ?",
+                [_ts(last_run - timedelta(days=days)), _ts(now - timedelta(days=days))],
+            )
+        # Joined since the last run, or aged out of new_subscribers.
+        collect("SELECT id AS sid FROM subscribers WHERE subscribed_at > ?", [_ts(last_run)])
+        collect(
+            "SELECT id AS sid FROM subscribers WHERE subscribed_at > ? AND subscribed_at <= ?",
+            [_ts(last_run - timedelta(days=_NEW_DAYS)), _ts(now - timedelta(days=_NEW_DAYS))],
+        )
+        # Status changes: active but unsegmented, or segmented but no longer active.
+        seg_list = list(seg_ids.values())
+        collect(
+            f"""SELECT s.id AS sid FROM subscribers s
+               WHERE s.status = 'active' AND NOT EXISTS (
+                   SELECT 1 FROM subscriber_segment_members m
+                   WHERE m.subscriber_id = s.id AND m.segment_id IN ({_marks(seg_list)}))""",
+            seg_list,
+        )
+        collect(
+            f"""SELECT m.subscriber_id AS sid FROM subscriber_segment_members m
+               JOIN subscribers s ON s.id = m.subscriber_id
+               WHERE m.segment_id IN ({_marks(seg_list)}) AND s.status <> 'active'""",
+            seg_list,
+        )
+        return ids
+
+    def _classify(self, conn, now: datetime, scope: Optional[set[int]]) -> dict[int, tuple[str, float]]:
+        """subscriber id -> (segment slug, score) for active subscribers in ``scope`` (None: all)."""
+        cutoffs = [
+            _ts(now - timedelta(days=_NEW_DAYS)),
+            _ts(now - timedelta(days=8)),
+            _ts(now - timedelta(days=15)),
+            _ts(now - timedelta(days=31)),
+            _ts(now - timedelta(days=15)),
+        ]
+        out: dict[int, tuple[str, float]] = {}
+        for where, ids in _scoped("s.id", scope):
+            for row in conn.execute(_CLASSIFY_SQL.format(where=where), cutoffs + ids).fetchall():
+                out[row["subscriber_id"]] = (row["segment"], float(row["score"]))
+        return out
+
+    def _apply_memberships(
+        self, conn, seg_ids: dict[str, int], desired: dict[int, tuple[str, float]],
+        scope: Optional[set[int]], now: datetime,
+    ) -> tuple[int, int, int]:
+        """Write only the membership rows that differ from ``desired``.
+
+        Returns (inserted, deleted, rescored).
+        """
+        seg_list = list(seg_ids.values())
+        current: dict[tuple[int, int], float] = {}
+        for where, ids in _scoped("subscriber_id", scope):
+            for row in conn.execute(
+                f"SELECT segment_id, subscriber_id, score FROM subscriber_segment_members "
+                f"WHERE segment_id IN ({_marks(seg_list)}){where}",
+                seg_list + ids,
+            ).fetchall():
+                current[(row["segment_id"], row["subscriber_id"])] = row["score"]
+
+        wanted = {(seg_ids[slug], sub_id): score for sub_id, (slug, score) in desired.items()}
+        deletes = [key for key in current if key not in wanted]
+        inserts = [(seg, sub, score) for (seg, sub), score in wanted.items() if (seg, sub) not in current]
+        rescored = [(score, seg, sub) for (seg, sub), score in wanted.items()
+                    if (seg, sub) in current and current[(seg, sub)] != score]
+
+        if deletes:
+            conn.executemany(
+                "DELETE FROM subscriber_segment_members WHERE segment_id = ? AND subscriber_id = ?", deletes,
+            )
+        if inserts:
+            conn.executemany(
+                "INSERT INTO subscriber_segment_members (segment_id, subscriber_id, score) VALUES (?, ?, ?)", inserts,
+            )
+        if rescored:
+            conn.executemany(
+                "UPDATE subscriber_segment_members SET score = ? WHERE segment_id = ? AND subscriber_id = ?", rescored,
+            )
+        conn.execute(
+            f"""UPDATE subscriber_segments SET
+                   subscriber_count = (SELECT COUNT(*) FROM subscriber_segment_members m
+                                       WHERE m.segment_id = subscriber_segments.id),
+                   last_computed_at = ?
+               WHERE id IN ({_marks(seg_list)})""",
+            [_ts(now)] + seg_list,
+        )
+        return len(inserts), len(deletes), len(rescored)
 
     def personalize_section_order(self, subscriber_id: int, section_slugs: list[str]) -> list[str]:
         """Reorder sections based on subscriber's engagement profile.
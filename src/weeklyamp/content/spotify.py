@@ -1,10 +1,19 @@
-"""Spotify Web API client for artist lookups and release tracking."""
+"""Spotify Web API client for artist lookups and release tracking.
+
+All clients share one pooled ``httpx.Client`` (keep-alive connections,
+thread-safe), so the concurrent release scan reuses TCP/TLS sessions
+instead of opening one per call. 429 responses are honoured process-wide:
+the Retry-After delay pauses every thread, not just the one that was
+throttled, since Spotify rate-limits per app.
+"""
 
 from __future__ import annotations
 
 import json
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Optional
 
 import httpx
@@ -24,6 +33,7 @@ class SpotifyClient:
         self.config = config
         self._access_token: str = ""
         self._token_expires_at: float = 0.0
+        self._token_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Authentication
@@ -36,7 +46,7 @@ class SpotifyClient:
         the token expires.
         """
         logger.info("Authenticating with Spotify (client credentials)")
-        resp = httpx.post(
+        resp = _get_client().post(
             TOKEN_URL,
             data={"grant_type": "client_credentials"},
             auth=(self.config.client_id, self.config.client_secret),
@@ -54,6 +64,12 @@ class SpotifyClient:
     # Internal request helper
     # ------------------------------------------------------------------
 
+    def _ensure_token(self, force: bool = False) -> str:
+        with self._token_lock:
+            if force or not self._access_token or time.time() >= self._token_expires_at:
+                self.authenticate()
+            return self._access_token
+
     def _request(
         self,
         method: str,
@@ -63,21 +79,45 @@ class SpotifyClient:
         """Make an authenticated request to the Spotify Web API.
 
         Automatically refreshes the access token when it is expired or
-        missing.
+        missing (and once more on a 401). 429s wait for Retry-After and
+        5xx/transport errors back off exponentially, up to
+        ``config.max_retries`` retries.
         """
-        if not self._access_token or time.time() >= self._token_expires_at:
-            self.authenticate()
-
         url = f"{API_BASE}/{path}"
-        resp = httpx.request(
-            method,
-            url,
-            params=params,
-            headers={"Authorization": f"Bearer {self._access_token}"},
-            timeout=15,
-        )
-        resp.raise_for_status()
-        return resp.json()
+        token = self._ensure_token()
+        refreshed = False
+        attempt = 0
+        while True:
+            _wait_for_cooldown()
+            try:
+                resp = _get_client().request(
+                    method,
+                    url,
+                    params=params,
+                    headers={"Authorization": f"Bearer {token}"},
+                )
+            except httpx.TransportError:
+                if attempt >= self.config.max_retries:
+                    raise
+                time.sleep(_backoff(attempt))
+                attempt += 1
+                continue
+
+            if resp.status_code == 401 and not refreshed:
+                token = self._ensure_token(force=True)
+                refreshed = True
+                continue
+            if (resp.status_code == 429 or resp.status_code >= 500) and attempt < self.config.max_retries:
+                if resp.status_code == 429:
+                    delay = _retry_after(resp, attempt)
+                    logger.warning("Spotify rate limited; pausing %.1fs", delay)
+                    _start_cooldown(delay)
+                else:
+                    time.sleep(_backoff(attempt))
+                attempt += 1
+                continue
+            resp.raise_for_status()
+            return resp.json()
 
     # ------------------------------------------------------------------
     # Public API methods
@@ -121,6 +161,19 @@ class SpotifyClient:
             "external_url": item.get("external_urls", {}).get("spotify", ""),
         }
 
+    @staticmethod
+    def _album(item: dict) -> dict:
+        images = item.get("images") or []
+        return {
+            "id": item["id"],
+            "name": item["name"],
+            "release_date": item.get("release_date", ""),
+            "album_type": item.get("album_group", item.get("album_type", "album")),
+            "total_tracks": item.get("total_tracks", 0),
+            "image_url": images[0]["url"] if images else "",
+            "external_url": item.get("external_urls", {}).get("spotify", ""),
+        }
+
     def get_artist_albums(self, spotify_id: str, limit: int = 20) -> list[dict]:
         """Return the artist's albums and singles."""
         data = self._request(
@@ -128,18 +181,34 @@ class SpotifyClient:
             f"artists/{spotify_id}/albums",
             params={"include_groups": "album,single", "limit": limit},
         )
+        return [self._album(item) for item in data.get("items", [])]
+
+    def get_albums_since(self, spotify_id: str, since: str, page_size: int = 50) -> list[dict]:
+        """Albums and singles released on or after ``since``.
+
+        Spotify lists each include_group newest first, so each group is
+        paged only until it reaches an older release. An empty ``since``
+        (first scan) fetches one page per group.
+        """
+        since_key = _date_key(since) if since else ""
         albums: list[dict] = []
-        for item in data.get("items", []):
-            images = item.get("images") or []
-            albums.append({
-                "id": item["id"],
-                "name": item["name"],
-                "release_date": item.get("release_date", ""),
-                "album_type": item.get("album_group", item.get("album_type", "album")),
-                "total_tracks": item.get("total_tracks", 0),
-                "image_url": images[0]["url"] if images else "",
-                "external_url": item.get("external_urls", {}).get("spotify", ""),
-            })
+        for group in ("album", "single"):
+            offset = 0
+            while True:
+                data = self._request(
+                    "GET",
+                    f"artists/{spotify_id}/albums",
+                    params={"include_groups": group, "limit": page_size, "offset": offset},
+                )
+                items = data.get("items", [])
+                fresh = [
+                    self._album(item) for item in items
+                    if not since_key or _date_key(item.get("release_date", "")) >= since_key
+                ]
+                albums.extend(fresh)
+                if not since_key or len(fresh) < len(items) or not data.get("next"):
+                    break
+                offset += page_size
         return albums
 
     def get_artist_top_tracks(self, spotify_id: str, market: str = "US") -> list[dict]:
@@ -199,3 +268,122 @@ class SpotifyClient:
             )
         logger.info("Synced %d releases for artist %s", len(albums), spotify_id)
         return len(albums)
+
+
+# ----------------------------------------------------------------------
+# Concurrent release scanning
+# ----------------------------------------------------------------------
+
+def scan_releases(client: SpotifyClient, repo: Any, spotify_ids: list[str]) -> dict:
+    """Incrementally sync releases for many artists in parallel.
+
+    Fetches run on ``config.scan_concurrency`` threads and only look at
+    releases on or after each artist's watermark in spotify_release_watermarks.
+    Writes stay on the calling thread and are batched. Returns
+    ``{"artists", "synced", "failed", "releases"}``.
+    """
+    watermarks = repo.get_spotify_release_watermarks()
+    ids = list(dict.fromkeys(sid for sid in spotify_ids if sid))
+    stats = {"artists": len(ids), "synced": 0, "failed": 0, "releases": 0}
+    new_marks: dict[str, str] = {}
+
+    workers = max(1, min(client.config.scan_concurrency, len(ids) or 1))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="spotify") as pool:
+        futures = {
+            pool.submit(client.get_albums_since, sid, watermarks.get(sid, "")): sid
+            for sid in ids
+        }
+        for future in as_completed(futures):
+            sid = futures[future]
+            try:
+                albums = future.result()
+            except Exception:
+                logger.warning("Spotify release scan failed for %s", sid, exc_info=True)
+                stats["failed"] += 1
+                continue
+            repo.upsert_spotify_releases([
+                {
+                    "spotify_artist_id": sid,
+                    "album_id": a["id"],
+                    "album_name": a["name"],
+                    "release_date": a.get("release_date", ""),
+                    "album_type": a.get("album_type", "album"),
+                    "image_url": a.get("image_url", ""),
+                    "external_url": a.get("external_url", ""),
+                }
+                for a in albums
+            ])
+            newest = max((a.get("release_date", "") for a in albums), key=_date_key, default="")
+            old = watermarks.get(sid, "")
+            new_marks[sid] = newest if _date_key(newest) > _date_key(old) else old
+            stats["synced"] += 1
+            stats["releases"] += len(albums)
+
+    repo.set_spotify_release_watermarks(new_marks)
+    return stats
+
+
+# ----------------------------------------------------------------------
+# Shared HTTP client and rate-limit state
+# ----------------------------------------------------------------------
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+_cooldown_until = 0.0
+_cooldown_lock = threading.Lock()
+
+_MAX_RETRY_AFTER = 120.0
+
+
+def _get_client() -> httpx.Client:
+    global _client
+    with _client_lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.Client(
+                timeout=15,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            )
+    return _client
+
+
+def close_client() -> None:
+    """Close the shared Spotify client. Call during application shutdown."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def _start_cooldown(seconds: float) -> None:
+    global _cooldown_until
+    with _cooldown_lock:
+        _cooldown_until = max(_cooldown_until, time.monotonic() + seconds)
+
+
+def _wait_for_cooldown() -> None:
+    remaining = _cooldown_until - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def _retry_after(resp: httpx.Response, attempt: int) -> float:
+    try:
+        return min(max(float(resp.headers.get("Retry-After", "")), 0.0), _MAX_RETRY_AFTER)
+    except ValueError:
+        return _backoff(attempt)
+
+
+def _backoff(attempt: int) -> float:
+    return min(0.5 * 2 ** attempt, 30.0)
+
+
+def _date_key(release_date: str) -> str:
+    """Comparable form of a Spotify release_date, which may have year,
+    month or day precision ("2024", "2024-05", "2024-05-17")."""
+    release_date = release_date or ""
+    if len(release_date) == 4:
+        return release_date + "-00-00"
+    if len(release_date) == 7:
+        return release_date + "-00"
+    return release_date
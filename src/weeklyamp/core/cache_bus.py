@@ -0,0 +1,146 @@
+"""Cross-worker invalidation for in-process caches.
+
+Feature flags, the admin password hash, white-label domain routing and
+the public-page response cache all keep values in process memory. An
+admin write used to clear only the copy in the worker that handled it;
+every other uvicorn worker served the stale value until restart.
+
+Each cache namespace has a row in ``cache_versions``. The repository
+write paths bump that row in the same transaction as the data change.
+Every worker calls :func:`poll` per request; it costs one clock read
+until ``POLL_INTERVAL`` has passed, then one small query that reads all
+versions and runs the handlers registered (via :func:`subscribe`) for
+each namespace whose version moved. All workers converge within
+``POLL_INTERVAL`` seconds.
+
+On Postgres the bump also sends ``NOTIFY weeklyamp_cache``. A listener
+thread started with :func:`start_listener` marks the bus dirty when one
+arrives, so the next request polls at once instead of waiting out the
+interval.
+"""
+
+from __future__ import annotations
+
+import logging
+import select
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "weeklyamp_cache"
+POLL_INTERVAL = 5.0
+
+FEATURE_FLAGS = "feature_flags"
+ADMIN_SETTINGS = "admin_settings"
+DOMAINS = "domains"
+ISSUES = "issues"
+
+_handlers: dict[str, list[Callable[[], None]]] = {}
+_versions: dict[str, int] = {}
+_next_poll = 0.0
+_dirty = threading.Event()
+_poll_lock = threading.Lock()
+_stop = threading.Event()
+_listener: Optional[threading.Thread] = None
+
+
+def subscribe(namespace: str, fn: Callable[[], None]) -> None:
+    """Run ``fn`` whenever another write moves ``namespace``'s version."""
+    fns = _handlers.setdefault(namespace, [])
+    if fn not in fns:
+        fns.append(fn)
+
+
+def due() -> bool:
+    """True when the next :func:`poll` would query the database."""
+    return _dirty.is_set() or time.monotonic() >= _next_poll
+
+
+def poll(repo=None, force: bool = False) -> list[str]:
+    """Read cache versions if due and run handlers for the ones that moved.
+
+    Returns the namespaces whose handlers ran. Only one thread polls at
+    a time; the others skip rather than queue up behind it. The first
+    poll in a process treats every namespace as moved, which clears
+    anything cached before the bus saw its versions.
+    """
+    global _next_poll
+    if not force and not due():
+        return []
+    if not _poll_lock.acquire(blocking=False):
+        return []
+    try:
+        _next_poll = time.monotonic() + POLL_INTERVAL
+        _dirty.clear()
+        if repo is None:
+            from weeklyamp.web.deps import get_repo
+            repo = get_repo()
+        versions = repo.get_cache_versions()
+        changed = [ns for ns, v in versions.items() if _versions.get(ns) != v]
+        _versions.update(versions)
+    except Exception:
+        logger.debug("cache version poll failed", exc_info=True)
+        return []
+    finally:
+        _poll_lock.release()
+
+    for namespace in changed:
+        for fn in _handlers.get(namespace, ()):
+            try:
+                fn()
+            except Exception:
+                logger.exception("Cache invalidation handler for %s failed", namespace)
+    return changed
+
+
+def _listen(database_url: str) -> None:
+    import psycopg2
+    import psycopg2.extensions
+
+    backoff = 1.0
+    while not _stop.is_set():
+        conn = None
+        try:
+            conn = psycopg2.connect(database_url)
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            conn.cursor().execute(f"LISTEN {CHANNEL}")
+            # Anything bumped while we were disconnected is picked up here.
+            _dirty.set()
+            backoff = 1.0
+            while not _stop.is_set():
+                if select.select([conn], [], [], 5.0)[0]:
+                    conn.poll()
+                    if conn.notifies:
+                        conn.notifies.clear()
+                        _dirty.set()
+        except Exception:
+            logger.warning("Cache invalidation listener lost its connection; retrying in %.0fs", backoff,
+                           exc_info=True)
+            _stop.wait(backoff)
+            backoff = min(backoff * 2, 60.0)
+        finally:
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
+
+def start_listener(database_url: str) -> None:
+    """Start the Postgres LISTEN thread for this process (idempotent)."""
+    global _listener
+    if not database_url or (_listener is not None and _listener.is_alive()):
+        return
+    _stop.clear()
+    _listener = threading.Thread(target=_listen, args=(database_url,), name="cache-bus", daemon=True)
+    _listener.start()
+
+
+def stop_listener() -> None:
+    global _listener
+    _stop.set()
+    if _listener is not None:
+        _listener.join(timeout=10)
+        _listener = None
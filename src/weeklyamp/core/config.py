@@ -32,12 +32,15 @@ from weeklyamp.core.models import (
     PodcastConfig,
     PromoConfig,
     RateLimitConfig,
+    ResponseCacheConfig,
     ReengagementConfig,
     ReferralConfig,
     RolesConfig,
     ScheduleConfig,
     SchedulerConfig,
     SponsorSlotsConfig,
+    StartupConfig,
+    MetricsConfig,
     ArtistProfilesConfig,
     ContestsConfig,
     GenrePreferencesConfig,
@@ -121,6 +124,11 @@ def load_config(config_path: Optional[str] = None) -> AppConfig:
             "artist": "newsletter-artist",
             "industry": "newsletter-industry",
         }),
+        requests_per_second=ghl_data.get("requests_per_second", 9.0),
+        burst=ghl_data.get("burst", 10),
+        push_concurrency=ghl_data.get("push_concurrency", 4),
+        page_size=ghl_data.get("page_size", 100),
+        full_sync_hours=ghl_data.get("full_sync_hours", 24),
     )
 
     # Schedule config
@@ -176,6 +184,28 @@ def load_config(config_path: Optional[str] = None) -> AppConfig:
         submit_window=int(os.getenv("WEEKLYAMP_RATE_SUBMIT_WINDOW", rl_data.get("submit_window", 900))),
     )
 
+    # Public page response cache
+    rc_data = yaml_data.get("response_cache", {})
+    response_cache = ResponseCacheConfig(
+        enabled=os.getenv("WEEKLYAMP_RESPONSE_CACHE", str(rc_data.get("enabled", True))).lower() in ("true", "1", "yes"),
+        max_entries=int(rc_data.get("max_entries", 500)),
+        max_bytes=int(rc_data.get("max_bytes", 64 * 1024 * 1024)),
+    )
+
+    # Boot-time work
+    st_data = yaml_data.get("startup", {})
+    startup = StartupConfig(
+        seed_on_boot=os.getenv("WEEKLYAMP_SEED_ON_BOOT", str(st_data.get("seed_on_boot", True))).lower() in ("true", "1", "yes"),
+        lazy_admin_routes=os.getenv("WEEKLYAMP_LAZY_ADMIN_ROUTES", str(st_data.get("lazy_admin_routes", True))).lower() in ("true", "1", "yes"),
+    )
+
+    # Instrumentation
+    mt_data = yaml_data.get("metrics", {})
+    metrics = MetricsConfig(
+        enabled=os.getenv("WEEKLYAMP_METRICS", str(mt_data.get("enabled", True))).lower() in ("true", "1", "yes"),
+        slow_query_ms=int(os.getenv("WEEKLYAMP_SLOW_QUERY_MS", mt_data.get("slow_query_ms", 0))),
+    )
+
     # Analytics config (with tracking sub-config)
     analytics_data = yaml_data.get("analytics", {})
     analytics = AnalyticsConfig(
@@ -221,6 +251,10 @@ def load_config(config_path: Optional[str] = None) -> AppConfig:
         inbound_secret=os.getenv("WEEKLYAMP_WEBHOOK_SECRET", wh_data.get("inbound_secret", "")),
         max_retries=wh_data.get("max_retries", 3),
         timeout_seconds=wh_data.get("timeout_seconds", 10),
+        max_concurrency=wh_data.get("max_concurrency", 8),
+        per_endpoint_concurrency=wh_data.get("per_endpoint_concurrency", 2),
+        retry_base_seconds=wh_data.get("retry_base_seconds", 30),
+        dispatch_batch_size=wh_data.get("dispatch_batch_size", 100),
     )
 
     # Referral config
@@ -247,6 +281,8 @@ def load_config(config_path: Optional[str] = None) -> AppConfig:
         client_secret=os.getenv("SPOTIFY_CLIENT_SECRET", sp_data.get("client_secret", "")),
         cache_ttl_hours=sp_data.get("cache_ttl_hours", 24),
         auto_lookup_submissions=sp_data.get("auto_lookup_submissions", False),
+        scan_concurrency=sp_data.get("scan_concurrency", 8),
+        max_retries=sp_data.get("max_retries", 4),
     )
 
     # Artist profiles config
@@ -401,6 +437,9 @@ def load_config(config_path: Optional[str] = None) -> AppConfig:
         franchise=franchise,
         data_product=data_product,
         rate_limits=rate_limits,
+        response_cache=response_cache,
+        startup=startup,
+        metrics=metrics,
         features=features,
         db_path=db_path,
         db_backend=db_backend,
@@ -6,15 +6,19 @@ is chosen by the ``WEEKLYAMP_DB_BACKEND`` env-var / config field.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
 import sqlite3
+import types
 
 logger = logging.getLogger(__name__)
 from pathlib import Path
 from typing import Optional, Union
 
 _SCHEMA_PATH = Path(__file__).parent.parent / "db" / "schema.sql"
+_SCHEMA_PG_PATH = Path(__file__).parent.parent / "db" / "schema_pg.sql"
 
 # ---------------------------------------------------------------------------
 # Backend detection
@@ -127,6 +131,136 @@ def get_schema_version(db_path: str = "", database_url: str = "", backend: str =
         conn.close()
 
 
+# ---------------------------------------------------------------------------
+# Startup fingerprints
+# ---------------------------------------------------------------------------
+
+def schema_fingerprint() -> str:
+    """Hash of the schema files and every migration this build ships."""
+    from weeklyamp.db.migrations import MIGRATIONS, PG_MIGRATIONS
+
+    h = hashlib.sha256()
+    h.update(_SCHEMA_PATH.read_bytes())
+    h.update(_SCHEMA_PG_PATH.read_bytes())
+    for version in sorted(MIGRATIONS):
+        h.update(f"{version}:{MIGRATIONS[version]}".encode())
+    for version in sorted(PG_MIGRATIONS):
+        h.update(f"pg{version}:{PG_MIGRATIONS[version]}".encode())
+    return h.hexdigest()
+
+
+def seed_fingerprint(features: Optional[dict[str, bool]] = None) -> str:
+    """Hash of the seed data: the DEFAULT_* lists, the rows seed_content
+    writes inline, sources.yaml and flag defaults.
+    """
+    from weeklyamp.core.config import _find_project_root
+
+    h = hashlib.sha256()
+    for name in sorted(n for n in globals() if n.startswith("DEFAULT_")):
+        h.update(f"{name}:{globals()[name]!r}".encode())
+    # seed_content's rows are literals in its body, i.e. its constants.
+    h.update(repr([c for c in seed_content.__code__.co_consts if not isinstance(c, types.CodeType)]).encode())
+    sources = _find_project_root() / "config" / "sources.yaml"
+    if sources.exists():
+        h.update(sources.read_bytes())
+    h.update(json.dumps(features or {}, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+def get_startup_state(db_path: str = "", database_url: str = "", backend: str = "") -> dict[str, str]:
+    """Stored fingerprints, or an empty dict for a new or pre-v65 database."""
+    backend = backend or _get_backend()
+    if backend != "postgres" and not Path(db_path or os.getenv("WEEKLYAMP_DB_PATH", "data/weeklyamp.db")).exists():
+        return {}
+    try:
+        conn = get_connection(db_path, database_url, backend)
+    except Exception:
+        return {}
+    try:
+        rows = conn.execute("SELECT key, value FROM startup_state").fetchall()
+        return {r["key"]: r["value"] for r in rows}
+    except Exception:
+        # Table not created yet — the caller runs the full init.
+        return {}
+    finally:
+        conn.close()
+
+
+def set_startup_state(key: str, value: str, db_path: str = "", database_url: str = "", backend: str = "") -> None:
+    backend = backend or _get_backend()
+    p = _ph(backend)
+    conn = get_connection(db_path, database_url, backend)
+    conn.execute(
+        f"INSERT INTO startup_state (key, value) VALUES ({p}, {p}) "
+        "ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = CURRENT_TIMESTAMP",
+        (key, value),
+    )
+    conn.commit()
+    conn.close()
+
+
+def seed_database(
+    db_path: str = "", database_url: str = "", backend: str = "",
+    features: Optional[dict[str, bool]] = None,
+) -> dict[str, int]:
+    """Run every seed step. Idempotent; returns rows added per step.
+
+    This is the ``weeklyamp seed`` one-shot. App boot calls it only when
+    the stored seed fingerprint is missing or out of date.
+    """
+    counts = {
+        "sections": seed_sections(db_path, database_url, backend),
+        "editions": seed_editions(db_path, database_url, backend),
+        "guest_contacts": seed_guest_contacts(db_path, database_url, backend),
+        "agents": seed_agents(db_path, database_url, backend),
+        "content": seed_content(db_path, database_url, backend),
+        "daily_actions": seed_daily_actions(db_path, database_url, backend),
+    }
+    from weeklyamp.db.repository import Repository
+    from weeklyamp.research.sources import sync_sources_from_config
+
+    repo = Repository(db_path, database_url, backend)
+    counts["sources"] = sync_sources_from_config(repo)
+    if features is not None:
+        from weeklyamp.core import feature_flags as ff
+        ff.seed_from_config(repo, features)
+    return counts
+
+
+def prepare_database(
+    db_path: str = "", database_url: str = "", backend: str = "",
+    features: Optional[dict[str, bool]] = None,
+    seed: bool = True,
+    force: bool = False,
+) -> dict[str, bool]:
+    """Boot-time schema and seed work, skipped when the fingerprints match.
+
+    Reads the stored fingerprints with one query. The schema file,
+    migrations and drift repair only run when this build's schema
+    fingerprint differs; the seed steps (when ``seed``) only when the
+    seed fingerprint does. ``force`` runs both regardless.
+
+    Returns ``{"schema": ran, "seed": ran}``.
+    """
+    backend = backend or _get_backend()
+    state = {} if force else get_startup_state(db_path, database_url, backend)
+    ran = {"schema": False, "seed": False}
+
+    schema_fp = schema_fingerprint()
+    if state.get("schema") != schema_fp:
+        init_database(db_path, database_url, backend)
+        set_startup_state("schema", schema_fp, db_path, database_url, backend)
+        ran["schema"] = True
+
+    seed_fp = seed_fingerprint(features)
+    if seed and state.get("seed") != seed_fp:
+        counts = seed_database(db_path, database_url, backend, features=features)
+        set_startup_state("seed", seed_fp, db_path, database_url, backend)
+        ran["seed"] = True
+        logger.info("Seeded database: %s", ", ".join(f"{k}={v}" for k, v in counts.items() if v))
+    return ran
+
+
 # Default section definitions to seed on init
 # (slug, display_name, sort_order, section_type, word_count_label, target_word_count, category, series_type, series_length, description)
 DEFAULT_SECTIONS = [
@@ -10,7 +10,9 @@ Flags resolve in this order (highest priority first):
 3. Hardcoded ``False`` — safety net if both DB and config miss.
 
 The DB lookup result is cached in-process until :func:`invalidate_cache`
-is called (which the admin-UI write path does on every toggle).
+is called. The admin-UI write path does that on every toggle, and the
+cache bus (:mod:`weeklyamp.core.cache_bus`) does it in every other
+worker once it sees the ``feature_flags`` version move.
 
 Canonical flag names live in :class:`FeatureFlag` so typos fail at
 import time instead of silently resolving to the hardcoded ``False``.
@@ -22,6 +24,8 @@ import logging
 import threading
 from typing import Optional
 
+from weeklyamp.core import cache_bus
+
 logger = logging.getLogger(__name__)
 
 
@@ -168,6 +172,9 @@ def invalidate_cache(key: Optional[str] = None) -> None:
             _cache.pop(key, None)
 
 
+cache_bus.subscribe(cache_bus.FEATURE_FLAGS, invalidate_cache)
+
+
 def enabled(name: str, *, repo=None) -> bool:
     """Return True if the named feature flag is on.
 
@@ -0,0 +1,215 @@
+"""In-process counters and histograms for the hot paths, in Prometheus format.
+
+What is measured, and where it is hooked in:
+
+* every query issued through ``Repository._conn()`` — count and latency
+  by statement kind, plus an optional slow-query log;
+* every HTTP request — latency by route template, and how many queries
+  it issued (``MetricsMiddleware``);
+* every scheduler and send job — duration and query count (:func:`job`);
+* every LLM call — latency and tokens by provider, model and caller
+  (the agent type, or ``app``);
+* every SMTP message and connection — outcome and latency.
+
+:func:`render` produces the Prometheus text exposition served at the
+admin-only ``/metrics``. Values live in this worker process only; with
+several workers each scrape reports the one that answered it.
+
+The registry is a dict of series behind one lock. No client library is
+needed, and an increment costs about a microsecond. ``configure`` turns
+collection off or sets the slow-query threshold from ``config.metrics``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("weeklyamp.slow_query")
+
+_SECONDS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+_COUNTS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+# name -> (type, help, buckets)
+_DEFS: dict[str, tuple[str, str, tuple]] = {
+    "weeklyamp_http_requests_total": ("counter", "HTTP requests by route template and status.", ()),
+    "weeklyamp_http_request_duration_seconds": ("histogram", "HTTP request latency until response headers.", _SECONDS),
+    "weeklyamp_http_request_db_queries": ("histogram", "Database queries issued per HTTP request.", _COUNTS),
+    "weeklyamp_db_queries_total": ("counter", "Queries issued through Repository connections.", ()),
+    "weeklyamp_db_query_duration_seconds": ("histogram", "Query execution time.", _SECONDS),
+    "weeklyamp_db_slow_queries_total": ("counter", "Queries slower than metrics.slow_query_ms.", ()),
+    "weeklyamp_job_duration_seconds": ("histogram", "Scheduler and send job run time.", _SECONDS),
+    "weeklyamp_job_db_queries": ("histogram", "Database queries issued per job run.", _COUNTS),
+    "weeklyamp_llm_request_duration_seconds": ("histogram", "LLM provider call latency.", _SECONDS),
+    "weeklyamp_llm_tokens_total": ("counter", "Tokens reported by the LLM provider.", ()),
+    "weeklyamp_smtp_messages_total": ("counter", "Messages handed to the SMTP server, by outcome.", ()),
+    "weeklyamp_smtp_send_duration_seconds": ("histogram", "Time to hand one message to the SMTP server.", _SECONDS),
+    "weeklyamp_smtp_connect_duration_seconds": ("histogram", "SMTP connect, STARTTLS and login time.", _SECONDS),
+}
+
+_lock = threading.Lock()
+# name -> {sorted label items -> float (counter) | [bucket counts..., sum, count] (histogram)}
+_series: dict[str, dict[tuple, object]] = {name: {} for name in _DEFS}
+
+_enabled = True
+_slow_query_seconds = 0.0
+
+# Per request / per job query tally: [count, seconds]. The list is shared,
+# not copied, by contexts derived from the scope (threadpool and
+# run_db calls copy the context), so their queries land in it too.
+_query_scope: ContextVar[Optional[list]] = ContextVar("weeklyamp_query_scope", default=None)
+_llm_caller: ContextVar[str] = ContextVar("weeklyamp_llm_caller", default="app")
+
+
+def configure(enabled: bool = True, slow_query_ms: float = 0) -> None:
+    """Apply ``config.metrics``; ``slow_query_ms`` of 0 turns the slow log off."""
+    global _enabled, _slow_query_seconds
+    _enabled = enabled
+    _slow_query_seconds = slow_query_ms / 1000.0
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def inc(name: str, amount: float = 1, **labels: str) -> None:
+    if not _enabled:
+        return
+    key = tuple(sorted(labels.items()))
+    with _lock:
+        series = _series[name]
+        series[key] = series.get(key, 0) + amount
+
+
+def observe(name: str, value: float, **labels: str) -> None:
+    if not _enabled:
+        return
+    buckets = _DEFS[name][2]
+    key = tuple(sorted(labels.items()))
+    with _lock:
+        series = _series[name]
+        state = series.get(key)
+        if state is None:
+            state = series[key] = [0] * len(buckets) + [0.0, 0]
+        for i, bound in enumerate(buckets):
+            if value <= bound:
+                state[i] += 1
+        state[-2] += value
+        state[-1] += 1
+
+
+def reset() -> None:
+    """Drop every recorded value (tests)."""
+    with _lock:
+        for series in _series.values():
+            series.clear()
+
+
+def _kind(sql: str) -> str:
+    word = sql.lstrip()[:6].lower()
+    return word if word in ("select", "insert", "update", "delete") else "other"
+
+
+def record_query(sql: str, seconds: float) -> None:
+    """Count one executed statement; called by the repository connections."""
+    if not _enabled:
+        return
+    kind = _kind(sql)
+    inc("weeklyamp_db_queries_total", kind=kind)
+    observe("weeklyamp_db_query_duration_seconds", seconds, kind=kind)
+    scope = _query_scope.get()
+    if scope is not None:
+        scope[0] += 1
+        scope[1] += seconds
+    if _slow_query_seconds and seconds >= _slow_query_seconds:
+        inc("weeklyamp_db_slow_queries_total", kind=kind)
+        # Statement text only: parameters can hold subscriber emails.
+        slow_query_logger.warning("slow query %.1f ms: %s", seconds * 1000, " ".join(sql.split())[:500])
+
+
+@contextlib.contextmanager
+def query_scope() -> Iterator[list]:
+    """Tally queries made inside the block: yields ``[count, seconds]``."""
+    tally = [0, 0.0]
+    token = _query_scope.set(tally)
+    try:
+        yield tally
+    finally:
+        _query_scope.reset(token)
+
+
+@contextlib.contextmanager
+def job(name: str) -> Iterator[None]:
+    """Record a job run's duration, outcome and query count."""
+    started = time.perf_counter()
+    outcome = "error"
+    with query_scope() as tally:
+        try:
+            yield
+            outcome = "ok"
+        finally:
+            observe("weeklyamp_job_duration_seconds", time.perf_counter() - started, job=name, outcome=outcome)
+            observe("weeklyamp_job_db_queries", tally[0], job=name)
+
+
+@contextlib.contextmanager
+def llm_caller(name: str) -> Iterator[None]:
+    """Attribute LLM calls made inside the block to ``name`` (an agent type)."""
+    token = _llm_caller.set(name or "app")
+    try:
+        yield
+    finally:
+        _llm_caller.reset(token)
+
+
+def record_llm_call(provider: str, model: str, seconds: float, tokens: int, ok: bool) -> None:
+    caller = _llm_caller.get()
+    observe(
+        "weeklyamp_llm_request_duration_seconds", seconds,
+        provider=provider, model=model, caller=caller, outcome="ok" if ok else "error",
+    )
+    if tokens:
+        inc("weeklyamp_llm_tokens_total", tokens, provider=provider, model=model, caller=caller)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(key: tuple, extra: tuple = ()) -> str:
+    items = key + extra
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in items) + "}"
+
+
+def _num(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render() -> str:
+    """Every series in the Prometheus text exposition format (0.0.4)."""
+    with _lock:
+        snapshot = {name: {k: (list(v) if isinstance(v, list) else v) for k, v in series.items()}
+                    for name, series in _series.items()}
+    lines: list[str] = []
+    for name, (kind, help_text, buckets) in _DEFS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for key, value in sorted(snapshot[name].items()):
+            if kind == "counter":
+                lines.append(f"{name}{_labels(key)} {_num(value)}")
+                continue
+            # Buckets are stored per-bound already cumulative: observe()
+            # counts a value into every bound it fits under.
+            for bound, count in zip(buckets, value):
+                lines.append(f"{name}_bucket{_labels(key, (('le', _num(float(bound))),))} {count}")
+            lines.append(f"{name}_bucket{_labels(key, (('le', '+Inf'),))} {value[-1]}")
+            lines.append(f"{name}_sum{_labels(key)} {_num(value[-2])}")
+            lines.append(f"{name}_count{_labels(key)} {value[-1]}")
+    return "\n".join(lines) + "\n"
@@ -695,6 +695,15 @@ class GHLConfig(BaseModel):
         "artist": "newsletter-artist",
         "industry": "newsletter-industry",
     })
+    # GHL allows 100 requests per 10 s per location; stay just under it.
+    requests_per_second: float = 9.0
+    burst: int = 10
+    push_concurrency: int = 4
+    page_size: int = 100
+    # The incremental cursor only sees newly added contacts, so a full pass
+    # (picking up tag, email and unsubscribe changes) runs at least this
+    # often. 0 turns the automatic full pass off.
+    full_sync_hours: int = 24
 
 
 class NewsletterConfig(BaseModel):
@@ -851,6 +860,10 @@ class WebhookConfig(BaseModel):
     inbound_secret: str = ""
     max_retries: int = 3
     timeout_seconds: int = 10
+    max_concurrency: int = 8  # deliveries in flight across all endpoints
+    per_endpoint_concurrency: int = 2  # in flight to any one host
+    retry_base_seconds: int = 30  # backoff: base * 2**(attempt-1)
+    dispatch_batch_size: int = 100  # outbox rows claimed per dispatch run
 
 
 class ReferralConfig(BaseModel):
@@ -881,6 +894,8 @@ class SpotifyConfig(BaseModel):
     client_secret: str = ""
     cache_ttl_hours: int = 24
     auto_lookup_submissions: bool = False
+    scan_concurrency: int = 8
+    max_retries: int = 4
 
 
 class ArtistProfilesConfig(BaseModel):
@@ -1017,6 +1032,7 @@ class AudioConfig(BaseModel):
     tts_provider: str = "openai"
     voice_id: str = ""
     output_format: str = "mp3"
+    max_concurrency: int = 4
 
 
 class CommunityConfig(BaseModel):
@@ -1137,6 +1153,25 @@ class RateLimitConfig(BaseModel):
     submit_window: int = 900
 
 
+class ResponseCacheConfig(BaseModel):
+    """In-memory cache of public pages served to anonymous visitors."""
+    enabled: bool = True
+    max_entries: int = 500
+    max_bytes: int = 64 * 1024 * 1024
+
+
+class StartupConfig(BaseModel):
+    """What app boot does before it accepts traffic."""
+    seed_on_boot: bool = True  # off when deploys run `weeklyamp seed` instead
+    lazy_admin_routes: bool = True
+
+
+class MetricsConfig(BaseModel):
+    """Request, query, job, LLM and SMTP instrumentation served at /metrics."""
+    enabled: bool = True
+    slow_query_ms: int = 0  # log queries at least this slow; 0 = off
+
+
 class AppConfig(BaseModel):
     newsletter: NewsletterConfig = Field(default_factory=NewsletterConfig)
     ai: AIConfig = Field(default_factory=AIConfig)
@@ -1179,6 +1214,9 @@ class AppConfig(BaseModel):
     franchise: FranchiseConfig = Field(default_factory=FranchiseConfig)
     data_product: DataProductConfig = Field(default_factory=DataProductConfig)
     rate_limits: RateLimitConfig = Field(default_factory=RateLimitConfig)
+    response_cache: ResponseCacheConfig = Field(default_factory=ResponseCacheConfig)
+    startup: StartupConfig = Field(default_factory=StartupConfig)
+    metrics: MetricsConfig = Field(default_factory=MetricsConfig)
     features: dict[str, bool] = Field(default_factory=dict)
     db_path: str = "data/weeklyamp.db"
     db_backend: str = "sqlite"  # "sqlite" or "postgres"
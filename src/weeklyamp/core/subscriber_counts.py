@@ -0,0 +1,50 @@
+"""Short-TTL in-process cache over the subscriber counters.
+
+``Repository.get_subscriber_count`` is already a primary-key read of the
+trigger-maintained ``subscriber_counters`` table. Public marketing pages
+show the number as social proof and are hit far more often than it
+changes, so they go through :func:`cached_subscriber_count`, which
+serves each count from memory for up to ``ttl`` seconds. Admin views and
+jobs that need the exact figure keep calling the repository directly.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 60.0
+
+_cache: dict[tuple[str, str], tuple[float, int]] = {}
+_lock = threading.Lock()
+
+
+def cached_subscriber_count(repo, edition_slug: str = "", ttl: float = DEFAULT_TTL_SECONDS) -> int:
+    """Active subscribers (optionally for one edition), at most ``ttl`` seconds old.
+
+    A failed read falls back to the last cached value, or 0 — a landing
+    page never errors over its social-proof number.
+    """
+    key = (repo.database_url or repo.db_path, edition_slug)
+    now = time.monotonic()
+    with _lock:
+        hit = _cache.get(key)
+    if hit and now - hit[0] < ttl:
+        return hit[1]
+    try:
+        count = repo.get_subscriber_count([edition_slug] if edition_slug else None)
+    except Exception:
+        logger.exception("Subscriber count read failed")
+        return hit[1] if hit else 0
+    with _lock:
+        _cache[key] = (now, count)
+    return count
+
+
+def invalidate_cache() -> None:
+    """Drop every cached count in this process."""
+    with _lock:
+        _cache.clear()
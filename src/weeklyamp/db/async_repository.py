@@ -0,0 +1,83 @@
+"""Awaitable access to the synchronous :class:`Repository` for async routes.
+
+Route handlers are ``async def`` but the repository is blocking sqlite3 /
+psycopg2 code, so calling it directly stalls every other request on the
+worker's event loop for the length of the query. :func:`run_db` runs a
+blocking callable on a dedicated, bounded thread pool instead, and
+:class:`AsyncRepository` exposes every public ``Repository`` method as a
+coroutine with the same signature::
+
+    repo = get_async_repo()
+    issue = await repo.get_issue(issue_id)
+
+The pool is separate from Starlette's default threadpool, so slow
+queries can't starve sync endpoints of threads, and it is sized by
+``WEEKLYAMP_DB_THREADS`` (default ``PG_POOL_MAX``, else 10) so that on
+Postgres no more queries run at once than the pool has connections.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from weeklyamp.db.repository import Repository
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _db_threads() -> int:
+    return int(os.environ.get("WEEKLYAMP_DB_THREADS") or os.environ.get("PG_POOL_MAX") or 10)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=_db_threads(), thread_name_prefix="weeklyamp-db")
+    return _executor
+
+
+async def run_db(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run blocking ``fn(*args, **kwargs)`` on the database thread pool."""
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, fn, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(_get_executor(), call)
+
+
+class AsyncRepository:
+    """Coroutine versions of every public :class:`Repository` method.
+
+    Private helpers (``_conn`` and friends) are deliberately not exposed:
+    raw-connection work belongs in a plain function passed to
+    :func:`run_db`, so the connection never crosses threads. The wrapped
+    repository is available as ``sync`` for code that is already off the
+    event loop.
+    """
+
+    def __init__(self, repo: Repository) -> None:
+        self.sync = repo
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attr = getattr(self.sync, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await run_db(attr, *args, **kwargs)
+
+        # Cache the bound wrapper so repeated calls skip __getattr__.
+        self.__dict__[name] = call
+        return call
@@ -1937,6 +1937,458 @@ CREATE TABLE IF NOT EXISTS daily_action_completions (
 CREATE INDEX IF NOT EXISTS idx_da_done_sub ON daily_action_completions(subscriber_id, action_date DESC);
 
 INSERT OR IGNORE INTO schema_version (version) VALUES (55);
+""",
+    56: """
+-- v56: Durable outbox for outbound webhooks.
+--
+-- fire_event() only writes here; the webhook_dispatch job drains it, so
+-- a publish never waits on a third-party endpoint. Timestamps are ISO
+-- text computed in Python (see v55) so "due" is a plain string compare
+-- on both backends. status: pending -> delivered | dead.
+CREATE TABLE IF NOT EXISTS webhook_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    webhook_id INTEGER NOT NULL REFERENCES webhooks(id),
+    event_type TEXT NOT NULL DEFAULT '',
+    payload_json TEXT NOT NULL DEFAULT '{}',
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at TEXT NOT NULL DEFAULT '',
+    claim_token TEXT NOT NULL DEFAULT '',
+    last_status INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT NOT NULL DEFAULT '',
+    delivered_at TEXT NOT NULL DEFAULT '',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_webhook_outbox_due ON webhook_outbox(status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS idx_webhook_outbox_claim ON webhook_outbox(claim_token);
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (56);
+""",
+    57: """
+-- v57: Materialized public feeds and archive pages.
+--
+-- One row per rendered document (RSS/JSON feeds, archive listings,
+-- archive issue pages). Rows are written on first request after a
+-- change and deleted by the Repository whenever an issue's status or
+-- assembled content changes, so every worker serves the same copy
+-- without re-running the N+1 build. last_modified is an RFC 7231 date.
+CREATE TABLE IF NOT EXISTS rendered_pages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cache_key TEXT NOT NULL UNIQUE,
+    content_type TEXT NOT NULL DEFAULT 'text/html',
+    body TEXT NOT NULL DEFAULT '',
+    etag TEXT NOT NULL DEFAULT '',
+    last_modified TEXT NOT NULL DEFAULT '',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_assembled_issue ON assembled_issues(issue_id, id);
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (57);
+""",
+    58: """
+-- v58: Full-text search index for the public archive.
+--
+-- SQLite uses an FTS5 table keyed by rowid = issues.id; PostgreSQL has
+-- its own v58 (see PG_MIGRATIONS) with a weighted tsvector + GIN index.
+-- Every assembled issue is indexed whatever its status; searches join
+-- issues to keep only published ones. Repository.save_assembled keeps
+-- the row current, and the INSERT below backfills existing issues.
+CREATE VIRTUAL TABLE IF NOT EXISTS archive_search USING fts5(
+    title, edition_slug, body,
+    tokenize = 'porter unicode61'
+);
+INSERT INTO archive_search (rowid, title, edition_slug, body)
+SELECT i.id, COALESCE(i.title, ''), COALESCE(i.edition_slug, ''), COALESCE(a.plain_text, '')
+FROM issues i
+JOIN assembled_issues a ON a.id = (
+    SELECT MAX(id) FROM assembled_issues WHERE issue_id = i.id
+)
+WHERE i.id NOT IN (SELECT rowid FROM archive_search);
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (58);
+""",
+    59: """
+-- v59: Incremental Spotify release scanning.
+--
+-- This added per-artist release watermarks as columns on
+-- spotify_artist_cache; they now live in their own table (v70), so the
+-- version only records that the step ran.
+INSERT OR IGNORE INTO schema_version (version) VALUES (59);
+""",
+    60: """
+-- v60: Trigger-maintained active-subscriber counters.
+--
+-- edition_id 0 holds the global count; every other row is one edition's
+-- count of active subscribers linked to it. Triggers on subscribers,
+-- subscriber_editions and newsletter_editions keep the rows current, so
+-- reading a count is a primary-key lookup instead of a table scan. The
+-- reconcile_subscriber_counters job recomputes them periodically.
+CREATE TABLE IF NOT EXISTS subscriber_counters (
+    edition_id INTEGER PRIMARY KEY,
+    active_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT OR IGNORE INTO subscriber_counters (edition_id, active_count)
+SELECT 0, COUNT(*) FROM subscribers WHERE status = 'active';
+
+INSERT OR IGNORE INTO subscriber_counters (edition_id, active_count)
+SELECT ne.id, (
+    SELECT COUNT(*) FROM subscriber_editions se
+    JOIN subscribers s ON s.id = se.subscriber_id
+    WHERE se.edition_id = ne.id AND s.status = 'active'
+) FROM newsletter_editions ne;
+
+CREATE TRIGGER IF NOT EXISTS trg_counters_edition_ins
+AFTER INSERT ON newsletter_editions
+BEGIN
+    INSERT OR IGNORE INTO subscriber_counters (edition_id, active_count) VALUES (NEW.id, 0);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_counters_subscriber_ins
+AFTER INSERT ON subscribers
+WHEN NEW.status = 'active'
+BEGIN
+    UPDATE subscriber_counters
+    SET active_count = active_count + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE edition_id = 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_counters_subscriber_del
+AFTER DELETE ON subscribers
+WHEN OLD.status = 'active'
+BEGIN
+    UPDATE subscriber_counters
+    SET active_count = active_count - 1, updated_at = CURRENT_TIMESTAMP
+    WHERE edition_id = 0
+       OR edition_id IN (SELECT edition_id FROM subscriber_editions WHERE subscriber_id = OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_counters_subscriber_status
+AFTER UPDATE OF status ON subscribers
+WHEN (COALESCE(OLD.status, '') = 'active') != (COALESCE(NEW.status, '') = 'active')
+BEGIN
+    UPDATE subscriber_counters
+    SET active_count = active_count + (CASE WHEN NEW.status = 'active' THEN 1 ELSE -1 END),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE edition_id = 0
+       OR edition_id IN (SELECT edition_id FROM subscriber_editions WHERE subscriber_id = NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_counters_link_ins
+AFTER INSERT ON subscriber_editions
+WHEN (SELECT status FROM subscribers WHERE id = NEW.subscriber_id) = 'active'
+BEGIN
+    UPDATE subscriber_counters
+    SET active_count = active_count + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE edition_id = NEW.edition_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_counters_link_del
+AFTER DELETE ON subscriber_editions
+WHEN (SELECT status FROM subscribers WHERE id = OLD.subscriber_id) = 'active'
+BEGIN
+    UPDATE subscriber_counters
+    SET active_count = active_count - 1, updated_at = CURRENT_TIMESTAMP
+    WHERE edition_id = OLD.edition_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_counters_link_upd
+AFTER UPDATE OF subscriber_id, edition_id ON subscriber_editions
+BEGIN
+    UPDATE subscriber_counters
+    SET active_count = active_count - 1, updated_at = CURRENT_TIMESTAMP
+    WHERE edition_id = OLD.edition_id
+      AND (SELECT status FROM subscribers WHERE id = OLD.subscriber_id) = 'active';
+    UPDATE subscriber_counters
+    SET active_count = active_count + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE edition_id = NEW.edition_id
+      AND (SELECT status FROM subscribers WHERE id = NEW.subscriber_id) = 'active';
+END;
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (60);
+""",
+    61: """
+-- v61: Cache invalidation versions.
+--
+-- One row per in-process cache namespace (feature_flags, admin_settings,
+-- domains, issues). Writes bump the row in the same transaction as the
+-- data change; every worker polls the table (and, on Postgres, listens
+-- for NOTIFY) and drops its cached copy when a version moves.
+CREATE TABLE IF NOT EXISTS cache_versions (
+    namespace TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (61);
+""",
+    62: """
+-- v62: Invoice number sequences and billing-period idempotency.
+--
+-- invoice_sequences holds the last number issued per prefix (LIC, ART,
+-- SUB), so numbering no longer counts the whole invoices table and two
+-- concurrent runs can't draw the same number. Numbers used to come from
+-- one global count, so every prefix starts after the current row count.
+--
+-- billing_period ('YYYY-MM') plus the partial unique index means an
+-- entity can be invoiced at most once per period: re-running the monthly
+-- job never double-bills.
+CREATE TABLE IF NOT EXISTS invoice_sequences (
+    prefix TEXT PRIMARY KEY,
+    last_value INTEGER NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO invoice_sequences (prefix, last_value)
+    SELECT 'LIC', COUNT(*) FROM invoices;
+INSERT OR IGNORE INTO invoice_sequences (prefix, last_value)
+    SELECT 'ART', COUNT(*) FROM invoices;
+INSERT OR IGNORE INTO invoice_sequences (prefix, last_value)
+    SELECT 'SUB', COUNT(*) FROM invoices;
+
+ALTER TABLE invoices ADD COLUMN billing_period TEXT DEFAULT '';
+CREATE UNIQUE INDEX IF NOT EXISTS idx_invoices_period
+    ON invoices(entity_type, entity_id, billing_period) WHERE billing_period != '';
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (62);
+""",
+    63: """
+-- v63: Background send jobs for publishing.
+--
+-- One row per publish. The runner writes sent/failed, elapsed time and
+-- the emails-per-minute rate after every SMTP batch, so the publish page
+-- can show live progress from any worker and the finished rows keep
+-- per-send throughput for later analysis. cancel_requested is checked
+-- between batches.
+CREATE TABLE IF NOT EXISTS send_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    issue_id INTEGER NOT NULL REFERENCES issues(id),
+    assembled_id INTEGER,
+    edition_slug TEXT DEFAULT '',
+    subject TEXT DEFAULT '',
+    state TEXT NOT NULL DEFAULT 'queued'
+        CHECK (state IN ('queued', 'running', 'done', 'failed', 'cancelled')),
+    total INTEGER DEFAULT 0,
+    sent INTEGER DEFAULT 0,
+    failed INTEGER DEFAULT 0,
+    cancel_requested INTEGER DEFAULT 0,
+    elapsed_seconds REAL DEFAULT 0,
+    rate_per_minute REAL DEFAULT 0,
+    error TEXT DEFAULT '',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP,
+    finished_at TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_send_jobs_issue ON send_jobs(issue_id, state);
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (63);
+""",
+    64: """
+-- v64: Per-issue link registry for click tracking.
+--
+-- Each distinct link in an issue gets a short numeric id when the issue is
+-- prepared for sending. Tracked emails point at /t/c/<link id>/<subscriber>
+-- instead of carrying the whole destination base64-encoded in every link,
+-- and the redirect endpoint resolves the id from an in-memory map.
+CREATE TABLE IF NOT EXISTS issue_links (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    issue_id INTEGER NOT NULL REFERENCES issues(id),
+    url TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (issue_id, url)
+);
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (64);
+""",
+    65: """
+-- v65: Startup fingerprints.
+--
+-- Boot re-ran schema.sql, every migration check and all the seed
+-- functions on every start. The app now stores a hash of the schema and
+-- migrations ('schema') and of the seed data it last applied ('seed'),
+-- and skips that work when the running build's hashes match.
+CREATE TABLE IF NOT EXISTS startup_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL DEFAULT '',
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (65);
+""",
+    66: """
+-- v66: Per-subscriber engagement rollup for segmentation.
+--
+-- Segmentation used to join every active subscriber against the whole
+-- email_tracking_events table. The rollup keeps open/click counts and the
+-- latest event time per subscriber; each run folds in only the events
+-- past the high-water mark. subscriber_id 0 holds no counts: its
+-- last_event_id is the highest email_tracking_events id folded in.
+CREATE TABLE IF NOT EXISTS subscriber_engagement (
+    subscriber_id INTEGER PRIMARY KEY,
+    opens INTEGER NOT NULL DEFAULT 0,
+    clicks INTEGER NOT NULL DEFAULT 0,
+    last_event_at TIMESTAMP,
+    last_event_id INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_subscriber_engagement_last ON subscriber_engagement(last_event_at);
+CREATE INDEX IF NOT EXISTS idx_subscribers_subscribed ON subscribers(subscribed_at);
+
+INSERT OR IGNORE INTO subscriber_engagement (subscriber_id) VALUES (0);
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (66);
+""",
+    67: """
+-- v67: Persisted markdown renderings.
+--
+-- Draft bodies were converted to sanitized HTML (markdown + bleach) on
+-- every assembly and admin page view. Renderings are now keyed by a hash
+-- of the markdown (and renderer version), written when a draft is
+-- created or edited and reused until the content changes.
+CREATE TABLE IF NOT EXISTS rendered_markdown (
+    content_hash TEXT PRIMARY KEY,
+    html TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (67);
+""",
+    68: """
+-- v68: Trigger-maintained updated_at on the tables incremental backups
+-- export.
+--
+-- Incremental backups pick up edited rows by their change timestamp, but
+-- most of these tables had none and others only moved it on some
+-- updates (status changes never touched subscribers.synced_at). Every
+-- UPDATE now stamps updated_at unless the statement set it itself. Rows
+-- never updated keep NULL; their ids are already past the backup
+-- watermark.
+ALTER TABLE subscribers ADD COLUMN updated_at TIMESTAMP;
+ALTER TABLE newsletter_editions ADD COLUMN updated_at TIMESTAMP;
+ALTER TABLE drafts ADD COLUMN updated_at TIMESTAMP;
+ALTER TABLE section_definitions ADD COLUMN updated_at TIMESTAMP;
+ALTER TABLE assembled_issues ADD COLUMN updated_at TIMESTAMP;
+ALTER TABLE engagement_metrics ADD COLUMN updated_at TIMESTAMP;
+
+CREATE TRIGGER IF NOT EXISTS trg_subscribers_touch
+AFTER UPDATE ON subscribers
+WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE subscribers SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_newsletter_editions_touch
+AFTER UPDATE ON newsletter_editions
+WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE newsletter_editions SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_issues_touch
+AFTER UPDATE ON issues
+WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE issues SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_drafts_touch
+AFTER UPDATE ON drafts
+WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE drafts SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_section_definitions_touch
+AFTER UPDATE ON section_definitions
+WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE section_definitions SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_assembled_issues_touch
+AFTER UPDATE ON assembled_issues
+WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE assembled_issues SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_engagement_metrics_touch
+AFTER UPDATE ON engagement_metrics
+WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE engagement_metrics SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (68);
+""",
+    69: """
+-- v69: At most one active send job per issue, plus a runner heartbeat.
+--
+-- The partial unique index makes "one queued or running job per issue"
+-- hold under concurrent publishes; runners claim a queued job with a
+-- conditional UPDATE. heartbeat_at moves with every progress write, and
+-- the send_job_sweep job fails running jobs whose worker went quiet.
+-- Older duplicates of an active job are failed first so the index builds.
+ALTER TABLE send_jobs ADD COLUMN heartbeat_at TIMESTAMP;
+
+UPDATE send_jobs SET state = 'failed', error = 'Superseded by a newer job for this issue.',
+    finished_at = CURRENT_TIMESTAMP
+WHERE state IN ('queued', 'running')
+  AND id NOT IN (
+      SELECT MAX(id) FROM send_jobs WHERE state IN ('queued', 'running') GROUP BY issue_id
+  );
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_send_jobs_one_active
+    ON send_jobs(issue_id) WHERE state IN ('queued', 'running');
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (69);
+""",
+    70: """
+-- v70: Spotify release watermarks.
+--
+-- Per-artist watermark: the newest release_date already stored in
+-- spotify_releases. The daily scan only keeps albums on or after it, and
+-- stops paging once a page reaches older releases. An artist with no row
+-- gets one full scan.
+--
+-- Watermarks used to be kept on spotify_artist_cache, so scanning an
+-- artist that was never looked up inserted a bare cache row with no
+-- name, which then showed up blank wherever cached artists are listed.
+-- Those bare rows are dropped.
+CREATE TABLE IF NOT EXISTS spotify_release_watermarks (
+    spotify_artist_id TEXT PRIMARY KEY,
+    last_release_date TEXT NOT NULL DEFAULT '',
+    checked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+DELETE FROM spotify_artist_cache WHERE artist_name = '' AND data_json = '{}';
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (70);
+""",
+    71: """
+-- v71: Subscriber CSV import jobs.
+--
+-- Import progress was kept in admin_settings under one key per import,
+-- which nothing cleaned up. Each import is now a row here, updated after
+-- every chunk and deleted once its result has been shown (or a day after
+-- it finished, if nobody looked).
+CREATE TABLE IF NOT EXISTS subscriber_import_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    state TEXT NOT NULL DEFAULT 'running'
+        CHECK (state IN ('running', 'done', 'failed')),
+    percent INTEGER DEFAULT 0,
+    rows_read INTEGER DEFAULT 0,
+    imported INTEGER DEFAULT 0,
+    new_subscribers INTEGER DEFAULT 0,
+    skipped INTEGER DEFAULT 0,
+    duplicates INTEGER DEFAULT 0,
+    errors INTEGER DEFAULT 0,
+    error TEXT DEFAULT '',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+DELETE FROM admin_settings WHERE key LIKE 'subscriber_import_status:%';
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (71);
 """,
 }
 
@@ -2133,6 +2585,181 @@ INSERT INTO schema_version (version) VALUES (50) ON CONFLICT DO NOTHING;
 """
 
 
+# v58 (PG-specific): archive search. FTS5 has no PostgreSQL equivalent,
+# so the index is a generated, weighted tsvector (title > edition > body)
+# with a GIN index. Same table name and issue key as the SQLite version.
+PG_MIGRATIONS[58] = """
+CREATE TABLE IF NOT EXISTS archive_search (
+    issue_id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL DEFAULT '',
+    edition_slug TEXT NOT NULL DEFAULT '',
+    body TEXT NOT NULL DEFAULT '',
+    tsv tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', title), 'A') ||
+        setweight(to_tsvector('english', edition_slug), 'B') ||
+        setweight(to_tsvector('english', body), 'C')
+    ) STORED
+);
+CREATE INDEX IF NOT EXISTS idx_archive_search_tsv ON archive_search USING GIN (tsv);
+INSERT INTO archive_search (issue_id, title, edition_slug, body)
+SELECT i.id, COALESCE(i.title, ''), COALESCE(i.edition_slug, ''), COALESCE(a.plain_text, '')
+FROM issues i
+JOIN assembled_issues a ON a.id = (
+    SELECT MAX(id) FROM assembled_issues WHERE issue_id = i.id
+)
+ON CONFLICT (issue_id) DO NOTHING;
+INSERT INTO schema_version (version) VALUES (58) ON CONFLICT DO NOTHING;
+"""
+# v60: subscriber counters — PG triggers need plpgsql functions.
+PG_MIGRATIONS[60] = """
+CREATE TABLE IF NOT EXISTS subscriber_counters (
+    edition_id INTEGER PRIMARY KEY,
+    active_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO subscriber_counters (edition_id, active_count)
+SELECT 0, COUNT(*) FROM subscribers WHERE status = 'active'
+ON CONFLICT (edition_id) DO NOTHING;
+
+INSERT INTO subscriber_counters (edition_id, active_count)
+SELECT ne.id, (
+    SELECT COUNT(*) FROM subscriber_editions se
+    JOIN subscribers s ON s.id = se.subscriber_id
+    WHERE se.edition_id = ne.id AND s.status = 'active'
+) FROM newsletter_editions ne
+ON CONFLICT (edition_id) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION subscriber_counters_on_edition() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO subscriber_counters (edition_id, active_count) VALUES (NEW.id, 0)
+    ON CONFLICT (edition_id) DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION subscriber_counters_on_subscriber() RETURNS trigger AS $$
+DECLARE
+    delta INTEGER := 0;
+    sid INTEGER;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        sid := NEW.id;
+        IF NEW.status = 'active' THEN delta := 1; END IF;
+    ELSIF TG_OP = 'DELETE' THEN
+        sid := OLD.id;
+        IF OLD.status = 'active' THEN delta := -1; END IF;
+    ELSE
+        sid := NEW.id;
+        IF COALESCE(OLD.status, '') = 'active' AND COALESCE(NEW.status, '') <> 'active' THEN
+            delta := -1;
+        ELSIF COALESCE(OLD.status, '') <> 'active' AND NEW.status = 'active' THEN
+            delta := 1;
+        END IF;
+    END IF;
+    IF delta <> 0 THEN
+        UPDATE subscriber_counters
+        SET active_count = active_count + delta, updated_at = CURRENT_TIMESTAMP
+        WHERE edition_id = 0
+           OR edition_id IN (SELECT edition_id FROM subscriber_editions WHERE subscriber_id = sid);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION subscriber_counters_on_link() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE subscriber_counters
+        SET active_count = active_count - 1, updated_at = CURRENT_TIMESTAMP
+        WHERE edition_id = OLD.edition_id
+          AND EXISTS (SELECT 1 FROM subscribers WHERE id = OLD.subscriber_id AND status = 'active');
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE subscriber_counters
+        SET active_count = active_count + 1, updated_at = CURRENT_TIMESTAMP
+        WHERE edition_id = NEW.edition_id
+          AND EXISTS (SELECT 1 FROM subscribers WHERE id = NEW.subscriber_id AND status = 'active');
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_counters_edition ON newsletter_editions;
+CREATE TRIGGER trg_counters_edition AFTER INSERT ON newsletter_editions
+    FOR EACH ROW EXECUTE FUNCTION subscriber_counters_on_edition();
+
+DROP TRIGGER IF EXISTS trg_counters_subscriber ON subscribers;
+CREATE TRIGGER trg_counters_subscriber AFTER INSERT OR DELETE OR UPDATE OF status ON subscribers
+    FOR EACH ROW EXECUTE FUNCTION subscriber_counters_on_subscriber();
+
+DROP TRIGGER IF EXISTS trg_counters_link ON subscriber_editions;
+CREATE TRIGGER trg_counters_link AFTER INSERT OR DELETE OR UPDATE OF subscriber_id, edition_id ON subscriber_editions
+    FOR EACH ROW EXECUTE FUNCTION subscriber_counters_on_link();
+
+INSERT INTO schema_version (version) VALUES (60) ON CONFLICT DO NOTHING;
+"""
+
+# v62: the generic converter drops INSERT OR IGNORE's conflict handling.
+PG_MIGRATIONS[62] = PG_MIGRATIONS[62].replace(
+    "COUNT(*) FROM invoices;", "COUNT(*) FROM invoices ON CONFLICT (prefix) DO NOTHING;"
+)
+
+# v66: the generic converter drops INSERT OR IGNORE's conflict handling.
+PG_MIGRATIONS[66] = PG_MIGRATIONS[66].replace(
+    "VALUES (0);", "VALUES (0) ON CONFLICT (subscriber_id) DO NOTHING;"
+)
+
+# v68: updated_at triggers — PG stamps the row in a BEFORE trigger.
+PG_MIGRATIONS[68] = """
+ALTER TABLE subscribers ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP;
+ALTER TABLE newsletter_editions ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP;
+ALTER TABLE drafts ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP;
+ALTER TABLE section_definitions ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP;
+ALTER TABLE assembled_issues ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP;
+ALTER TABLE engagement_metrics ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP;
+
+CREATE OR REPLACE FUNCTION touch_updated_at() RETURNS trigger AS $$
+BEGIN
+    IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+        NEW.updated_at := CURRENT_TIMESTAMP;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_subscribers_touch ON subscribers;
+CREATE TRIGGER trg_subscribers_touch BEFORE UPDATE ON subscribers
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+DROP TRIGGER IF EXISTS trg_newsletter_editions_touch ON newsletter_editions;
+CREATE TRIGGER trg_newsletter_editions_touch BEFORE UPDATE ON newsletter_editions
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+DROP TRIGGER IF EXISTS trg_issues_touch ON issues;
+CREATE TRIGGER trg_issues_touch BEFORE UPDATE ON issues
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+DROP TRIGGER IF EXISTS trg_drafts_touch ON drafts;
+CREATE TRIGGER trg_drafts_touch BEFORE UPDATE ON drafts
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+DROP TRIGGER IF EXISTS trg_section_definitions_touch ON section_definitions;
+CREATE TRIGGER trg_section_definitions_touch BEFORE UPDATE ON section_definitions
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+DROP TRIGGER IF EXISTS trg_assembled_issues_touch ON assembled_issues;
+CREATE TRIGGER trg_assembled_issues_touch BEFORE UPDATE ON assembled_issues
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+DROP TRIGGER IF EXISTS trg_engagement_metrics_touch ON engagement_metrics;
+CREATE TRIGGER trg_engagement_metrics_touch BEFORE UPDATE ON engagement_metrics
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+INSERT INTO schema_version (version) VALUES (68) ON CONFLICT DO NOTHING;
+"""
+
+
 def run_pg_migrations(database_url: str) -> list[int]:
     """Run all pending PostgreSQL migrations. Returns list of versions applied."""
     from weeklyamp.db.postgres import get_pg_connection
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import logging
 import os
+import re
+import threading
 import weakref
 from pathlib import Path
 from typing import Any, Optional
@@ -19,6 +23,24 @@ _SCHEMA_PG_PATH = Path(__file__).parent / "schema_pg.sql"
 # Connection pool singleton
 _pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
 
+# A statement run this many times with parameters is PREPAREd on each
+# pooled connection that runs it, then sent as EXECUTE so the server
+# skips parse and plan. 0 disables. Keep it off behind a transaction-mode
+# pooler (PgBouncer), which can't hold session-level prepared statements.
+_PREPARE_THRESHOLD = int(os.environ.get("PG_PREPARE_THRESHOLD", 0))
+# Return PgRow tuples (one shared column map per result shape) instead of
+# copying every row into a dict.
+_TUPLE_ROWS = os.environ.get("PG_TUPLE_ROWS", "").lower() in ("1", "true", "yes")
+
+_MAX_TRACKED_STATEMENTS = 4096
+_statement_uses: dict[str, int] = {}
+_unpreparable: set[str] = set()
+# Prepared statement names per raw psycopg2 connection. Weak keys, so a
+# connection the pool discards takes its entry with it.
+_prepared_on: "weakref.WeakKeyDictionary[Any, set[str]]" = weakref.WeakKeyDictionary()
+_registry_lock = threading.Lock()
+_PLACEHOLDER_RE = re.compile(r"%%|%s")
+
 
 def _get_pool(dsn: str) -> psycopg2.pool.ThreadedConnectionPool:
     """Get or create the connection pool singleton."""
@@ -44,6 +66,73 @@ def close_pool() -> None:
         _pool = None
 
 
+@functools.lru_cache(maxsize=1024)
+def _prepared_form(sql: str) -> tuple[str, str]:
+    """Statement name and ``$n`` form of a ``%s``-style statement."""
+    n = 0
+
+    def _number(match: re.Match) -> str:
+        nonlocal n
+        if match.group(0) == "%%":
+            return "%"
+        n += 1
+        return f"${n}"
+
+    name = "wa_" + hashlib.sha1(sql.encode()).hexdigest()[:16]
+    return name, _PLACEHOLDER_RE.sub(_number, sql)
+
+
+def _is_hot(sql: str) -> bool:
+    """Count a parameterized run of ``sql``; True once it should be prepared."""
+    if sql in _unpreparable:
+        return False
+    with _registry_lock:
+        uses = _statement_uses.get(sql, 0) + 1
+        if uses == 1 and len(_statement_uses) >= _MAX_TRACKED_STATEMENTS:
+            _statement_uses.clear()
+        _statement_uses[sql] = uses
+    return uses >= _PREPARE_THRESHOLD
+
+
+class PgRow(tuple):
+    """A result row as a tuple that also reads like the dict rows callers use.
+
+    ``row["col"]``, ``row[0]``, ``row.get()``, ``keys()`` and ``dict(row)``
+    all work; ``in`` tests column names. Each result shape gets one
+    subclass (see :func:`_row_class`) holding the shared column map, so
+    a row costs a tuple rather than a dict.
+    """
+
+    __slots__ = ()
+    _index: dict[str, int] = {}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return tuple.__getitem__(self, self._index[key])
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def get(self, key: str, default: Any = None) -> Any:
+        i = self._index.get(key)
+        return default if i is None else tuple.__getitem__(self, i)
+
+    def keys(self):
+        return self._index.keys()
+
+    def values(self) -> tuple:
+        return tuple(self)
+
+    def items(self):
+        return zip(self._index, self)
+
+
+@functools.lru_cache(maxsize=512)
+def _row_class(columns: tuple[str, ...]) -> type:
+    return type("PgRow", (PgRow,), {"__slots__": (), "_index": {c: i for i, c in enumerate(columns)}})
+
+
 def _safe_putconn(dsn: str, conn) -> None:
     """Return a connection to the pool, swallowing any error.
 
@@ -103,9 +192,56 @@ class PgConnection:
 
     # -- Core interface --
 
+    def _cursor(self):
+        if _TUPLE_ROWS:
+            return self._conn.cursor()
+        return self._conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+
     def execute(self, sql: str, params: Any = None) -> "PgCursor":
-        cur = self._conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-        cur.execute(sql, params)
+        cur = self._cursor()
+        if (
+            _PREPARE_THRESHOLD
+            and isinstance(params, (tuple, list)) and params
+            and _is_hot(sql)
+            and self._prepare(cur, sql)
+        ):
+            name, _ = _prepared_form(sql)
+            cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+        else:
+            cur.execute(sql, params)
+        return PgCursor(cur)
+
+    def _prepare(self, cur, sql: str) -> bool:
+        """PREPARE ``sql`` on this connection once; False if the server refuses.
+
+        The PREPARE runs inside a savepoint so a statement the server
+        can't prepare (parameter types it can't infer) doesn't abort the
+        caller's transaction; it is then always run unprepared.
+        """
+        name, pg_sql = _prepared_form(sql)
+        prepared = _prepared_on.setdefault(self._conn, set())
+        if name in prepared:
+            return True
+        cur.execute("SAVEPOINT weeklyamp_prepare")
+        try:
+            cur.execute(f"PREPARE {name} AS {pg_sql}")
+        except psycopg2.Error:
+            cur.execute("ROLLBACK TO SAVEPOINT weeklyamp_prepare")
+            _unpreparable.add(sql)
+            logger.debug("Statement not preparable, running it unprepared: %s", sql)
+            return False
+        cur.execute("RELEASE SAVEPOINT weeklyamp_prepare")
+        prepared.add(name)
+        return True
+
+    def executemany(self, sql: str, seq_of_params) -> "PgCursor":
+        """Run one statement for every parameter tuple in ``seq_of_params``.
+
+        Uses ``execute_batch`` so rows travel in pages rather than one
+        round-trip per row — the whole point of callers reaching for this.
+        """
+        cur = self._cursor()
+        psycopg2.extras.execute_batch(cur, sql, list(seq_of_params), page_size=500)
         return PgCursor(cur)
 
     def executescript(self, sql: str) -> None:
@@ -158,21 +294,35 @@ class PgConnection:
 
 
 class PgCursor:
-    """Wraps a psycopg2 RealDictCursor to expose ``fetchone`` / ``fetchall``
-    returning plain dicts.
+    """Wraps a psycopg2 cursor to expose ``fetchone`` / ``fetchall``
+    returning plain dicts, or :class:`PgRow` tuples with ``PG_TUPLE_ROWS``.
     """
 
-    def __init__(self, cur: psycopg2.extras.RealDictCursor) -> None:
+    def __init__(self, cur) -> None:
         self._cur = cur
         self.lastrowid: Optional[int] = None
 
+    @property
+    def rowcount(self) -> int:
+        return self._cur.rowcount
+
+    def _row_class(self) -> type:
+        return _row_class(tuple(col[0] for col in self._cur.description))
+
     def fetchone(self) -> Optional[dict]:
         row = self._cur.fetchone()
-        return dict(row) if row else None
+        if not row:
+            return None
+        if isinstance(row, dict):
+            return dict(row)
+        return self._row_class()(row)
 
     def fetchall(self) -> list[dict]:
         rows = self._cur.fetchall()
-        return [dict(r) for r in rows]
+        if not rows or isinstance(rows[0], dict):
+            return [dict(r) for r in rows]
+        cls = self._row_class()
+        return [cls(r) for r in rows]
 
     def close(self) -> None:
         self._cur.close()
@@ -2,16 +2,49 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import sqlite3
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
+from weeklyamp.core import metrics
 from weeklyamp.core.database import get_connection
 
 logger = logging.getLogger(__name__)
 
+# Callbacks run whenever a write changes what public pages show. The web
+# response cache registers one here so this module never imports the web
+# layer.
+_content_change_listeners: list[Callable[[], None]] = []
+
+
+# admin_settings keys that workers hold in memory: the admin password hash
+# (web.security) and the promo override baked into cached public pages
+# (content.promo.PROMO_SETTINGS_KEY). Only writes to these bump the
+# admin_settings cache version; sync cursors, backup watermarks and other
+# operational state change often and would otherwise flush every
+# worker's response cache each time.
+CACHED_ADMIN_SETTINGS = frozenset({"admin_password_hash", "promo_config"})
+
+
+def add_content_change_listener(fn: Callable[[], None]) -> None:
+    """Call ``fn`` after every write that invalidates materialized pages."""
+    if fn not in _content_change_listeners:
+        _content_change_listeners.append(fn)
+
+
+def _notify_content_change() -> None:
+    """Run the listeners; call only after the invalidating write commits,
+    so a listener that triggers a re-read never sees the old rows."""
+    for fn in _content_change_listeners:
+        try:
+            fn()
+        except Exception:
+            logger.exception("Content change listener failed")
+
 
 class _PgCursorAdapter:
     """Wraps a PgCursor/dict result to provide ``lastrowid`` like sqlite3."""
@@ -20,6 +53,10 @@ class _PgCursorAdapter:
         self._cur = cur
         self.lastrowid = lastrowid
 
+    @property
+    def rowcount(self) -> int:
+        return self._cur.rowcount
+
     def fetchone(self):
         return self._cur.fetchone()
 
@@ -27,6 +64,21 @@ class _PgCursorAdapter:
         return self._cur.fetchall()
 
 
+@functools.lru_cache(maxsize=2048)
+def _translate(sql: str) -> tuple[str, bool]:
+    """``?`` → ``%s``, plus ``RETURNING id`` on INSERTs: (sql, is_insert).
+
+    Repository SQL is a fixed set of literals, so each is translated once.
+    """
+    converted = sql.replace("?", "%s")
+    stripped = converted.strip()
+    is_insert = stripped.upper().startswith("INSERT")
+    # Auto-append RETURNING id for INSERT statements that don't already have it
+    if is_insert and "RETURNING" not in stripped.upper():
+        converted = converted.rstrip().rstrip(";") + " RETURNING id"
+    return converted, is_insert
+
+
 class _PgConnAdapter:
     """Wraps a PgConnection so that SQLite-style ``?`` placeholders are
     transparently converted to ``%s`` before execution.  This lets every
@@ -44,13 +96,10 @@ class _PgConnAdapter:
         return sql.replace("?", "%s")
 
     def execute(self, sql: str, params=None):
-        converted = self._convert(sql)
-        stripped = converted.strip()
-        is_insert = stripped.upper().startswith("INSERT")
-        # Auto-append RETURNING id for INSERT statements that don't already have it
-        if is_insert and "RETURNING" not in stripped.upper():
-            converted = converted.rstrip().rstrip(";") + " RETURNING id"
+        converted, is_insert = _translate(sql)
+        started = time.perf_counter()
         raw_cur = self._conn.execute(converted, params)
+        metrics.record_query(sql, time.perf_counter() - started)
         # Extract lastrowid from the RETURNING clause
         lastrowid = None
         if is_insert:
@@ -62,6 +111,14 @@ class _PgConnAdapter:
                 pass
         return _PgCursorAdapter(raw_cur, lastrowid)
 
+    def executemany(self, sql: str, seq_of_params):
+        # No RETURNING here: bulk writers don't read ids back, and a
+        # RETURNING clause would defeat execute_batch's paging.
+        started = time.perf_counter()
+        cur = self._conn.executemany(self._convert(sql), seq_of_params)
+        metrics.record_query(sql, time.perf_counter() - started)
+        return _PgCursorAdapter(cur)
+
     def executescript(self, sql: str) -> None:
         self._conn.executescript(sql)
 
@@ -75,6 +132,53 @@ class _PgConnAdapter:
         self._conn.close()
 
 
+class _TimedSqliteConn:
+    """A ``sqlite3.Connection`` that reports each statement to :mod:`metrics`.
+
+    Only the execute methods are intercepted; everything else, including
+    ``row_factory`` and use as a context manager, goes to the connection.
+    """
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw: sqlite3.Connection) -> None:
+        object.__setattr__(self, "_raw", raw)
+
+    def execute(self, sql: str, params=()):
+        started = time.perf_counter()
+        try:
+            return self._raw.execute(sql, params)
+        finally:
+            metrics.record_query(sql, time.perf_counter() - started)
+
+    def executemany(self, sql: str, seq_of_params):
+        started = time.perf_counter()
+        try:
+            return self._raw.executemany(sql, seq_of_params)
+        finally:
+            metrics.record_query(sql, time.perf_counter() - started)
+
+    def executescript(self, sql: str):
+        started = time.perf_counter()
+        try:
+            return self._raw.executescript(sql)
+        finally:
+            metrics.record_query(sql, time.perf_counter() - started)
+
+    def __getattr__(self, name: str):
+        return getattr(self._raw, name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self._raw, name, value)
+
+    def __enter__(self):
+        self._raw.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        return self._raw.__exit__(*exc)
+
+
 class Repository:
     """Central data-access layer for the WEEKLYAMP database.
 
@@ -165,6 +269,8 @@ class Repository:
         raw = get_connection(self.db_path, self.database_url, self.backend)
         if self._is_pg:
             return _PgConnAdapter(raw)
+        if metrics.enabled():
+            return _TimedSqliteConn(raw)
         return raw
 
     # NOTE: Placeholder conversion (? -> %s) and RETURNING id for
@@ -204,7 +310,9 @@ class Repository:
             "UPDATE issues SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
             (status, issue_id),
         )
+        self._invalidate_rendered_pages(conn)
         conn.commit()
+        _notify_content_change()
         conn.close()
 
     def get_next_issue_number(self) -> int:
@@ -246,16 +354,33 @@ class Repository:
         conn.close()
         return [dict(r) for r in rows]
 
-    def get_published_issues(self, limit: int = 20) -> list[dict]:
+    def get_published_issues(self, limit: int = 20, edition_slug: str = "") -> list[dict]:
         """Return issues with status='published', newest first."""
         conn = self._conn()
-        rows = conn.execute(
-            "SELECT * FROM issues WHERE status = 'published' ORDER BY publish_date DESC LIMIT ?",
-            (limit,),
-        ).fetchall()
+        if edition_slug:
+            rows = conn.execute(
+                """SELECT * FROM issues WHERE status = 'published' AND edition_slug = ?
+                   ORDER BY publish_date DESC LIMIT ?""",
+                (edition_slug, limit),
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT * FROM issues WHERE status = 'published' ORDER BY publish_date DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
         conn.close()
         return [dict(r) for r in rows]
 
+    def get_issue_by_number(self, issue_number: int, published_only: bool = False) -> Optional[dict]:
+        """Look up an issue by its (unique, indexed) issue_number."""
+        conn = self._conn()
+        sql = "SELECT * FROM issues WHERE issue_number = ?"
+        if published_only:
+            sql += " AND status = 'published'"
+        row = conn.execute(sql, (issue_number,)).fetchone()
+        conn.close()
+        return dict(row) if row else None
+
     # ---- Section Definitions ----
 
     def get_active_sections(self) -> list[dict]:
@@ -496,6 +621,22 @@ class Repository:
         conn.close()
         return [dict(r) for r in rows]
 
+    def get_editorial_inputs_for_issues(self, issue_ids: list[int]) -> dict[tuple[int, str], list[dict]]:
+        """Editorial inputs for many issues: ``{(issue_id, section_slug): [input, ...]}``."""
+        ids = [int(i) for i in issue_ids]
+        if not ids:
+            return {}
+        marks = ", ".join("?" for _ in ids)
+        conn = self._conn()
+        rows = conn.execute(
+            f"SELECT * FROM editorial_inputs WHERE issue_id IN ({marks}) ORDER BY id", ids,
+        ).fetchall()
+        conn.close()
+        result: dict[tuple[int, str], list[dict]] = {}
+        for r in rows:
+            result.setdefault((r["issue_id"], r["section_slug"]), []).append(dict(r))
+        return result
+
     # ---- Drafts ----
 
     def create_draft(
@@ -518,6 +659,7 @@ class Repository:
                VALUES (?, ?, ?, ?, ?, ?)""",
             (issue_id, section_slug, version, content, ai_model, prompt_used),
         )
+        self._store_draft_renders(conn, content)
         conn.commit()
         row_id = cur.lastrowid
         conn.close()
@@ -550,6 +692,34 @@ class Repository:
         conn.close()
         return [dict(r) for r in rows]
 
+    def get_drafts_for_issues(self, issue_ids: list[int]) -> dict[int, list[dict]]:
+        """``get_drafts_for_issue`` for many issues in one query.
+
+        Returns ``{issue_id: [draft, ...]}``; issues without drafts are absent.
+        """
+        ids = [int(i) for i in issue_ids]
+        if not ids:
+            return {}
+        marks = ", ".join("?" for _ in ids)
+        conn = self._conn()
+        rows = conn.execute(
+            f"""SELECT d.* FROM drafts d
+               INNER JOIN (
+                   SELECT issue_id, section_slug, MAX(version) as max_v
+                   FROM drafts WHERE issue_id IN ({marks})
+                   GROUP BY issue_id, section_slug
+               ) latest ON d.issue_id = latest.issue_id
+                   AND d.section_slug = latest.section_slug
+                   AND d.version = latest.max_v
+               ORDER BY d.issue_id, d.section_slug""",
+            ids,
+        ).fetchall()
+        conn.close()
+        result: dict[int, list[dict]] = {}
+        for r in rows:
+            result.setdefault(r["issue_id"], []).append(dict(r))
+        return result
+
     def update_draft_status(self, draft_id: int, status: str, reviewer_notes: str = "") -> None:
         conn = self._conn()
         conn.execute(
@@ -565,9 +735,73 @@ class Repository:
             "UPDATE drafts SET content = ?, status = 'revised' WHERE id = ?",
             (content, draft_id),
         )
+        self._store_draft_renders(conn, content)
         conn.commit()
         conn.close()
 
+    # ---- Rendered markdown ----
+
+    def _store_draft_renders(self, conn, content: str) -> None:
+        """Render a draft's new content once, at write time, for every reader."""
+        from weeklyamp.content.rendering import renders_for_storage
+
+        try:
+            rows = renders_for_storage(content or "")
+        except Exception:
+            # Readers render on a miss; never fail a draft save over the cache.
+            logger.warning("Could not pre-render draft content", exc_info=True)
+            return
+        # executemany: the PG adapter adds no RETURNING id there, and this
+        # table has no id column.
+        conn.executemany(
+            "INSERT INTO rendered_markdown (content_hash, html) VALUES (?, ?) ON CONFLICT (content_hash) DO NOTHING",
+            rows,
+        )
+
+    def get_rendered_markdown(self, content_hashes: list[str]) -> dict[str, str]:
+        """Persisted renderings by content hash; unknown hashes are absent."""
+        hashes = list(dict.fromkeys(content_hashes))
+        if not hashes:
+            return {}
+        marks = ", ".join("?" for _ in hashes)
+        conn = self._conn()
+        rows = conn.execute(
+            f"SELECT content_hash, html FROM rendered_markdown WHERE content_hash IN ({marks})",
+            hashes,
+        ).fetchall()
+        conn.close()
+        return {r["content_hash"]: r["html"] for r in rows}
+
+    def save_rendered_markdown(self, rows: list[tuple[str, str]]) -> None:
+        """Persist ``(content_hash, html)`` renderings; existing hashes are kept."""
+        if not rows:
+            return
+        conn = self._conn()
+        conn.executemany(
+            "INSERT INTO rendered_markdown (content_hash, html) VALUES (?, ?) ON CONFLICT (content_hash) DO NOTHING",
+            rows,
+        )
+        conn.commit()
+        conn.close()
+
+    def prune_rendered_markdown(self, older_than_days: int) -> int:
+        """Delete renderings stored more than ``older_than_days`` ago; returns how many.
+
+        Rows are keyed by content, so edits leave the old rendering
+        behind. A pruned rendering that is still needed is simply
+        rendered and stored again on its next use.
+        """
+        from datetime import timedelta, timezone
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=older_than_days)).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+        conn = self._conn()
+        cur = conn.execute("DELETE FROM rendered_markdown WHERE created_at < ?", (cutoff,))
+        conn.commit()
+        deleted = cur.rowcount
+        conn.close()
+        return deleted
+
     # ---- Assembled Issues ----
 
     def save_assembled(self, issue_id: int, html_content: str, plain_text: str = "", preheader_text: str = "") -> int:
@@ -577,7 +811,10 @@ class Repository:
                VALUES (?, ?, ?, ?, ?)""",
             (issue_id, html_content, plain_text, preheader_text, html_content),
         )
+        self._index_archive_search(conn, issue_id, plain_text)
+        self._invalidate_rendered_pages(conn)
         conn.commit()
+        _notify_content_change()
         row_id = cur.lastrowid
         conn.close()
         return row_id
@@ -591,6 +828,27 @@ class Repository:
         conn.close()
         return dict(row) if row else None
 
+    def get_assembled_for_issues(self, issue_ids: list[int]) -> dict[int, dict]:
+        """Latest assembled row per issue, for many issues in one query.
+
+        Returns ``{issue_id: assembled_dict}``; issues never assembled are
+        absent. Replaces a ``get_assembled`` call per issue in list views.
+        """
+        ids = [int(i) for i in issue_ids]
+        if not ids:
+            return {}
+        marks = ", ".join("?" for _ in ids)
+        conn = self._conn()
+        rows = conn.execute(
+            f"""SELECT * FROM assembled_issues WHERE id IN (
+                    SELECT MAX(id) FROM assembled_issues
+                    WHERE issue_id IN ({marks}) GROUP BY issue_id
+                )""",
+            ids,
+        ).fetchall()
+        conn.close()
+        return {r["issue_id"]: dict(r) for r in rows}
+
     def get_assembled_by_id(self, assembled_id: int) -> Optional[dict]:
         conn = self._conn()
         row = conn.execute(
@@ -624,7 +882,9 @@ class Repository:
                WHERE id = ?""",
             (web_html, assembled_id),
         )
+        self._invalidate_rendered_pages(conn)
         conn.commit()
+        _notify_content_change()
         conn.close()
 
     def update_assembled_ghl(self, assembled_id: int, campaign_id: str) -> None:
@@ -633,8 +893,459 @@ class Repository:
             "UPDATE assembled_issues SET ghl_campaign_id = ?, published_at = CURRENT_TIMESTAMP WHERE id = ?",
             (campaign_id, assembled_id),
         )
+        self._invalidate_rendered_pages(conn)
+        conn.commit()
+        _notify_content_change()
+        conn.close()
+
+    # ---- Subscriber import jobs ----
+
+    def create_import_job(self) -> int:
+        """Start tracking a CSV import; also clears results nobody collected."""
+        from datetime import timedelta, timezone
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S")
+        conn = self._conn()
+        conn.execute(
+            "DELETE FROM subscriber_import_jobs WHERE state != 'running' AND finished_at < ?",
+            (cutoff,),
+        )
+        cur = conn.execute("INSERT INTO subscriber_import_jobs (state) VALUES ('running')")
+        conn.commit()
+        job_id = cur.lastrowid
+        conn.close()
+        return job_id
+
+    def update_import_job(self, job_id: int, stats: dict, percent: int) -> None:
+        """Record the running totals from ``import_subscribers_csv``'s progress callback."""
+        conn = self._conn()
+        conn.execute(
+            """UPDATE subscriber_import_jobs
+               SET percent = ?, rows_read = ?, imported = ?, new_subscribers = ?,
+                   skipped = ?, duplicates = ?, errors = ?
+               WHERE id = ?""",
+            (percent, stats.get("rows", 0), stats.get("imported", 0), stats.get("new", 0),
+             stats.get("skipped", 0), stats.get("duplicates", 0), stats.get("errors", 0), job_id),
+        )
+        conn.commit()
+        conn.close()
+
+    def finish_import_job(self, job_id: int, state: str, error: str = "") -> None:
+        conn = self._conn()
+        conn.execute(
+            """UPDATE subscriber_import_jobs
+               SET state = ?, error = ?, percent = CASE WHEN ? = 'done' THEN 100 ELSE percent END,
+                   finished_at = CURRENT_TIMESTAMP
+               WHERE id = ?""",
+            (state, error, state, job_id),
+        )
+        conn.commit()
+        conn.close()
+
+    def get_import_job(self, job_id: int) -> Optional[dict]:
+        conn = self._conn()
+        row = conn.execute("SELECT * FROM subscriber_import_jobs WHERE id = ?", (job_id,)).fetchone()
+        conn.close()
+        return dict(row) if row else None
+
+    def delete_import_job(self, job_id: int) -> None:
+        conn = self._conn()
+        conn.execute("DELETE FROM subscriber_import_jobs WHERE id = ?", (job_id,))
+        conn.commit()
+        conn.close()
+
+    # ---- Send jobs ----
+
+    def create_send_job(
+        self, issue_id: int, assembled_id: int, edition_slug: str = "", subject: str = "",
+    ) -> Optional[int]:
+        """Queue a job; None when the issue already has a queued or running one.
+
+        The partial unique index on active jobs (v69) makes the check and
+        the insert one atomic step, so concurrent publishes can't both
+        create a job.
+        """
+        conn = self._conn()
+        cur = conn.execute(
+            """INSERT INTO send_jobs (issue_id, assembled_id, edition_slug, subject) VALUES (?, ?, ?, ?)
+               ON CONFLICT (issue_id) WHERE state IN ('queued', 'running') DO NOTHING""",
+            (issue_id, assembled_id, edition_slug, subject),
+        )
+        conn.commit()
+        job_id = cur.lastrowid if cur.rowcount else None
+        conn.close()
+        return job_id
+
+    def get_send_job(self, job_id: int) -> Optional[dict]:
+        conn = self._conn()
+        row = conn.execute("SELECT * FROM send_jobs WHERE id = ?", (job_id,)).fetchone()
+        conn.close()
+        return dict(row) if row else None
+
+    def get_active_send_job(self, issue_id: int) -> Optional[dict]:
+        """The queued or running job for ``issue_id``, if any."""
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT * FROM send_jobs WHERE issue_id = ? AND state IN ('queued', 'running') "
+            "ORDER BY id DESC LIMIT 1",
+            (issue_id,),
+        ).fetchone()
+        conn.close()
+        return dict(row) if row else None
+
+    def get_send_jobs(self, limit: int = 20) -> list[dict]:
+        conn = self._conn()
+        rows = conn.execute("SELECT * FROM send_jobs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        conn.close()
+        return [dict(r) for r in rows]
+
+    def claim_send_job(self, job_id: int) -> bool:
+        """Move a queued, uncancelled job to running; False if another runner got it first."""
+        conn = self._conn()
+        cur = conn.execute(
+            """UPDATE send_jobs
+               SET state = 'running', started_at = CURRENT_TIMESTAMP, heartbeat_at = CURRENT_TIMESTAMP
+               WHERE id = ? AND state = 'queued' AND cancel_requested = 0""",
+            (job_id,),
+        )
+        conn.commit()
+        claimed = cur.rowcount > 0
+        conn.close()
+        return claimed
+
+    def set_send_job_total(self, job_id: int, total: int) -> None:
+        conn = self._conn()
+        conn.execute(
+            "UPDATE send_jobs SET total = ?, heartbeat_at = CURRENT_TIMESTAMP WHERE id = ?",
+            (total, job_id),
+        )
+        conn.commit()
+        conn.close()
+
+    def update_send_job_progress(self, job_id: int, sent: int, failed: int, elapsed_seconds: float) -> None:
+        """Record counts so far plus elapsed time and the emails-per-minute rate.
+
+        Also the runner's heartbeat: see :meth:`fail_stale_send_jobs`.
+        """
+        rate = (sent + failed) * 60.0 / elapsed_seconds if elapsed_seconds > 0 else 0.0
+        conn = self._conn()
+        conn.execute(
+            """UPDATE send_jobs
+               SET sent = ?, failed = ?, elapsed_seconds = ?, rate_per_minute = ?, heartbeat_at = CURRENT_TIMESTAMP
+               WHERE id = ?""",
+            (sent, failed, elapsed_seconds, rate, job_id),
+        )
+        conn.commit()
+        conn.close()
+
+    def finish_send_job(self, job_id: int, state: str, error: str = "") -> None:
+        conn = self._conn()
+        conn.execute(
+            "UPDATE send_jobs SET state = ?, error = ?, finished_at = CURRENT_TIMESTAMP WHERE id = ?",
+            (state, error, job_id),
+        )
+        conn.commit()
+        conn.close()
+
+    def request_send_job_cancel(self, job_id: int) -> bool:
+        """Cancel a job; False if it already finished.
+
+        A queued job is cancelled outright. A running one is flagged and
+        stops after its current batch; if its worker has died, the stale
+        sweep finishes it as cancelled.
+        """
+        conn = self._conn()
+        cur = conn.execute(
+            """UPDATE send_jobs SET state = 'cancelled', cancel_requested = 1, finished_at = CURRENT_TIMESTAMP
+               WHERE id = ? AND state = 'queued'""",
+            (job_id,),
+        )
+        updated = cur.rowcount > 0
+        if not updated:
+            cur = conn.execute(
+                "UPDATE send_jobs SET cancel_requested = 1 WHERE id = ? AND state = 'running'",
+                (job_id,),
+            )
+            updated = cur.rowcount > 0
+        conn.commit()
+        conn.close()
+        return updated
+
+    def fail_stale_send_jobs(self, stale_after_seconds: float) -> int:
+        """Finish jobs whose runner stopped reporting; returns how many.
+
+        A running job with no heartbeat for ``stale_after_seconds`` lost
+        its worker: it becomes cancelled if a cancel was requested, else
+        failed. It is never requeued, because part of the list may
+        already have been mailed. A queued job that never started in that
+        time (its background task died with the worker) fails too. Either
+        way the issue can be sent again.
+        """
+        from datetime import datetime, timedelta, timezone
+        cutoff = (datetime.now(timezone.utc) - timedelta(seconds=stale_after_seconds)).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+        conn = self._conn()
+        cur = conn.execute(
+            """UPDATE send_jobs
+               SET state = CASE WHEN cancel_requested = 1 THEN 'cancelled' ELSE 'failed' END,
+                   error = CASE WHEN cancel_requested = 1 THEN error
+                                ELSE 'Send worker stopped responding; check sent counts before resending.' END,
+                   finished_at = CURRENT_TIMESTAMP
+               WHERE state = 'running' AND COALESCE(heartbeat_at, started_at, created_at) < ?""",
+            (cutoff,),
+        )
+        count = cur.rowcount
+        cur = conn.execute(
+            """UPDATE send_jobs
+               SET state = 'failed', error = 'Send job never started.', finished_at = CURRENT_TIMESTAMP
+               WHERE state = 'queued' AND created_at < ?""",
+            (cutoff,),
+        )
+        count += cur.rowcount
+        conn.commit()
+        conn.close()
+        return count
+
+    def is_send_job_cancel_requested(self, job_id: int) -> bool:
+        conn = self._conn()
+        row = conn.execute("SELECT cancel_requested FROM send_jobs WHERE id = ?", (job_id,)).fetchone()
+        conn.close()
+        return bool(row and row["cancel_requested"])
+
+    # ---- Issue links (click tracking) ----
+
+    def register_issue_links(self, issue_id: int, urls: list[str]) -> dict[str, int]:
+        """Assign ids to ``urls`` for ``issue_id`` and return ``{url: id}``.
+
+        Re-registering is idempotent: a URL keeps the id it was first
+        given, so re-sending an issue reuses its existing links.
+        """
+        conn = self._conn()
+        if urls:
+            conn.executemany(
+                "INSERT INTO issue_links (issue_id, url) VALUES (?, ?) ON CONFLICT(issue_id, url) DO NOTHING",
+                [(issue_id, url) for url in dict.fromkeys(urls)],
+            )
+            conn.commit()
+        rows = conn.execute("SELECT id, url FROM issue_links WHERE issue_id = ?", (issue_id,)).fetchall()
+        conn.close()
+        return {r["url"]: r["id"] for r in rows}
+
+    def get_issue_link(self, link_id: int) -> Optional[dict]:
+        conn = self._conn()
+        row = conn.execute("SELECT id, issue_id, url FROM issue_links WHERE id = ?", (link_id,)).fetchone()
+        conn.close()
+        return dict(row) if row else None
+
+    # ---- Archive Search ----
+
+    # Snippet highlight delimiters. Control characters cannot occur in
+    # issue text, so the caller can HTML-escape the snippet and then turn
+    # these into <mark> tags without touching real content.
+    SEARCH_MARK_START = "\x02"
+    SEARCH_MARK_END = "\x03"
+
+    def _index_archive_search(self, conn, issue_id: int, plain_text: str) -> None:
+        """Upsert an issue's search row inside the caller's transaction."""
+        issue = conn.execute(
+            "SELECT title, edition_slug FROM issues WHERE id = ?", (issue_id,),
+        ).fetchone()
+        if not issue:
+            return
+        values = (issue_id, issue["title"] or "", issue["edition_slug"] or "", plain_text or "")
+        if self._is_pg:
+            conn.execute(
+                """INSERT INTO archive_search (issue_id, title, edition_slug, body)
+                   VALUES (?, ?, ?, ?)
+                   ON CONFLICT (issue_id) DO UPDATE SET
+                       title = EXCLUDED.title, edition_slug = EXCLUDED.edition_slug,
+                       body = EXCLUDED.body
+                   RETURNING issue_id""",
+                values,
+            )
+        else:
+            # FTS5 tables have no UPSERT.
+            conn.execute("DELETE FROM archive_search WHERE rowid = ?", (issue_id,))
+            conn.execute(
+                "INSERT INTO archive_search (rowid, title, edition_slug, body) VALUES (?, ?, ?, ?)",
+                values,
+            )
+
+    @staticmethod
+    def _search_terms(query: str) -> list[str]:
+        import re
+        return re.findall(r"\w+", query.lower())[:16]
+
+    def search_archive(
+        self, query: str, edition_slug: str = "", limit: int = 20, offset: int = 0,
+    ) -> tuple[list[dict], int]:
+        """Ranked full-text search over published issues.
+
+        Matches every word of ``query`` (stemmed) against title, edition
+        and assembled plain text, title hits ranking highest. Returns
+        ``(rows, total)`` where each row is the issue dict plus ``score``
+        and ``snippet`` — an excerpt with matches wrapped in
+        ``SEARCH_MARK_START`` / ``SEARCH_MARK_END``.
+        """
+        terms = self._search_terms(query)
+        if not terms:
+            return [], 0
+
+        edition_clause = " AND i.edition_slug = ?" if edition_slug else ""
+        edition_params = (edition_slug,) if edition_slug else ()
+        conn = self._conn()
+        if self._is_pg:
+            tsquery = " ".join(terms)
+            total = conn.execute(
+                f"""SELECT COUNT(*) AS c FROM archive_search s
+                    JOIN issues i ON i.id = s.issue_id
+                    WHERE s.tsv @@ plainto_tsquery('english', ?)
+                      AND i.status = 'published'{edition_clause}""",
+                (tsquery, *edition_params),
+            ).fetchone()["c"]
+            headline_opts = (
+                f"StartSel={self.SEARCH_MARK_START}, StopSel={self.SEARCH_MARK_END}, "
+                "MaxWords=35, MinWords=15, MaxFragments=2"
+            )
+            rows = conn.execute(
+                f"""SELECT i.*, ts_rank(s.tsv, q) AS score,
+                           ts_headline('english', s.body, q, ?) AS snippet
+                    FROM archive_search s
+                    JOIN issues i ON i.id = s.issue_id,
+                         plainto_tsquery('english', ?) q
+                    WHERE s.tsv @@ q AND i.status = 'published'{edition_clause}
+                    ORDER BY score DESC, i.issue_number DESC
+                    LIMIT ? OFFSET ?""",
+                (headline_opts, tsquery, *edition_params, limit, offset),
+            ).fetchall()
+        else:
+            match = " ".join(f'"{t}"' for t in terms)
+            total = conn.execute(
+                f"""SELECT COUNT(*) AS c FROM archive_search
+                    JOIN issues i ON i.id = archive_search.rowid
+                    WHERE archive_search MATCH ?
+                      AND i.status = 'published'{edition_clause}""",
+                (match, *edition_params),
+            ).fetchone()["c"]
+            # bm25() is lower-is-better; column weights title > edition > body.
+            rows = conn.execute(
+                f"""SELECT i.*, bm25(archive_search, 10.0, 5.0, 1.0) AS score,
+                           snippet(archive_search, 2, ?, ?, '…', 24) AS snippet
+                    FROM archive_search
+                    JOIN issues i ON i.id = archive_search.rowid
+                    WHERE archive_search MATCH ?
+                      AND i.status = 'published'{edition_clause}
+                    ORDER BY score, i.issue_number DESC
+                    LIMIT ? OFFSET ?""",
+                (self.SEARCH_MARK_START, self.SEARCH_MARK_END, match,
+                 *edition_params, limit, offset),
+            ).fetchall()
+        conn.close()
+        return [dict(r) for r in rows], total
+
+    # ---- Rendered Pages (materialized feeds / archive) ----
+
+    def get_rendered_page(self, cache_key: str) -> Optional[dict]:
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT * FROM rendered_pages WHERE cache_key = ?", (cache_key,),
+        ).fetchone()
+        conn.close()
+        return dict(row) if row else None
+
+    def get_rendered_pages_generation(self) -> int:
+        """Version of the ``issues`` cache namespace, bumped by every invalidation."""
+        return self.get_cache_versions().get("issues", 0)
+
+    def save_rendered_page(
+        self, cache_key: str, content_type: str, body: str, etag: str, last_modified: str,
+        generation: Optional[int] = None,
+    ) -> bool:
+        """Store a materialized page; False when it was built too long ago.
+
+        ``generation`` is :meth:`get_rendered_pages_generation` as read
+        before the page was built. If an invalidation has run since, the
+        body may predate it, so it is not saved: the check and the write
+        are one statement.
+        """
+        conn = self._conn()
+        cur = conn.execute(
+            """INSERT INTO rendered_pages (cache_key, content_type, body, etag, last_modified)
+               SELECT ?, ?, ?, ?, ?
+               WHERE ? IS NULL
+                  OR COALESCE((SELECT version FROM cache_versions WHERE namespace = 'issues'), 0) = ?
+               ON CONFLICT(cache_key) DO UPDATE SET
+                   content_type = excluded.content_type, body = excluded.body,
+                   etag = excluded.etag, last_modified = excluded.last_modified""",
+            (cache_key, content_type, body, etag, last_modified, generation, generation),
+        )
         conn.commit()
+        saved = cur.rowcount > 0
         conn.close()
+        return saved
+
+    def invalidate_rendered_pages(self) -> None:
+        conn = self._conn()
+        self._invalidate_rendered_pages(conn)
+        conn.commit()
+        _notify_content_change()
+        conn.close()
+
+    @staticmethod
+    def _invalidate_rendered_pages(conn) -> None:
+        """Drop every materialized page inside the caller's transaction.
+
+        Called from each write that can change what a public feed or
+        archive page shows. The pages are rebuilt on their next request,
+        so a blanket delete is cheaper than working out which keys an
+        edit touched. The caller runs :func:`_notify_content_change`
+        once it has committed.
+        """
+        conn.execute("DELETE FROM rendered_pages")
+        Repository._bump_cache_version(conn, "issues")
+
+    # ---- Cache invalidation versions ----
+
+    @staticmethod
+    def _bump_cache_version(conn, namespace: str) -> None:
+        """Advance ``namespace`` in cache_versions inside the caller's transaction.
+
+        Other workers notice on their next :func:`weeklyamp.core.cache_bus.poll`.
+        On Postgres a NOTIFY goes out too; it is delivered on commit, so
+        listeners never re-read before the change is visible.
+        """
+        if isinstance(conn, _PgConnAdapter):
+            conn.execute(
+                "INSERT INTO cache_versions (namespace, version) VALUES (?, 1) "
+                "ON CONFLICT (namespace) DO UPDATE SET version = cache_versions.version + 1, "
+                "updated_at = CURRENT_TIMESTAMP RETURNING namespace",
+                (namespace,),
+            )
+            conn.execute("SELECT pg_notify('weeklyamp_cache', ?)", (namespace,))
+        else:
+            conn.execute(
+                "INSERT INTO cache_versions (namespace, version) VALUES (?, 1) "
+                "ON CONFLICT(namespace) DO UPDATE SET version = cache_versions.version + 1, "
+                "updated_at = CURRENT_TIMESTAMP",
+                (namespace,),
+            )
+
+    def bump_cache_version(self, namespace: str) -> None:
+        conn = self._conn()
+        try:
+            self._bump_cache_version(conn, namespace)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get_cache_versions(self) -> dict[str, int]:
+        """Current version of every cache namespace (one small read)."""
+        conn = self._conn()
+        try:
+            rows = conn.execute("SELECT namespace, version FROM cache_versions").fetchall()
+        finally:
+            conn.close()
+        return {r["namespace"]: r["version"] for r in rows}
 
     # ---- Subscribers ----
 
@@ -652,6 +1363,81 @@ class Repository:
         conn.commit()
         conn.close()
 
+    @staticmethod
+    def _subscribers_by_email(conn, emails: list[str]) -> list:
+        """``id, email`` rows for ``emails`` on an open connection, queried
+        in slices that stay well under SQLite's bound-parameter limit."""
+        rows: list = []
+        for i in range(0, len(emails), 500):
+            batch = emails[i:i + 500]
+            placeholders = ",".join("?" for _ in batch)
+            rows.extend(conn.execute(
+                f"SELECT id, email FROM subscribers WHERE email IN ({placeholders})",
+                tuple(batch),
+            ).fetchall())
+        return rows
+
+    def upsert_subscribers(self, rows: list[tuple[str, str]], status: str = "active") -> int:
+        """Bulk ``upsert_subscriber`` for ``(email, ghl_contact_id)`` pairs.
+
+        One connection and one transaction per call. Returns how many of
+        the emails were not already in the table.
+        """
+        if not rows:
+            return 0
+        emails = list({email for email, _ in rows})
+        conn = self._conn()
+        try:
+            existing = {r["email"] for r in self._subscribers_by_email(conn, emails)}
+            conn.executemany(
+                """INSERT INTO subscribers (email, ghl_contact_id, status, synced_at)
+                   VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                   ON CONFLICT(email) DO UPDATE SET
+                       ghl_contact_id = excluded.ghl_contact_id,
+                       status = excluded.status,
+                       synced_at = CURRENT_TIMESTAMP""",
+                [(email, ghl_contact_id, status) for email, ghl_contact_id in rows],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return len(emails) - len(existing)
+
+    def unsubscribe_ghl_contacts(self, rows: list[tuple[str, str]]) -> int:
+        """Unsubscribe active rows linked to GHL contacts that left the list.
+
+        ``rows`` are ``(ghl_contact_id, current_email)``: every active
+        subscriber with that contact id but a different email is
+        unsubscribed. An empty email (contact untagged or marked DND in
+        GHL) unsubscribes all of them; a changed email retires the row
+        for the old address. Returns how many rows changed.
+        """
+        current = {cid: email for cid, email in rows if cid}
+        if not current:
+            return 0
+        cids = list(current)
+        conn = self._conn()
+        try:
+            stale: list[tuple[int]] = []
+            for start in range(0, len(cids), 500):
+                chunk = cids[start:start + 500]
+                marks = ", ".join("?" for _ in chunk)
+                for r in conn.execute(
+                    f"""SELECT id, email, ghl_contact_id FROM subscribers
+                        WHERE status = 'active' AND ghl_contact_id IN ({marks})""",
+                    chunk,
+                ).fetchall():
+                    if r["email"] != current[r["ghl_contact_id"]]:
+                        stale.append((r["id"],))
+            conn.executemany(
+                "UPDATE subscribers SET status = 'unsubscribed', synced_at = CURRENT_TIMESTAMP WHERE id = ?",
+                stale,
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return len(stale)
+
     def update_subscriber_ghl_id(self, subscriber_id: int, ghl_contact_id: str) -> None:
         conn = self._conn()
         conn.execute(
@@ -661,6 +1447,18 @@ class Repository:
         conn.commit()
         conn.close()
 
+    def update_subscriber_ghl_ids(self, pairs: list[tuple[int, str]]) -> None:
+        """Bulk ``update_subscriber_ghl_id`` for ``(subscriber_id, ghl_contact_id)``."""
+        if not pairs:
+            return
+        conn = self._conn()
+        conn.executemany(
+            "UPDATE subscribers SET ghl_contact_id = ? WHERE id = ?",
+            [(ghl_contact_id, subscriber_id) for subscriber_id, ghl_contact_id in pairs],
+        )
+        conn.commit()
+        conn.close()
+
     def get_subscriber_count(self, edition_slugs: "list[str] | None" = None) -> int:
         """Count active subscribers.
 
@@ -668,23 +1466,79 @@ class Repository:
         subscribed to any of the given edition slugs — used by the
         licensee portal so operators see their city's subscribers, not
         the global tenant count.
+
+        The global and single-edition counts come from the
+        trigger-maintained ``subscriber_counters`` table; only a
+        multi-edition count (which must not double-count overlaps)
+        still joins the subscriber tables.
         """
         conn = self._conn()
-        if edition_slugs:
-            placeholders = ",".join("?" for _ in edition_slugs)
-            sql = (
-                "SELECT COUNT(DISTINCT s.id) as c FROM subscribers s "
-                "JOIN subscriber_editions se ON se.subscriber_id = s.id "
-                "JOIN newsletter_editions ne ON ne.id = se.edition_id "
-                f"WHERE s.status = 'active' AND ne.slug IN ({placeholders})"
-            )
-            row = conn.execute(sql, tuple(edition_slugs)).fetchone()
-        else:
-            row = conn.execute(
-                "SELECT COUNT(*) as c FROM subscribers WHERE status = 'active'"
-            ).fetchone()
-        conn.close()
-        return row["c"]
+        try:
+            if not edition_slugs:
+                row = conn.execute(
+                    "SELECT active_count AS c FROM subscriber_counters WHERE edition_id = 0"
+                ).fetchone()
+                if row is None:
+                    row = conn.execute(
+                        "SELECT COUNT(*) as c FROM subscribers WHERE status = 'active'"
+                    ).fetchone()
+            elif len(edition_slugs) == 1:
+                row = conn.execute(
+                    "SELECT sc.active_count AS c FROM subscriber_counters sc "
+                    "JOIN newsletter_editions ne ON ne.id = sc.edition_id WHERE ne.slug = ?",
+                    (edition_slugs[0],),
+                ).fetchone()
+            else:
+                placeholders = ",".join("?" for _ in edition_slugs)
+                sql = (
+                    "SELECT COUNT(DISTINCT s.id) as c FROM subscribers s "
+                    "JOIN subscriber_editions se ON se.subscriber_id = s.id "
+                    "JOIN newsletter_editions ne ON ne.id = se.edition_id "
+                    f"WHERE s.status = 'active' AND ne.slug IN ({placeholders})"
+                )
+                row = conn.execute(sql, tuple(edition_slugs)).fetchone()
+        finally:
+            conn.close()
+        return row["c"] if row else 0
+
+    def reconcile_subscriber_counters(self) -> int:
+        """Recompute ``subscriber_counters`` from the subscriber tables.
+
+        Corrects drift from writes the triggers cannot see (bulk repairs,
+        restores, ``INSERT OR REPLACE``). Returns how many counters were
+        wrong.
+        """
+        conn = self._conn()
+        try:
+            actual = {0: conn.execute(
+                "SELECT COUNT(*) AS c FROM subscribers WHERE status = 'active'"
+            ).fetchone()["c"]}
+            for r in conn.execute("SELECT id FROM newsletter_editions").fetchall():
+                actual[r["id"]] = 0
+            for r in conn.execute(
+                "SELECT se.edition_id AS edition_id, COUNT(*) AS c FROM subscriber_editions se "
+                "JOIN subscribers s ON s.id = se.subscriber_id "
+                "WHERE s.status = 'active' GROUP BY se.edition_id"
+            ).fetchall():
+                actual[r["edition_id"]] = r["c"]
+            stored = {
+                r["edition_id"]: r["active_count"]
+                for r in conn.execute("SELECT edition_id, active_count FROM subscriber_counters").fetchall()
+            }
+            wrong = [(eid, count) for eid, count in actual.items() if stored.get(eid) != count]
+            if wrong:
+                sql = (
+                    "INSERT INTO subscriber_counters (edition_id, active_count) VALUES (?, ?) "
+                    "ON CONFLICT(edition_id) DO UPDATE SET active_count = excluded.active_count, "
+                    "updated_at = CURRENT_TIMESTAMP"
+                )
+                conn.executemany(sql, wrong)
+                conn.commit()
+        finally:
+            conn.close()
+        if wrong:
+            logger.warning("Reconciled %d drifted subscriber counters", len(wrong))
+        return len(wrong)
 
     def get_subscribers(self, status: str = "active") -> list[dict]:
         conn = self._conn()
@@ -694,6 +1548,35 @@ class Repository:
         conn.close()
         return [dict(r) for r in rows]
 
+    def iter_subscribers(
+        self, statuses: "tuple[str, ...]" = ("active",), batch_size: int = 1000,
+    ) -> Iterator[dict]:
+        """Yield subscribers with any of ``statuses`` in id order.
+
+        Keyset-paginated: each batch is a separate short query on
+        ``id > last_id``, so memory stays at one batch however large the
+        table is, and no connection is held open between batches — a
+        slow download never pins a pool connection or a SQLite read
+        transaction.
+        """
+        placeholders = ",".join("?" for _ in statuses)
+        sql = (
+            f"SELECT * FROM subscribers WHERE status IN ({placeholders}) "
+            "AND id > ? ORDER BY id LIMIT ?"
+        )
+        last_id = 0
+        while True:
+            conn = self._conn()
+            try:
+                rows = conn.execute(sql, (*statuses, last_id, batch_size)).fetchall()
+            finally:
+                conn.close()
+            for row in rows:
+                yield dict(row)
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1]["id"]
+
     def get_subscribers_for_edition(self, edition_slug: str) -> list[dict]:
         """Return active subscribers who are subscribed to the given edition."""
         conn = self._conn()
@@ -784,6 +1667,56 @@ class Repository:
         conn.close()
         return sub_id
 
+    def import_subscribers(
+        self, rows: list[tuple[str, str, str]], source_channel: str = "csv_import",
+    ) -> int:
+        """Bulk ``subscribe_to_editions`` for ``(email, first_name, edition_slug)``.
+
+        The whole batch is one transaction: one lookup of which emails
+        already exist, one ``executemany`` upsert of the subscribers, one
+        id lookup and one ``executemany`` for the edition links. Rows for
+        unknown edition slugs still create the subscriber, as the
+        single-row path does. Returns how many emails were new.
+        """
+        if not rows:
+            return 0
+        emails = list(dict.fromkeys(email for email, _, _ in rows))
+        default_days = "monday,wednesday,saturday"
+        conn = self._conn()
+        try:
+            edition_ids = {
+                r["slug"]: r["id"]
+                for r in conn.execute("SELECT id, slug FROM newsletter_editions").fetchall()
+            }
+            existing = {r["email"] for r in self._subscribers_by_email(conn, emails)}
+            conn.executemany(
+                """INSERT INTO subscribers (email, first_name, source_channel, status, subscribed_at)
+                   VALUES (?, ?, ?, 'active', CURRENT_TIMESTAMP)
+                   ON CONFLICT(email) DO UPDATE SET
+                       first_name = CASE WHEN excluded.first_name != '' THEN excluded.first_name ELSE subscribers.first_name END,
+                       source_channel = CASE WHEN excluded.source_channel != '' THEN excluded.source_channel ELSE subscribers.source_channel END,
+                       status = 'active',
+                       synced_at = CURRENT_TIMESTAMP""",
+                [(email, first_name, source_channel) for email, first_name, _ in rows],
+            )
+            sub_ids = {r["email"]: r["id"] for r in self._subscribers_by_email(conn, emails)}
+            links = {
+                (sub_ids[email], edition_ids[slug])
+                for email, _, slug in rows
+                if slug in edition_ids and email in sub_ids
+            }
+            conn.executemany(
+                """INSERT INTO subscriber_editions (subscriber_id, edition_id, send_days)
+                   VALUES (?, ?, ?)
+                   ON CONFLICT(subscriber_id, edition_id) DO UPDATE SET
+                       send_days = excluded.send_days""",
+                [(sub_id, edition_id, default_days) for sub_id, edition_id in sorted(links)],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return len(emails) - len(existing)
+
     def get_edition_subscriber_count(self, edition_id: int) -> int:
         conn = self._conn()
         row = conn.execute(
@@ -1638,6 +2571,43 @@ class Repository:
         conn.close()
         return dict(row) if row else None
 
+    def get_guest_articles_by_drafts(self, draft_ids: list[int]) -> dict[int, dict]:
+        """``get_guest_article_by_draft`` for many drafts: ``{draft_id: article}``."""
+        ids = [int(i) for i in draft_ids]
+        if not ids:
+            return {}
+        marks = ", ".join("?" for _ in ids)
+        conn = self._conn()
+        rows = conn.execute(
+            f"""SELECT a.*, c.name as contact_name, c.email as contact_email
+               FROM guest_articles a
+               LEFT JOIN guest_contacts c ON a.contact_id = c.id
+               WHERE a.draft_id IN ({marks}) ORDER BY a.id""",
+            ids,
+        ).fetchall()
+        conn.close()
+        result: dict[int, dict] = {}
+        for r in rows:
+            result.setdefault(r["draft_id"], dict(r))
+        return result
+
+    def get_submissions_by_drafts(self, draft_ids: list[int]) -> dict[int, dict]:
+        """``get_submission_by_draft`` for many drafts: ``{draft_id: submission}``."""
+        ids = [int(i) for i in draft_ids]
+        if not ids:
+            return {}
+        marks = ", ".join("?" for _ in ids)
+        conn = self._conn()
+        rows = conn.execute(
+            f"SELECT * FROM artist_submissions WHERE draft_id IN ({marks}) ORDER BY id",
+            ids,
+        ).fetchall()
+        conn.close()
+        result: dict[int, dict] = {}
+        for r in rows:
+            result.setdefault(r["draft_id"], dict(r))
+        return result
+
     # ---- Artist Submissions ----
 
     def create_submission(
@@ -2884,6 +3854,55 @@ class Repository:
         conn.commit()
         conn.close()
 
+    def upsert_spotify_releases(self, releases: list[dict]) -> None:
+        """Bulk ``upsert_spotify_release`` in one transaction."""
+        if not releases:
+            return
+        conn = self._conn()
+        conn.executemany(
+            """INSERT INTO spotify_releases
+               (spotify_artist_id, album_id, album_name, release_date, album_type, image_url, external_url)
+               VALUES (?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(spotify_artist_id, album_id) DO UPDATE SET
+                   album_name=excluded.album_name, release_date=excluded.release_date,
+                   image_url=excluded.image_url, external_url=excluded.external_url""",
+            [
+                (r["spotify_artist_id"], r["album_id"], r.get("album_name", ""),
+                 r.get("release_date", ""), r.get("album_type", "single"),
+                 r.get("image_url", ""), r.get("external_url", ""))
+                for r in releases
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+    def get_spotify_release_watermarks(self) -> dict[str, str]:
+        """``{spotify_artist_id: last_release_date}`` for every scanned artist."""
+        conn = self._conn()
+        rows = conn.execute(
+            "SELECT spotify_artist_id, last_release_date FROM spotify_release_watermarks "
+            "WHERE last_release_date != ''"
+        ).fetchall()
+        conn.close()
+        return {r["spotify_artist_id"]: r["last_release_date"] for r in rows}
+
+    def set_spotify_release_watermarks(self, watermarks: dict[str, str]) -> None:
+        """Record scan results; kept apart from spotify_artist_cache so
+        scanning an artist never creates a nameless cache row."""
+        if not watermarks:
+            return
+        conn = self._conn()
+        conn.executemany(
+            """INSERT INTO spotify_release_watermarks (spotify_artist_id, last_release_date, checked_at)
+               VALUES (?, ?, CURRENT_TIMESTAMP)
+               ON CONFLICT(spotify_artist_id) DO UPDATE SET
+                   last_release_date=excluded.last_release_date,
+                   checked_at=excluded.checked_at""",
+            list(watermarks.items()),
+        )
+        conn.commit()
+        conn.close()
+
     def get_recent_releases(self, limit: int = 20) -> list[dict]:
         conn = self._conn()
         rows = conn.execute(
@@ -3632,8 +4651,36 @@ class Repository:
         conn = self._conn()
         set_clause = ", ".join(f"{k} = ?" for k in fields)
         conn.execute(f"UPDATE audio_issues SET {set_clause} WHERE id = ?", (*fields.values(), audio_id))
+        self._invalidate_rendered_pages(conn)
         conn.commit()
+        _notify_content_change()
+        conn.close()
+
+    def get_issues_needing_audio(self, limit: int = 3, stale_after_seconds: float = 30 * 60) -> list[int]:
+        """Published, assembled issues with no complete or in-progress audio.
+
+        A ``processing`` row older than ``stale_after_seconds`` lost its
+        worker mid-render, so it no longer holds the issue back.
+        """
+        from datetime import timedelta, timezone
+        cutoff = (datetime.now(timezone.utc) - timedelta(seconds=stale_after_seconds)).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+        conn = self._conn()
+        rows = conn.execute(
+            """SELECT i.id FROM issues i
+               WHERE i.status = 'published'
+                 AND EXISTS (SELECT 1 FROM assembled_issues a WHERE a.issue_id = i.id)
+                 AND NOT EXISTS (
+                     SELECT 1 FROM audio_issues au
+                     WHERE au.issue_id = i.id
+                       AND (au.status = 'complete' OR (au.status = 'processing' AND au.created_at >= ?))
+                 )
+               ORDER BY i.id DESC LIMIT ?""",
+            (cutoff, limit),
+        ).fetchall()
         conn.close()
+        return [r["id"] for r in rows]
 
     def get_audio_issues(self, limit: int = 50) -> list[dict]:
         conn = self._conn()
@@ -3738,6 +4785,118 @@ class Repository:
         conn.close()
         return row_id
 
+    @staticmethod
+    def _reserve_invoice_seq(conn, prefix: str, count: int = 1) -> int:
+        """Reserve ``count`` numbers for ``prefix``; returns the first.
+
+        Runs in the caller's transaction. The upsert takes the row lock
+        (Postgres) or the write lock (SQLite), so concurrent callers get
+        disjoint ranges.
+        """
+        is_pg = isinstance(conn, _PgConnAdapter)
+        conn.execute(
+            "INSERT INTO invoice_sequences (prefix, last_value) VALUES (?, ?) "
+            "ON CONFLICT (prefix) DO UPDATE SET last_value = invoice_sequences.last_value + ?"
+            + (" RETURNING prefix" if is_pg else ""),
+            (prefix, count, count),
+        )
+        row = conn.execute(
+            "SELECT last_value FROM invoice_sequences WHERE prefix = ?", (prefix,)
+        ).fetchone()
+        return row["last_value"] - count + 1
+
+    def next_invoice_number(self, prefix: str, stamp: str) -> str:
+        """Allocate one invoice number, e.g. ``LIC-202610-00042``."""
+        conn = self._conn()
+        try:
+            seq = self._reserve_invoice_seq(conn, prefix)
+            conn.commit()
+        finally:
+            conn.close()
+        return f"{prefix}-{stamp}-{seq:05d}"
+
+    def create_invoices(self, prefix: str, stamp: str, invoices: list[dict]) -> list[int]:
+        """Number and insert ``invoices`` in one transaction; returns new ids.
+
+        Each dict carries the create_invoice fields plus ``billing_period``.
+        A row whose entity already has an invoice for that period is
+        skipped (idx_invoices_period), so a re-run never double-bills.
+        """
+        if not invoices:
+            return []
+        conn = self._conn()
+        ids: list[int] = []
+        try:
+            first = self._reserve_invoice_seq(conn, prefix, len(invoices))
+            for offset, inv in enumerate(invoices):
+                cur = conn.execute(
+                    "INSERT INTO invoices (invoice_number, entity_type, entity_id, amount_cents, "
+                    "line_items_json, due_date, notes, billing_period) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (entity_type, entity_id, billing_period) WHERE billing_period != '' "
+                    "DO NOTHING",
+                    (
+                        f"{prefix}-{stamp}-{first + offset:05d}",
+                        inv["entity_type"], inv["entity_id"], inv["amount_cents"],
+                        inv.get("line_items_json", "[]"), inv.get("due_date", ""),
+                        inv.get("notes", ""), inv.get("billing_period", ""),
+                    ),
+                )
+                if cur.rowcount and cur.lastrowid:
+                    ids.append(cur.lastrowid)
+            conn.commit()
+        finally:
+            conn.close()
+        return ids
+
+    def get_licensee_billing_rows(self, month: str, licensee_id: int = 0) -> list[dict]:
+        """Active licensees not yet invoiced for ``month``, with that month's platform share."""
+        sql = (
+            "SELECT l.id, l.license_fee_cents, l.revenue_share_pct, "
+            "COALESCE(r.platform_share_cents, 0) AS platform_share_cents "
+            "FROM licensees l "
+            "LEFT JOIN (SELECT licensee_id, SUM(platform_share_cents) AS platform_share_cents "
+            "           FROM license_revenue WHERE month = ? GROUP BY licensee_id) r "
+            "  ON r.licensee_id = l.id "
+            "WHERE l.status = 'active' AND NOT EXISTS ("
+            "  SELECT 1 FROM invoices i WHERE i.entity_type = 'licensee' "
+            "  AND i.entity_id = l.id AND i.billing_period = ?) "
+        )
+        params: list = [month, month]
+        if licensee_id:
+            sql += "AND l.id = ? "
+            params.append(licensee_id)
+        conn = self._conn()
+        rows = conn.execute(sql + "ORDER BY l.id", params).fetchall()
+        conn.close()
+        return [dict(r) for r in rows]
+
+    def get_artist_newsletter_billing_rows(self, month: str, newsletter_id: int = 0) -> list[dict]:
+        """Artist newsletters not yet invoiced for ``month``, with active subscriber counts.
+
+        The monthly run bills 'active' newsletters; a single newsletter
+        (``newsletter_id``) may also be billed while still in 'setup'.
+        """
+        sql = (
+            "SELECT an.id, COALESCE(s.cnt, 0) AS subscriber_count "
+            "FROM artist_newsletters an "
+            "LEFT JOIN (SELECT newsletter_id, COUNT(*) AS cnt FROM artist_newsletter_subscribers "
+            "           WHERE status = 'active' GROUP BY newsletter_id) s "
+            "  ON s.newsletter_id = an.id "
+            "WHERE NOT EXISTS ("
+            "  SELECT 1 FROM invoices i WHERE i.entity_type = 'artist_newsletter' "
+            "  AND i.entity_id = an.id AND i.billing_period = ?) "
+        )
+        params: list = [month]
+        if newsletter_id:
+            sql += "AND an.id = ? AND an.status IN ('active', 'setup') "
+            params.append(newsletter_id)
+        else:
+            sql += "AND an.status = 'active' "
+        conn = self._conn()
+        rows = conn.execute(sql + "ORDER BY an.id", params).fetchall()
+        conn.close()
+        return [dict(r) for r in rows]
+
     def get_invoices(self, entity_type: str = "", entity_id: int = 0, status: str = "") -> list[dict]:
         conn = self._conn()
         sql = "SELECT * FROM invoices WHERE 1=1"
@@ -4455,6 +5614,7 @@ class Repository:
         params.append(licensee_id)
         conn = self._conn()
         conn.execute(sql, tuple(params))
+        self._bump_cache_version(conn, "domains")
         conn.commit()
         conn.close()
 
@@ -4465,6 +5625,7 @@ class Repository:
             "updated_at = CURRENT_TIMESTAMP WHERE id = ?",
             (licensee_id,),
         )
+        self._bump_cache_version(conn, "domains")
         conn.commit()
         conn.close()
 
@@ -4475,6 +5636,7 @@ class Repository:
         if status == "active":
             updates += ", activated_at = CURRENT_TIMESTAMP"
         conn.execute(f"UPDATE licensees SET {updates} WHERE id = ?", (*params, licensee_id))
+        self._bump_cache_version(conn, "domains")
         conn.commit()
         conn.close()
 
@@ -4812,6 +5974,8 @@ class Repository:
                     "updated_at = CURRENT_TIMESTAMP",
                     (key, value),
                 )
+            if key in CACHED_ADMIN_SETTINGS:
+                self._bump_cache_version(conn, "admin_settings")
             conn.commit()
         finally:
             conn.close()
@@ -4871,23 +6035,14 @@ class Repository:
         """
         conn = self._conn()
         try:
-            editions = conn.execute(
-                "SELECT slug FROM newsletter_editions"
-            ).fetchall()
-            counts = conn.execute(
-                "SELECT ne.slug AS slug, COUNT(DISTINCT s.id) AS c "
-                "FROM subscribers s "
-                "JOIN subscriber_editions se ON se.subscriber_id = s.id "
-                "JOIN newsletter_editions ne ON ne.id = se.edition_id "
-                "WHERE s.status = 'active' "
-                "GROUP BY ne.slug"
+            rows = conn.execute(
+                "SELECT ne.slug AS slug, COALESCE(sc.active_count, 0) AS c "
+                "FROM newsletter_editions ne "
+                "LEFT JOIN subscriber_counters sc ON sc.edition_id = ne.id"
             ).fetchall()
         finally:
             conn.close()
-        by_slug = {r["slug"]: 0 for r in editions}
-        for r in counts:
-            by_slug[r["slug"]] = r["c"]
-        return by_slug
+        return {r["slug"]: r["c"] for r in rows}
 
     # ---- Feature flags (runtime-mutable feature toggles) ----
     # Table schema (from db/schema.sql): feature_flags(
@@ -4951,6 +6106,7 @@ class Repository:
                     "updated_at = CURRENT_TIMESTAMP",
                     (key, 1 if enabled else 0, description),
                 )
+            self._bump_cache_version(conn, "feature_flags")
             conn.commit()
         finally:
             conn.close()
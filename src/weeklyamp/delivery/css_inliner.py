@@ -11,12 +11,20 @@ def inline_css(html: str) -> str:
     This ensures consistent rendering across email clients (Outlook,
     Gmail, Yahoo) that strip <style> tags.
 
+    HTML with no ``<style>`` block or stylesheet link is returned as-is
+    without a parse — there is nothing to move, and the per-recipient
+    send loop calls this once per inbox.
+
     Gracefully degrades: returns the original HTML unchanged if
     ``premailer`` is not installed or if transformation fails.
     """
     if not html:
         return html
 
+    lowered = html.lower()
+    if "<style" not in lowered and "<link" not in lowered:
+        return html
+
     try:
         import premailer
 
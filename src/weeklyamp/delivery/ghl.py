@@ -1,10 +1,17 @@
-"""GoHighLevel (GHL) API v2 client for contact management and email campaigns."""
+"""GoHighLevel (GHL) API v2 client for contact management and email campaigns.
+
+Every request passes through a token bucket shared by all clients for
+the same location, sized to GHL's per-location quota (ghl.requests_per_second
+/ ghl.burst), so concurrent pushes and a running sync cannot together
+exceed it. A 429 pauses the bucket for Retry-After and is retried.
+"""
 
 from __future__ import annotations
 
 import logging
+import threading
 import time
-from typing import Optional
+from typing import Iterator, Optional
 
 import httpx
 
@@ -15,6 +22,67 @@ logger = logging.getLogger(__name__)
 # GHL API version header required for v2 endpoints
 _API_VERSION = "2021-07-28"
 
+_MAX_RETRIES = 3
+
+
+def _added_ms(contact: dict) -> str:
+    """``dateAdded`` as epoch milliseconds (GHL's ``startAfter`` unit), or ""."""
+    from datetime import datetime
+    try:
+        added = datetime.fromisoformat(str(contact.get("dateAdded", "")).replace("Z", "+00:00"))
+    except ValueError:
+        return ""
+    return str(int(added.timestamp() * 1000))
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens/second, at most ``capacity``."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = max(rate, 0.001)
+        self.capacity = max(capacity, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self._blocked_until:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+                else:
+                    wait = self._blocked_until - now
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for ``seconds`` (server said Retry-After) and
+        restart from an empty bucket."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+            self._updated = self._blocked_until
+
+
+_limiters: dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def _limiter_for(config: GHLConfig) -> TokenBucket:
+    with _limiters_lock:
+        bucket = _limiters.get(config.location_id)
+        if bucket is None:
+            bucket = TokenBucket(config.requests_per_second, config.burst)
+            _limiters[config.location_id] = bucket
+    return bucket
+
 
 class GHLClient:
     """Client for the GoHighLevel API v2."""
@@ -31,6 +99,23 @@ class GHLClient:
             },
             timeout=30.0,
         )
+        self._limiter = _limiter_for(config)
+
+    def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Rate-limited request; retries 429s after their Retry-After."""
+        for attempt in range(_MAX_RETRIES + 1):
+            self._limiter.acquire()
+            resp = self._client.request(method, url, **kwargs)
+            if resp.status_code != 429 or attempt == _MAX_RETRIES:
+                break
+            try:
+                delay = min(float(resp.headers.get("Retry-After", "")), 60.0)
+            except ValueError:
+                delay = 2.0 ** attempt
+            logger.warning("GHL rate limited; pausing %.1fs", delay)
+            self._limiter.pause(delay)
+        resp.raise_for_status()
+        return resp
 
     # ---- Contacts ----
 
@@ -56,38 +141,27 @@ class GHLClient:
         if tags:
             payload["tags"] = tags
 
-        resp = self._client.post("/contacts/", json=payload)
-        resp.raise_for_status()
+        resp = self._request("POST", "/contacts/", json=payload)
         return resp.json().get("contact", {})
 
     def get_contact(self, contact_id: str) -> dict:
         """Get a contact by ID."""
-        resp = self._client.get(f"/contacts/{contact_id}")
-        resp.raise_for_status()
+        resp = self._request("GET", f"/contacts/{contact_id}")
         return resp.json().get("contact", {})
 
     def update_contact(self, contact_id: str, **fields) -> dict:
         """Update a contact's fields (tags, name, etc.)."""
-        resp = self._client.put(f"/contacts/{contact_id}", json=fields)
-        resp.raise_for_status()
+        resp = self._request("PUT", f"/contacts/{contact_id}", json=fields)
         return resp.json().get("contact", {})
 
     def add_tags(self, contact_id: str, tags: list[str]) -> dict:
         """Add tags to a contact."""
-        resp = self._client.post(
-            f"/contacts/{contact_id}/tags",
-            json={"tags": tags},
-        )
-        resp.raise_for_status()
+        resp = self._request("POST", f"/contacts/{contact_id}/tags", json={"tags": tags})
         return resp.json()
 
     def remove_tags(self, contact_id: str, tags: list[str]) -> dict:
         """Remove tags from a contact."""
-        resp = self._client.delete(
-            f"/contacts/{contact_id}/tags",
-            json={"tags": tags},
-        )
-        resp.raise_for_status()
+        resp = self._request("DELETE", f"/contacts/{contact_id}/tags", json={"tags": tags})
         return resp.json()
 
     def search_contacts(
@@ -106,78 +180,84 @@ class GHLClient:
         if start_after:
             params["startAfterId"] = start_after
 
-        resp = self._client.get("/contacts/", params=params)
-        resp.raise_for_status()
+        resp = self._request("GET", "/contacts/", params=params)
         return resp.json()
 
-    def get_contacts_by_tag(self, tag: str, limit: int = 100) -> list[dict]:
-        """Get all contacts with a specific tag.
-
-        Uses search with tag filter and paginates through all results.
+    def iter_contact_pages(
+        self,
+        limit: int = 100,
+        start_after_id: str = "",
+        start_after: str = "",
+        query: str = "",
+    ) -> Iterator[tuple[list[dict], dict]]:
+        """Yield ``(contacts, cursor)`` one page at a time.
+
+        ``cursor`` holds the ``start_after_id`` / ``start_after`` values
+        that resume listing after this page's last contact, so a caller
+        can persist it once the page is handled and pick up from there
+        next run. It is taken from the contact itself because the final
+        page comes without a ``meta`` cursor.
+
+        Resuming relies on GHL listing contacts oldest first (ascending
+        ``dateAdded``). A page that moves the cursor backwards is logged,
+        since an incremental sync would then miss contacts; a full sync
+        is the remedy.
         """
-        all_contacts: list[dict] = []
-        start_after = ""
-
         while True:
             params: dict = {
                 "locationId": self.config.location_id,
                 "limit": limit,
-                "query": tag,
             }
+            if query:
+                params["query"] = query
+            if start_after_id:
+                params["startAfterId"] = start_after_id
             if start_after:
-                params["startAfterId"] = start_after
-
-            resp = self._client.get("/contacts/", params=params)
-            resp.raise_for_status()
-            data = resp.json()
+                params["startAfter"] = start_after
 
+            data = self._request("GET", "/contacts/", params=params).json()
             contacts = data.get("contacts", [])
-            # Filter to only those that actually have the tag
-            tagged = [c for c in contacts if tag in (c.get("tags", []) or [])]
-            all_contacts.extend(tagged)
-
-            meta = data.get("meta", {})
-            next_id = meta.get("startAfterId") or meta.get("nextPageUrl")
-            if not contacts or not next_id:
-                break
-            start_after = meta.get("startAfterId", "")
-            if not start_after:
-                break
-            # Respect rate limits
-            time.sleep(0.5)
-
-        return all_contacts
-
-    def get_all_contacts(self, limit: int = 100) -> list[dict]:
-        """Paginate through all contacts in the location."""
-        all_contacts: list[dict] = []
-        start_after = ""
-
-        while True:
-            params: dict = {
-                "locationId": self.config.location_id,
-                "limit": limit,
+            if not contacts:
+                return
+            meta = data.get("meta", {}) or {}
+            next_id = meta.get("startAfterId", "") or ""
+            next_after = str(meta.get("startAfter", "") or "")
+            last = contacts[-1]
+            cursor = {
+                "start_after_id": last.get("id") or next_id or start_after_id,
+                "start_after": next_after or _added_ms(last) or start_after,
             }
-            if start_after:
-                params["startAfterId"] = start_after
+            if (cursor["start_after"].isdigit() and start_after.isdigit()
+                    and int(cursor["start_after"]) < int(start_after)):
+                logger.warning(
+                    "GHL contacts are not listed oldest first (startAfter %s -> %s); "
+                    "incremental sync may skip contacts — run a full sync",
+                    start_after, cursor["start_after"],
+                )
+            yield contacts, cursor
+            if not next_id:
+                return
+            start_after_id, start_after = next_id, next_after
 
-            resp = self._client.get("/contacts/", params=params)
-            resp.raise_for_status()
-            data = resp.json()
+    def get_contacts_by_tag(self, tag: str, limit: int = 100) -> list[dict]:
+        """Get all contacts with a specific tag.
 
-            contacts = data.get("contacts", [])
-            if not contacts:
-                break
-            all_contacts.extend(contacts)
+        Uses search with tag filter and paginates through all results.
+        """
+        return [
+            c
+            for contacts, _ in self.iter_contact_pages(limit=limit, query=tag)
+            # Filter to only those that actually have the tag
+            for c in contacts if tag in (c.get("tags", []) or [])
+        ]
 
-            meta = data.get("meta", {})
-            start_after = meta.get("startAfterId", "")
-            if not start_after:
-                break
-            # Respect rate limits
-            time.sleep(0.5)
+    def get_all_contacts(self, limit: int = 100) -> list[dict]:
+        """Paginate through all contacts in the location.
 
-        return all_contacts
+        Holds every contact in memory; syncs should stream
+        ``iter_contact_pages`` instead.
+        """
+        return [c for contacts, _ in self.iter_contact_pages(limit=limit) for c in contacts]
 
     def get_contact_count(self, tag: str = "") -> int:
         """Get count of contacts, optionally filtered by tag."""
@@ -212,21 +292,14 @@ class GHLClient:
         if from_name:
             payload["emailFrom"] = f"{from_name} <{from_email}>"
 
-        resp = self._client.post(
-            f"/conversations/messages/email",
-            json=payload,
-        )
-        resp.raise_for_status()
+        resp = self._request("POST", "/conversations/messages/email", json=payload)
         return resp.json()
 
     # ---- Workflows ----
 
     def trigger_workflow(self, workflow_id: str, contact_id: str) -> dict:
         """Trigger a workflow for a contact."""
-        resp = self._client.post(
-            f"/contacts/{contact_id}/workflow/{workflow_id}",
-        )
-        resp.raise_for_status()
+        resp = self._request("POST", f"/contacts/{contact_id}/workflow/{workflow_id}")
         return resp.json()
 
     def close(self) -> None:
@@ -0,0 +1,210 @@
+"""Background send jobs for publishing an issue to subscribers.
+
+Publishing used to run ``SMTPSender.send_bulk`` inside the request
+handler, which held that worker's event loop for the whole send. The
+publish route now only records a row in ``send_jobs`` and schedules
+:func:`run_send_job`, which does the work off the request path:
+
+1. loads the recipients and runs the preflight checks,
+2. sends in batches, writing sent/failed counts to the job row after
+   each batch and stopping early once a cancel has been requested,
+3. on success marks the issue published and fires ``issue.published``,
+4. records elapsed time and throughput on the row for later analysis.
+
+Progress, cancellation and the final metrics all live in the database,
+so any worker can report on or cancel a job another worker is running.
+A runner claims its job with a conditional update, so a job is only
+ever run once, and heartbeats on every batch; the scheduler's
+:func:`sweep_stale_send_jobs` finishes jobs whose runner died.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Optional
+
+from weeklyamp.content.assembly import assemble_newsletter
+from weeklyamp.core import metrics
+from weeklyamp.core.models import AppConfig
+from weeklyamp.db.repository import Repository
+from weeklyamp.delivery.smtp_sender import SMTPSender
+from weeklyamp.delivery.tracking import TrackingProcessor
+
+logger = logging.getLogger(__name__)
+
+# A running job that hasn't reported progress in this long has lost its
+# worker. Generous, since one batch includes per-recipient personalizing.
+SEND_JOB_STALE_SECONDS = 15 * 60
+
+
+def enqueue_send_job(repo: Repository, issue: dict, assembled: dict, subject: str) -> tuple[int, bool]:
+    """Record a queued job for ``issue``; the caller schedules :func:`run_send_job`.
+
+    Returns ``(job_id, created)``. When a job is already queued or
+    running for this issue its id is returned with ``created=False``
+    instead of creating a second one, so a double-clicked Send button
+    never mails the list twice.
+    """
+    # Retry once: the active job we collided with may finish before we
+    # look it up, leaving the slot free again.
+    for _ in range(2):
+        job_id = repo.create_send_job(
+            issue_id=issue["id"],
+            assembled_id=assembled["id"],
+            edition_slug=issue.get("edition_slug", "") or "",
+            subject=subject,
+        )
+        if job_id is not None:
+            return job_id, True
+        active = repo.get_active_send_job(issue["id"])
+        if active:
+            return active["id"], False
+    raise RuntimeError(f"could not queue a send job for issue {issue['id']}")
+
+
+def _tracking_base(config: AppConfig) -> str:
+    """Base URL for /t/ links: the tracking domain when set, else the site."""
+    domain = config.tracking.tracking_domain
+    if not domain:
+        return config.site_domain
+    return domain if "://" in domain else f"https://{domain}"
+
+
+def _personalizer(repo: Repository, config: AppConfig, issue_id: int, preheader: str):
+    """Per-subscriber section ranking, when the genre engine asks for it."""
+    genre = getattr(config, "genre_preferences", None)
+    if not genre or not genre.weight_sections_by_genre:
+        return None
+
+    def _personalize(recipient: dict) -> tuple[str, str]:
+        sub_id = recipient.get("id")
+        if not sub_id:
+            return "", ""
+        try:
+            return assemble_newsletter(repo, issue_id, config, subscriber_id=sub_id, preheader_text=preheader)
+        except Exception:
+            # Personalizer never raises out of send_bulk — return
+            # empty so the bulk fallback HTML is used.
+            return "", ""
+
+    return _personalize
+
+
+def run_send_job(repo: Repository, config: AppConfig, job_id: int) -> Optional[dict]:
+    """Run a queued send job to completion, cancellation or failure.
+
+    Returns the send_bulk result, or None when the job could not start.
+    Never raises: failures are recorded on the job row.
+    """
+    try:
+        with metrics.job("send_job"):
+            return _run_send_job(repo, config, job_id)
+    except Exception:
+        logger.exception("Send job %s failed", job_id)
+        return None
+
+
+def _run_send_job(repo: Repository, config: AppConfig, job_id: int) -> Optional[dict]:
+    # Only the runner whose claim succeeds proceeds; a job cancelled
+    # while queued is already finished and can't be claimed.
+    if not repo.claim_send_job(job_id):
+        return None
+    job = repo.get_send_job(job_id)
+
+    started = time.monotonic()
+    try:
+        issue = repo.get_issue(job["issue_id"])
+        assembled = repo.get_assembled(job["issue_id"])
+        if not issue or not assembled:
+            repo.finish_send_job(job_id, "failed", error="Issue is no longer assembled.")
+            return None
+
+        recipients = repo.get_subscribers("active")
+
+        from weeklyamp.delivery.preflight import run_preflight
+        preflight = run_preflight(
+            subject=job["subject"],
+            html_body=assembled["html_content"],
+            plain_text=assembled.get("plain_text", "") or "",
+            recipients=recipients,
+        )
+        if preflight["blockers"]:
+            repo.finish_send_job(
+                job_id, "failed", error="Preflight check failed: " + "; ".join(preflight["blockers"]),
+            )
+            return None
+        if preflight["warnings"]:
+            logger.info("preflight warnings on issue %s: %s", issue["id"], "; ".join(preflight["warnings"]))
+
+        # Tracking links and the open pixel are resolved once here; the
+        # sender only fills in each recipient's id.
+        html = assembled["html_content"]
+        if config.tracking.open_tracking or config.tracking.click_tracking:
+            html = TrackingProcessor(config.tracking, repo).prepare_issue_html(
+                html, issue["id"], _tracking_base(config),
+            )
+
+        repo.set_send_job_total(job_id, len(recipients))
+
+        def _progress(sent: int, failed: int) -> bool:
+            repo.update_send_job_progress(job_id, sent, failed, time.monotonic() - started)
+            return not repo.is_send_job_cancel_requested(job_id)
+
+        preheader = assembled.get("preheader_text", "") or ""
+        result = SMTPSender(config.email).send_bulk(
+            recipients=recipients,
+            subject=job["subject"],
+            html_body=html,
+            plain_text=assembled.get("plain_text", ""),
+            site_domain=config.site_domain,
+            personalize=_personalizer(repo, config, issue["id"], preheader),
+            progress=_progress,
+        )
+    except Exception as exc:
+        repo.finish_send_job(job_id, "failed", error=str(exc))
+        raise
+
+    elapsed = time.monotonic() - started
+    repo.update_send_job_progress(job_id, result["sent"], result["failed"], elapsed)
+    repo.update_assembled_ghl(assembled["id"], f"smtp-{issue['id']}")
+    if result["sent"] > 0:
+        repo.update_issue_status(issue["id"], "published")
+        # Only an outbox insert — delivery happens in webhook_dispatch.
+        from weeklyamp.delivery.webhooks import WebhookManager
+        WebhookManager(repo, config.webhooks).fire_event("issue.published", {
+            "issue_id": issue["id"],
+            "issue_number": issue["issue_number"],
+            "edition_slug": job["edition_slug"],
+            "sent": result["sent"],
+        })
+
+    state = "cancelled" if result.get("cancelled") else "done"
+    error = "; ".join(result["errors"][:5]) if result["errors"] else ""
+    repo.finish_send_job(job_id, state, error=error)
+    logger.info("Send job %s %s: %d sent, %d failed", job_id, state, result["sent"], result["failed"])
+    return result
+
+
+def sweep_stale_send_jobs(repo: Repository) -> int:
+    """Fail or cancel jobs whose runner stopped heartbeating; returns how many."""
+    swept = repo.fail_stale_send_jobs(SEND_JOB_STALE_SECONDS)
+    if swept:
+        logger.warning("Finished %d stale send job(s)", swept)
+    return swept
+
+
+def job_stats(job: dict) -> dict:
+    """Progress for display: items done, percent and ETA in seconds.
+
+    The rate (emails per minute) is persisted on the row after every
+    batch, so a running job's ETA is the remaining count at that rate.
+    """
+    done = (job.get("sent") or 0) + (job.get("failed") or 0)
+    total = job.get("total") or 0
+    rate = job.get("rate_per_minute") or 0.0
+    eta = None
+    if job.get("state") == "running" and rate:
+        eta = max(total - done, 0) * 60.0 / rate
+    percent = min(int(done * 100 / total), 100) if total else 0
+    return {"done": done, "percent": percent, "rate": rate, "eta": eta}
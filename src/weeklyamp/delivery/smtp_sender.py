@@ -9,8 +9,10 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import Callable, Optional, Tuple
 
+from weeklyamp.core import metrics
 from weeklyamp.core.models import EmailConfig
 from weeklyamp.delivery.css_inliner import inline_css
+from weeklyamp.delivery.tracking import SUBSCRIBER_SLOT
 
 logger = logging.getLogger(__name__)
 
@@ -97,13 +99,18 @@ class SMTPSender:
                 server.login(self.config.smtp_user, self.config.smtp_password)
                 server.send_message(msg)
 
+        started = time.perf_counter()
         try:
             _retry_with_backoff(_do_send)
             logger.info("Email sent to %s", to_email)
+            metrics.inc("weeklyamp_smtp_messages_total", outcome="sent")
             return True
         except Exception:
             logger.exception("Failed to send email to %s after retries", to_email)
+            metrics.inc("weeklyamp_smtp_messages_total", outcome="failed")
             return False
+        finally:
+            metrics.observe("weeklyamp_smtp_send_duration_seconds", time.perf_counter() - started)
 
     def send_bulk(
         self,
@@ -114,6 +121,7 @@ class SMTPSender:
         site_domain: str = "",
         *,
         personalize: "Personalizer | None" = None,
+        progress: Optional[Callable[[int, int], bool]] = None,
     ) -> dict:
         """Send newsletter to a list of recipients via SMTP.
 
@@ -121,7 +129,9 @@ class SMTPSender:
             recipients: list of {"id": int, "email": str, "unsubscribe_token": str, ...}
             subject: Email subject line
             html_body: Full newsletter HTML — used when ``personalize``
-                is None or returns falsy for a recipient.
+                is None or returns falsy for a recipient. Any
+                ``{{subscriber_id}}`` slots (tracked links, open pixel)
+                are filled with the recipient's id.
             plain_text: Plain text version (same fallback semantics).
             site_domain: Base URL for unsubscribe links.
             personalize: Optional callable taking a recipient dict and
@@ -132,8 +142,12 @@ class SMTPSender:
                 ``html_body`` on a None/empty return keeps the loop
                 resilient: a single subscriber's personalization
                 failure does not abort the batch.
+            progress: Optional callable run after each batch with the
+                running ``(sent, failed)`` counts. Returning False stops
+                the send before the next batch (cancellation).
 
-        Returns: {"sent": N, "failed": N, "errors": [...]}
+        Returns: {"sent": N, "failed": N, "errors": [...]}, plus
+        ``"cancelled": True`` when ``progress`` stopped the send.
         """
         if not self.config.enabled:
             logger.warning("Email sending is disabled")
@@ -142,6 +156,9 @@ class SMTPSender:
         # Inline CSS once for the bulk HTML template. Per-recipient
         # personalized HTML is inlined separately below.
         html_body = inline_css(html_body)
+        # Bodies prepared by TrackingProcessor.prepare_issue_html carry a
+        # subscriber-id slot; split once so each recipient is one join.
+        html_parts = html_body.split(SUBSCRIBER_SLOT)
 
         # Domain warm-up: respect daily limit if enabled
         if self._warmup_config and getattr(self._warmup_config, 'warmup_enabled', False):
@@ -166,7 +183,9 @@ class SMTPSender:
                     server.login(self.config.smtp_user, self.config.smtp_password)
                     return server
 
+                connect_started = time.perf_counter()
                 server = _retry_with_backoff(_connect)
+                metrics.observe("weeklyamp_smtp_connect_duration_seconds", time.perf_counter() - connect_started)
                 try:
                     for recipient in batch:
                         email = recipient.get("email", "")
@@ -185,6 +204,8 @@ class SMTPSender:
                         # back to the bulk html_body so one bad subscriber
                         # doesn't break the batch.
                         recipient_html = html_body
+                        if len(html_parts) > 1:
+                            recipient_html = str(recipient.get("id") or 0).join(html_parts)
                         recipient_plain = plain_text
                         if personalize is not None:
                             try:
@@ -214,24 +235,34 @@ class SMTPSender:
                             unsubscribe_url=unsub_url,
                         )
 
+                        send_started = time.perf_counter()
                         try:
                             server.send_message(msg)
                             sent += 1
+                            metrics.inc("weeklyamp_smtp_messages_total", outcome="sent")
                         except Exception as e:
                             failed += 1
                             errors.append(f"{email}: {e}")
                             logger.warning("Failed to send to %s: %s", email, e)
+                            metrics.inc("weeklyamp_smtp_messages_total", outcome="failed")
+                        metrics.observe("weeklyamp_smtp_send_duration_seconds", time.perf_counter() - send_started)
                 finally:
                     server.quit()
 
             except Exception as e:
                 # Connection-level failure — count remaining batch as failed
                 failed += len(batch)
+                metrics.inc("weeklyamp_smtp_messages_total", len(batch), outcome="connection_failed")
                 errors.append(f"SMTP connection error: {e}")
                 logger.exception("SMTP connection failed for batch starting at %d", batch_start)
 
+            more = batch_start + _BATCH_SIZE < len(recipients)
+            if progress is not None and progress(sent, failed) is False and more:
+                logger.info("Bulk send cancelled after %d sent, %d failed", sent, failed)
+                return {"sent": sent, "failed": failed, "errors": errors, "cancelled": True}
+
             # Pause between batches to respect rate limits
-            if batch_start + _BATCH_SIZE < len(recipients):
+            if more:
                 time.sleep(_BATCH_DELAY)
 
         logger.info("Bulk send complete: %d sent, %d failed out of %d", sent, failed, len(recipients))
@@ -1,55 +1,114 @@
-"""Subscriber sync between GoHighLevel and local database."""
+"""Subscriber sync between GoHighLevel and local database.
+
+The pull side streams GHL's contact listing a page at a time: each page
+is filtered, upserted in one transaction, and then its resume cursor is
+saved in ``admin_settings`` so an interrupted or later run continues
+after the last contact committed instead of starting over. GHL lists
+contacts oldest first, so an incremental run picks up contacts added
+since the previous one (the client logs a warning if the listing ever
+goes backwards).
+
+That cursor can't see edits to contacts it has already passed, so a
+full pass re-reads everything whenever the last one is older than
+``ghl.full_sync_hours`` (or when asked with ``full=True``). Any pass
+also retires local rows whose GHL contact lost its newsletter tags, was
+marked do-not-disturb, or changed email.
+
+The push side creates contacts concurrently; the shared token bucket in
+``delivery.ghl`` keeps the combined request rate inside GHL's quota.
+"""
 
 from __future__ import annotations
 
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from rich.console import Console
 
 from weeklyamp.core.models import GHLConfig
 from weeklyamp.db.repository import Repository
 from weeklyamp.delivery.ghl import GHLClient
 
+logger = logging.getLogger(__name__)
 console = Console()
 
+SYNC_CURSOR_KEY = "ghl_sync_cursor"
 
-def sync_subscribers(repo: Repository, config: GHLConfig) -> dict[str, int]:
-    """Pull all contacts from GoHighLevel and upsert into local DB.
-
-    Contacts are filtered by edition tags to identify newsletter subscribers.
-    Returns {"synced": N, "new": N, "total": N}.
-    """
-    client = GHLClient(config)
 
+def _load_cursor(repo: Repository) -> dict:
     try:
-        contacts = client.get_all_contacts()
-    finally:
-        client.close()
+        cursor = json.loads(repo.get_admin_setting(SYNC_CURSOR_KEY) or "{}")
+    except ValueError:
+        return {}
+    return cursor if isinstance(cursor, dict) else {}
 
-    # Collect all edition tag values for filtering
-    edition_tag_values = set(config.edition_tags.values())
 
-    existing_count = repo.get_subscriber_count()
-    synced = 0
+def _full_sync_due(cursor: dict, config: GHLConfig) -> bool:
+    if not config.full_sync_hours:
+        return False
+    last = cursor.get("full_synced_at") or 0
+    return time.time() - last >= config.full_sync_hours * 3600
 
-    for contact in contacts:
-        email = contact.get("email", "")
-        if not email:
-            continue
 
-        # Only sync contacts that have at least one newsletter tag
-        contact_tags = contact.get("tags", []) or []
-        if not any(tag in edition_tag_values for tag in contact_tags):
-            continue
+def sync_subscribers(repo: Repository, config: GHLConfig, full: bool = False) -> dict[str, int]:
+    """Pull contacts from GoHighLevel and upsert them into the local DB.
 
-        ghl_contact_id = contact.get("id", "")
-        repo.upsert_subscriber(email=email, ghl_contact_id=ghl_contact_id, status="active")
-        synced += 1
+    Contacts are filtered by edition tags to identify newsletter subscribers.
+    Resumes from the stored cursor unless ``full`` is set or a periodic
+    full pass is due.
+    Returns {"synced": N, "new": N, "unsubscribed": N, "total": N}.
+    """
+    # Collect all edition tag values for filtering
+    edition_tag_values = set(config.edition_tags.values())
+    stored = _load_cursor(repo)
+    full = full or _full_sync_due(stored, config)
+    cursor = {} if full else stored
+    full_synced_at = time.time() if full else stored.get("full_synced_at", 0)
 
-    new_count = repo.get_subscriber_count()
+    synced = 0
+    new = 0
+    unsubscribed = 0
+    client = GHLClient(config)
+    try:
+        pages = client.iter_contact_pages(
+            limit=config.page_size,
+            start_after_id=cursor.get("start_after_id", ""),
+            start_after=cursor.get("start_after", ""),
+        )
+        for contacts, next_cursor in pages:
+            rows = []
+            current = []
+            for contact in contacts:
+                # Only sync contacts that have at least one newsletter tag
+                listed = (
+                    contact.get("email")
+                    and not contact.get("dnd")
+                    and any(tag in edition_tag_values for tag in (contact.get("tags", []) or []))
+                )
+                if listed:
+                    rows.append((contact["email"], contact.get("id", "")))
+                current.append((contact.get("id", ""), contact["email"] if listed else ""))
+            new += repo.upsert_subscribers(rows)
+            unsubscribed += repo.unsubscribe_ghl_contacts(current)
+            synced += len(rows)
+            # Until a full pass finishes, keep the previous completion time,
+            # so an interrupted one is retried from the start next run.
+            next_cursor["full_synced_at"] = stored.get("full_synced_at", 0)
+            repo.set_admin_setting(SYNC_CURSOR_KEY, json.dumps(next_cursor))
+        if full:
+            final = _load_cursor(repo)
+            final["full_synced_at"] = full_synced_at
+            repo.set_admin_setting(SYNC_CURSOR_KEY, json.dumps(final))
+    finally:
+        client.close()
 
     return {
         "synced": synced,
-        "new": max(0, new_count - existing_count),
-        "total": new_count,
+        "new": new,
+        "unsubscribed": unsubscribed,
+        "total": repo.get_subscriber_count(),
     }
 
 
@@ -58,34 +117,42 @@ def push_subscribers_to_ghl(repo: Repository, config: GHLConfig) -> dict[str, in
 
     Returns {"pushed": N, "skipped": N, "errors": N}.
     """
+    subscribers = repo.get_subscribers("active")
+    pending = [sub for sub in subscribers if not sub.get("ghl_contact_id")]
+    skipped = len(subscribers) - len(pending)
+
+    # Determine edition tags from subscriber_editions
+    tags = list(config.edition_tags.values())  # Default: all editions
+
     client = GHLClient(config)
+
+    def _push(sub: dict) -> str:
+        result = client.create_contact(
+            email=sub["email"],
+            first_name=sub.get("first_name", ""),
+            tags=tags,
+        )
+        return result.get("id", "")
+
     pushed = 0
-    skipped = 0
     errors = 0
-
+    ghl_ids: list[tuple[int, str]] = []
     try:
-        subscribers = repo.get_subscribers("active")
-        for sub in subscribers:
-            if sub.get("ghl_contact_id"):
-                skipped += 1
-                continue
-
-            # Determine edition tags from subscriber_editions
-            tags = list(config.edition_tags.values())  # Default: all editions
-
-            try:
-                result = client.create_contact(
-                    email=sub["email"],
-                    first_name=sub.get("first_name", ""),
-                    tags=tags,
-                )
-                ghl_id = result.get("id", "")
+        workers = max(1, min(config.push_concurrency, len(pending) or 1))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ghl-push") as pool:
+            futures = [(sub, pool.submit(_push, sub)) for sub in pending]
+            for sub, future in futures:
+                try:
+                    ghl_id = future.result()
+                except Exception:
+                    logger.warning("GHL push failed for subscriber %s", sub["id"], exc_info=True)
+                    errors += 1
+                    continue
                 if ghl_id:
-                    repo.update_subscriber_ghl_id(sub["id"], ghl_id)
+                    ghl_ids.append((sub["id"], ghl_id))
                 pushed += 1
-            except Exception:
-                errors += 1
     finally:
         client.close()
+        repo.update_subscriber_ghl_ids(ghl_ids)
 
     return {"pushed": pushed, "skipped": skipped, "errors": errors}
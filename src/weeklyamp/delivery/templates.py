@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader
@@ -23,8 +24,14 @@ def _get_template_dir() -> Path:
     raise FileNotFoundError("Cannot find templates/ directory")
 
 
+@functools.lru_cache(maxsize=1)
 def get_env() -> Environment:
-    """Return a Jinja2 environment configured for newsletter templates."""
+    """Return the shared Jinja2 environment for newsletter templates.
+
+    One environment for the process, so each template is compiled once
+    and served from Jinja's cache (which still reloads edited files)
+    instead of being recompiled on every render.
+    """
     return Environment(
         loader=FileSystemLoader(str(_get_template_dir())),
         autoescape=False,  # We handle HTML ourselves
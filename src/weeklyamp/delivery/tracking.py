@@ -5,12 +5,52 @@ from __future__ import annotations
 import base64
 import logging
 import re
+from typing import Optional
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 from weeklyamp.core.models import TrackingConfig
 
 logger = logging.getLogger(__name__)
 
+# Placeholder for the recipient's subscriber id in HTML prepared by
+# TrackingProcessor.prepare_issue_html. SMTPSender.send_bulk splits the
+# body on it once and fills it per recipient with a join. No spaces:
+# the CSS inliner percent-encodes them inside URLs.
+SUBSCRIBER_SLOT = "{{subscriber_id}}"
+
+_LINK_RE = re.compile(r'<a\s[^>]*href=["\']([^"\']+)["\']', re.IGNORECASE)
+_BODY_CLOSE_RE = re.compile(r"</body>", re.IGNORECASE)
+
+
+def _click_trackable(url: str) -> bool:
+    """False for mailto:/tel:/anchors, template tags and unsubscribe links."""
+    if url.startswith(("mailto:", "tel:", "#", "{{", "{%")):
+        return False
+    return "/unsubscribe" not in url
+
+
+def _with_utm(url: str, utm_params: dict[str, str]) -> str:
+    """``url`` with ``utm_params`` added, keeping any UTM params it already has.
+
+    Only external http(s) links are tagged; tracking redirects and
+    unsubscribe links are returned unchanged.
+    """
+    if not url.startswith(("http://", "https://")):
+        return url
+    if "/t/click/" in url or "/t/c/" in url or "/unsubscribe" in url:
+        return url
+    parsed = urlparse(url)
+    existing_params = parse_qs(parsed.query, keep_blank_values=True)
+    # Don't overwrite existing UTM params
+    for key, value in utm_params.items():
+        if key not in existing_params:
+            existing_params[key] = [value]
+    new_query = urlencode(
+        {k: v[0] for k, v in existing_params.items()},
+        doseq=False,
+    )
+    return urlunparse(parsed._replace(query=new_query))
+
 
 class TrackingProcessor:
     """Injects open/click tracking pixels and link redirects into HTML emails.
@@ -19,8 +59,68 @@ class TrackingProcessor:
     by default.  When disabled, methods return the input HTML unchanged.
     """
 
-    def __init__(self, config: TrackingConfig) -> None:
+    def __init__(self, config: TrackingConfig, repo=None) -> None:
         self.config = config
+        self.repo = repo
+
+    # ------------------------------------------------------------------
+    # Send-time preparation (once per issue)
+    # ------------------------------------------------------------------
+
+    def prepare_issue_html(
+        self,
+        html_body: str,
+        issue_id: int,
+        site_domain: str,
+        utm: Optional[dict[str, str]] = None,
+    ) -> str:
+        """Rewrite *html_body* once per issue so per-recipient tracking is a slot fill.
+
+        Each distinct trackable link is registered in ``issue_links``
+        (needs ``repo``) and its href replaced with
+        ``/t/c/<link id>/{{subscriber_id}}``; UTM params, when given,
+        are applied to each distinct URL once before it is registered.
+        The open pixel is inserted with the same slot. The result is
+        passed to ``SMTPSender.send_bulk`` as the bulk HTML, which fills
+        :data:`SUBSCRIBER_SLOT` for each recipient.
+
+        Returns *html_body* unchanged when tracking and UTM are both off.
+        """
+        domain = site_domain.rstrip("/")
+        click = self.config.click_tracking and self.repo is not None
+
+        if click or utm:
+            hrefs = dict.fromkeys(m.group(1) for m in _LINK_RE.finditer(html_body))
+            targets = {
+                url: _with_utm(url, utm) if utm else url
+                for url in hrefs if _click_trackable(url)
+            }
+            if click:
+                link_ids = self.repo.register_issue_links(issue_id, list(targets.values()))
+                targets = {
+                    url: f"{domain}/t/c/{link_ids[dest]}/{SUBSCRIBER_SLOT}"
+                    for url, dest in targets.items()
+                }
+
+            def _rewrite_link(match: re.Match) -> str:
+                new_url = targets.get(match.group(1))
+                if new_url is None:
+                    return match.group(0)
+                return match.group(0).replace(match.group(1), new_url)
+
+            html_body = _LINK_RE.sub(_rewrite_link, html_body)
+            logger.debug("Prepared %d tracked links for issue=%s", len(targets), issue_id)
+
+        if self.config.open_tracking:
+            pixel_tag = (
+                f'<img src="{domain}/t/open/{issue_id}/{SUBSCRIBER_SLOT}.gif" width="1" height="1" '
+                f'alt="" style="display:none;border:0;" />'
+            )
+            html_body, found = _BODY_CLOSE_RE.subn(lambda m: pixel_tag + m.group(0), html_body, count=1)
+            if not found:
+                html_body += pixel_tag
+
+        return html_body
 
     # ------------------------------------------------------------------
     # Open + click tracking
@@ -80,11 +180,9 @@ class TrackingProcessor:
         if self.config.click_tracking:
             def _rewrite_link(match: re.Match) -> str:
                 original_url = match.group(1)
-                # Skip mailto:, tel:, and anchor-only links
-                if original_url.startswith(("mailto:", "tel:", "#", "{{", "{%")):
-                    return match.group(0)
-                # Skip unsubscribe links — those must remain direct
-                if "/unsubscribe" in original_url:
+                # Skip mailto:, tel:, anchors and unsubscribe links —
+                # those must remain direct
+                if not _click_trackable(original_url):
                     return match.group(0)
                 encoded = base64.urlsafe_b64encode(
                     original_url.encode("utf-8")
@@ -95,12 +193,7 @@ class TrackingProcessor:
                 )
                 return match.group(0).replace(original_url, redirect_url)
 
-            html_body = re.sub(
-                r'<a\s[^>]*href=["\']([^"\']+)["\']',
-                _rewrite_link,
-                html_body,
-                flags=re.IGNORECASE,
-            )
+            html_body = _LINK_RE.sub(_rewrite_link, html_body)
             logger.debug(
                 "Click tracking injected for issue=%s subscriber=%s",
                 issue_id,
@@ -143,30 +236,11 @@ class TrackingProcessor:
 
         def _add_utm(match: re.Match) -> str:
             original_url = match.group(1)
-            # Only tag external http(s) links
-            if not original_url.startswith(("http://", "https://")):
+            new_url = _with_utm(original_url, utm_params)
+            if new_url == original_url:
                 return match.group(0)
-            # Skip tracking redirect links and unsubscribe
-            if "/t/click/" in original_url or "/unsubscribe" in original_url:
-                return match.group(0)
-            parsed = urlparse(original_url)
-            existing_params = parse_qs(parsed.query, keep_blank_values=True)
-            # Don't overwrite existing UTM params
-            for key, value in utm_params.items():
-                if key not in existing_params:
-                    existing_params[key] = [value]
-            new_query = urlencode(
-                {k: v[0] for k, v in existing_params.items()},
-                doseq=False,
-            )
-            new_url = urlunparse(parsed._replace(query=new_query))
             return match.group(0).replace(original_url, new_url)
 
-        html_body = re.sub(
-            r'<a\s[^>]*href=["\']([^"\']+)["\']',
-            _add_utm,
-            html_body,
-            flags=re.IGNORECASE,
-        )
+        html_body = _LINK_RE.sub(_add_utm, html_body)
         logger.debug("UTM params injected: source=%s campaign=%s", utm_source, utm_campaign)
         return html_body
@@ -6,8 +6,12 @@ import hashlib
 import hmac
 import json
 import logging
-from datetime import datetime
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import Optional
+from urllib.parse import urlsplit
 
 import httpx
 
@@ -18,7 +22,11 @@ logger = logging.getLogger(__name__)
 
 
 class WebhookManager:
-    """Fire outbound webhooks, verify inbound signatures, and manage webhook config.
+    """Queue and deliver outbound webhooks, verify inbound signatures, and
+    manage webhook config.
+
+    Outbound delivery goes through the ``webhook_outbox`` table:
+    ``fire_event`` enqueues, ``deliver_pending`` sends.
 
     All operations are gated behind ``config.enabled``.  When disabled,
     ``fire_event`` is a no-op and ``verify_inbound`` always returns ``False``.
@@ -33,23 +41,21 @@ class WebhookManager:
     # ------------------------------------------------------------------
 
     def fire_event(self, event_type: str, payload_dict: dict) -> list[dict]:
-        """Find all active outbound webhooks matching *event_type* and POST to each.
-
-        Each request includes:
-        * ``Content-Type: application/json``
-        * ``X-WeeklyAmp-Signature``: HMAC-SHA256 hex digest of the JSON body
-          using the webhook's secret.
-        * ``X-WeeklyAmp-Event``: The event type string.
+        """Queue *event_type* for every active outbound webhook that wants it.
 
-        Results are logged to the ``webhook_log`` table.
+        Nothing is sent here. One ``webhook_outbox`` row is written per
+        matching webhook and :meth:`deliver_pending` (run by the
+        ``webhook_dispatch`` background job) does the HTTP work, so the
+        caller — usually a web request or the publish flow — never waits
+        on a third-party endpoint.
 
         Args:
             event_type: Event identifier (e.g. ``"issue.published"``).
             payload_dict: Arbitrary JSON-serialisable payload.
 
         Returns:
-            List of result dicts: ``{"webhook_id": int, "status_code": int,
-            "success": bool, "error": str | None}``.
+            List of ``{"webhook_id": int, "outbox_id": int}`` for the
+            queued deliveries.
         """
         if not self.config.enabled:
             logger.debug("Webhooks disabled — skipping event %s", event_type)
@@ -60,67 +66,111 @@ class WebhookManager:
             logger.debug("No outbound webhooks registered for %s", event_type)
             return []
 
-        body_bytes = json.dumps(payload_dict, default=str).encode("utf-8")
-        results: list[dict] = []
-
-        for wh in webhooks:
-            webhook_id = wh["id"]
-            url = wh["url"]
-            secret = wh.get("secret", "")
-
-            # Compute HMAC signature
-            signature = ""
-            if secret:
-                signature = hmac.new(
-                    secret.encode("utf-8"),
-                    body_bytes,
-                    hashlib.sha256,
-                ).hexdigest()
-
-            headers = {
-                "Content-Type": "application/json",
-                "X-WeeklyAmp-Event": event_type,
-                "X-WeeklyAmp-Signature": signature,
-            }
-
-            status_code = 0
-            success = False
-            error_msg: Optional[str] = None
-
-            try:
-                with httpx.Client(timeout=self.config.timeout_seconds) as client:
-                    resp = client.post(url, content=body_bytes, headers=headers)
-                    status_code = resp.status_code
-                    success = 200 <= status_code < 300
-                    if not success:
-                        error_msg = f"HTTP {status_code}: {resp.text[:500]}"
-            except httpx.TimeoutException:
-                error_msg = "Request timed out"
-                logger.warning("Webhook %s timed out for event %s", webhook_id, event_type)
-            except Exception as exc:
-                error_msg = str(exc)[:500]
-                logger.exception(
-                    "Webhook %s failed for event %s", webhook_id, event_type,
+        payload_json = json.dumps(payload_dict, default=str)
+        now = _now()
+        queued: list[dict] = []
+        conn = self.repo._conn()
+        try:
+            for wh in webhooks:
+                cur = conn.execute(
+                    """INSERT INTO webhook_outbox
+                       (webhook_id, event_type, payload_json, next_attempt_at)
+                       VALUES (?, ?, ?, ?)""",
+                    (wh["id"], event_type, payload_json, now),
                 )
+                queued.append({"webhook_id": wh["id"], "outbox_id": cur.lastrowid})
+            conn.commit()
+        except Exception:
+            logger.exception("Failed to queue webhook event %s", event_type)
+            conn.rollback()
+            return []
+        finally:
+            conn.close()
+        return queued
 
-            # Log the result
-            self._log_delivery(
-                webhook_id=webhook_id,
-                event_type=event_type,
-                url=url,
-                status_code=status_code,
-                success=success,
-                error=error_msg,
-            )
+    def deliver_pending(self, limit: Optional[int] = None) -> dict:
+        """Deliver due outbox rows concurrently and record the outcomes.
+
+        Rows are claimed with a random token and a lease (their
+        ``next_attempt_at`` is pushed forward) so two workers draining the
+        same outbox never double-send. Deliveries share one pooled
+        ``httpx.Client``; at most ``max_concurrency`` are in flight, and
+        at most ``per_endpoint_concurrency`` against any one host so a
+        slow receiver cannot hog the pool.
+
+        A failed delivery is retried after ``retry_base_seconds * 2**n``.
+        After ``max_retries`` retries the row is marked ``dead`` and left
+        for an admin to inspect or :meth:`retry_dead`. Log rows and
+        status updates for the whole batch are written in one transaction.
+
+        Returns:
+            ``{"delivered": n, "retrying": n, "dead": n}``.
+        """
+        summary = {"delivered": 0, "retrying": 0, "dead": 0}
+        if not self.config.enabled:
+            return summary
+
+        rows = self._claim_due(limit or self.config.dispatch_batch_size)
+        if not rows:
+            return summary
+
+        client = _get_client(self.config.max_concurrency)
+        semaphores: dict[str, threading.BoundedSemaphore] = {}
+        for row in rows:
+            host = urlsplit(row["url"]).netloc
+            if host not in semaphores:
+                semaphores[host] = threading.BoundedSemaphore(
+                    max(1, self.config.per_endpoint_concurrency)
+                )
+
+        def _deliver(row: dict) -> dict:
+            with semaphores[urlsplit(row["url"]).netloc]:
+                return self._post(client, row)
 
-            results.append({
-                "webhook_id": webhook_id,
-                "status_code": status_code,
-                "success": success,
-                "error": error_msg,
-            })
+        workers = max(1, min(self.config.max_concurrency, len(rows)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="webhook") as pool:
+            outcomes = list(pool.map(_deliver, rows))
 
-        return results
+        self._record_outcomes(rows, outcomes, summary)
+        logger.info(
+            "Webhook dispatch: %d delivered, %d retrying, %d dead",
+            summary["delivered"], summary["retrying"], summary["dead"],
+        )
+        return summary
+
+    def get_outbox(self, status: str = "", limit: int = 50) -> list[dict]:
+        """Return recent outbox rows, optionally filtered by status."""
+        conn = self.repo._conn()
+        try:
+            if status:
+                rows = conn.execute(
+                    "SELECT * FROM webhook_outbox WHERE status = ? ORDER BY id DESC LIMIT ?",
+                    (status, limit),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM webhook_outbox ORDER BY id DESC LIMIT ?",
+                    (limit,),
+                ).fetchall()
+        finally:
+            conn.close()
+        return [dict(r) for r in rows]
+
+    def retry_dead(self, outbox_id: int) -> bool:
+        """Put a dead-lettered delivery back in the queue with a fresh budget."""
+        conn = self.repo._conn()
+        try:
+            cur = conn.execute(
+                """UPDATE webhook_outbox
+                   SET status = 'pending', attempts = 0, next_attempt_at = ?,
+                       claim_token = '', last_error = ''
+                   WHERE id = ? AND status = 'dead'""",
+                (_now(), outbox_id),
+            )
+            conn.commit()
+            return cur.rowcount > 0
+        finally:
+            conn.close()
 
     # ------------------------------------------------------------------
     # Inbound: signature verification
@@ -271,27 +321,210 @@ class WebhookManager:
                 matching.append(row_dict)
         return matching
 
-    def _log_delivery(
-        self,
-        webhook_id: int,
-        event_type: str,
-        url: str,
-        status_code: int,
-        success: bool,
-        error: Optional[str],
-    ) -> None:
-        """Insert a row into ``webhook_log``."""
+    def _claim_due(self, limit: int) -> list[dict]:
+        """Lease up to *limit* due outbox rows to this worker and return them."""
+        token = secrets.token_hex(8)
+        now = _now()
+        # Long enough for every attempt in the batch to finish even when
+        # the per-endpoint limit serialises them; a crashed worker's rows
+        # come back once the lease runs out.
+        lease_until = _now(self.config.timeout_seconds * 6 + 60)
         conn = self.repo._conn()
         try:
+            # The outer status/next_attempt_at check is what keeps a
+            # concurrent claimer from taking the same rows: once this
+            # UPDATE commits, those rows are no longer due.
             conn.execute(
+                """UPDATE webhook_outbox
+                   SET claim_token = ?, next_attempt_at = ?
+                   WHERE status = 'pending' AND next_attempt_at <= ?
+                     AND id IN (
+                         SELECT id FROM webhook_outbox
+                         WHERE status = 'pending' AND next_attempt_at <= ?
+                         ORDER BY id
+                         LIMIT ?
+                     )""",
+                (token, lease_until, now, now, limit),
+            )
+            conn.commit()
+            rows = conn.execute(
+                """SELECT o.*, w.url, w.secret
+                   FROM webhook_outbox o
+                   JOIN webhooks w ON w.id = o.webhook_id
+                   WHERE o.claim_token = ? AND o.status = 'pending'
+                   ORDER BY o.id""",
+                (token,),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [dict(r) for r in rows]
+
+    def _post(self, client: httpx.Client, row: dict) -> dict:
+        """POST one outbox row. Never raises; returns status and error."""
+        body_bytes = row["payload_json"].encode("utf-8")
+        secret = row.get("secret") or ""
+
+        # Compute HMAC signature
+        signature = ""
+        if secret:
+            signature = hmac.new(
+                secret.encode("utf-8"),
+                body_bytes,
+                hashlib.sha256,
+            ).hexdigest()
+
+        headers = {
+            "Content-Type": "application/json",
+            "X-WeeklyAmp-Event": row["event_type"],
+            "X-WeeklyAmp-Signature": signature,
+        }
+
+        status_code = 0
+        body = ""
+        error_msg: Optional[str] = None
+        try:
+            resp = client.post(
+                row["url"], content=body_bytes, headers=headers,
+                timeout=self.config.timeout_seconds,
+            )
+            status_code = resp.status_code
+            body = resp.text[:500]
+            if not 200 <= status_code < 300:
+                error_msg = f"HTTP {status_code}: {body}"
+        except httpx.TimeoutException:
+            error_msg = "Request timed out"
+            logger.warning(
+                "Webhook %s timed out for event %s", row["webhook_id"], row["event_type"],
+            )
+        except Exception as exc:
+            error_msg = str(exc)[:500]
+            logger.warning(
+                "Webhook %s failed for event %s: %s",
+                row["webhook_id"], row["event_type"], error_msg,
+            )
+        return {"status_code": status_code, "body": body, "error": error_msg}
+
+    def _record_outcomes(self, rows: list[dict], outcomes: list[dict], summary: dict) -> None:
+        """Write the batch's log rows and outbox transitions in one transaction."""
+        now = _now()
+        delivered: list[tuple] = []
+        retrying: list[tuple] = []
+        dead: list[tuple] = []
+        logs: list[tuple] = []
+        failed_hooks: list[tuple] = []
+        ok_hooks: list[tuple] = []
+
+        for row, outcome in zip(rows, outcomes):
+            attempts = int(row.get("attempts") or 0) + 1
+            error = outcome["error"]
+            logs.append((
+                row["webhook_id"], row["event_type"], row["payload_json"],
+                outcome["status_code"], error or outcome["body"],
+            ))
+            if error is None:
+                delivered.append((attempts, outcome["status_code"], now, row["id"]))
+                ok_hooks.append((now, row["webhook_id"]))
+                continue
+            failed_hooks.append((row["webhook_id"],))
+            if attempts > self.config.max_retries:
+                dead.append((attempts, outcome["status_code"], error, row["id"]))
+            else:
+                delay = self.config.retry_base_seconds * (2 ** (attempts - 1))
+                retrying.append((
+                    attempts, _now(delay), outcome["status_code"], error, row["id"],
+                ))
+
+        conn = self.repo._conn()
+        try:
+            if delivered:
+                conn.executemany(
+                    """UPDATE webhook_outbox
+                       SET status = 'delivered', attempts = ?, last_status = ?,
+                           last_error = '', delivered_at = ?, claim_token = ''
+                       WHERE id = ?""",
+                    delivered,
+                )
+            if retrying:
+                conn.executemany(
+                    """UPDATE webhook_outbox
+                       SET attempts = ?, next_attempt_at = ?, last_status = ?,
+                           last_error = ?, claim_token = ''
+                       WHERE id = ?""",
+                    retrying,
+                )
+            if dead:
+                conn.executemany(
+                    """UPDATE webhook_outbox
+                       SET status = 'dead', attempts = ?, last_status = ?,
+                           last_error = ?, claim_token = ''
+                       WHERE id = ?""",
+                    dead,
+                )
+            if ok_hooks:
+                conn.executemany(
+                    "UPDATE webhooks SET last_triggered_at = ? WHERE id = ?", ok_hooks,
+                )
+            if failed_hooks:
+                conn.executemany(
+                    "UPDATE webhooks SET failure_count = failure_count + 1 WHERE id = ?",
+                    failed_hooks,
+                )
+            conn.executemany(
                 """INSERT INTO webhook_log
-                   (webhook_id, event_type, url, status_code, success, error)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (webhook_id, event_type, url, status_code, int(success), error or ""),
+                   (webhook_id, event_type, payload_json, response_status, response_body)
+                   VALUES (?, ?, ?, ?, ?)""",
+                logs,
             )
             conn.commit()
         except Exception:
-            logger.exception("Failed to log webhook delivery for %s", webhook_id)
+            # The leases expire on their own, so an unrecorded batch is
+            # retried rather than lost — receivers must already tolerate
+            # duplicates because the outbox is at-least-once.
+            logger.exception("Failed to record webhook dispatch outcomes")
             conn.rollback()
+            return
         finally:
             conn.close()
+
+        summary["delivered"] += len(delivered)
+        summary["retrying"] += len(retrying)
+        summary["dead"] += len(dead)
+
+
+# ----------------------------------------------------------------------
+# Module helpers
+# ----------------------------------------------------------------------
+
+# One pooled client per process, shared by every dispatch run, so repeat
+# deliveries to the same endpoint reuse a warm connection instead of
+# paying a TCP + TLS handshake each time. httpx.Client is thread-safe.
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def _get_client(max_connections: int) -> httpx.Client:
+    global _client
+    with _client_lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=max(1, max_connections),
+                    max_keepalive_connections=max(1, max_connections),
+                ),
+                follow_redirects=False,
+            )
+    return _client
+
+
+def close_client() -> None:
+    """Close the shared delivery client. Call during application shutdown."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def _now(offset_seconds: float = 0) -> str:
+    """UTC timestamp as fixed-width ISO text, so string order is time order."""
+    return (datetime.utcnow() + timedelta(seconds=offset_seconds)).strftime("%Y-%m-%d %H:%M:%S")
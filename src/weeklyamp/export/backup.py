@@ -8,16 +8,24 @@ Encrypted backups use Fernet symmetric encryption keyed by the
 ``WEEKLYAMP_BACKUP_KEY`` env var (32-byte URL-safe base64). Generate a
 key with :func:`generate_backup_key`; store it somewhere outside the
 repo and outside Railway's main env (e.g. a password manager).
+
+Encrypted backups are streamed: tables are read a batch at a time into
+a tar.gz stream that is encrypted in 1 MiB authenticated chunks straight
+to disk, and restore reverses that without loading the archive. A
+``manifest.json`` inside the archive lists every file's SHA-256 plus the
+per-table watermarks that incremental backups start from.
 """
 
 from __future__ import annotations
 
-import csv
+import hashlib
 import io
 import json
 import logging
 import os
+import re
 import tarfile
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -26,9 +34,72 @@ import yaml
 
 from weeklyamp.core.models import AppConfig
 from weeklyamp.db.repository import Repository
+from weeklyamp.export.subscriber_csv import iter_subscribers_csv, write_subscribers_csv
 
 logger = logging.getLogger(__name__)
 
+_EXPORT_STATUSES = ("active", "inactive")
+
+# Tables dumped row by row into encrypted backups, each with the column
+# that moves when an existing row is edited (kept current by triggers,
+# migration v68). None means the table is dumped in full every time:
+# subscriber_editions links are replaced by delete + insert, which an
+# incremental can't express.
+BACKUP_TABLES: dict[str, Optional[str]] = {
+    "subscribers": "updated_at",
+    "subscriber_editions": None,
+    "newsletter_editions": "updated_at",
+    "issues": "updated_at",
+    "drafts": "updated_at",
+    "section_definitions": "updated_at",
+    "assembled_issues": "updated_at",
+    "engagement_metrics": "updated_at",
+}
+
+_WATERMARK_KEY = "backup_watermarks"
+_MANIFEST = "manifest.json"
+_PART_ROWS = 1000
+_COPY_BLOCK = 64 * 1024
+_PART_SUFFIX = re.compile(r"\.part\d+$")
+
+
+def _resolve_key(key: "bytes | str | None", missing_message: str) -> bytes:
+    k = key or os.environ.get("WEEKLYAMP_BACKUP_KEY", "")
+    if not k:
+        raise ValueError(missing_message)
+    return k.encode() if isinstance(k, str) else k
+
+
+def _add_member(tar: tarfile.TarFile, name: str, payload: bytes) -> None:
+    info = tarfile.TarInfo(name=name)
+    info.size = len(payload)
+    info.mtime = int(time.time())
+    tar.addfile(info, io.BytesIO(payload))
+
+
+class _ArchiveWriter:
+    """Adds logical files to a streaming tar as numbered parts.
+
+    A tar header needs the member size up front, so a file produced
+    incrementally (a CSV or a table dump) is stored as ``name.part00001``,
+    ``name.part00002``… each one batch long; restore concatenates them.
+    Running SHA-256s and sizes go into ``files`` for the manifest.
+    """
+
+    def __init__(self, tar: tarfile.TarFile, files: dict) -> None:
+        self._tar = tar
+        self._files = files
+        self._digests: dict = {}
+
+    def add(self, name: str, payload: bytes) -> None:
+        digest = self._digests.setdefault(name, hashlib.sha256())
+        entry = self._files.setdefault(name, {"parts": 0, "size": 0})
+        entry["parts"] += 1
+        entry["size"] += len(payload)
+        digest.update(payload)
+        entry["sha256"] = digest.hexdigest()
+        _add_member(self._tar, f"{name}.part{entry['parts']:05d}", payload)
+
 
 class ExportManager:
     """Create data exports and backups of the WeeklyAmp system."""
@@ -44,27 +115,24 @@ class ExportManager:
     def export_subscribers(self, format: str = "csv") -> tuple[str, str, int]:
         """Export all subscribers to a CSV string.
 
-        Returns ``(csv_content, filename, record_count)``.
+        Returns ``(csv_content, filename, record_count)``. Use
+        :meth:`write_subscribers_csv` to go straight to a file.
         """
-        subscribers = self.repo.get_subscribers(status="active")
-        subscribers += self.repo.get_subscribers(status="inactive")
-
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         filename = f"subscribers_{timestamp}.csv"
 
         buf = io.StringIO()
-        if subscribers:
-            fieldnames = list(subscribers[0].keys())
-            writer = csv.DictWriter(buf, fieldnames=fieldnames)
-            writer.writeheader()
-            for sub in subscribers:
-                writer.writerow(sub)
-        else:
-            buf.write("email,status\n")
+        count = self.write_subscribers_csv(buf)
+        logger.info("Exported %d subscribers to %s", count, filename)
+        return buf.getvalue(), filename, count
 
-        content = buf.getvalue()
-        logger.info("Exported %d subscribers to %s", len(subscribers), filename)
-        return content, filename, len(subscribers)
+    def write_subscribers_csv(self, fh) -> int:
+        """Stream active and inactive subscribers as CSV into ``fh``.
+
+        Rows are fetched and written a batch at a time. Returns the
+        record count.
+        """
+        return write_subscribers_csv(self.repo, fh, statuses=_EXPORT_STATUSES)
 
     # ------------------------------------------------------------------
     # Content export
@@ -91,18 +159,15 @@ class ExportManager:
             # Export all recent issues
             issues = self.repo.get_upcoming_issues(limit=50)
             issues += self.repo.get_published_issues(limit=50)
-            seen_ids: set[int] = set()
-            for iss in issues:
-                iid = iss["id"]
-                if iid in seen_ids:
-                    continue
-                seen_ids.add(iid)
-                drafts = self.repo.get_drafts_for_issue(iid)
-                assembled = self.repo.get_assembled(iid)
+            unique = list({iss["id"]: iss for iss in reversed(issues)}.values())[::-1]
+            ids = [iss["id"] for iss in unique]
+            drafts = self.repo.get_drafts_for_issues(ids)
+            assembled = self.repo.get_assembled_for_issues(ids)
+            for iss in unique:
                 data["issues"].append({
                     "issue": iss,
-                    "drafts": drafts,
-                    "assembled": assembled,
+                    "drafts": drafts.get(iss["id"], []),
+                    "assembled": assembled.get(iss["id"]),
                 })
 
         content = json.dumps(data, indent=2, default=str)
@@ -159,9 +224,8 @@ class ExportManager:
         os.makedirs(backup_dir, exist_ok=True)
 
         # Subscribers
-        csv_content, csv_filename, sub_count = self.export_subscribers()
-        with open(os.path.join(backup_dir, "subscribers.csv"), "w") as f:
-            f.write(csv_content)
+        with open(os.path.join(backup_dir, "subscribers.csv"), "w", newline="") as f:
+            sub_count = self.write_subscribers_csv(f)
 
         # Content
         content_json = self.export_content()
@@ -194,50 +258,84 @@ class ExportManager:
     def encrypted_full_backup(self, output_dir: str, key: "bytes | str | None" = None) -> str:
         """Produce a single encrypted archive of the full backup contents.
 
-        Bundles subscribers.csv + content.json + config.yaml into a
-        tar.gz in memory, then encrypts with Fernet. Writes one file:
-        ``backup_<timestamp>.enc`` — no plaintext ever touches disk.
+        Bundles subscribers.csv + content.json + config.yaml and a
+        row-level dump of every table in ``BACKUP_TABLES`` into a tar.gz
+        stream that is encrypted chunk by chunk as it is written (see
+        ``encrypted_stream``). Writes one file: ``backup_<timestamp>.enc``
+        — no plaintext ever touches disk, and memory stays at one batch
+        of rows plus one encryption chunk whatever the data size.
 
         ``key`` may be passed explicitly (testing) or read from the
         ``WEEKLYAMP_BACKUP_KEY`` env var. Raises ValueError if neither
         is set — refusing to fall back silently to plaintext is the
         whole point of this path.
         """
-        from cryptography.fernet import Fernet
+        return self._encrypted_backup(output_dir, key, incremental=False)
 
-        k = key or os.environ.get("WEEKLYAMP_BACKUP_KEY", "")
-        if not k:
-            raise ValueError(
-                "WEEKLYAMP_BACKUP_KEY not set — generate one with "
-                "ExportManager.generate_backup_key() and store in env."
-            )
-        if isinstance(k, str):
-            k = k.encode()
+    def encrypted_incremental_backup(self, output_dir: str, key: "bytes | str | None" = None) -> str:
+        """Encrypted archive of table rows added or changed since the last backup.
 
-        # Build files in memory, bundle into an in-memory tar, encrypt.
-        csv_content, _, sub_count = self.export_subscribers()
-        content_json = self.export_content()
-        config_yaml = self.export_config()
+        Each table's watermark (highest id, plus the newest value of its
+        change-timestamp column) is stored after every successful backup;
+        this one exports only rows beyond them, except for tables in
+        ``BACKUP_TABLES`` without a change column, which are exported in
+        full. Deleted rows are not captured — restore the last full backup, then apply the
+        incrementals in order. Writes ``backup_<timestamp>_incr.enc``.
+        """
+        return self._encrypted_backup(output_dir, key, incremental=True)
 
-        tar_buf = io.BytesIO()
-        with tarfile.open(fileobj=tar_buf, mode="w:gz") as tar:
-            for name, data in (
-                ("subscribers.csv", csv_content),
-                ("content.json", content_json),
-                ("config.yaml", config_yaml),
-            ):
-                info = tarfile.TarInfo(name=name)
-                payload = data.encode() if isinstance(data, str) else data
-                info.size = len(payload)
-                tar.addfile(info, io.BytesIO(payload))
+    def _encrypted_backup(self, output_dir: str, key: "bytes | str | None", incremental: bool) -> str:
+        from weeklyamp.export.encrypted_stream import EncryptingWriter
 
-        ciphertext = Fernet(k).encrypt(tar_buf.getvalue())
+        k = _resolve_key(
+            key,
+            "WEEKLYAMP_BACKUP_KEY not set — generate one with "
+            "ExportManager.generate_backup_key() and store in env.",
+        )
+        since = self._load_watermarks() if incremental else {}
 
         os.makedirs(output_dir, exist_ok=True)
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        out_path = os.path.join(output_dir, f"backup_{timestamp}.enc")
-        with open(out_path, "wb") as f:
-            f.write(ciphertext)
+        suffix = "_incr" if incremental else ""
+        out_path = os.path.join(output_dir, f"backup_{timestamp}{suffix}.enc")
+        tmp_path = out_path + ".part"
+
+        manifest: dict = {
+            "format": 2,
+            "kind": "incremental" if incremental else "full",
+            "created_at": datetime.utcnow().isoformat(),
+            "since": since,
+            "watermarks": {},
+            "tables": {},
+            "files": {},
+        }
+        try:
+            with open(tmp_path, "wb") as fh:
+                writer = EncryptingWriter(fh, k)
+                with tarfile.open(fileobj=writer, mode="w|gz") as tar:
+                    archive = _ArchiveWriter(tar, manifest["files"])
+                    if not incremental:
+                        archive.add("config.yaml", self.export_config().encode())
+                        archive.add("content.json", self.export_content().encode())
+                        for chunk in iter_subscribers_csv(
+                            self.repo, statuses=_EXPORT_STATUSES, batch_size=_PART_ROWS,
+                        ):
+                            archive.add("subscribers.csv", chunk.encode())
+                    for table, ts_column in BACKUP_TABLES.items():
+                        self._backup_table(archive, manifest, table, ts_column, since.get(table, {}))
+                    _add_member(tar, _MANIFEST, json.dumps(manifest, indent=2, default=str).encode())
+                writer.close()
+            os.replace(tmp_path, out_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        # Only a backup that made it to disk moves the watermarks on.
+        self.repo.set_admin_setting(
+            _WATERMARK_KEY, json.dumps(manifest["watermarks"], default=str),
+        )
+        record_count = sum(manifest["tables"].values())
 
         # Audit: note encrypted backup in export_log (CHECK constraint
         # limits export_type to the original four values, so reuse
@@ -249,15 +347,76 @@ class ExportManager:
                 """INSERT INTO export_log
                        (export_type, file_path, record_count)
                    VALUES (?, ?, ?)""",
-                ("full_backup", f"enc:{os.path.basename(out_path)}", sub_count),
+                ("full_backup", f"enc:{os.path.basename(out_path)}", record_count),
             )
             conn.commit()
         finally:
             conn.close()
 
-        logger.info("Encrypted backup written to %s (%d subscribers)", out_path, sub_count)
+        logger.info("Encrypted %s backup written to %s (%d rows)", manifest["kind"], out_path, record_count)
         return out_path
 
+    def _load_watermarks(self) -> dict:
+        try:
+            marks = json.loads(self.repo.get_admin_setting(_WATERMARK_KEY) or "{}")
+        except ValueError:
+            return {}
+        return marks if isinstance(marks, dict) else {}
+
+    def _backup_table(
+        self, archive: "_ArchiveWriter", manifest: dict, table: str,
+        ts_column: Optional[str], since: dict,
+    ) -> None:
+        """Dump ``table`` as JSON lines, one tar member per batch of rows.
+
+        The watermark is read before the dump and the timestamp compare is
+        inclusive, so a row written while it runs (or within the same
+        second as the watermark) is at worst exported again next time,
+        never skipped.
+        """
+        conn = self.repo._conn()
+        try:
+            cols = "MAX(id) AS max_id" + (f", MAX({ts_column}) AS max_ts" if ts_column else "")
+            row = conn.execute(f"SELECT {cols} FROM {table}").fetchone()
+        except Exception:
+            logger.warning("Skipping table %s in backup", table, exc_info=True)
+            return
+        finally:
+            conn.close()
+        manifest["watermarks"][table] = {
+            "id": row["max_id"] or 0,
+            "ts": str(row["max_ts"]) if ts_column and row["max_ts"] else "",
+        }
+
+        where, params = "", []
+        if ts_column and (since.get("id") or since.get("ts")):
+            if since.get("ts"):
+                where, params = f" AND (id > ? OR {ts_column} >= ?)", [since.get("id", 0), since["ts"]]
+            else:
+                # Watermark from before the column was tracked: take every
+                # row edited since.
+                where, params = f" AND (id > ? OR {ts_column} IS NOT NULL)", [since.get("id", 0)]
+        sql = f"SELECT * FROM {table} WHERE id > ?{where} ORDER BY id LIMIT ?"
+
+        name = f"tables/{table}.jsonl"
+        count = 0
+        last_id = 0
+        while True:
+            conn = self.repo._conn()
+            try:
+                rows = conn.execute(sql, (last_id, *params, _PART_ROWS)).fetchall()
+            finally:
+                conn.close()
+            if rows:
+                archive.add(name, "".join(
+                    json.dumps(dict(r), default=str, separators=(",", ":")) + "\n" for r in rows
+                ).encode())
+                count += len(rows)
+            if len(rows) < _PART_ROWS:
+                break
+            last_id = rows[-1]["id"]
+        manifest["tables"][table] = count
+
     @staticmethod
     def generate_backup_key() -> str:
         """Generate a fresh Fernet key suitable for WEEKLYAMP_BACKUP_KEY.
@@ -277,22 +436,65 @@ class ExportManager:
         Returns the extracted directory path. Used for disaster recovery
         and — importantly — in the restore round-trip test to verify
         the encryption/compression pipeline actually round-trips.
-        """
-        from cryptography.fernet import Fernet
 
-        k = key or os.environ.get("WEEKLYAMP_BACKUP_KEY", "")
-        if not k:
-            raise ValueError("WEEKLYAMP_BACKUP_KEY not set")
-        if isinstance(k, str):
-            k = k.encode()
-
-        with open(encrypted_path, "rb") as f:
-            ciphertext = f.read()
-        plaintext = Fernet(k).decrypt(ciphertext)
+        Chunked archives are decrypted, decompressed and written out as
+        a stream; every file's SHA-256 is checked against the manifest,
+        and a tampered, reordered or truncated archive raises
+        (``InvalidToken`` or ``ValueError``). Archives written before
+        the chunked format are still read, in one piece.
+        """
+        from weeklyamp.export.encrypted_stream import DecryptingReader, is_chunked
 
+        k = _resolve_key(key, "WEEKLYAMP_BACKUP_KEY not set")
         os.makedirs(output_dir, exist_ok=True)
-        with tarfile.open(fileobj=io.BytesIO(plaintext), mode="r:gz") as tar:
-            tar.extractall(output_dir)
+
+        if not is_chunked(encrypted_path):
+            from cryptography.fernet import Fernet
+
+            with open(encrypted_path, "rb") as f:
+                ciphertext = f.read()
+            plaintext = Fernet(k).decrypt(ciphertext)
+            with tarfile.open(fileobj=io.BytesIO(plaintext), mode="r:gz") as tar:
+                tar.extractall(output_dir)
+            return output_dir
+
+        root = Path(output_dir).resolve()
+        digests: dict = {}
+        manifest = None
+        with open(encrypted_path, "rb") as fh:
+            reader = DecryptingReader(fh, k)
+            with tarfile.open(fileobj=reader, mode="r|gz") as tar:
+                for member in tar:
+                    if not member.isfile():
+                        continue
+                    src = tar.extractfile(member)
+                    if member.name == _MANIFEST:
+                        manifest = json.loads(src.read())
+                        continue
+                    logical = _PART_SUFFIX.sub("", member.name)
+                    dest = (root / logical).resolve()
+                    if root not in dest.parents:
+                        raise ValueError(f"unsafe path in backup: {member.name}")
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    # Parts of one logical file arrive in order; the
+                    # first creates it and the rest append.
+                    mode = "ab" if logical in digests else "wb"
+                    digest = digests.setdefault(logical, hashlib.sha256())
+                    with open(dest, mode) as out:
+                        for block in iter(lambda: src.read(_COPY_BLOCK), b""):
+                            digest.update(block)
+                            out.write(block)
+            # Drain past the end of the tar so the final-chunk and
+            # trailing-data checks run.
+            reader.read()
+
+        if manifest is None:
+            raise ValueError("backup has no manifest")
+        expected = manifest.get("files", {})
+        actual = {name: d.hexdigest() for name, d in digests.items()}
+        if set(expected) != set(actual) or any(expected[n]["sha256"] != actual[n] for n in actual):
+            raise ValueError("backup contents do not match the manifest")
+        (root / _MANIFEST).write_text(json.dumps(manifest, indent=2))
         return output_dir
 
     # ------------------------------------------------------------------
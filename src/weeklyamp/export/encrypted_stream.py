@@ -0,0 +1,139 @@
+"""Chunked authenticated encryption for backup archives.
+
+A backup is written as a sequence of Fernet tokens instead of one token
+over the whole archive, so neither side ever holds more than one chunk
+in memory:
+
+    MAGIC
+    [16-byte random stream id]
+    [4-byte big-endian length][Fernet token]   × N
+
+Each token's plaintext starts with the stream id, an 8-byte chunk index
+and a 1-byte "final" flag. Fernet authenticates every chunk; the stream
+id stops chunks of two backups made with the same key being spliced
+together, and the index and final flag make reordering, dropping and
+truncating chunks detectable too. The reader raises ``InvalidToken`` for
+a wrong key or tampered chunk, and ``ValueError`` for a stream that is
+mixed, out of order or cut short.
+
+Streams written before the stream id was added (``MAGIC_V2``) are still
+read.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from typing import BinaryIO, Optional
+
+from cryptography.fernet import Fernet
+
+MAGIC = b"WAMPBAK3\n"
+MAGIC_V2 = b"WAMPBAK2\n"
+STREAM_ID_SIZE = 16
+CHUNK_SIZE = 1024 * 1024
+
+_LEN = struct.Struct(">I")
+_HEAD = struct.Struct(">QB")
+
+
+class EncryptingWriter:
+    """Write-only file object that encrypts to ``fh`` in CHUNK_SIZE pieces."""
+
+    def __init__(self, fh: BinaryIO, key: bytes, chunk_size: Optional[int] = None) -> None:
+        self._fh = fh
+        self._fernet = Fernet(key)
+        self._chunk_size = chunk_size or CHUNK_SIZE
+        self._buf = bytearray()
+        self._index = 0
+        self._closed = False
+        self._stream_id = os.urandom(STREAM_ID_SIZE)
+        self.bytes_written = len(MAGIC) + STREAM_ID_SIZE
+        fh.write(MAGIC + self._stream_id)
+
+    def write(self, data: bytes) -> int:
+        self._buf += data
+        while len(self._buf) > self._chunk_size:
+            self._emit(bytes(self._buf[:self._chunk_size]), final=False)
+            del self._buf[:self._chunk_size]
+        return len(data)
+
+    def _emit(self, data: bytes, final: bool) -> None:
+        token = self._fernet.encrypt(self._stream_id + _HEAD.pack(self._index, final) + data)
+        self._fh.write(_LEN.pack(len(token)))
+        self._fh.write(token)
+        self.bytes_written += _LEN.size + len(token)
+        self._index += 1
+
+    def close(self) -> None:
+        """Flush the final chunk. Does not close the underlying file."""
+        if not self._closed:
+            self._emit(bytes(self._buf), final=True)
+            self._buf.clear()
+            self._closed = True
+
+
+class DecryptingReader:
+    """Read-only file object over a stream written by EncryptingWriter."""
+
+    def __init__(self, fh: BinaryIO, key: bytes) -> None:
+        magic = fh.read(len(MAGIC))
+        if magic == MAGIC:
+            self._stream_id = fh.read(STREAM_ID_SIZE)
+            if len(self._stream_id) < STREAM_ID_SIZE:
+                raise ValueError("backup stream is truncated")
+        elif magic == MAGIC_V2:
+            self._stream_id = b""
+        else:
+            raise ValueError("not a chunked backup stream")
+        self._fh = fh
+        self._fernet = Fernet(key)
+        self._buf = b""
+        self._pos = 0
+        self._index = 0
+        self._done = False
+
+    def _next_chunk(self) -> None:
+        raw_len = self._fh.read(_LEN.size)
+        if len(raw_len) < _LEN.size:
+            raise ValueError("backup stream is truncated")
+        (length,) = _LEN.unpack(raw_len)
+        token = self._fh.read(length)
+        if len(token) < length:
+            raise ValueError("backup stream is truncated")
+        plain = self._fernet.decrypt(token)
+        id_size = len(self._stream_id)
+        if plain[:id_size] != self._stream_id:
+            raise ValueError("backup chunk belongs to a different backup stream")
+        index, final = _HEAD.unpack_from(plain, id_size)
+        if index != self._index:
+            raise ValueError(f"backup chunk {index} out of order (expected {self._index})")
+        self._index += 1
+        self._buf = plain[id_size + _HEAD.size:]
+        self._pos = 0
+        if final:
+            if self._fh.read(1):
+                raise ValueError("unexpected data after the final backup chunk")
+            self._done = True
+
+    def read(self, size: int = -1) -> bytes:
+        parts = []
+        remaining = size
+        while size < 0 or remaining > 0:
+            if self._pos >= len(self._buf):
+                if self._done:
+                    break
+                self._next_chunk()
+                continue
+            available = len(self._buf) - self._pos
+            take = available if size < 0 else min(remaining, available)
+            parts.append(self._buf[self._pos:self._pos + take])
+            self._pos += take
+            remaining -= take
+        return b"".join(parts)
+
+
+def is_chunked(path: str) -> bool:
+    """True when ``path`` starts with a chunked-stream magic."""
+    with open(path, "rb") as fh:
+        return fh.read(len(MAGIC)) in (MAGIC, MAGIC_V2)
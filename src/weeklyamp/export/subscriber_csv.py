@@ -0,0 +1,151 @@
+"""Streaming subscriber CSV export and chunked bulk import.
+
+Export walks ``Repository.iter_subscribers`` and emits CSV text one
+batch at a time, so a download or backup of any size holds a single
+batch in memory.
+
+Import reads the file as a stream, normalises and validates each row,
+drops (email, edition) pairs already seen earlier in the file — the
+same email on several rows joins each edition listed — and hands ``chunk_size``
+rows at a time to ``Repository.import_subscribers`` — one transaction
+and a handful of queries per chunk instead of several per row. An
+optional ``progress`` callback receives the running totals after every
+chunk, which is how the admin import page reports on large files.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import logging
+from typing import Callable, Iterable, Iterator, Optional, TextIO
+
+from weeklyamp.db.repository import Repository
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+_EMAIL_KEYS = ("email", "Email", "EMAIL")
+_NAME_KEYS = ("first_name", "First Name", "name", "Name")
+_EDITION_KEYS = ("edition", "Edition")
+
+
+def _csv_chunks(
+    repo: Repository,
+    columns: Optional[list[str]],
+    statuses: tuple[str, ...],
+    batch_size: int,
+) -> Iterator[tuple[str, int]]:
+    """Yield ``(csv_text, rows_in_text)``; the header rides on the first chunk."""
+    buf = io.StringIO()
+    writer: Optional[csv.DictWriter] = None
+    pending = 0
+    for sub in repo.iter_subscribers(statuses, batch_size=batch_size):
+        if writer is None:
+            writer = csv.DictWriter(buf, fieldnames=columns or list(sub), extrasaction="ignore")
+            writer.writeheader()
+        writer.writerow(sub)
+        pending += 1
+        if pending == batch_size:
+            yield buf.getvalue(), pending
+            buf.seek(0)
+            buf.truncate()
+            pending = 0
+    if writer is None:
+        csv.writer(buf).writerow(columns or ["email", "status"])
+    if buf.tell():
+        yield buf.getvalue(), pending
+
+
+def iter_subscribers_csv(
+    repo: Repository,
+    columns: Optional[list[str]] = None,
+    statuses: tuple[str, ...] = ("active",),
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[str]:
+    """CSV of subscribers as a stream of text chunks (for StreamingResponse).
+
+    ``columns`` defaults to every column of the subscribers table.
+    """
+    for text, _ in _csv_chunks(repo, columns, statuses, batch_size):
+        yield text
+
+
+def write_subscribers_csv(
+    repo: Repository,
+    fh: TextIO,
+    columns: Optional[list[str]] = None,
+    statuses: tuple[str, ...] = ("active",),
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Write the subscriber CSV to ``fh``; returns the number of rows."""
+    count = 0
+    for text, rows in _csv_chunks(repo, columns, statuses, batch_size):
+        fh.write(text)
+        count += rows
+    return count
+
+
+def _first(row: dict, keys: tuple[str, ...]) -> str:
+    for key in keys:
+        if row.get(key):
+            return row[key]
+    return ""
+
+
+def import_subscribers_csv(
+    repo: Repository,
+    lines: Iterable[str],
+    default_edition: str = "fan",
+    chunk_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[Callable[[dict], None]] = None,
+    source_channel: str = "csv_import",
+) -> dict[str, int]:
+    """Import subscribers from CSV ``lines`` (a text file or any line iterable).
+
+    Returns {"rows": N, "imported": N, "new": N, "skipped": N,
+    "duplicates": N, "errors": N}. ``imported`` counts rows written
+    (new plus updated); ``skipped`` rows had no usable email. A chunk
+    whose transaction fails is retried row by row so one bad row only
+    costs itself.
+    """
+    stats = {"rows": 0, "imported": 0, "new": 0, "skipped": 0, "duplicates": 0, "errors": 0}
+    seen: set[tuple[str, str]] = set()
+    chunk: list[tuple[str, str, str]] = []
+
+    def _flush() -> None:
+        try:
+            stats["new"] += repo.import_subscribers(chunk, source_channel=source_channel)
+            stats["imported"] += len(chunk)
+        except Exception:
+            logger.exception("CSV import chunk failed; retrying %d rows one by one", len(chunk))
+            for row in chunk:
+                try:
+                    stats["new"] += repo.import_subscribers([row], source_channel=source_channel)
+                    stats["imported"] += 1
+                except Exception:
+                    logger.warning("CSV import row failed for %s", row[0], exc_info=True)
+                    stats["errors"] += 1
+        chunk.clear()
+        if progress:
+            progress(dict(stats))
+
+    for row in csv.DictReader(lines):
+        stats["rows"] += 1
+        email = _first(row, _EMAIL_KEYS).strip().lower()
+        if not email or "@" not in email:
+            stats["skipped"] += 1
+            continue
+        edition = (_first(row, _EDITION_KEYS) or default_edition).strip()
+        if (email, edition) in seen:
+            stats["duplicates"] += 1
+            continue
+        seen.add((email, edition))
+        chunk.append((email, _first(row, _NAME_KEYS).strip(), edition))
+        if len(chunk) >= chunk_size:
+            _flush()
+
+    if chunk:
+        _flush()
+    return stats
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import signal
@@ -16,17 +17,9 @@ from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.gzip import GZipMiddleware
 
+from weeklyamp.core import metrics
 from weeklyamp.core.config import load_config
-from weeklyamp.core.database import (
-    init_database,
-    seed_agents,
-    seed_content,
-    seed_daily_actions,
-    seed_editions,
-    seed_guest_contacts,
-    seed_sections,
-)
-from weeklyamp.research.sources import sync_sources_from_config
+from weeklyamp.core.database import prepare_database
 from weeklyamp.web.security import (
     AdminIPAllowlistMiddleware,
     AuthMiddleware,
@@ -197,6 +190,7 @@ def create_app() -> FastAPI:
     _setup_sentry()
 
     config = load_config()
+    metrics.configure(enabled=config.metrics.enabled, slow_query_ms=config.metrics.slow_query_ms)
 
     # Production safety checks — fail fast if critical config is missing
     if _is_production():
@@ -246,24 +240,17 @@ def create_app() -> FastAPI:
                     db_path = os.path.join("/app", db_path)
                 else:
                     db_path = os.path.abspath(db_path)
-            init_database(db_path, database_url, backend)
-            seed_sections(db_path, database_url, backend)
-            seed_editions(db_path, database_url, backend)
-            seed_guest_contacts(db_path, database_url, backend)
-            seed_agents(db_path, database_url, backend)
-            seed_content(db_path, database_url, backend)
-            seed_daily_actions(db_path, database_url, backend)
-            # Sync any new sources from sources.yaml into DB
-            from weeklyamp.db.repository import Repository
-            repo = Repository(db_path, database_url, backend)
-            added = sync_sources_from_config(repo)
-            if added:
-                logger.info("Synced %d new sources from sources.yaml", added)
-            # Feature flags: register config defaults + seed any missing
-            # DB rows so /admin/feature-flags has a complete list to toggle.
+            # Schema and seed work is skipped when the fingerprints stored
+            # by the last boot match this build (core/database.py).
+            ran = prepare_database(
+                db_path, database_url, backend,
+                features=config.features, seed=config.startup.seed_on_boot,
+            )
+            if not ran["schema"]:
+                logger.info("Schema fingerprint unchanged — skipped schema init")
+            # Flag defaults live in memory; registering them is not seeding.
             from weeklyamp.core import feature_flags as ff
             ff.set_config_defaults(config.features)
-            ff.seed_from_config(repo, config.features)
             logger.info("Database initialized at %s (backend=%s)", db_path, backend)
         except Exception:
             logger.exception("Failed to initialize database")
@@ -274,9 +261,16 @@ def create_app() -> FastAPI:
         from weeklyamp.workers.scheduler import start_scheduler, stop_scheduler
         _bg_scheduler = start_scheduler()
 
+        # Postgres NOTIFY makes other workers' cache invalidations prompt;
+        # without it they still arrive on the next poll interval.
+        from weeklyamp.core import cache_bus
+        if config.db_backend == "postgres":
+            cache_bus.start_listener(config.database_url)
+
         yield
 
         # Shutdown — stop scheduler and close connections cleanly
+        cache_bus.stop_listener()
         stop_scheduler()
         logger.info("Shutting down — closing database connections")
 
@@ -303,6 +297,15 @@ def create_app() -> FastAPI:
         # validates the HMAC before reading the full body.
         exempt_paths=("/webhooks/inbound",),
     )
+    # Public-page response cache sits inside GZip: it stores precompressed
+    # variants itself, and GZip passes an already-encoded body through.
+    if config.response_cache.enabled:
+        from weeklyamp.web.middleware.response_cache import ResponseCacheMiddleware
+        app.add_middleware(
+            ResponseCacheMiddleware,
+            max_entries=config.response_cache.max_entries,
+            max_bytes=config.response_cache.max_bytes,
+        )
     app.add_middleware(GZipMiddleware, minimum_size=500)
 
     # Pre-launch "coming soon" gate. Registered LAST so it sits OUTERMOST and
@@ -339,6 +342,17 @@ def create_app() -> FastAPI:
         from weeklyamp.web.middleware.domain_router import DomainRoutingMiddleware
         app.add_middleware(DomainRoutingMiddleware, config=config)
 
+    # Cross-worker cache invalidation — outermost, so every layer below
+    # (domain routing, auth, flags, the response cache) sees fresh state.
+    from weeklyamp.web.middleware.cache_bus import CacheBusMiddleware
+    app.add_middleware(CacheBusMiddleware)
+
+    # Request latency and query counts. Outside everything else so the
+    # timing covers the whole middleware stack.
+    if config.metrics.enabled:
+        from weeklyamp.web.middleware.metrics import MetricsMiddleware
+        app.add_middleware(MetricsMiddleware)
+
     # Auth routes
     app.add_api_route("/login", login_page, methods=["GET"])
     app.add_api_route("/login", login_submit, methods=["POST"])
@@ -363,14 +377,16 @@ def create_app() -> FastAPI:
         logger.exception("Unhandled server error: %s %s", request.method, request.url.path)
         return HTMLResponse(_error_500, status_code=500)
 
-    # Public landing page
+    # Public landing page. The Environment is built once per app, not per
+    # hit, so the compiled template is reused.
+    from jinja2 import Environment, FileSystemLoader
+    _landing_env = Environment(loader=FileSystemLoader(str(_TEMPLATES_DIR / "web")), autoescape=True)
+
     @app.get("/")
     def landing(request: Request):
         from fastapi.responses import HTMLResponse as HR
         from weeklyamp.web.security import is_authenticated
-        from jinja2 import Environment, FileSystemLoader
-        env = Environment(loader=FileSystemLoader(str(_TEMPLATES_DIR / "web")), autoescape=True)
-        tpl = env.get_template("landing.html")
+        tpl = _landing_env.get_template("landing.html")
         authenticated = is_authenticated(request)
         return HR(tpl.render(
             authenticated=authenticated,
@@ -391,23 +407,31 @@ def create_app() -> FastAPI:
         "daily-action": ("demo_daily_action.html", "Single Daily Action", "Daily &mdash; one action for artists, thirty seconds to read"),
     }
 
+    @functools.lru_cache(maxsize=len(_SAMPLE_FILES))
+    def _read_sample(fname: str) -> str | None:
+        # The demo files ship with the deploy and never change while the
+        # process runs, so each is read from disk at most once.
+        sample_path = _TEMPLATES_DIR.parent / fname
+        if not sample_path.exists():
+            return None
+        return sample_path.read_text()
+
     @app.get("/sample/{edition}")
     def sample_issue(edition: str):
         entry = _SAMPLE_FILES.get(edition.lower())
         if not entry:
             return HTMLResponse(_error_404, status_code=404)
-        fname = entry[0]
-        sample_path = _TEMPLATES_DIR.parent / fname
-        if not sample_path.exists():
+        html = _read_sample(entry[0])
+        if html is None:
             return HTMLResponse(_error_404, status_code=404)
-        return HTMLResponse(sample_path.read_text())
+        return HTMLResponse(html)
 
     @app.get("/samples", response_class=HTMLResponse)
     def samples_index():
         """Index page listing all sample editions — share this URL."""
         cards = []
         for slug, (fname, title, blurb) in _SAMPLE_FILES.items():
-            if not (_TEMPLATES_DIR.parent / fname).exists():
+            if _read_sample(fname) is None:
                 continue
             cards.append(
                 f'<a href="/sample/{slug}" style="display:block;padding:20px;border:1px solid #e5e7eb;'
@@ -638,6 +662,21 @@ def create_app() -> FastAPI:
         """Liveness check — confirms the process is alive."""
         return {"status": "ok"}
 
+    @app.get("/metrics")
+    def metrics_endpoint(request: Request):
+        """This worker's metrics in Prometheus text format.
+
+        Admins only: a logged-in session, or for scrapers a bearer token
+        matching ``WEEKLYAMP_METRICS_TOKEN``.
+        """
+        import hmac
+        from weeklyamp.web.security import is_authenticated
+        token = os.environ.get("WEEKLYAMP_METRICS_TOKEN", "")
+        bearer = request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+        if not (is_authenticated(request) or (token and hmac.compare_digest(bearer.encode(), token.encode()))):
+            return PlainTextResponse("Unauthorized", status_code=401, headers={"WWW-Authenticate": "Bearer"})
+        return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
     # SEO: robots.txt
     @app.get("/robots.txt")
     def robots_txt():
@@ -734,7 +773,6 @@ def create_app() -> FastAPI:
         subscribers,
     )
     from weeklyamp.web.routes import agents as agents_routes
-    from weeklyamp.web.routes import promo_admin as promo_admin_routes
     from weeklyamp.web.routes import calendar as calendar_routes
     from weeklyamp.web.routes import growth as growth_routes
     from weeklyamp.web.routes import editor_articles as editor_articles_routes
@@ -761,24 +799,14 @@ def create_app() -> FastAPI:
     from weeklyamp.web.routes import contests as contests_routes
     from weeklyamp.web.routes import reader_content as reader_content_routes
     from weeklyamp.web.routes import embed as embed_routes
-    from weeklyamp.web.routes import welcome as welcome_routes
-    from weeklyamp.web.routes import reengagement as reengagement_routes
     from weeklyamp.web.routes import billing as billing_routes
     from weeklyamp.web.routes import advertiser_portal as advertiser_portal_routes
     from weeklyamp.web.routes import affiliates as affiliates_routes
     from weeklyamp.web.routes import community as community_routes
-    from weeklyamp.web.routes import revenue as revenue_routes
     # v28+ markets & artist newsletters
-    from weeklyamp.web.routes import markets as markets_routes
     from weeklyamp.web.routes import artist_newsletters as artist_newsletters_routes
-    from weeklyamp.web.routes import segments as segments_routes
     from weeklyamp.web.routes import mobile_app as mobile_app_routes
     from weeklyamp.web.routes import mobile_api as mobile_api_routes
-    from weeklyamp.web.routes import setup as setup_routes
-    from weeklyamp.web.routes import users as users_routes
-    from weeklyamp.web.routes import licensing as licensing_routes
-    from weeklyamp.web.routes import pricing_calc as pricing_calc_routes
-    from weeklyamp.web.routes import marketing as marketing_routes
     from weeklyamp.web.routes import edition_pages as edition_pages_routes
     from weeklyamp.web.routes import live_editions as live_editions_routes
     from weeklyamp.web.routes import notifications as notifications_routes
@@ -789,21 +817,27 @@ def create_app() -> FastAPI:
     from weeklyamp.web.routes import admin_feature_flags as admin_feature_flags_routes
     from weeklyamp.web.routes import admin_password_reset as admin_password_reset_routes
     from weeklyamp.web.routes import daily_action as daily_action_routes
-    from weeklyamp.web.routes import analytics as analytics_hub_routes
-    from weeklyamp.web.routes import send_time as send_time_routes
     # v36+ future vision features
     from weeklyamp.web.routes import events as events_routes
     from weeklyamp.web.routes import marketplace as marketplace_routes
-    from weeklyamp.web.routes import developer_api as developer_api_routes
     # v38+ Developer API v2
     from weeklyamp.web.routes import api_v2 as api_v2_routes
-    # v51+ Resend to non-openers
-    from weeklyamp.web.routes import resend as resend_routes
 
     # Feature-flag-gated routers. Each gated router 404s when its flag
     # is off; flip at /admin/feature-flags to turn on.
     from weeklyamp.core.feature_flags import FeatureFlag, require_feature
 
+    # Admin-only dashboards that own their /admin/<name> prefix are
+    # imported on first request when startup.lazy_admin_routes is on
+    # (see web/lazy_routes.py).
+    from weeklyamp.web import lazy_routes
+
+    def include_admin(module: str, prefix: str, dependencies=()) -> None:
+        lazy_routes.include_router(
+            app, f"weeklyamp.web.routes.{module}", prefix,
+            lazy=config.startup.lazy_admin_routes, dependencies=dependencies,
+        )
+
     # Routes
     app.include_router(dashboard.router)
     app.include_router(research.router, prefix="/research")
@@ -872,12 +906,12 @@ def create_app() -> FastAPI:
         dependencies=[Depends(require_feature(FeatureFlag.USER_SUBMISSIONS))],
     )
     app.include_router(embed_routes.router)
-    app.include_router(
-        welcome_routes.router, prefix="/admin/welcome-sequence",
+    include_admin(
+        "welcome", "/admin/welcome-sequence",
         dependencies=[Depends(require_feature(FeatureFlag.WELCOME_SEQUENCE))],
     )
-    app.include_router(
-        reengagement_routes.router, prefix="/admin/reengagement",
+    include_admin(
+        "reengagement", "/admin/reengagement",
         dependencies=[Depends(require_feature(FeatureFlag.REENGAGEMENT))],
     )
     # v26+ paid tiers & billing
@@ -901,29 +935,29 @@ def create_app() -> FastAPI:
         dependencies=[Depends(require_feature(FeatureFlag.REFERRALS))],
     )
     # v28+ revenue dashboard
-    app.include_router(revenue_routes.router, prefix="/admin/revenue")
+    include_admin("revenue", "/admin/revenue")
     # v28+ markets & artist newsletters
-    app.include_router(markets_routes.router, prefix="/admin/markets")
+    include_admin("markets", "/admin/markets")
     app.include_router(artist_newsletters_routes.router)
     # v28+ subscriber segmentation
-    app.include_router(segments_routes.router, prefix="/admin/segments")
+    include_admin("segments", "/admin/segments")
     # Mobile app waitlist
     app.include_router(mobile_app_routes.router)
     # Mobile JSON API (v1)
     app.include_router(mobile_api_routes.router, prefix="/api/v1")
     # Setup & deliverability guide
-    app.include_router(setup_routes.router, prefix="/admin/setup")
+    include_admin("setup", "/admin/setup")
     # v29+ admin user management
-    app.include_router(users_routes.router, prefix="/admin/users")
+    include_admin("users", "/admin/users")
     # v30+ city edition licensing
-    app.include_router(
-        licensing_routes.router, prefix="/admin/licensing",
+    include_admin(
+        "licensing", "/admin/licensing",
         dependencies=[Depends(require_feature(FeatureFlag.FRANCHISE))],
     )
     # Revenue calculator
-    app.include_router(pricing_calc_routes.router, prefix="/admin/calculator")
+    include_admin("pricing_calc", "/admin/calculator")
     # v32+ marketing & promotion hub
-    app.include_router(marketing_routes.router, prefix="/admin/marketing")
+    include_admin("marketing", "/admin/marketing")
     # Edition-specific landing pages
     app.include_router(edition_pages_routes.router)
     # Living Editions — web-hosted versions of published issues
@@ -936,7 +970,7 @@ def create_app() -> FastAPI:
         dependencies=[Depends(require_feature(FeatureFlag.WHITE_LABEL))],
     )
     # Admin self-service: change password + feature flags + 2FA + reset + cost
-    app.include_router(promo_admin_routes.router, prefix="/admin/promo")
+    include_admin("promo_admin", "/admin/promo")
     app.include_router(admin_account_routes.router, prefix="/admin")
     app.include_router(admin_feature_flags_routes.router, prefix="/admin")
     # Daily Action: public "mark it done" links plus the admin review desk.
@@ -949,11 +983,11 @@ def create_app() -> FastAPI:
     # _PUBLIC_PREFIXES so /login/forgot and /login/reset inherit.
     app.include_router(admin_password_reset_routes.router, prefix="/login")
     # Analytics hub (NPS, content reports, forecasting, media kit)
-    app.include_router(analytics_hub_routes.router, prefix="/admin/analytics")
+    include_admin("analytics", "/admin/analytics")
     # Send-Time Optimization dashboard
-    app.include_router(send_time_routes.router, prefix="/admin/send-times")
+    include_admin("send_time", "/admin/send-times")
     # v51+ Resend to non-openers
-    app.include_router(resend_routes.router, prefix="/admin/resend")
+    include_admin("resend", "/admin/resend")
     # v36+ future vision features
     app.include_router(
         events_routes.router, prefix="/events",
@@ -963,7 +997,7 @@ def create_app() -> FastAPI:
         marketplace_routes.router, prefix="/marketplace",
         dependencies=[Depends(require_feature(FeatureFlag.MARKETPLACE))],
     )
-    app.include_router(developer_api_routes.router, prefix="/admin/api")
+    include_admin("developer_api", "/admin/api")
     # v38+ Developer API v2 (public, auth via API key)
     app.include_router(
         api_v2_routes.router,
@@ -8,6 +8,7 @@ from jinja2 import Environment, FileSystemLoader
 
 from weeklyamp.core.config import load_config
 from weeklyamp.core.models import AppConfig
+from weeklyamp.db.async_repository import AsyncRepository
 from weeklyamp.db.repository import Repository
 
 _TEMPLATES_DIR = Path(__file__).parent.parent.parent.parent / "templates" / "web"
@@ -17,16 +18,16 @@ _env = Environment(
     autoescape=True,
 )
 
-# Add markdown filter with XSS sanitization
-import markdown as _md
+# Add markdown filter with XSS sanitization. Renderings are cached by
+# content hash (see weeklyamp.content.rendering), so re-rendering an admin
+# page doesn't re-run markdown and bleach on unchanged drafts.
 from markupsafe import Markup
 
-from weeklyamp.web.sanitize import sanitize_html
+from weeklyamp.content.rendering import markdown_to_html
 
 
 def _md_filter(text: str) -> str:
-    raw = _md.markdown(text or "", extensions=["extra"])
-    return Markup(sanitize_html(raw))
+    return Markup(markdown_to_html(text or ""))
 
 _env.filters["markdown"] = _md_filter
 _env.filters["truncate_words"] = lambda s, n=20: " ".join((s or "").split()[:n]) + ("..." if len((s or "").split()) > n else "")
@@ -107,6 +108,11 @@ def get_repo() -> Repository:
     return Repository(db_path, database_url, backend)
 
 
+def get_async_repo() -> AsyncRepository:
+    """``get_repo()`` behind the awaitable facade, for ``async def`` routes."""
+    return AsyncRepository(get_repo())
+
+
 def render(template_name: str, **ctx) -> str:
     tpl = _env.get_template(template_name)
     cfg = load_config()
@@ -0,0 +1,60 @@
+"""Import admin-only route modules on their first request.
+
+Defining a FastAPI route builds its dependency and response models, so
+importing every route module was a large share of ``create_app``. The
+admin dashboards listed in the app factory each own an ``/admin/<name>``
+prefix that no other router uses; with ``startup.lazy_admin_routes`` they
+are mounted as :class:`LazyRouter` apps that import the module and build
+its router the first time a request reaches the prefix.
+
+Lazily mounted routes don't appear in the OpenAPI schema until loaded,
+which is why only admin HTML routers are mounted this way.
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from typing import Optional, Sequence
+
+from fastapi import APIRouter, FastAPI
+from starlette.types import Receive, Scope, Send
+
+
+class LazyRouter:
+    """ASGI app that imports ``module`` and serves its ``router`` on first use."""
+
+    def __init__(self, module: str, dependencies: Sequence = (), attr: str = "router") -> None:
+        self.module = module
+        self.dependencies = list(dependencies)
+        self.attr = attr
+        self._router: Optional[APIRouter] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._router is not None
+
+    def load(self) -> APIRouter:
+        with self._lock:
+            if self._router is None:
+                router = APIRouter()
+                router.include_router(
+                    getattr(importlib.import_module(self.module), self.attr),
+                    dependencies=self.dependencies,
+                )
+                self._router = router
+        return self._router
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        router = self._router or self.load()
+        await router(scope, receive, send)
+
+
+def include_router(app: FastAPI, module: str, prefix: str, *, lazy: bool, dependencies: Sequence = ()) -> None:
+    """Add ``module``'s router under ``prefix``, lazily when ``lazy``."""
+    if lazy:
+        app.mount(prefix, LazyRouter(module, dependencies))
+    else:
+        router = importlib.import_module(module).router
+        app.include_router(router, prefix=prefix, dependencies=list(dependencies))
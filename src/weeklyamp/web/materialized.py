@@ -0,0 +1,243 @@
+"""Materialized public documents with conditional-GET support.
+
+Feeds and archive pages are read far more often than issues are
+published, and building them means loading every listed issue's
+assembled content. So each document is rendered once, stored in the
+``rendered_pages`` table with an ETag and Last-Modified date, and served
+from there until the Repository invalidates it (any write to an issue's
+status or assembled content clears the table). Every worker reads the
+same stored copy, so a publish on one worker is seen by all of them. A
+page is only stored if no invalidation ran while it was being built, so
+a slow build can't put pre-publish content back.
+
+Clients that send ``If-None-Match`` / ``If-Modified-Since`` get a bodiless
+304 when nothing changed, which is most feed-reader polls.
+
+``serve_file`` applies the same validators to static files on disk and
+adds single-range support (206 Partial Content) so podcast players can
+seek without downloading the whole episode.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Callable
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+
+def make_etag(body: str | bytes) -> str:
+    """Strong ETag for a document body."""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+def http_date(timestamp: float | None = None) -> str:
+    """RFC 7231 IMF-fixdate, e.g. ``Mon, 19 Oct 2026 09:00:00 GMT``."""
+    return formatdate(timestamp, usegmt=True)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: str) -> bool:
+    """True when the request's validators show the client's copy is current.
+
+    ``If-None-Match`` wins when present, as RFC 7232 requires; the date
+    is only consulted for clients that sent no ETag.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        return etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def validator_headers(etag: str, last_modified: str, max_age: int = 300) -> dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    if last_modified:
+        headers["Last-Modified"] = last_modified
+    return headers
+
+
+def not_modified(etag: str, last_modified: str, max_age: int = 300) -> Response:
+    return Response(status_code=304, headers=validator_headers(etag, last_modified, max_age))
+
+
+def config_tag(config) -> str:
+    """Short fingerprint of the config values baked into public documents.
+
+    Part of every cache key, so a changed domain or newsletter name in
+    config produces new documents instead of serving the old ones.
+    """
+    raw = "|".join((
+        config.site_domain or "",
+        config.newsletter.name or "",
+        config.newsletter.tagline or "",
+    ))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:10]
+
+
+def serve_materialized(
+    request: Request,
+    repo,
+    cache_key: str,
+    content_type: str,
+    build: Callable[[], str],
+    *,
+    max_age: int = 300,
+) -> Response:
+    """Serve ``cache_key`` from ``rendered_pages``, building it on a miss.
+
+    ``build`` returns the document body. A storage failure is logged and
+    the freshly built body is served anyway — caching is never allowed
+    to take a public page down.
+    """
+    page = None
+    try:
+        page = repo.get_rendered_page(cache_key)
+    except Exception:
+        logger.exception("rendered_pages read failed for %s", cache_key)
+
+    if page is None:
+        generation = None
+        try:
+            generation = repo.get_rendered_pages_generation()
+        except Exception:
+            logger.exception("cache generation read failed for %s", cache_key)
+        body = build()
+        page = {
+            "content_type": content_type,
+            "body": body,
+            "etag": make_etag(body),
+            "last_modified": http_date(),
+        }
+        try:
+            if generation is not None:
+                repo.save_rendered_page(
+                    cache_key, content_type, body, page["etag"], page["last_modified"],
+                    generation=generation,
+                )
+        except Exception:
+            logger.exception("rendered_pages write failed for %s", cache_key)
+
+    if is_not_modified(request, page["etag"], page["last_modified"]):
+        return not_modified(page["etag"], page["last_modified"], max_age)
+    return Response(
+        content=page["body"],
+        media_type=page["content_type"],
+        headers=validator_headers(page["etag"], page["last_modified"], max_age),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Files with Range support
+# ---------------------------------------------------------------------------
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+_FILE_CHUNK = 64 * 1024
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Resolve a single ``bytes=`` range to inclusive offsets.
+
+    Returns None for anything unsupported (multiple ranges, other units),
+    which the caller answers with the full file as RFC 7233 allows.
+    Raises ValueError when the range cannot be satisfied.
+    """
+    match = _RANGE_RE.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if size == 0:
+        # No byte of an empty file can be addressed, suffix ranges included.
+        raise ValueError("range not satisfiable")
+    if not first:
+        # Suffix range: the final N bytes.
+        length = int(last)
+        if length == 0:
+            raise ValueError("empty suffix range")
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError("range not satisfiable")
+    return start, end
+
+
+def _read_file(path: Path, start: int, length: int):
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = fh.read(min(_FILE_CHUNK, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def serve_file(
+    request: Request,
+    path: Path,
+    media_type: str,
+    *,
+    filename: str = "",
+    max_age: int = 3600,
+) -> Response:
+    """Serve a file with ETag/Last-Modified, 304s and byte ranges.
+
+    The ETag comes from the file's mtime and size, so a regenerated file
+    gets a new tag. ``If-Range`` is honoured: a stale validator turns a
+    range request back into a full 200.
+    """
+    stat = path.stat()
+    size = stat.st_size
+    etag = f'"{stat.st_mtime_ns:x}-{size:x}"'
+    last_modified = http_date(stat.st_mtime)
+
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified, max_age)
+
+    headers = validator_headers(etag, last_modified, max_age)
+    headers["Accept-Ranges"] = "bytes"
+    if filename:
+        headers["Content-Disposition"] = f'inline; filename="{filename}"'
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (not if_range or if_range.strip() in (etag, last_modified)):
+        try:
+            byte_range = _parse_range(range_header, size)
+        except ValueError:
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(status_code=416, headers=headers)
+
+    if byte_range is None:
+        headers["Content-Length"] = str(size)
+        return StreamingResponse(_read_file(path, 0, size), media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    length = end - start + 1
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(length)
+    return StreamingResponse(
+        _read_file(path, start, length), status_code=206, media_type=media_type, headers=headers,
+    )
@@ -0,0 +1,22 @@
+"""Poll the cache invalidation bus once per request.
+
+Sits outermost so every handler below it sees caches that reflect
+writes made in other workers. The check is a clock comparison until a
+poll is due; the poll itself (one small query) runs in the threadpool.
+"""
+
+from __future__ import annotations
+
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from weeklyamp.core import cache_bus
+
+
+class CacheBusMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next) -> Response:
+        if cache_bus.due():
+            await run_in_threadpool(cache_bus.poll)
+        return await call_next(request)
@@ -7,14 +7,31 @@ INACTIVE by default — requires white_label.enabled=true.
 from __future__ import annotations
 
 import logging
+import weakref
 from typing import Optional
 
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
+from weeklyamp.core import cache_bus
+
 logger = logging.getLogger(__name__)
 
+# Live middleware instances. The cache bus holds one module-level handler
+# rather than a bound method per instance, so rebuilding the app (each
+# create_app() makes a new middleware) neither piles up handlers nor
+# keeps old instances alive.
+_instances: "weakref.WeakSet[DomainRoutingMiddleware]" = weakref.WeakSet()
+
+
+def _invalidate_all() -> None:
+    for middleware in list(_instances):
+        middleware.invalidate_cache()
+
+
+cache_bus.subscribe(cache_bus.DOMAINS, _invalidate_all)
+
 
 class DomainRoutingMiddleware(BaseHTTPMiddleware):
     """Route requests to edition-specific content based on Host header.
@@ -29,6 +46,7 @@ class DomainRoutingMiddleware(BaseHTTPMiddleware):
         self.config = config
         self._domain_cache: dict[str, dict] = {}
         self._cache_built = False
+        _instances.add(self)
 
     def _build_cache(self) -> None:
         """Build domain → tenant mapping from database.
@@ -91,8 +109,8 @@ class DomainRoutingMiddleware(BaseHTTPMiddleware):
             logger.exception("Failed to build domain routing cache")
 
     def invalidate_cache(self) -> None:
-        """Force cache rebuild on next request. Call when a licensee
-        domain is verified or a custom_domain field is changed."""
+        """Force cache rebuild on next request. Runs through the cache
+        bus whenever a licensee's domain, branding or status changes."""
         self._domain_cache = {}
         self._cache_built = False
 
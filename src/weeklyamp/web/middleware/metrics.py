@@ -0,0 +1,47 @@
+"""Record latency and query count for every request.
+
+Requests are labelled by route template (``/review/{issue_id}``), not raw
+path, so a crawler walking ids can't grow the series without bound;
+anything no route matched is ``unmatched``. Routes inside a mounted app
+(the lazily loaded admin routers) carry the mount prefix, taken from the
+``root_path`` the mount adds to the scope. Queries are tallied through
+:func:`weeklyamp.core.metrics.query_scope`, which also sees queries run on
+the threadpool or via ``run_db`` because both copy the request context.
+"""
+
+from __future__ import annotations
+
+import time
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from weeklyamp.core import metrics
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next) -> Response:
+        if not metrics.enabled():
+            return await call_next(request)
+        started = time.perf_counter()
+        status = 500
+        app_root = request.scope.get("root_path", "")
+        with metrics.query_scope() as tally:
+            try:
+                response = await call_next(request)
+                status = response.status_code
+                return response
+            finally:
+                route = request.scope.get("route")
+                template = getattr(route, "path", None)
+                if template is None:
+                    template = "unmatched"
+                else:
+                    template = request.scope.get("root_path", "")[len(app_root):] + template
+                metrics.inc("weeklyamp_http_requests_total", method=request.method, route=template, status=str(status))
+                metrics.observe(
+                    "weeklyamp_http_request_duration_seconds", time.perf_counter() - started,
+                    method=request.method, route=template,
+                )
+                metrics.observe("weeklyamp_http_request_db_queries", tally[0], route=template)
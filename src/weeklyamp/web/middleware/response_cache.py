@@ -0,0 +1,220 @@
+"""In-memory response cache for public pages served to anonymous visitors.
+
+Landing, edition, archive, sample and embed pages render templates and
+query the database on every hit, yet look identical for every anonymous
+visitor on a given host. This middleware keeps the rendered response in
+memory for a per-route TTL so a traffic spike from a social share is
+served without touching Jinja or the database.
+
+Only ``GET`` requests from visitors without a valid admin session are
+cached, and only 200 responses that set no cookies. Entries are keyed
+on host + path + query string, so white-label tenants never see each
+other's pages. Each entry keeps a gzip-precompressed copy and an ETag,
+and conditional requests are answered with 304.
+
+Every route rule carries tags. :func:`invalidate` drops entries by tag:
+issue writes invalidate ``"issues"`` through the repository's
+content-change hook, and admin changes to flags or site settings
+invalidate ``"site"``. Other workers drop the same tags when the cache
+bus reports the write (see :mod:`weeklyamp.core.cache_bus`).
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from weeklyamp.core import cache_bus
+from weeklyamp.db.repository import add_content_change_listener
+from weeklyamp.web.materialized import http_date, is_not_modified, make_etag, validator_headers
+from weeklyamp.web.security import is_authenticated
+
+logger = logging.getLogger(__name__)
+
+# (path pattern, TTL seconds, tags). First match wins; unmatched paths
+# are never cached.
+_RULES: tuple[tuple[re.Pattern, int, tuple[str, ...]], ...] = (
+    (re.compile(r"^/$"), 300, ("site",)),
+    (re.compile(r"^/(for-artists|for-fans|for-industry|license)$"), 300, ("site",)),
+    (re.compile(r"^/newsletters(/archive(/\d+)?)?$"), 120, ("issues", "site")),
+    (re.compile(r"^/articles/[\w-]+/[\w-]+/\d+$"), 300, ("issues", "site")),
+    (re.compile(r"^/samples$"), 3600, ("site",)),
+    (re.compile(r"^/sample/[\w-]+$"), 3600, ("site",)),
+    (re.compile(r"^/embed/(subscribe|badge|code)$"), 600, ("site",)),
+)
+
+_GZIP_MIN_BYTES = 500
+_MAX_ENTRY_BYTES = 1024 * 1024
+# Headers recomputed per response rather than replayed from the entry.
+_DROP_HEADERS = {"content-length", "content-encoding", "etag", "last-modified", "cache-control", "vary"}
+
+
+def _rule_for(path: str) -> Optional[tuple[int, tuple[str, ...]]]:
+    for pattern, ttl, tags in _RULES:
+        if pattern.match(path):
+            return ttl, tags
+    return None
+
+
+@dataclass
+class _Entry:
+    body: bytes
+    gzipped: Optional[bytes]
+    headers: list[tuple[str, str]]
+    etag: str
+    last_modified: str
+    expires: float
+    tags: tuple[str, ...]
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + len(self.gzipped or b"")
+
+
+class ResponseCache:
+    """LRU store of cached responses, bounded by entry count and bytes."""
+
+    def __init__(self, max_entries: int = 500, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str, str], _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        _caches.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple[str, str, str]) -> Optional[_Entry]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires <= now:
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple[str, str, str], entry: _Entry) -> None:
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, *tags: str) -> int:
+        """Drop entries carrying any of ``tags`` (every entry when none given)."""
+        with self._lock:
+            if not tags:
+                dropped = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                return dropped
+            wanted = set(tags)
+            keys = [k for k, e in self._entries.items() if wanted.intersection(e.tags)]
+            for key in keys:
+                self._drop(key)
+            return len(keys)
+
+    def _drop(self, key: tuple[str, str, str]) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+
+_caches: "weakref.WeakSet[ResponseCache]" = weakref.WeakSet()
+
+
+def invalidate(*tags: str) -> None:
+    """Drop cached responses tagged with any of ``tags`` in this process."""
+    for cache in list(_caches):
+        cache.invalidate(*tags)
+
+
+add_content_change_listener(lambda: invalidate("issues"))
+# Writes made in other workers arrive through the cache bus.
+cache_bus.subscribe(cache_bus.ISSUES, lambda: invalidate("issues"))
+cache_bus.subscribe(cache_bus.FEATURE_FLAGS, lambda: invalidate("site"))
+cache_bus.subscribe(cache_bus.ADMIN_SETTINGS, lambda: invalidate("site"))
+
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    """Serve cacheable public pages from a :class:`ResponseCache`."""
+
+    def __init__(self, app, max_entries: int = 500, max_bytes: int = 64 * 1024 * 1024) -> None:
+        super().__init__(app)
+        self.cache = ResponseCache(max_entries=max_entries, max_bytes=max_bytes)
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        if request.method != "GET":
+            return await call_next(request)
+        rule = _rule_for(request.url.path)
+        if rule is None or is_authenticated(request):
+            return await call_next(request)
+
+        key = (request.headers.get("host", "").lower(), request.url.path, request.url.query)
+        entry = self.cache.get(key)
+        if entry is not None:
+            return self._serve(request, entry, hit=True)
+
+        response = await call_next(request)
+        if (
+            response.status_code != 200
+            or "set-cookie" in response.headers
+            or "content-encoding" in response.headers
+        ):
+            return response
+
+        chunks = []
+        size = 0
+        async for chunk in response.body_iterator:
+            if isinstance(chunk, str):
+                chunk = chunk.encode(response.charset)
+            chunks.append(chunk)
+            size += len(chunk)
+        body = b"".join(chunks)
+        ttl, tags = rule
+        entry = _Entry(
+            body=body,
+            gzipped=gzip.compress(body, 6) if len(body) >= _GZIP_MIN_BYTES else None,
+            headers=[(k, v) for k, v in response.headers.items() if k not in _DROP_HEADERS],
+            etag=make_etag(body),
+            last_modified=http_date(),
+            expires=time.monotonic() + ttl,
+            tags=tags,
+        )
+        if size <= _MAX_ENTRY_BYTES:
+            self.cache.put(key, entry)
+        return self._serve(request, entry, hit=False)
+
+    @staticmethod
+    def _serve(request: Request, entry: _Entry, hit: bool) -> Response:
+        headers = dict(entry.headers)
+        # Browsers revalidate every time; the ETag makes that a 304.
+        headers.update(validator_headers(entry.etag, entry.last_modified, max_age=0))
+        headers["Vary"] = "Accept-Encoding, Cookie"
+        headers["X-Cache"] = "HIT" if hit else "MISS"
+        if is_not_modified(request, entry.etag, entry.last_modified):
+            headers.pop("content-type", None)
+            return Response(status_code=304, headers=headers)
+        body = entry.body
+        if entry.gzipped is not None and "gzip" in request.headers.get("accept-encoding", ""):
+            body = entry.gzipped
+            headers["Content-Encoding"] = "gzip"
+        return Response(body, headers=headers)
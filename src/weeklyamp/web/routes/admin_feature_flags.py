@@ -18,6 +18,7 @@ from weeklyamp.core.feature_flags import (
     missing_dependencies,
 )
 from weeklyamp.web.deps import get_repo, render
+from weeklyamp.web.middleware import response_cache
 from weeklyamp.web.security import is_authenticated
 
 router = APIRouter()
@@ -102,6 +103,7 @@ async def feature_flags_toggle(
     repo = get_repo()
     repo.set_feature_flag(key, new_value, description=description, category=category)
     invalidate_cache(key)
+    response_cache.invalidate("site")
 
     # Re-resolve deps after the toggle so the row reflects the new state.
     unmet = missing_dependencies(key) if new_value else []
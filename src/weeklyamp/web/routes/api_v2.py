@@ -15,8 +15,10 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 
-from weeklyamp.web.deps import get_config, get_repo
+from weeklyamp.db.async_repository import run_db
+from weeklyamp.web.deps import get_async_repo, get_config, get_repo
 from weeklyamp.web.security import rate_limit
 
 router = APIRouter(
@@ -28,6 +30,25 @@ router = APIRouter(
 )
 
 
+def _fetch_all(sql: str, params=()) -> list[dict]:
+    """Run a read query on a fresh connection (call through ``run_db``)."""
+    conn = get_repo()._conn()
+    rows = conn.execute(sql, params).fetchall()
+    conn.close()
+    return [dict(r) for r in rows]
+
+
+def _touch_api_key(key_id: int) -> None:
+    """Update last_used (best-effort; don't fail auth on write errors)."""
+    try:
+        conn = get_repo()._conn()
+        conn.execute("UPDATE api_keys SET last_used_at = CURRENT_TIMESTAMP WHERE id = ?", (key_id,))
+        conn.commit()
+        conn.close()
+    except Exception:
+        pass
+
+
 # ---- API Key Authentication ----
 
 async def verify_api_key(request: Request) -> dict:
@@ -53,19 +74,16 @@ async def verify_api_key(request: Request) -> dict:
         raise HTTPException(status_code=401, detail="Unauthorized")
 
     key_hash = hashlib.sha256(key.encode()).hexdigest()
-    repo = get_repo()
-
-    conn = repo._conn()
-    row = conn.execute(
+    rows = await run_db(
+        _fetch_all,
         "SELECT * FROM api_keys WHERE key_hash = ? AND is_active = 1",
         (key_hash,),
-    ).fetchone()
-    conn.close()
+    )
 
-    if not row:
+    if not rows:
         raise HTTPException(status_code=401, detail="Unauthorized")
 
-    api_key = dict(row)
+    api_key = rows[0]
 
     # Defense in depth: explicitly compare the stored hash to the
     # computed one with a constant-time comparator.
@@ -73,14 +91,7 @@ async def verify_api_key(request: Request) -> dict:
     if not hmac.compare_digest(stored_hash, key_hash):
         raise HTTPException(status_code=401, detail="Unauthorized")
 
-    # Update last_used (best-effort; don't fail auth on write errors)
-    try:
-        conn = repo._conn()
-        conn.execute("UPDATE api_keys SET last_used_at = CURRENT_TIMESTAMP WHERE id = ?", (api_key["id"],))
-        conn.commit()
-        conn.close()
-    except Exception:
-        pass
+    await run_db(_touch_api_key, api_key["id"])
 
     return api_key
 
@@ -97,8 +108,6 @@ async def list_issues(
     offset: int = 0,
 ):
     """List newsletter issues."""
-    repo = get_repo()
-    conn = repo._conn()
     sql = "SELECT id, issue_number, title, edition_slug, status, published_at, created_at FROM issues WHERE status = ?"
     params: list = [status]
     if edition:
@@ -106,19 +115,18 @@ async def list_issues(
         params.append(edition)
     sql += " ORDER BY id DESC LIMIT ? OFFSET ?"
     params.extend([limit, offset])
-    rows = conn.execute(sql, params).fetchall()
-    conn.close()
-    return {"issues": [dict(r) for r in rows], "count": len(rows)}
+    rows = await run_db(_fetch_all, sql, params)
+    return {"issues": rows, "count": len(rows)}
 
 
 @router.get("/issues/{issue_id}")
 async def get_issue(issue_id: int, request: Request, api_key: dict = Depends(verify_api_key)):
     """Get a specific issue with assembled content."""
-    repo = get_repo()
-    issue = repo.get_issue(issue_id)
+    repo = get_async_repo()
+    issue = await repo.get_issue(issue_id)
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
-    drafts = repo.get_drafts_for_issue(issue_id)
+    drafts = await repo.get_drafts_for_issue(issue_id)
     return {
         "issue": dict(issue),
         "drafts": [{"section_slug": d["section_slug"], "content": d["content"], "status": d["status"]} for d in drafts],
@@ -140,10 +148,9 @@ async def list_subscribers(
     if "admin" not in perms and "subscribers" not in perms:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
-    repo = get_repo()
-    conn = repo._conn()
     if edition:
-        rows = conn.execute(
+        rows = await run_db(
+            _fetch_all,
             """SELECT s.id, s.email, s.first_name, s.last_name, s.status, s.created_at
                FROM subscribers s
                JOIN subscriber_editions se ON se.subscriber_id = s.id
@@ -151,14 +158,14 @@ async def list_subscribers(
                WHERE ne.slug = ? AND s.status = 'active'
                ORDER BY s.id DESC LIMIT ? OFFSET ?""",
             (edition, limit, offset),
-        ).fetchall()
+        )
     else:
-        rows = conn.execute(
+        rows = await run_db(
+            _fetch_all,
             "SELECT id, email, first_name, last_name, status, created_at FROM subscribers WHERE status = 'active' ORDER BY id DESC LIMIT ? OFFSET ?",
             (limit, offset),
-        ).fetchall()
-    conn.close()
-    return {"subscribers": [dict(r) for r in rows], "count": len(rows)}
+        )
+    return {"subscribers": rows, "count": len(rows)}
 
 
 @router.post("/subscribers")
@@ -173,12 +180,12 @@ async def create_subscriber(request: Request, api_key: dict = Depends(verify_api
     if not email:
         raise HTTPException(status_code=400, detail="Email required")
 
-    repo = get_repo()
-    existing = repo.get_subscriber_by_email(email)
+    repo = get_async_repo()
+    existing = await repo.get_subscriber_by_email(email)
     if existing:
         return {"subscriber_id": existing["id"], "status": "existing"}
 
-    sub_id = repo.create_subscriber(
+    sub_id = await repo.create_subscriber(
         email=email,
         first_name=body.get("first_name", ""),
         last_name=body.get("last_name", ""),
@@ -211,7 +218,8 @@ async def generate_content(request: Request, api_key: dict = Depends(verify_api_
     prompt = build_prompt(section_slug, topic=topic, notes=notes, newsletter_name=config.newsletter.name)
 
     from weeklyamp.content.generator import generate_draft
-    content, model = generate_draft(prompt, config)
+    # Not a DB call: the model request runs on Starlette's threadpool.
+    content, model = await run_in_threadpool(generate_draft, prompt, config)
 
     return {"content": content, "model": model, "section_slug": section_slug}
 
@@ -225,9 +233,9 @@ async def growth_analytics(
     days: int = 30,
 ):
     """Get subscriber growth metrics."""
-    repo = get_repo()
-    trend = repo.get_growth_trend(days=days)
-    subscriber_count = repo.get_subscriber_count()
+    repo = get_async_repo()
+    trend = await repo.get_growth_trend(days=days)
+    subscriber_count = await repo.get_subscriber_count()
     return {
         "current_subscribers": subscriber_count,
         "trend": [dict(r) for r in trend],
@@ -242,14 +250,12 @@ async def engagement_analytics(
     limit: int = 10,
 ):
     """Get engagement metrics for recent issues."""
-    repo = get_repo()
-    conn = repo._conn()
-    rows = conn.execute(
+    rows = await run_db(
+        _fetch_all,
         "SELECT * FROM engagement_metrics ORDER BY id DESC LIMIT ?",
         (limit,),
-    ).fetchall()
-    conn.close()
-    return {"metrics": [dict(r) for r in rows]}
+    )
+    return {"metrics": rows}
 
 
 @router.get("/analytics/revenue")
@@ -259,8 +265,7 @@ async def revenue_analytics(request: Request, api_key: dict = Depends(verify_api
     if "admin" not in perms and "revenue" not in perms:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
-    repo = get_repo()
-    summary = repo.get_revenue_summary()
+    summary = await get_async_repo().get_revenue_summary()
     return {"revenue": summary}
 
 
@@ -269,8 +274,7 @@ async def revenue_analytics(request: Request, api_key: dict = Depends(verify_api
 @router.get("/editions")
 async def list_editions(request: Request, api_key: dict = Depends(verify_api_key)):
     """List newsletter editions."""
-    repo = get_repo()
-    editions = repo.get_editions()
+    editions = await get_async_repo().get_editions()
     return {"editions": [dict(e) for e in editions]}
 
 
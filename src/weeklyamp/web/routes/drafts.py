@@ -7,6 +7,7 @@ from fastapi.responses import HTMLResponse
 
 from weeklyamp.content.generator import generate_draft
 from weeklyamp.content.prompts import build_prompt
+from weeklyamp.content.rendering import markdown_to_html_many
 from weeklyamp.content.sections import get_section_slugs
 from weeklyamp.core.models import WORD_COUNT_MAX_TOKENS
 from weeklyamp.web.deps import get_config, get_repo, render
@@ -121,6 +122,9 @@ async def view_draft(section_slug: str):
         return render("partials/alert.html", message="No current issue.", level="error")
     draft = repo.get_latest_draft(issue["id"], section_slug)
     section = repo.get_section(section_slug)
+    if draft:
+        # Persisted rendering, if any, for the template's markdown filter.
+        markdown_to_html_many([draft["content"] or ""], processes=1, repo=repo)
     return render("draft_detail.html", draft=draft, section=section, issue=issue)
 
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 from fastapi import APIRouter, Form, Request
 from fastapi.responses import HTMLResponse
 
+from weeklyamp.core.subscriber_counts import cached_subscriber_count
 from weeklyamp.web.deps import get_config, get_repo, render
 
 router = APIRouter()
@@ -13,7 +14,7 @@ router = APIRouter()
 async def artists_landing(request: Request):
     repo = get_repo()
     config = get_config()
-    subscriber_count = repo.get_subscriber_count()
+    subscriber_count = cached_subscriber_count(repo)
     return HTMLResponse(render("landing_artists.html", subscriber_count=subscriber_count, config=config))
 
 
@@ -21,7 +22,7 @@ async def artists_landing(request: Request):
 async def fans_landing(request: Request):
     repo = get_repo()
     config = get_config()
-    subscriber_count = repo.get_subscriber_count()
+    subscriber_count = cached_subscriber_count(repo)
     return HTMLResponse(render("landing_fans.html", subscriber_count=subscriber_count, config=config))
 
 
@@ -29,7 +30,7 @@ async def fans_landing(request: Request):
 async def industry_landing(request: Request):
     repo = get_repo()
     config = get_config()
-    subscriber_count = repo.get_subscriber_count()
+    subscriber_count = cached_subscriber_count(repo)
     return HTMLResponse(render("landing_industry.html", subscriber_count=subscriber_count, config=config))
 
 
@@ -37,7 +38,7 @@ async def industry_landing(request: Request):
 async def license_sales(request: Request):
     repo = get_repo()
     config = get_config()
-    subscriber_count = repo.get_subscriber_count()
+    subscriber_count = cached_subscriber_count(repo)
     markets = repo.get_edition_markets()
     # Count city markets
     city_slugs = {"nashville","los-angeles","new-york","atlanta","london","austin","miami","chicago","detroit","memphis","seattle","toronto","berlin","lagos","tokyo","seoul","paris","sao-paulo","mumbai","kingston"}
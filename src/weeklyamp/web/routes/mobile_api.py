@@ -9,7 +9,8 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, Header, Request
 from fastapi.responses import JSONResponse
 
-from weeklyamp.web.deps import get_config, get_repo
+from weeklyamp.db.async_repository import run_db
+from weeklyamp.web.deps import get_async_repo, get_config, get_repo
 from weeklyamp.web.security import rate_limit
 
 router = APIRouter(
@@ -28,11 +29,24 @@ def _get_subscriber(repo, token: str):
     return dict(row) if row else None
 
 
+async def _authenticate(authorization: str):
+    """Resolve the Bearer token to ``(repo, subscriber)``; subscriber may be None."""
+    repo = get_repo()
+    token = authorization.replace("Bearer ", "").strip()
+    return repo, await run_db(_get_subscriber, repo, token)
+
+
+def _fetch_all(repo, sql: str, params=()) -> list[dict]:
+    conn = repo._conn()
+    rows = conn.execute(sql, params).fetchall()
+    conn.close()
+    return [dict(r) for r in rows]
+
+
 @router.get("/editions")
 async def api_editions():
     """List available newsletter editions."""
-    repo = get_repo()
-    editions = repo.get_editions()
+    editions = await get_async_repo().get_editions()
     return JSONResponse([{
         "slug": e["slug"], "name": e["name"], "tagline": e.get("tagline", ""),
         "color": e.get("color", ""), "icon": e.get("icon", ""),
@@ -42,8 +56,7 @@ async def api_editions():
 @router.get("/issues")
 async def api_issues(edition: str = "", limit: int = 20):
     """List published issues, optionally filtered by edition."""
-    repo = get_repo()
-    issues = repo.get_published_issues(limit=limit)
+    issues = await get_async_repo().get_published_issues(limit=limit)
     if edition:
         issues = [i for i in issues if i.get("edition_slug") == edition]
     return JSONResponse([{
@@ -56,12 +69,12 @@ async def api_issues(edition: str = "", limit: int = 20):
 @router.get("/issues/{issue_id}")
 async def api_issue_detail(issue_id: int):
     """Get full issue content."""
-    repo = get_repo()
-    issue = repo.get_issue(issue_id)
+    repo = get_async_repo()
+    issue = await repo.get_issue(issue_id)
     if not issue:
         return JSONResponse({"error": "Issue not found"}, status_code=404)
-    assembled = repo.get_assembled(issue_id)
-    audio = repo.get_audio_issue(issue_id)
+    assembled = await repo.get_assembled(issue_id)
+    audio = await repo.get_audio_issue(issue_id)
     return JSONResponse({
         "id": issue["id"], "issue_number": issue["issue_number"],
         "edition_slug": issue.get("edition_slug", ""), "title": issue.get("title", ""),
@@ -74,22 +87,19 @@ async def api_issue_detail(issue_id: int):
 @router.get("/profile")
 async def api_profile(authorization: str = Header("")):
     """Get subscriber profile and preferences."""
-    repo = get_repo()
-    token = authorization.replace("Bearer ", "").strip()
-    subscriber = _get_subscriber(repo, token)
+    repo, subscriber = await _authenticate(authorization)
     if not subscriber:
         return JSONResponse({"error": "Unauthorized"}, status_code=401)
 
     # Get edition subscriptions
-    conn = repo._conn()
-    editions = conn.execute(
+    editions = await run_db(
+        _fetch_all, repo,
         """SELECT ne.slug, ne.name, se.send_days
            FROM subscriber_editions se
            JOIN newsletter_editions ne ON ne.id = se.edition_id
            WHERE se.subscriber_id = ?""",
         (subscriber["id"],),
-    ).fetchall()
-    conn.close()
+    )
 
     return JSONResponse({
         "id": subscriber["id"],
@@ -102,11 +112,11 @@ async def api_profile(authorization: str = Header("")):
 @router.get("/community")
 async def api_community():
     """List forum categories and recent threads."""
-    repo = get_repo()
-    categories = repo.get_forum_categories()
+    repo = get_async_repo()
+    categories = await repo.get_forum_categories()
     result = []
     for cat in categories:
-        threads = repo.get_forum_threads(cat["id"], limit=5)
+        threads = await repo.get_forum_threads(cat["id"], limit=5)
         result.append({
             "slug": cat["slug"], "name": cat["name"],
             "description": cat.get("description", ""), "edition_slug": cat.get("edition_slug", ""),
@@ -119,17 +129,17 @@ async def api_community():
 @router.get("/trivia")
 async def api_trivia():
     """List active trivia questions and polls."""
-    repo = get_repo()
-    conn = repo._conn()
-    rows = conn.execute("SELECT * FROM trivia_polls WHERE status = 'active' ORDER BY created_at DESC LIMIT 10").fetchall()
-    conn.close()
+    rows = await run_db(
+        _fetch_all, get_repo(),
+        "SELECT * FROM trivia_polls WHERE status = 'active' ORDER BY created_at DESC LIMIT 10",
+    )
     import json
     return JSONResponse([{
         "id": r["id"], "question_type": r["question_type"],
         "question_text": r["question_text"],
         "options": json.loads(r.get("options_json", "[]")),
         "edition_slug": r.get("edition_slug", ""),
-    } for r in [dict(row) for row in rows]])
+    } for r in rows])
 
 
 # ---- Write Endpoints (require auth) ----
@@ -137,44 +147,42 @@ async def api_trivia():
 @router.post("/profile/preferences")
 async def api_update_preferences(request: Request, authorization: str = Header("")):
     """Update subscriber preferences (frequency, timezone, interests)."""
-    repo = get_repo()
-    token = authorization.replace("Bearer ", "").strip()
-    subscriber = _get_subscriber(repo, token)
+    repo, subscriber = await _authenticate(authorization)
     if not subscriber:
         return JSONResponse({"error": "Unauthorized"}, status_code=401)
     body = await request.json()
     from weeklyamp.content.preferences import PreferenceManager
     config = get_config()
     mgr = PreferenceManager(repo, config)
-    mgr.update_preferences(subscriber["id"], body)
+    await run_db(mgr.update_preferences, subscriber["id"], body)
     return JSONResponse({"status": "updated"})
 
 
 @router.post("/profile/genres")
 async def api_update_genres(request: Request, authorization: str = Header("")):
     """Set subscriber genre preferences."""
-    repo = get_repo()
-    token = authorization.replace("Bearer ", "").strip()
-    subscriber = _get_subscriber(repo, token)
+    repo, subscriber = await _authenticate(authorization)
     if not subscriber:
         return JSONResponse({"error": "Unauthorized"}, status_code=401)
     body = await request.json()
     genres = body.get("genres", [])
-    conn = repo._conn()
-    conn.execute("DELETE FROM subscriber_genres WHERE subscriber_id = ?", (subscriber["id"],))
-    for genre in genres[:5]:  # max 5 genres
-        conn.execute("INSERT INTO subscriber_genres (subscriber_id, genre) VALUES (?, ?)", (subscriber["id"], genre))
-    conn.commit()
-    conn.close()
+
+    def _replace_genres() -> None:
+        conn = repo._conn()
+        conn.execute("DELETE FROM subscriber_genres WHERE subscriber_id = ?", (subscriber["id"],))
+        for genre in genres[:5]:  # max 5 genres
+            conn.execute("INSERT INTO subscriber_genres (subscriber_id, genre) VALUES (?, ?)", (subscriber["id"], genre))
+        conn.commit()
+        conn.close()
+
+    await run_db(_replace_genres)
     return JSONResponse({"status": "updated", "genres": genres[:5]})
 
 
 @router.post("/trivia/{trivia_id}/vote")
 async def api_trivia_vote(trivia_id: int, request: Request, authorization: str = Header("")):
     """Submit a trivia/poll vote."""
-    repo = get_repo()
-    token = authorization.replace("Bearer ", "").strip()
-    subscriber = _get_subscriber(repo, token)
+    repo, subscriber = await _authenticate(authorization)
     if not subscriber:
         return JSONResponse({"error": "Unauthorized"}, status_code=401)
     body = await request.json()
@@ -182,54 +190,54 @@ async def api_trivia_vote(trivia_id: int, request: Request, authorization: str =
     from weeklyamp.content.trivia_polls import TriviaManager
     config = get_config()
     mgr = TriviaManager(repo, config)
-    mgr.record_vote(trivia_id, subscriber["id"], option_index)
+    await run_db(mgr.record_vote, trivia_id, subscriber["id"], option_index)
     return JSONResponse({"status": "voted"})
 
 
 @router.get("/refer")
 async def api_referral_info(authorization: str = Header("")):
     """Get subscriber's referral code and stats."""
-    repo = get_repo()
-    token = authorization.replace("Bearer ", "").strip()
-    subscriber = _get_subscriber(repo, token)
+    repo, subscriber = await _authenticate(authorization)
     if not subscriber:
         return JSONResponse({"error": "Unauthorized"}, status_code=401)
     from weeklyamp.content.referrals import ReferralManager
     config = get_config()
     mgr = ReferralManager(repo, config)
-    code = mgr.get_or_create_code(subscriber["id"])
-    stats = mgr.get_referral_stats(subscriber["id"])
+    code = await run_db(mgr.get_or_create_code, subscriber["id"])
+    stats = await run_db(mgr.get_referral_stats, subscriber["id"])
     return JSONResponse({"code": code, "stats": stats})
 
 
 @router.post("/subscribe/{edition_slug}")
 async def api_subscribe_edition(edition_slug: str, request: Request, authorization: str = Header("")):
     """Subscribe to an additional edition."""
-    repo = get_repo()
-    token = authorization.replace("Bearer ", "").strip()
-    subscriber = _get_subscriber(repo, token)
+    repo, subscriber = await _authenticate(authorization)
     if not subscriber:
         return JSONResponse({"error": "Unauthorized"}, status_code=401)
-    conn = repo._conn()
-    edition = conn.execute("SELECT id FROM newsletter_editions WHERE slug = ?", (edition_slug,)).fetchone()
-    if not edition:
+
+    def _subscribe() -> bool:
+        conn = repo._conn()
+        edition = conn.execute("SELECT id FROM newsletter_editions WHERE slug = ?", (edition_slug,)).fetchone()
+        if not edition:
+            conn.close()
+            return False
+        conn.execute(
+            "INSERT OR IGNORE INTO subscriber_editions (subscriber_id, edition_id) VALUES (?, ?)",
+            (subscriber["id"], edition["id"]),
+        )
+        conn.commit()
         conn.close()
+        return True
+
+    if not await run_db(_subscribe):
         return JSONResponse({"error": "Edition not found"}, status_code=404)
-    conn.execute(
-        "INSERT OR IGNORE INTO subscriber_editions (subscriber_id, edition_id) VALUES (?, ?)",
-        (subscriber["id"], edition["id"]),
-    )
-    conn.commit()
-    conn.close()
     return JSONResponse({"status": "subscribed", "edition": edition_slug})
 
 
 @router.post("/push/register")
 async def api_register_push(request: Request, authorization: str = Header("")):
     """Register a push notification token."""
-    repo = get_repo()
-    token = authorization.replace("Bearer ", "").strip()
-    subscriber = _get_subscriber(repo, token)
+    repo, subscriber = await _authenticate(authorization)
     if not subscriber:
         return JSONResponse({"error": "Unauthorized"}, status_code=401)
     body = await request.json()
@@ -237,27 +245,29 @@ async def api_register_push(request: Request, authorization: str = Header("")):
     platform = body.get("platform", "ios")
     if not push_token:
         return JSONResponse({"error": "Token required"}, status_code=400)
-    conn = repo._conn()
-    conn.execute(
-        "INSERT OR IGNORE INTO push_tokens (subscriber_id, platform, token) VALUES (?, ?, ?)",
-        (subscriber["id"], platform, push_token),
-    )
-    conn.commit()
-    conn.close()
+
+    def _register() -> None:
+        conn = repo._conn()
+        conn.execute(
+            "INSERT OR IGNORE INTO push_tokens (subscriber_id, platform, token) VALUES (?, ?, ?)",
+            (subscriber["id"], platform, push_token),
+        )
+        conn.commit()
+        conn.close()
+
+    await run_db(_register)
     return JSONResponse({"status": "registered"})
 
 
 @router.get("/notifications")
 async def api_notifications(authorization: str = Header(""), limit: int = 20):
     """Get notification feed (public notifications)."""
-    repo = get_repo()
-    token = authorization.replace("Bearer ", "").strip()
-    subscriber = _get_subscriber(repo, token)
+    repo, subscriber = await _authenticate(authorization)
     if not subscriber:
         return JSONResponse({"error": "Unauthorized"}, status_code=401)
     from weeklyamp.notifications.manager import NotificationManager
     mgr = NotificationManager(repo)
-    notifications = mgr.get_recent(limit=limit, category="content")
+    notifications = await run_db(mgr.get_recent, limit=limit, category="content")
     return JSONResponse([{
         "title": n.get("title", ""),
         "message": n.get("message", ""),
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime
 from pathlib import Path
+from xml.sax.saxutils import escape as xml_escape
 
-from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import HTMLResponse, PlainTextResponse, Response
 
 from jinja2 import Environment, FileSystemLoader
+from markupsafe import Markup, escape
 
 from weeklyamp.core.config import load_config
+from weeklyamp.core.subscriber_counts import cached_subscriber_count
+from weeklyamp.db.async_repository import run_db
 from weeklyamp.db.repository import Repository
 from weeklyamp.web.deps import get_repo as _get_repo, get_config as _get_config
+from weeklyamp.web.materialized import config_tag, serve_file, serve_materialized
 
 _TEMPLATES_DIR = Path(__file__).parent.parent.parent.parent.parent / "templates" / "web"
 _env = Environment(loader=FileSystemLoader(str(_TEMPLATES_DIR)), autoescape=True)
@@ -29,101 +37,129 @@ async def newsletter_preview(issue_id: int, request: Request):
     assembled = repo.get_assembled(issue_id)
     if not assembled:
         return HTMLResponse("Issue not assembled yet", status_code=404)
-    subscriber_count = repo.get_subscriber_count()
+    subscriber_count = cached_subscriber_count(repo)
     tpl = _env.get_template("newsletter_preview.html")
     return HTMLResponse(tpl.render(
         issue=issue, html_content=assembled.get("html_content", ""),
         subscriber_count=subscriber_count, config=config))
 
 
+_ARCHIVE_PAGE_SIZE = 20
+
+
+def _highlight(snippet: str) -> Markup:
+    """Escape a search snippet, then turn the repository's match
+    delimiters into <mark> tags."""
+    escaped = str(escape(snippet or ""))
+    return Markup(
+        escaped.replace(Repository.SEARCH_MARK_START, "<mark>")
+        .replace(Repository.SEARCH_MARK_END, "</mark>")
+    )
+
+
+def _render_archive(results: list[dict], q: str, edition: str, *,
+                    total: int | None = None, page: int = 1, pages: int = 1) -> str:
+    tpl = _env.get_template("archive.html")
+    return tpl.render(
+        issues=results, query=q, edition=edition,
+        total=len(results) if total is None else total,
+        page=page, pages=pages,
+    )
+
+
 @router.get("/newsletters/archive", response_class=HTMLResponse)
-async def newsletters_archive(q: str = "", edition: str = ""):
+async def newsletters_archive(request: Request, q: str = "", edition: str = "", page: int = 1):
     """Browse and search the newsletter archive.
 
     Query parameters:
-        q       — full-text search across title and assembled plain content
+        q       — full-text search across title, edition and assembled
+                  plain text (FTS5 on SQLite, tsvector on Postgres)
         edition — filter by edition slug
+        page    — results page for searches
 
-    Search uses a simple LIKE %term% on assembled_issues.plain_content.
-    For larger archives this can be upgraded to Postgres FTS via a
-    tsvector column + GIN index, but that's premature for the current
-    issue count.
+    The unfiltered listing (optionally per edition) is served from
+    ``rendered_pages``; searches are ranked and paginated per request.
     """
     repo = _get_repo()
-    issues = repo.get_published_issues(limit=200)
-
-    if edition:
-        issues = [i for i in issues if i.get("edition_slug") == edition]
-
-    matches: list[dict] = []
-    if q:
-        needle = q.strip().lower()
-        for issue in issues:
-            haystack_parts = [
-                (issue.get("title") or "").lower(),
-                (issue.get("edition_slug") or "").lower(),
-                str(issue.get("issue_number") or ""),
-            ]
-            assembled = repo.get_assembled(issue["id"])
-            if assembled and assembled.get("plain_content"):
-                haystack_parts.append(assembled["plain_content"][:5000].lower())
-            if needle in " ".join(haystack_parts):
-                matches.append(issue)
-        results = matches
-    else:
-        results = issues[:50]
-
-    tpl = _env.get_template("archive.html")
-    try:
-        return tpl.render(issues=results, query=q, edition=edition, total=len(results))
-    except Exception:
-        # Fall back to old signature if the template doesn't accept new args
-        return tpl.render(issues=results)
+    if q.strip():
+        page = max(page, 1)
+        rows, total = await run_db(
+            repo.search_archive, q, edition_slug=edition,
+            limit=_ARCHIVE_PAGE_SIZE, offset=(page - 1) * _ARCHIVE_PAGE_SIZE,
+        )
+        for row in rows:
+            row["snippet_html"] = _highlight(row.get("snippet", ""))
+        pages = max(1, -(-total // _ARCHIVE_PAGE_SIZE))
+        return HTMLResponse(_render_archive(rows, q, edition, total=total, page=page, pages=pages))
+
+    if edition and not await run_db(repo.get_edition_by_slug, edition):
+        # Unknown slugs render the empty listing uncached, so arbitrary
+        # query strings can't grow rendered_pages.
+        return HTMLResponse(_render_archive([], "", edition))
+
+    cfg = _get_config()
+    return await run_db(
+        serve_materialized, request, repo,
+        f"archive:{config_tag(cfg)}:{edition}",
+        "text/html; charset=utf-8",
+        lambda: _render_archive(
+            repo.get_published_issues(limit=50, edition_slug=edition), "", edition,
+        ),
+    )
 
 
 @router.get("/newsletters/archive/{issue_number}", response_class=HTMLResponse)
-async def newsletter_issue(issue_number: int):
+async def newsletter_issue(issue_number: int, request: Request):
     repo = _get_repo()
-    cfg = load_config()
-    # Find the issue by number
-    issues = repo.get_published_issues(limit=100)
-    issue = next((i for i in issues if i["issue_number"] == issue_number), None)
-    if not issue:
-        from fastapi import HTTPException
-        raise HTTPException(status_code=404)
-    assembled = repo.get_assembled(issue["id"])
-    if not assembled:
-        from fastapi import HTTPException
-        raise HTTPException(status_code=404)
-    # Audio player
-    audio = repo.get_audio_issue(issue["id"])
-    audio_url = audio.get("audio_url", "") if audio and audio.get("status") == "complete" else ""
-    # SEO description from plain text
-    plain = assembled.get("plain_content") or ""
-    description = " ".join(plain.split())[:200].rsplit(" ", 1)[0] if plain.strip() else ""
-    # Related issues
-    related = repo.get_related_issues(issue.get("edition_slug", ""), issue["id"], limit=3)
-    tpl = _env.get_template("archive_issue.html")
-    return tpl.render(issue=issue, content=assembled["html_content"],
-        description=description, site_domain=cfg.site_domain, related_issues=related,
-        audio_url=audio_url)
+    cfg = _get_config()
+
+    def build() -> str:
+        issue = repo.get_issue_by_number(issue_number, published_only=True)
+        if not issue:
+            raise HTTPException(status_code=404)
+        assembled = repo.get_assembled(issue["id"])
+        if not assembled:
+            raise HTTPException(status_code=404)
+        # Audio player
+        audio = repo.get_audio_issue(issue["id"])
+        audio_url = audio.get("audio_url", "") if audio and audio.get("status") == "complete" else ""
+        # SEO description from plain text
+        plain = assembled.get("plain_text") or ""
+        description = " ".join(plain.split())[:200].rsplit(" ", 1)[0] if plain.strip() else ""
+        # Related issues
+        related = repo.get_related_issues(issue.get("edition_slug", ""), issue["id"], limit=3)
+        tpl = _env.get_template("archive_issue.html")
+        return tpl.render(issue=issue, content=assembled["html_content"],
+            description=description, site_domain=cfg.site_domain, related_issues=related,
+            audio_url=audio_url)
+
+    # A 404 raised from build() propagates before anything is stored.
+    return await run_db(
+        serve_materialized, request, repo,
+        f"archive_issue:{config_tag(cfg)}:{issue_number}",
+        "text/html; charset=utf-8",
+        build,
+    )
 
 
 def _build_rss(
     issues: list[dict],
-    repo,
+    assembled_map: dict[int, dict],
     *,
     title: str,
     description: str,
     site_domain: str,
     self_url: str,
 ) -> str:
-    """Render an RSS 2.0 feed from a list of issue dicts."""
+    """Render an RSS 2.0 feed from a list of issue dicts.
+
+    ``assembled_map`` is ``Repository.get_assembled_for_issues`` output.
+    """
     items = []
     for issue in issues:
-        assembled = repo.get_assembled(issue["id"])
+        assembled = assembled_map.get(issue["id"])
         pub_date = issue.get("publish_date", issue.get("created_at", ""))
-        plain = (assembled or {}).get("plain_content") or ""
+        plain = (assembled or {}).get("plain_text") or ""
         desc = plain[:500] + "..." if plain else f"Issue #{issue['issue_number']}"
         item_title = f"{title} #{issue['issue_number']}"
         if issue.get("title"):
@@ -153,7 +189,7 @@ def _build_rss(
 
 def _build_json_feed(
     issues: list[dict],
-    repo,
+    assembled_map: dict[int, dict],
     *,
     title: str,
     description: str,
@@ -163,8 +199,8 @@ def _build_json_feed(
     """Render a JSON Feed 1.1 (https://jsonfeed.org/version/1.1) document."""
     items = []
     for issue in issues:
-        assembled = repo.get_assembled(issue["id"])
-        plain = (assembled or {}).get("plain_content") or ""
+        assembled = assembled_map.get(issue["id"])
+        plain = (assembled or {}).get("plain_text") or ""
         permalink = f"{site_domain}/newsletters/archive/{issue['issue_number']}"
         items.append({
             "id": permalink,
@@ -186,86 +222,136 @@ def _build_json_feed(
     }
 
 
-@router.get("/feed.xml")
-async def rss_feed():
-    from fastapi.responses import Response
-    cfg = load_config()
+def _serve_feed(request: Request, fmt: str, edition_slug: str = "") -> Response:
+    """Serve the site-wide or per-edition feed in ``fmt`` ("xml" or "json")."""
+    cfg = _get_config()
     site_domain = cfg.site_domain.rstrip("/")
     repo = _get_repo()
-    issues = repo.get_published_issues(limit=20)
-    xml = _build_rss(
-        issues, repo,
-        title=cfg.newsletter.name,
-        description=cfg.newsletter.tagline,
-        site_domain=site_domain,
-        self_url=f"{site_domain}/feed.xml",
+
+    title = cfg.newsletter.name
+    description = cfg.newsletter.tagline
+    if edition_slug:
+        edition = repo.get_edition_by_slug(edition_slug)
+        if not edition:
+            return Response(content="Not found", status_code=404)
+        title = f"{cfg.newsletter.name} — {edition.get('name', edition_slug)}"
+        description = edition.get("tagline", "") or cfg.newsletter.tagline
+        self_url = f"{site_domain}/feed/{edition_slug}.{fmt}"
+    else:
+        self_url = f"{site_domain}/feed.{fmt}"
+
+    def build() -> str:
+        issues = repo.get_published_issues(limit=20, edition_slug=edition_slug)
+        assembled_map = repo.get_assembled_for_issues([i["id"] for i in issues])
+        kwargs = dict(title=title, description=description,
+                      site_domain=site_domain, self_url=self_url)
+        if fmt == "json":
+            return json.dumps(_build_json_feed(issues, assembled_map, **kwargs), ensure_ascii=False)
+        return _build_rss(issues, assembled_map, **kwargs)
+
+    return serve_materialized(
+        request, repo,
+        f"feed:{config_tag(cfg)}:{edition_slug}.{fmt}",
+        "application/feed+json" if fmt == "json" else "application/rss+xml",
+        build,
     )
-    return Response(content=xml, media_type="application/rss+xml")
 
 
-@router.get("/feed.json")
-async def json_feed_global():
-    from fastapi.responses import JSONResponse
-    cfg = load_config()
-    site_domain = cfg.site_domain.rstrip("/")
+def _rfc822(timestamp: str) -> str:
+    """RSS date for a stored ``YYYY-MM-DD HH:MM:SS`` (UTC) timestamp."""
+    try:
+        dt = datetime.fromisoformat(str(timestamp)).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return ""
+    return format_datetime(dt, usegmt=True)
+
+
+def _build_podcast_feed(audio_issues: list[dict], site_domain: str) -> str:
+    from weeklyamp.content.audio import get_chapters_path
+
+    items = []
+    for ai in audio_issues:
+        if ai.get("status") != "complete" or not ai.get("audio_url"):
+            continue
+        issue_num = ai.get("issue_number", "")
+        url = xml_escape(f"{site_domain}{ai['audio_url']}")
+        duration = int(ai.get("duration_seconds") or 0)
+        chapters = ""
+        if get_chapters_path(ai["issue_id"]):
+            chapters_url = xml_escape(f"{site_domain}/audio/{ai['issue_id']}/chapters.json")
+            chapters = f'\n  <podcast:chapters url="{chapters_url}" type="application/json+chapters"/>'
+        items.append(f"""<item>
+  <title>TrueFans DISPATCH — Issue #{xml_escape(str(issue_num))}</title>
+  <guid isPermaLink="false">{url}#{ai['id']}</guid>
+  <enclosure url="{url}" type="audio/mpeg" length="{ai.get('file_size_bytes', 0)}"/>
+  <pubDate>{_rfc822(ai.get('created_at', ''))}</pubDate>
+  <itunes:duration>{duration}</itunes:duration>{chapters}
+</item>""")
+
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd" xmlns:podcast="https://podcastindex.org/namespace/1.0">
+<channel>
+  <title>TrueFans DISPATCH Audio</title>
+  <description>Audio versions of TrueFans DISPATCH</description>
+  <link>{xml_escape(site_domain)}</link>
+  <language>en-us</language>
+{chr(10).join(items)}
+</channel>
+</rss>"""
+
+
+# Declared before /feed/{edition_slug}.xml, which would otherwise claim
+# "podcast" as an edition slug.
+@router.get("/feed/podcast.xml")
+async def podcast_feed(request: Request):
+    """Podcast RSS, materialized until an audio_issues row changes."""
     repo = _get_repo()
-    issues = repo.get_published_issues(limit=20)
-    feed = _build_json_feed(
-        issues, repo,
-        title=cfg.newsletter.name,
-        description=cfg.newsletter.tagline,
-        site_domain=site_domain,
-        self_url=f"{site_domain}/feed.json",
+    cfg = _get_config()
+    return await run_db(
+        serve_materialized, request, repo,
+        f"podcast:{config_tag(cfg)}",
+        "application/rss+xml",
+        lambda: _build_podcast_feed(repo.get_audio_issues(limit=50), cfg.site_domain.rstrip("/")),
     )
-    return JSONResponse(feed, media_type="application/feed+json")
+
+
+@router.get("/audio/{issue_id}")
+async def serve_audio(issue_id: int, request: Request):
+    """Episode audio with byte ranges (206) and ETag / 304 for players."""
+    from weeklyamp.content.audio import get_audio_file_path
+    path = get_audio_file_path(issue_id)
+    if not path:
+        return PlainTextResponse("Audio not available", status_code=404)
+    return serve_file(request, path, "audio/mpeg", filename=f"truefans_issue_{issue_id}.mp3")
+
+
+@router.get("/audio/{issue_id}/chapters.json")
+async def serve_audio_chapters(issue_id: int, request: Request):
+    from weeklyamp.content.audio import get_chapters_path
+    path = get_chapters_path(issue_id)
+    if not path:
+        return PlainTextResponse("Chapters not available", status_code=404)
+    return serve_file(request, path, "application/json+chapters")
+
+
+@router.get("/feed.xml")
+async def rss_feed(request: Request):
+    return await run_db(_serve_feed, request, "xml")
+
+
+@router.get("/feed.json")
+async def json_feed_global(request: Request):
+    return await run_db(_serve_feed, request, "json")
 
 
 @router.get("/feed/{edition_slug}.xml")
-async def rss_feed_per_edition(edition_slug: str):
-    from fastapi.responses import Response
-    cfg = load_config()
-    site_domain = cfg.site_domain.rstrip("/")
-    repo = _get_repo()
-    edition = next(
-        (e for e in repo.get_editions() if e.get("slug") == edition_slug),
-        None,
-    )
-    if not edition:
-        return Response(content="Not found", status_code=404)
-    all_issues = repo.get_published_issues(limit=100)
-    issues = [i for i in all_issues if i.get("edition_slug") == edition_slug][:20]
-    xml = _build_rss(
-        issues, repo,
-        title=f"{cfg.newsletter.name} — {edition.get('name', edition_slug)}",
-        description=edition.get("tagline", "") or cfg.newsletter.tagline,
-        site_domain=site_domain,
-        self_url=f"{site_domain}/feed/{edition_slug}.xml",
-    )
-    return Response(content=xml, media_type="application/rss+xml")
+async def rss_feed_per_edition(edition_slug: str, request: Request):
+    return await run_db(_serve_feed, request, "xml", edition_slug)
 
 
 @router.get("/feed/{edition_slug}.json")
-async def json_feed_per_edition(edition_slug: str):
-    from fastapi.responses import JSONResponse, Response
-    cfg = load_config()
-    site_domain = cfg.site_domain.rstrip("/")
-    repo = _get_repo()
-    edition = next(
-        (e for e in repo.get_editions() if e.get("slug") == edition_slug),
-        None,
-    )
-    if not edition:
-        return Response(content="Not found", status_code=404)
-    all_issues = repo.get_published_issues(limit=100)
-    issues = [i for i in all_issues if i.get("edition_slug") == edition_slug][:20]
-    feed = _build_json_feed(
-        issues, repo,
-        title=f"{cfg.newsletter.name} — {edition.get('name', edition_slug)}",
-        description=edition.get("tagline", "") or cfg.newsletter.tagline,
-        site_domain=site_domain,
-        self_url=f"{site_domain}/feed/{edition_slug}.json",
-    )
-    return JSONResponse(feed, media_type="application/feed+json")
+async def json_feed_per_edition(edition_slug: str, request: Request):
+    return await run_db(_serve_feed, request, "json", edition_slug)
 
 
 @router.get("/newsletters", response_class=HTMLResponse)
@@ -287,47 +373,6 @@ async def newsletters_page():
     return tpl.render(editions=editions_with_sections)
 
 
-@router.get("/audio/{issue_id}")
-async def serve_audio(issue_id: int):
-    from weeklyamp.content.audio import get_audio_file_path
-    from fastapi.responses import FileResponse
-    path = get_audio_file_path(issue_id)
-    if not path:
-        from fastapi.responses import PlainTextResponse
-        return PlainTextResponse("Audio not available", status_code=404)
-    return FileResponse(str(path), media_type="audio/mpeg", filename=f"truefans_issue_{issue_id}.mp3")
-
-
-@router.get("/feed/podcast.xml", response_class=HTMLResponse)
-async def podcast_feed(request: Request):
-    repo = _get_repo()
-    cfg = load_config()
-    audio_issues = repo.get_audio_issues(limit=50)
-    # Build simple RSS podcast feed
-    items = ""
-    for ai in audio_issues:
-        if ai.get("status") == "complete" and ai.get("audio_url"):
-            issue_num = ai.get("issue_number", "")
-            items += f"""<item>
-  <title>TrueFans DISPATCH — Issue #{issue_num}</title>
-  <enclosure url="{cfg.site_domain}{ai['audio_url']}" type="audio/mpeg" length="{ai.get('file_size_bytes', 0)}"/>
-  <pubDate>{ai.get('created_at', '')}</pubDate>
-</item>\n"""
-
-    feed = f"""<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0" xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd">
-<channel>
-  <title>TrueFans DISPATCH Audio</title>
-  <description>Audio versions of TrueFans DISPATCH</description>
-  <link>{cfg.site_domain}</link>
-  <language>en-us</language>
-  {items}
-</channel>
-</rss>"""
-    from fastapi.responses import Response
-    return Response(content=feed, media_type="application/rss+xml")
-
-
 @router.get("/articles/{edition_slug}/{section_slug}/{issue_number}", response_class=HTMLResponse)
 async def standalone_article(edition_slug: str, section_slug: str, issue_number: int, request: Request):
     repo = _get_repo()
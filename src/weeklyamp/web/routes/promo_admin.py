@@ -17,6 +17,7 @@ from fastapi.responses import HTMLResponse, RedirectResponse, Response
 
 from weeklyamp.content.promo import PROMO_SETTINGS_KEY, effective_promo_config
 from weeklyamp.web.deps import get_config, get_repo, render
+from weeklyamp.web.middleware import response_cache
 from weeklyamp.web.routes.admin_account import _ensure_csrf, _require_admin
 
 router = APIRouter()
@@ -95,4 +96,5 @@ async def promo_admin_save(request: Request) -> Response:
                     "utm_medium", "routing", "default_target", "targets")
     }
     repo.set_admin_setting(PROMO_SETTINGS_KEY, json.dumps(override))
+    response_cache.invalidate("site")
     return RedirectResponse("/admin/promo/?saved=1", status_code=303)
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Form, Request
+from fastapi import APIRouter, BackgroundTasks, Form, Request
 from fastapi.responses import HTMLResponse
 
 from weeklyamp.content.assembly import assemble_newsletter
 from weeklyamp.delivery.ghl import GHLClient
+from weeklyamp.delivery.send_jobs import enqueue_send_job, job_stats, run_send_job
 from weeklyamp.delivery.smtp_sender import SMTPSender
 from weeklyamp.web.deps import get_config, get_repo, render
 
@@ -44,6 +45,8 @@ async def publish_page():
         total=total,
         config=cfg,
         edition=edition,
+        send_job=repo.get_active_send_job(issue["id"]) if issue else None,
+        job_stats=job_stats,
     )
 
 
@@ -78,8 +81,8 @@ async def preview():
 
 
 @router.post("/push", response_class=HTMLResponse)
-async def push():
-    """Send assembled newsletter via SMTP to edition subscribers."""
+async def push(background_tasks: BackgroundTasks):
+    """Queue a background job that sends the assembled newsletter via SMTP."""
     cfg = get_config()
     repo = get_repo()
     issue = repo.get_current_issue()
@@ -102,68 +105,26 @@ async def push():
     else:
         subject = f"{cfg.newsletter.name} #{issue['issue_number']}"
 
-    # Get recipients: all active subscribers (or filtered by edition tag via GHL)
-    recipients = repo.get_subscribers("active")
+    job_id, created = enqueue_send_job(repo, issue, assembled, subject)
+    if created:
+        background_tasks.add_task(run_send_job, repo, cfg, job_id)
+    job = repo.get_send_job(job_id)
+    return render("partials/send_job_status.html", job=job, stats=job_stats(job))
 
-    # Pre-send checklist — block on hard violations, surface warnings.
-    from weeklyamp.delivery.preflight import run_preflight
-    preflight = run_preflight(
-        subject=subject,
-        html_body=assembled["html_content"],
-        plain_text=assembled.get("plain_text", "") or "",
-        recipients=recipients,
-    )
-    if preflight["blockers"]:
-        msg = "Preflight check failed: " + "; ".join(preflight["blockers"])
-        return render("partials/alert.html", message=msg, level="error")
-    if preflight["warnings"]:
-        # Log warnings but don't block — send proceeds.
-        import logging as _log
-        _log.getLogger(__name__).info(
-            "preflight warnings on issue %s: %s",
-            issue.get("id"),
-            "; ".join(preflight["warnings"]),
-        )
-
-    # Per-subscriber section ranking is opt-in via the genre engine
-    # config flag. When on, build a personalizer that re-assembles each
-    # recipient's HTML with their preferred section order. When off,
-    # send_bulk uses the static assembled HTML and skips the per-call
-    # work entirely.
-    personalizer = None
-    preheader = assembled.get("preheader_text", "") or ""
-    if getattr(cfg, "genre_preferences", None) and cfg.genre_preferences.weight_sections_by_genre:
-        def _personalize(recipient: dict) -> tuple[str, str]:
-            sub_id = recipient.get("id")
-            if not sub_id:
-                return "", ""
-            try:
-                return assemble_newsletter(repo, issue["id"], cfg, subscriber_id=sub_id, preheader_text=preheader)
-            except Exception:
-                # Personalizer never raises out of send_bulk — return
-                # empty so the bulk fallback HTML is used.
-                return "", ""
-        personalizer = _personalize
 
-    sender = SMTPSender(cfg.email)
-    try:
-        result = sender.send_bulk(
-            recipients=recipients,
-            subject=subject,
-            html_body=assembled["html_content"],
-            plain_text=assembled.get("plain_text", ""),
-            site_domain=cfg.site_domain,
-            personalize=personalizer,
-        )
-        repo.update_assembled_ghl(assembled["id"], f"smtp-{issue['id']}")
-        if result["sent"] > 0:
-            repo.update_issue_status(issue["id"], "published")
-        msg = f"Sent to {result['sent']} subscribers"
-        if result["failed"]:
-            msg += f" ({result['failed']} failed)"
-        return render("partials/alert.html", message=msg, level="success")
-    except Exception as exc:
-        return render("partials/alert.html", message=f"Send failed: {exc}", level="error")
+@router.get("/jobs/{job_id}", response_class=HTMLResponse)
+async def send_job_status(job_id: int):
+    job = get_repo().get_send_job(job_id)
+    return render("partials/send_job_status.html", job=job, stats=job_stats(job) if job else {})
+
+
+@router.post("/jobs/{job_id}/cancel", response_class=HTMLResponse)
+async def cancel_send_job(job_id: int):
+    """Ask a send job to stop; the sender checks between batches."""
+    repo = get_repo()
+    repo.request_send_job_cancel(job_id)
+    job = repo.get_send_job(job_id)
+    return render("partials/send_job_status.html", job=job, stats=job_stats(job) if job else {})
 
 
 @router.post("/test-send", response_class=HTMLResponse)
@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
 
 from weeklyamp.core.models import ReferralConfig
+from weeklyamp.core.subscriber_counts import cached_subscriber_count
 from weeklyamp.content.referrals import ReferralManager
 from weeklyamp.web.deps import get_config, get_repo, render
 from weeklyamp.web.security import rate_limit
@@ -50,17 +51,7 @@ def _get_reward_tiers(config: ReferralConfig) -> list[dict]:
 
 def _get_subscriber_count() -> int:
     """Get total active subscriber count for social proof."""
-    repo = get_repo()
-    conn = repo._conn()
-    try:
-        row = conn.execute(
-            "SELECT COUNT(*) as cnt FROM subscribers WHERE status = 'active'"
-        ).fetchone()
-        conn.close()
-        return row["cnt"] if row else 0
-    except Exception:
-        conn.close()
-        return 0
+    return cached_subscriber_count(get_repo())
 
 
 def _get_referrer_info(code: str) -> dict | None:
@@ -5,6 +5,7 @@ from __future__ import annotations
 from fastapi import APIRouter, Form
 from fastapi.responses import HTMLResponse
 
+from weeklyamp.content.rendering import markdown_to_html_many
 from weeklyamp.web.deps import get_config, get_repo, render
 
 router = APIRouter()
@@ -17,6 +18,8 @@ async def review_page():
     sections = repo.get_active_sections()
     drafts = repo.get_drafts_for_issue(issue["id"]) if issue else []
     draft_map = {d["section_slug"]: d for d in drafts}
+    # Load persisted renderings in one query so the cards' markdown filter hits the cache.
+    markdown_to_html_many([d["content"] or "" for d in drafts], processes=1, repo=repo)
 
     return render("review.html",
         issue=issue,
@@ -8,8 +8,9 @@ from pathlib import Path
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 from jinja2 import Environment, FileSystemLoader
+from starlette.concurrency import run_in_threadpool
 
-from weeklyamp.analytics.scene_graph import index_issue
+from weeklyamp.analytics.scene_graph import index_issue, index_issues
 from weeklyamp.web.deps import get_repo, render
 
 logger = logging.getLogger(__name__)
@@ -164,7 +165,7 @@ async def scene_admin(request: Request):
 async def scene_index_issue(issue_id: int, request: Request):
     """Trigger indexing of a specific published issue."""
     repo = get_repo()
-    result = index_issue(repo, issue_id)
+    result = await run_in_threadpool(index_issue, repo, issue_id)
     msg = f"Indexed issue #{issue_id}: {result.get('entities_found', 0)} entities, {result.get('connections_found', 0)} connections"
     # Check if HTMX request
     if request.headers.get("HX-Request"):
@@ -175,15 +176,12 @@ async def scene_index_issue(issue_id: int, request: Request):
 
 @router.post("/admin/scene/reindex-all")
 async def scene_reindex_all(request: Request):
-    """Reindex all published issues."""
+    """Reindex all published issues (off the event loop)."""
     repo = get_repo()
     issues = repo.get_published_issues(limit=500)
-    total_entities = 0
-    total_connections = 0
-    for issue in issues:
-        result = index_issue(repo, issue["id"])
-        total_entities += result.get("entities_found", 0)
-        total_connections += result.get("connections_found", 0)
+    results = await run_in_threadpool(index_issues, repo, [i["id"] for i in issues])
+    total_entities = sum(r.get("entities_found", 0) for r in results.values())
+    total_connections = sum(r.get("connections_found", 0) for r in results.values())
 
     msg = f"Reindexed {len(issues)} issues: {total_entities} entities, {total_connections} connections"
     if request.headers.get("HX-Request"):
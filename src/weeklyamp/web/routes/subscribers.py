@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse
+import io
+import logging
+import os
+import shutil
+import tempfile
+
+from fastapi import APIRouter, BackgroundTasks, Request
+from fastapi.responses import HTMLResponse, StreamingResponse
+from markupsafe import escape
+from starlette.concurrency import run_in_threadpool
 
 from weeklyamp.delivery.subscribers import sync_subscribers
+from weeklyamp.export.subscriber_csv import import_subscribers_csv, iter_subscribers_csv
 from weeklyamp.web.deps import get_config, get_repo, render
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+_EXPORT_COLUMNS = ["email", "status", "source_channel", "subscribed_at"]
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -31,17 +43,24 @@ async def subscribers_page():
 
 
 @router.post("/sync", response_class=HTMLResponse)
-async def sync():
+async def sync(request: Request):
     cfg = get_config()
     repo = get_repo()
 
     if not cfg.ghl.api_key:
         return render("partials/alert.html", message="GoHighLevel not configured.", level="error")
 
+    form = await request.form()
+    # A full pass re-reads every contact, picking up edits the
+    # incremental cursor has already moved past.
+    full = bool(form.get("full"))
     try:
-        result = sync_subscribers(repo, cfg.ghl)
+        result = await run_in_threadpool(sync_subscribers, repo, cfg.ghl, full=full)
         return render("partials/alert.html",
-            message=f"Synced {result['synced']} subscribers ({result['new']} new, {result['total']} total).",
+            message=(
+                f"Synced {result['synced']} subscribers ({result['new']} new, "
+                f"{result['unsubscribed']} unsubscribed, {result['total']} total)."
+            ),
             level="success")
     except Exception as exc:
         return render("partials/alert.html", message=f"Sync failed: {exc}", level="error")
@@ -49,22 +68,9 @@ async def sync():
 
 @router.get("/export", response_class=HTMLResponse)
 async def export_subscribers(request: Request):
-    import csv
-    import io
-    from fastapi.responses import StreamingResponse
-
     repo = get_repo()
-    subscribers = repo.get_subscribers("active")
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["email", "status", "source_channel", "subscribed_at"])
-    for sub in subscribers:
-        writer.writerow([sub.get("email", ""), sub.get("status", ""), sub.get("source_channel", ""), sub.get("subscribed_at", "")])
-
-    output.seek(0)
     return StreamingResponse(
-        iter([output.getvalue()]),
+        iter_subscribers_csv(repo, columns=_EXPORT_COLUMNS),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=subscribers_export.csv"},
     )
@@ -78,10 +84,7 @@ async def import_page(request: Request):
 
 
 @router.post("/import", response_class=HTMLResponse)
-async def import_csv(request: Request):
-    import csv
-    import io
-    repo = get_repo()
+async def import_csv(request: Request, background_tasks: BackgroundTasks):
     form = await request.form()
     file = form.get("csv_file")
     default_edition = form.get("edition_slug", "fan")
@@ -89,37 +92,62 @@ async def import_csv(request: Request):
     if not file:
         return HTMLResponse('<div class="alert alert-danger">No file uploaded.</div>')
 
-    content = await file.read()
-    text = content.decode("utf-8-sig")
-    reader = csv.DictReader(io.StringIO(text))
-
-    imported = 0
-    skipped = 0
-    errors = []
-
-    for row in reader:
-        email = (row.get("email") or row.get("Email") or row.get("EMAIL") or "").strip().lower()
-        if not email or "@" not in email:
-            skipped += 1
-            continue
-
-        first_name = row.get("first_name") or row.get("First Name") or row.get("name") or row.get("Name") or ""
-        edition = row.get("edition") or row.get("Edition") or default_edition
-
-        try:
-            repo.subscribe_to_editions(
-                email=email,
-                edition_slugs=[edition],
-                first_name=first_name.strip(),
-                source_channel="csv_import",
-            )
-            imported += 1
-        except Exception as e:
-            errors.append(f"{email}: {e}")
-            skipped += 1
-
-    result = f'<div class="alert alert-success">Imported {imported} subscribers. Skipped {skipped}.'
-    if errors:
-        result += f' Errors: {len(errors)}'
+    # Spool the upload to disk so the import can outlive the request;
+    # the copy is blocking file I/O, so keep it off the event loop.
+    with tempfile.NamedTemporaryFile("wb", suffix=".csv", delete=False) as tmp:
+        await run_in_threadpool(shutil.copyfileobj, file.file, tmp, 1024 * 1024)
+    # Progress lives in subscriber_import_jobs so the status poll works
+    # whichever worker serves it.
+    repo = get_repo()
+    job_id = repo.create_import_job()
+    background_tasks.add_task(_run_import, repo, tmp.name, default_edition, job_id)
+    return HTMLResponse(_import_status_html(job_id, repo.get_import_job(job_id)))
+
+
+@router.get("/import/status/{job_id}", response_class=HTMLResponse)
+async def import_status(job_id: int):
+    repo = get_repo()
+    job = repo.get_import_job(job_id)
+    if job and job["state"] != "running":
+        # The result has been shown; nothing polls a finished import again.
+        repo.delete_import_job(job_id)
+    return HTMLResponse(_import_status_html(job_id, job))
+
+
+def _run_import(repo, path: str, default_edition: str, job_id: int) -> None:
+    """Background task: import the spooled CSV, recording progress as it goes."""
+    total = os.path.getsize(path) or 1
+    try:
+        with io.TextIOWrapper(open(path, "rb"), encoding="utf-8-sig", newline="") as text:
+            def _progress(stats: dict) -> None:
+                repo.update_import_job(job_id, stats, min(99, int(text.buffer.tell() * 100 / total)))
+
+            stats = import_subscribers_csv(repo, text, default_edition=default_edition, progress=_progress)
+        repo.update_import_job(job_id, stats, 100)
+        repo.finish_import_job(job_id, "done")
+    except Exception as exc:
+        logger.exception("Subscriber CSV import failed")
+        repo.finish_import_job(job_id, "failed", str(exc))
+    finally:
+        os.unlink(path)
+
+
+def _import_status_html(job_id: int, status: dict | None) -> str:
+    if not status:
+        return '<div class="alert alert-danger">Import not found.</div>'
+    if status["state"] == "failed":
+        return f'<div class="alert alert-danger">Import failed: {escape(status["error"] or "")}</div>'
+    if status["state"] == "running":
+        return (
+            f'<div class="alert alert-info" hx-get="/subscribers/import/status/{job_id}" '
+            'hx-trigger="every 2s" hx-swap="outerHTML">'
+            f'Importing&hellip; {status["rows_read"]} rows read ({status["percent"]}%).</div>'
+        )
+    result = (
+        f'<div class="alert alert-success">Imported {status["imported"]} subscribers '
+        f'({status["new_subscribers"]} new). Skipped {status["skipped"] + status["duplicates"]}.'
+    )
+    if status["errors"]:
+        result += f' Errors: {status["errors"]}'
     result += '</div>'
-    return HTMLResponse(result)
+    return result
@@ -5,11 +5,13 @@ from __future__ import annotations
 import base64
 import logging
 from datetime import datetime, timezone
+from typing import Optional
 
 from fastapi import APIRouter, Query
 from fastapi.responses import RedirectResponse, Response
 
-from weeklyamp.web.deps import get_config, get_repo
+from weeklyamp.db.async_repository import run_db
+from weeklyamp.web.deps import get_async_repo, get_config, get_repo
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -22,6 +24,55 @@ _TRANSPARENT_GIF = (
     b"\x44\x01\x00\x3b"
 )
 
+# issue_links id -> (issue_id, url). Registered links never change, so
+# entries can't go stale; the cap only bounds memory.
+_links: dict[int, tuple[int, str]] = {}
+_LINKS_MAX = 50_000
+
+
+def _resolve_link(link_id: int) -> Optional[tuple[int, str]]:
+    hit = _links.get(link_id)
+    if hit is None:
+        row = get_repo().get_issue_link(link_id)
+        if row is None:
+            return None
+        if len(_links) >= _LINKS_MAX:
+            _links.clear()
+        hit = _links[link_id] = (row["issue_id"], row["url"])
+    return hit
+
+
+def _record_click(issue_id: int, subscriber_id: int, url: str) -> None:
+    try:
+        repo = get_repo()
+        conn = repo._conn()
+        conn.execute(
+            """INSERT INTO email_tracking_events
+               (issue_id, subscriber_id, event_type, url, created_at)
+               VALUES (?, ?, 'click', ?, ?)""",
+            (issue_id, subscriber_id, url, datetime.now(timezone.utc).isoformat()),
+        )
+        conn.commit()
+        conn.close()
+    except Exception:
+        logger.exception("Failed to record click event issue=%s sub=%s", issue_id, subscriber_id)
+
+
+def _record_open(issue_id: int, subscriber_id: int) -> None:
+    try:
+        repo = get_repo()
+        conn = repo._conn()
+        conn.execute(
+            """INSERT INTO email_tracking_events
+               (issue_id, subscriber_id, event_type, created_at)
+               VALUES (?, ?, 'open', ?)""",
+            (issue_id, subscriber_id, datetime.now(timezone.utc).isoformat()),
+        )
+        conn.commit()
+        conn.close()
+    except Exception:
+        logger.exception("Failed to record open event issue=%s sub=%s", issue_id, subscriber_id)
+
 
 @router.get("/t/open/{issue_id}/{subscriber_id}.gif")
 async def track_open(issue_id: int, subscriber_id: int):
@@ -29,19 +80,7 @@ async def track_open(issue_id: int, subscriber_id: int):
     cfg = get_config()
 
     if cfg.tracking.open_tracking:
-        try:
-            repo = get_repo()
-            conn = repo._conn()
-            conn.execute(
-                """INSERT INTO email_tracking_events
-                   (issue_id, subscriber_id, event_type, created_at)
-                   VALUES (?, ?, 'open', ?)""",
-                (issue_id, subscriber_id, datetime.now(timezone.utc).isoformat()),
-            )
-            conn.commit()
-            conn.close()
-        except Exception:
-            logger.exception("Failed to record open event issue=%s sub=%s", issue_id, subscriber_id)
+        await run_db(_record_open, issue_id, subscriber_id)
 
     return Response(
         content=_TRANSPARENT_GIF,
@@ -69,23 +108,29 @@ async def track_click(
     cfg = get_config()
 
     if cfg.tracking.click_tracking:
-        try:
-            repo = get_repo()
-            conn = repo._conn()
-            conn.execute(
-                """INSERT INTO email_tracking_events
-                   (issue_id, subscriber_id, event_type, url, created_at)
-                   VALUES (?, ?, 'click', ?, ?)""",
-                (issue_id, subscriber_id, original_url, datetime.now(timezone.utc).isoformat()),
-            )
-            conn.commit()
-            conn.close()
-        except Exception:
-            logger.exception("Failed to record click event issue=%s sub=%s", issue_id, subscriber_id)
+        await run_db(_record_click, issue_id, subscriber_id, original_url)
 
     return RedirectResponse(url=original_url, status_code=302)
 
 
+@router.get("/t/c/{link_id}/{subscriber_id}")
+async def track_link(link_id: int, subscriber_id: int):
+    """Record a click on a registered issue link and redirect to it.
+
+    Links written by ``TrackingProcessor.prepare_issue_html``; the id is
+    resolved from memory, so a hit costs only the event insert.
+    """
+    link = _links.get(link_id) or await run_db(_resolve_link, link_id)
+    if link is None:
+        return RedirectResponse(url="/", status_code=302)
+    issue_id, url = link
+
+    if get_config().tracking.click_tracking:
+        await run_db(_record_click, issue_id, subscriber_id, url)
+
+    return RedirectResponse(url=url, status_code=302)
+
+
 @router.get("/t/promo")
 async def track_promo_click(
     t: str = Query(""),          # target key: amp | rise | edge
@@ -106,8 +151,8 @@ async def track_promo_click(
         dest = "/"
 
     try:
-        repo = get_repo()
-        repo.record_promo_event(target=t[:32], edition_slug=e[:64], event_type="click")
+        repo = get_async_repo()
+        await repo.record_promo_event(target=t[:32], edition_slug=e[:64], event_type="click")
     except Exception:
         logger.exception("Failed to record promo click t=%s e=%s", t, e)
 
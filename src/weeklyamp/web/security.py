@@ -14,6 +14,8 @@ from itsdangerous import BadSignature, SignatureExpired, TimestampSigner
 from jinja2 import Environment, FileSystemLoader
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 
+from weeklyamp.core import cache_bus
+
 logger = logging.getLogger(__name__)
 
 def _get_secret_key() -> str:
@@ -85,6 +87,10 @@ def invalidate_admin_hash_cache() -> None:
     _cached_admin_hash = ""
 
 
+# Other workers learn of a password change through the cache bus.
+cache_bus.subscribe(cache_bus.ADMIN_SETTINGS, invalidate_admin_hash_cache)
+
+
 # ---- 2FA (TOTP) ----
 # Two-factor auth lives in the same admin_settings key/value table we use
 # for the password hash. Key `admin_totp_secret` holds the base32 secret;
@@ -184,6 +190,9 @@ _PUBLIC_EXACT = frozenset({
     # does not satisfy the segment-bounded match and would otherwise
     # 302 to /login.
     "/samples",
+    # Prometheus scrapers can't log in; the handler accepts an admin
+    # session or the WEEKLYAMP_METRICS_TOKEN bearer token itself.
+    "/metrics",
 })
 
 _TEMPLATES_DIR = Path(__file__).parent.parent.parent.parent / "templates" / "web"
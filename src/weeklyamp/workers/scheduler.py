@@ -6,73 +6,108 @@ WEEKLYAMP_WORKERS_ENABLED=true is set in environment.
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 
+from weeklyamp.core import metrics
+
 logger = logging.getLogger(__name__)
 
 _scheduler = None
 
 
+def _add_job(fn, trigger: str, *, id: str, **kwargs) -> None:
+    """Register ``fn`` so each run records its duration, outcome and query count.
+
+    Jobs let their exceptions propagate; they are logged and recorded as
+    an error outcome here, so one failing job never stops the scheduler.
+    """
+    @functools.wraps(fn)
+    def run():
+        try:
+            with metrics.job(id):
+                fn()
+        except Exception:
+            logger.exception("%s failed", id)
+    _scheduler.add_job(run, trigger, id=id, **kwargs)
+
+
 def _research_fetch():
     """Fetch content from all configured RSS/scrape sources."""
-    try:
-        from weeklyamp.web.deps import get_repo
-        from weeklyamp.research.sources import fetch_all_sources
-        repo = get_repo()
-        results = fetch_all_sources(repo)
-        logger.info("research_fetch completed: %s", results)
-    except Exception:
-        logger.exception("research_fetch failed")
+    from weeklyamp.web.deps import get_repo
+    from weeklyamp.research.sources import fetch_all_sources
+    repo = get_repo()
+    results = fetch_all_sources(repo)
+    logger.info("research_fetch completed: %s", results)
 
 
 def _welcome_queue():
     """Process pending welcome sequence sends."""
-    try:
-        from weeklyamp.web.deps import get_config, get_repo
-        from weeklyamp.content.welcome_sequence import WelcomeManager
-        cfg = get_config()
-        if not cfg.welcome_sequence.enabled:
-            return
-        repo = get_repo()
-        mgr = WelcomeManager(repo, cfg.welcome_sequence, cfg.email)
-        pending = mgr.process_welcome_queue()
-        if pending:
-            logger.info("welcome_queue: %d sends pending", len(pending))
-    except Exception:
-        logger.exception("welcome_queue failed")
+    from weeklyamp.web.deps import get_config, get_repo
+    from weeklyamp.content.welcome_sequence import WelcomeManager
+    cfg = get_config()
+    if not cfg.welcome_sequence.enabled:
+        return
+    repo = get_repo()
+    mgr = WelcomeManager(repo, cfg.welcome_sequence, cfg.email)
+    pending = mgr.process_welcome_queue()
+    if pending:
+        logger.info("welcome_queue: %d sends pending", len(pending))
 
 
 def _scheduled_sends():
     """Process pending scheduled newsletter sends."""
-    try:
-        from weeklyamp.web.deps import get_config, get_repo
-        from weeklyamp.delivery.scheduler import SendScheduler
-        cfg = get_config()
-        if not cfg.scheduler.enabled:
-            return
-        repo = get_repo()
-        sched = SendScheduler(repo, cfg.scheduler, cfg.email)
-        sched.process_pending()
-    except Exception:
-        logger.exception("scheduled_sends failed")
+    from weeklyamp.web.deps import get_config, get_repo
+    from weeklyamp.delivery.scheduler import SendScheduler
+    cfg = get_config()
+    if not cfg.scheduler.enabled:
+        return
+    repo = get_repo()
+    sched = SendScheduler(repo, cfg.scheduler, cfg.email)
+    sched.process_pending()
+
+
+def _ghl_sync():
+    """Pull new GHL contacts; a full pass runs when ghl.full_sync_hours is up."""
+    from weeklyamp.web.deps import get_config, get_repo
+    from weeklyamp.delivery.subscribers import sync_subscribers
+    cfg = get_config()
+    if not cfg.ghl.api_key or not cfg.ghl.location_id:
+        return
+    result = sync_subscribers(get_repo(), cfg.ghl)
+    logger.info("ghl_sync: %s", result)
+
+
+def _send_job_sweep():
+    """Finish send jobs whose runner died mid-send or before starting."""
+    from weeklyamp.web.deps import get_repo
+    from weeklyamp.delivery.send_jobs import sweep_stale_send_jobs
+    sweep_stale_send_jobs(get_repo())
+
+
+def _webhook_dispatch():
+    """Drain due rows from the outbound webhook outbox."""
+    from weeklyamp.web.deps import get_config, get_repo
+    from weeklyamp.delivery.webhooks import WebhookManager
+    cfg = get_config()
+    if not cfg.webhooks.enabled:
+        return
+    WebhookManager(get_repo(), cfg.webhooks).deliver_pending()
 
 
 def _reengagement_check():
     """Check for and suppress long-inactive subscribers."""
-    try:
-        from weeklyamp.web.deps import get_config, get_repo
-        from weeklyamp.content.reengagement import ReengagementManager
-        cfg = get_config()
-        if not cfg.reengagement.enabled:
-            return
-        repo = get_repo()
-        mgr = ReengagementManager(repo, cfg.reengagement)
-        count = mgr.auto_suppress_inactive()
-        if count:
-            logger.info("reengagement_check: suppressed %d subscribers", count)
-    except Exception:
-        logger.exception("reengagement_check failed")
+    from weeklyamp.web.deps import get_config, get_repo
+    from weeklyamp.content.reengagement import ReengagementManager
+    cfg = get_config()
+    if not cfg.reengagement.enabled:
+        return
+    repo = get_repo()
+    mgr = ReengagementManager(repo, cfg.reengagement)
+    count = mgr.auto_suppress_inactive()
+    if count:
+        logger.info("reengagement_check: suppressed %d subscribers", count)
 
 
 def _daily_action_draft():
@@ -85,159 +120,138 @@ def _daily_action_draft():
     Drafts ``draft_days_ahead`` days forward so a human has time to
     approve before the send job looks for an approved row.
     """
-    try:
-        from datetime import date, timedelta
-        from weeklyamp.web.deps import get_config, get_repo
-        cfg = get_config()
-        da = cfg.daily_action
-        if not da.enabled:
-            return
-
-        from datetime import datetime
-        if datetime.now().hour != da.draft_hour:
-            return
-
-        from weeklyamp.content.daily_action import build_daily_action, should_send_on
-        repo = get_repo()
-        built = 0
-        for offset in range(0, max(1, da.draft_days_ahead) + 1):
-            target = date.today() + timedelta(days=offset)
-            if not should_send_on(target, da):
-                continue
-            if build_daily_action(repo, cfg, target):
-                built += 1
-        logger.info("daily_action_draft: %d action(s) ready", built)
-    except Exception:
-        logger.exception("daily_action_draft failed")
+    from datetime import date, timedelta
+    from weeklyamp.web.deps import get_config, get_repo
+    cfg = get_config()
+    da = cfg.daily_action
+    if not da.enabled:
+        return
+
+    from datetime import datetime
+    if datetime.now().hour != da.draft_hour:
+        return
+
+    from weeklyamp.content.daily_action import build_daily_action, should_send_on
+    repo = get_repo()
+    built = 0
+    for offset in range(0, max(1, da.draft_days_ahead) + 1):
+        target = date.today() + timedelta(days=offset)
+        if not should_send_on(target, da):
+            continue
+        if build_daily_action(repo, cfg, target):
+            built += 1
+    logger.info("daily_action_draft: %d action(s) ready", built)
 
 
 def _daily_action_send():
     """Hourly tick: send today's approved daily action at ``send_hour``."""
-    try:
-        from datetime import datetime
-        from weeklyamp.web.deps import get_config, get_repo
-        cfg = get_config()
-        da = cfg.daily_action
-        if not da.enabled:
-            return
-        if datetime.now().hour != da.send_hour:
-            return
-
-        from weeklyamp.content.daily_action import send_daily_action
-        repo = get_repo()
-        result = send_daily_action(repo, cfg)
-        if result.get("skipped"):
-            logger.info("daily_action_send: skipped — %s", result["skipped"])
-        else:
-            logger.info(
-                "daily_action_send: sent=%s failed=%s",
-                result.get("sent", 0), result.get("failed", 0),
-            )
-    except Exception:
-        logger.exception("daily_action_send failed")
+    from datetime import datetime
+    from weeklyamp.web.deps import get_config, get_repo
+    cfg = get_config()
+    da = cfg.daily_action
+    if not da.enabled:
+        return
+    if datetime.now().hour != da.send_hour:
+        return
+
+    from weeklyamp.content.daily_action import send_daily_action
+    repo = get_repo()
+    result = send_daily_action(repo, cfg)
+    if result.get("skipped"):
+        logger.info("daily_action_send: skipped — %s", result["skipped"])
+    else:
+        logger.info(
+            "daily_action_send: sent=%s failed=%s",
+            result.get("sent", 0), result.get("failed", 0),
+        )
 
 
 def _marketing_prospect_scan():
     """Weekly: AI identifies new sponsor prospects."""
-    try:
-        from weeklyamp.web.deps import get_config, get_repo
-        cfg = get_config()
-        if not cfg.agents.default_autonomy == "autonomous":
-            return  # Only run if fully autonomous
-        repo = get_repo()
-        from weeklyamp.agents.marketing import MarketingAgent
-        agent_row = repo.get_agent_by_type("marketing")
-        if not agent_row:
-            return
-        agent = MarketingAgent(repo, cfg, agent_row)
-        task_id = repo.create_agent_task(agent_row["id"], "identify_prospects")
-        agent.execute(task_id)
-        logger.info("marketing_prospect_scan completed")
-    except Exception:
-        logger.exception("marketing_prospect_scan failed")
+    from weeklyamp.web.deps import get_config, get_repo
+    cfg = get_config()
+    if not cfg.agents.default_autonomy == "autonomous":
+        return  # Only run if fully autonomous
+    repo = get_repo()
+    from weeklyamp.agents.marketing import MarketingAgent
+    agent_row = repo.get_agent_by_type("marketing")
+    if not agent_row:
+        return
+    agent = MarketingAgent(repo, cfg, agent_row)
+    task_id = repo.create_agent_task(agent_row["id"], "identify_prospects")
+    agent.execute(task_id)
+    logger.info("marketing_prospect_scan completed")
 
 
 def _marketing_outreach():
     """Daily: Draft outreach for new prospects."""
-    try:
-        from weeklyamp.web.deps import get_config, get_repo
-        cfg = get_config()
-        if not cfg.agents.default_autonomy == "autonomous":
-            return
-        repo = get_repo()
-        from weeklyamp.agents.marketing import MarketingAgent
-        agent_row = repo.get_agent_by_type("marketing")
-        if not agent_row:
-            return
-        agent = MarketingAgent(repo, cfg, agent_row)
-        task_id = repo.create_agent_task(agent_row["id"], "draft_outreach_batch")
-        agent.execute(task_id)
-        logger.info("marketing_outreach completed")
-    except Exception:
-        logger.exception("marketing_outreach failed")
+    from weeklyamp.web.deps import get_config, get_repo
+    cfg = get_config()
+    if not cfg.agents.default_autonomy == "autonomous":
+        return
+    repo = get_repo()
+    from weeklyamp.agents.marketing import MarketingAgent
+    agent_row = repo.get_agent_by_type("marketing")
+    if not agent_row:
+        return
+    agent = MarketingAgent(repo, cfg, agent_row)
+    task_id = repo.create_agent_task(agent_row["id"], "draft_outreach_batch")
+    agent.execute(task_id)
+    logger.info("marketing_outreach completed")
 
 
 def _marketing_social():
     """Daily: Draft social posts for latest issues."""
-    try:
-        from weeklyamp.web.deps import get_config, get_repo
-        cfg = get_config()
-        if not cfg.agents.default_autonomy == "autonomous":
-            return
-        repo = get_repo()
-        from weeklyamp.agents.marketing import MarketingAgent
-        agent_row = repo.get_agent_by_type("marketing")
-        if not agent_row:
-            return
-        agent = MarketingAgent(repo, cfg, agent_row)
-        task_id = repo.create_agent_task(agent_row["id"], "draft_social_batch")
-        agent.execute(task_id)
-        logger.info("marketing_social completed")
-    except Exception:
-        logger.exception("marketing_social failed")
+    from weeklyamp.web.deps import get_config, get_repo
+    cfg = get_config()
+    if not cfg.agents.default_autonomy == "autonomous":
+        return
+    repo = get_repo()
+    from weeklyamp.agents.marketing import MarketingAgent
+    agent_row = repo.get_agent_by_type("marketing")
+    if not agent_row:
+        return
+    agent = MarketingAgent(repo, cfg, agent_row)
+    task_id = repo.create_agent_task(agent_row["id"], "draft_social_batch")
+    agent.execute(task_id)
+    logger.info("marketing_social completed")
 
 
 def _marketing_retention():
     """Daily: Check for at-risk subscribers and queue win-backs."""
-    try:
-        from weeklyamp.web.deps import get_config, get_repo
-        cfg = get_config()
-        if not cfg.agents.default_autonomy == "autonomous":
-            return
-        repo = get_repo()
-        from weeklyamp.agents.marketing import MarketingAgent
-        agent_row = repo.get_agent_by_type("marketing")
-        if not agent_row:
-            return
-        agent = MarketingAgent(repo, cfg, agent_row)
-        task_id = repo.create_agent_task(agent_row["id"], "identify_at_risk")
-        agent.execute(task_id)
-        # If at-risk found, draft win-backs
-        task_id2 = repo.create_agent_task(agent_row["id"], "draft_winback_batch")
-        agent.execute(task_id2)
-        logger.info("marketing_retention completed")
-    except Exception:
-        logger.exception("marketing_retention failed")
+    from weeklyamp.web.deps import get_config, get_repo
+    cfg = get_config()
+    if not cfg.agents.default_autonomy == "autonomous":
+        return
+    repo = get_repo()
+    from weeklyamp.agents.marketing import MarketingAgent
+    agent_row = repo.get_agent_by_type("marketing")
+    if not agent_row:
+        return
+    agent = MarketingAgent(repo, cfg, agent_row)
+    task_id = repo.create_agent_task(agent_row["id"], "identify_at_risk")
+    agent.execute(task_id)
+    # If at-risk found, draft win-backs
+    task_id2 = repo.create_agent_task(agent_row["id"], "draft_winback_batch")
+    agent.execute(task_id2)
+    logger.info("marketing_retention completed")
 
 
 def _marketing_weekly_report():
     """Weekly: Generate marketing performance report."""
-    try:
-        from weeklyamp.web.deps import get_config, get_repo
-        cfg = get_config()
-        if not cfg.agents.default_autonomy == "autonomous":
-            return
-        repo = get_repo()
-        from weeklyamp.agents.marketing import MarketingAgent
-        agent_row = repo.get_agent_by_type("marketing")
-        if not agent_row:
-            return
-        agent = MarketingAgent(repo, cfg, agent_row)
-        task_id = repo.create_agent_task(agent_row["id"], "weekly_marketing_report")
-        agent.execute(task_id)
-        logger.info("marketing_weekly_report completed")
-    except Exception:
-        logger.exception("marketing_weekly_report failed")
+    from weeklyamp.web.deps import get_config, get_repo
+    cfg = get_config()
+    if not cfg.agents.default_autonomy == "autonomous":
+        return
+    repo = get_repo()
+    from weeklyamp.agents.marketing import MarketingAgent
+    agent_row = repo.get_agent_by_type("marketing")
+    if not agent_row:
+        return
+    agent = MarketingAgent(repo, cfg, agent_row)
+    task_id = repo.create_agent_task(agent_row["id"], "weekly_marketing_report")
+    agent.execute(task_id)
+    logger.info("marketing_weekly_report completed")
 
 
 def start_scheduler():
@@ -259,35 +273,44 @@ def start_scheduler():
         return None
 
     _scheduler = BackgroundScheduler()
-    _scheduler.add_job(_research_fetch, "interval", hours=6, id="research_fetch", name="Fetch RSS/scrape sources")
-    _scheduler.add_job(_welcome_queue, "interval", minutes=30, id="welcome_queue", name="Process welcome sequence")
-    _scheduler.add_job(_scheduled_sends, "interval", seconds=60, id="scheduled_sends", name="Process scheduled sends")
-    _scheduler.add_job(_reengagement_check, "cron", hour=3, id="reengagement_check", name="Re-engagement check")
+    _add_job(_research_fetch, "interval", hours=6, id="research_fetch", name="Fetch RSS/scrape sources")
+    _add_job(_welcome_queue, "interval", minutes=30, id="welcome_queue", name="Process welcome sequence")
+    _add_job(_scheduled_sends, "interval", seconds=60, id="scheduled_sends", name="Process scheduled sends")
+    _add_job(_ghl_sync, "interval", hours=1, id="ghl_sync", name="Sync subscribers from GoHighLevel")
+    _add_job(_send_job_sweep, "interval", minutes=5, id="send_job_sweep", name="Finish stale send jobs")
+    _add_job(_webhook_dispatch, "interval", seconds=15, id="webhook_dispatch", name="Deliver outbound webhooks")
+    _add_job(_reengagement_check, "cron", hour=3, id="reengagement_check", name="Re-engagement check")
 
     # TrueFans Single Daily Action — both tick hourly and no-op outside
     # their configured hour, so draft_hour/send_hour are runtime-editable.
-    _scheduler.add_job(_daily_action_draft, "cron", minute=5, id="daily_action_draft", name="Draft daily action")
-    _scheduler.add_job(_daily_action_send, "cron", minute=0, id="daily_action_send", name="Send daily action")
+    _add_job(_daily_action_draft, "cron", minute=5, id="daily_action_draft", name="Draft daily action")
+    _add_job(_daily_action_send, "cron", minute=0, id="daily_action_send", name="Send daily action")
 
     # Marketing automation (only runs when agents.default_autonomy == "autonomous")
-    _scheduler.add_job(_marketing_prospect_scan, "cron", day_of_week="mon", hour=9, id="marketing_prospect_scan", name="AI prospect identification")
-    _scheduler.add_job(_marketing_outreach, "cron", hour=10, id="marketing_outreach", name="AI sponsor outreach drafts")
-    _scheduler.add_job(_marketing_social, "cron", hour=11, id="marketing_social", name="AI social post drafts")
-    _scheduler.add_job(_marketing_retention, "cron", hour=14, id="marketing_retention", name="AI retention check")
-    _scheduler.add_job(_marketing_weekly_report, "cron", day_of_week="fri", hour=16, id="marketing_weekly_report", name="Weekly marketing report")
+    _add_job(_marketing_prospect_scan, "cron", day_of_week="mon", hour=9, id="marketing_prospect_scan", name="AI prospect identification")
+    _add_job(_marketing_outreach, "cron", hour=10, id="marketing_outreach", name="AI sponsor outreach drafts")
+    _add_job(_marketing_social, "cron", hour=11, id="marketing_social", name="AI social post drafts")
+    _add_job(_marketing_retention, "cron", hour=14, id="marketing_retention", name="AI retention check")
+    _add_job(_marketing_weekly_report, "cron", day_of_week="fri", hour=16, id="marketing_weekly_report", name="Weekly marketing report")
 
     # Billing automation
-    _scheduler.add_job(_billing_dunning, "cron", hour=6, id="billing_dunning", name="Billing dunning check")
-    _scheduler.add_job(_billing_invoice_generation, "cron", day=1, hour=2, id="billing_invoices", name="Monthly invoice generation")
+    _add_job(_billing_dunning, "cron", hour=6, id="billing_dunning", name="Billing dunning check")
+    _add_job(_billing_invoice_generation, "cron", day=1, hour=2, id="billing_invoices", name="Monthly invoice generation")
 
     # Spotify release scanning
-    _scheduler.add_job(_spotify_release_scan, "cron", hour=8, id="spotify_releases", name="Spotify release scan")
+    _add_job(_spotify_release_scan, "cron", hour=8, id="spotify_releases", name="Spotify release scan")
 
     # Audio/TTS generation (runs after scheduled sends to generate audio for published issues)
-    _scheduler.add_job(_audio_generation, "cron", hour=12, id="audio_generation", name="Audio newsletter generation")
+    _add_job(_audio_generation, "cron", hour=12, id="audio_generation", name="Audio newsletter generation")
 
     # Ad marketplace daily auction
-    _scheduler.add_job(_ad_auction, "cron", hour=5, id="ad_auction", name="Daily ad marketplace auction")
+    _add_job(_ad_auction, "cron", hour=5, id="ad_auction", name="Daily ad marketplace auction")
+
+    # Trigger-maintained subscriber counters: recompute to catch drift
+    _add_job(_reconcile_subscriber_counters, "interval", hours=1, id="subscriber_counters", name="Reconcile subscriber counters")
+
+    # Prune content-hash keyed render caches
+    _add_job(_cache_maintenance, "cron", hour=4, id="cache_maintenance", name="Prune rendered markdown and TTS chunk caches")
 
     _scheduler.start()
     logger.info("Background scheduler started with %d jobs", len(_scheduler.get_jobs()))
@@ -296,143 +319,134 @@ def start_scheduler():
 
 def _billing_dunning():
     """Check for past-due subscriptions and progress dunning state."""
-    try:
-        config = _load_config()
-        if not config.paid_tiers.enabled or not config.paid_tiers.dunning_enabled:
-            return
-        from weeklyamp.db.repository import Repository
-        repo = Repository(config.db_path)
-        past_due = repo.get_past_due_subscriptions()
-        from datetime import datetime, timedelta
-        grace_days = config.paid_tiers.dunning_grace_days
-        for billing in past_due:
-            state = billing.get("dunning_state", "")
-            started = billing.get("dunning_started_at")
-            if not started:
-                repo.update_dunning_state(billing["payment_subscription_id"], "grace")
-                continue
-            try:
-                start_dt = datetime.fromisoformat(started)
-            except (ValueError, TypeError):
-                continue
-            days_elapsed = (datetime.utcnow() - start_dt).days
-            if state == "grace" and days_elapsed >= grace_days:
-                repo.update_dunning_state(billing["payment_subscription_id"], "retry_1")
-            elif state == "retry_1" and days_elapsed >= grace_days * 2:
-                repo.update_dunning_state(billing["payment_subscription_id"], "retry_2")
-            elif state == "retry_2" and days_elapsed >= grace_days * 3:
-                repo.update_dunning_state(billing["payment_subscription_id"], "retry_3")
-            elif state == "retry_3" and days_elapsed >= grace_days * 4:
-                repo.update_billing_status(billing["payment_subscription_id"], "cancelled")
-                repo.update_dunning_state(billing["payment_subscription_id"], "cancelled")
-        logger.info("Dunning check complete: %d past-due subscriptions", len(past_due))
-    except Exception:
-        logger.exception("Billing dunning job failed")
+    config = _load_config()
+    if not config.paid_tiers.enabled or not config.paid_tiers.dunning_enabled:
+        return
+    from weeklyamp.db.repository import Repository
+    repo = Repository(config.db_path)
+    past_due = repo.get_past_due_subscriptions()
+    from datetime import datetime, timedelta
+    grace_days = config.paid_tiers.dunning_grace_days
+    for billing in past_due:
+        state = billing.get("dunning_state", "")
+        started = billing.get("dunning_started_at")
+        if not started:
+            repo.update_dunning_state(billing["payment_subscription_id"], "grace")
+            continue
+        try:
+            start_dt = datetime.fromisoformat(started)
+        except (ValueError, TypeError):
+            continue
+        days_elapsed = (datetime.utcnow() - start_dt).days
+        if state == "grace" and days_elapsed >= grace_days:
+            repo.update_dunning_state(billing["payment_subscription_id"], "retry_1")
+        elif state == "retry_1" and days_elapsed >= grace_days * 2:
+            repo.update_dunning_state(billing["payment_subscription_id"], "retry_2")
+        elif state == "retry_2" and days_elapsed >= grace_days * 3:
+            repo.update_dunning_state(billing["payment_subscription_id"], "retry_3")
+        elif state == "retry_3" and days_elapsed >= grace_days * 4:
+            repo.update_billing_status(billing["payment_subscription_id"], "cancelled")
+            repo.update_dunning_state(billing["payment_subscription_id"], "cancelled")
+    logger.info("Dunning check complete: %d past-due subscriptions", len(past_due))
 
 
 def _billing_invoice_generation():
     """Monthly: Generate invoices for all licensees and artist newsletters,
     then email each freshly-generated invoice to the entity it belongs to.
     """
-    try:
-        config = _load_config()
-        from weeklyamp.billing.invoices import InvoiceManager
-        from weeklyamp.db.repository import Repository
-        repo = Repository(
-            db_path=config.db_path,
-            database_url=config.database_url,
-            backend=config.db_backend,
-        )
-        mgr = InvoiceManager(repo, config)
-        lic_ids = mgr.generate_all_licensee_invoices()
-        art_ids = mgr.generate_all_artist_newsletter_invoices()
-        logger.info(
-            "Invoice generation: %d licensee, %d artist newsletter",
-            len(lic_ids), len(art_ids),
-        )
-
-        # Email each fresh invoice. Failures are logged per-invoice and
-        # don't stop the loop — we'd rather send 9/10 than fail closed.
-        sent = 0
-        for inv_id in lic_ids + art_ids:
-            try:
-                if mgr.send_invoice_email(inv_id, config.email):
-                    sent += 1
-            except Exception:
-                logger.exception("Failed to email invoice %s", inv_id)
-        logger.info("Invoice delivery: %d/%d emailed", sent, len(lic_ids) + len(art_ids))
-    except Exception:
-        logger.exception("Invoice generation job failed")
+    from weeklyamp.billing.invoices import InvoiceManager
+    from weeklyamp.web.deps import get_config, get_repo
+    config = get_config()
+    mgr = InvoiceManager(get_repo(), config)
+    lic_ids = mgr.generate_all_licensee_invoices()
+    art_ids = mgr.generate_all_artist_newsletter_invoices()
+    logger.info(
+        "Invoice generation: %d licensee, %d artist newsletter",
+        len(lic_ids), len(art_ids),
+    )
+
+    # Email each fresh invoice. Failures are logged per-invoice and
+    # don't stop the loop — we'd rather send 9/10 than fail closed.
+    sent = 0
+    for inv_id in lic_ids + art_ids:
+        try:
+            if mgr.send_invoice_email(inv_id, config.email):
+                sent += 1
+        except Exception:
+            logger.exception("Failed to email invoice %s", inv_id)
+    logger.info("Invoice delivery: %d/%d emailed", sent, len(lic_ids) + len(art_ids))
 
 
 def _spotify_release_scan():
     """Daily: Scan for new releases from artists in profiles."""
-    try:
-        config = _load_config()
-        if not config.spotify.enabled:
-            return
-        from weeklyamp.content.spotify import SpotifyClient
-        from weeklyamp.db.repository import Repository
-        repo = Repository(config.db_path)
-        client = SpotifyClient(config.spotify)
-        conn = repo._conn()
-        artists = conn.execute(
-            "SELECT id, spotify_id FROM artist_profiles WHERE spotify_id != '' AND is_active = 1"
-        ).fetchall()
-        conn.close()
-        synced = 0
-        for artist in artists:
-            try:
-                client.sync_releases(repo, artist["spotify_id"])
-                synced += 1
-            except Exception:
-                continue
-        logger.info("Spotify release scan: checked %d artists, synced %d", len(artists), synced)
-    except Exception:
-        logger.exception("Spotify release scan job failed")
+    from weeklyamp.web.deps import get_config, get_repo
+    config = get_config()
+    if not config.spotify.enabled:
+        return
+    from weeklyamp.content.spotify import SpotifyClient, scan_releases
+    repo = get_repo()
+    conn = repo._conn()
+    artists = conn.execute(
+        "SELECT spotify_id FROM artist_profiles WHERE spotify_id != '' AND is_active = 1"
+    ).fetchall()
+    conn.close()
+    stats = scan_releases(SpotifyClient(config.spotify), repo, [a["spotify_id"] for a in artists])
+    logger.info(
+        "Spotify release scan: checked %d artists, synced %d, failed %d, %d new/updated releases",
+        stats["artists"], stats["synced"], stats["failed"], stats["releases"],
+    )
 
 
 def _audio_generation():
     """Generate audio/TTS versions of published issues."""
-    try:
-        config = _load_config()
-        if not config.audio.enabled:
-            return
-        from weeklyamp.content.audio import generate_audio_for_issue
-        from weeklyamp.db.repository import Repository
-        repo = Repository(config.db_path)
-        conn = repo._conn()
-        issues = conn.execute(
-            "SELECT ai.issue_id, ai.html_content FROM assembled_issues ai "
-            "JOIN issues i ON i.id = ai.issue_id "
-            "WHERE i.status = 'published' AND ai.audio_url = '' "
-            "ORDER BY ai.id DESC LIMIT 3"
-        ).fetchall()
-        conn.close()
-        for issue in issues:
-            try:
-                generate_audio_for_issue(repo, config, issue["issue_id"])
-            except Exception:
-                logger.exception("Audio generation failed for issue %s", issue["issue_id"])
-        logger.info("Audio generation: processed %d issues", len(issues))
-    except Exception:
-        logger.exception("Audio generation job failed")
+    from weeklyamp.web.deps import get_config, get_repo
+    from weeklyamp.content.audio import AUDIO_STALE_SECONDS, generate_audio_newsletter
+    config = get_config()
+    if not config.audio.enabled:
+        return
+    repo = get_repo()
+    issue_ids = repo.get_issues_needing_audio(limit=3, stale_after_seconds=AUDIO_STALE_SECONDS)
+    for issue_id in issue_ids:
+        try:
+            generate_audio_newsletter(repo, config, issue_id)
+        except Exception:
+            logger.exception("Audio generation failed for issue %s", issue_id)
+    logger.info("Audio generation: processed %d issues", len(issue_ids))
+
+
+def _reconcile_subscriber_counters():
+    """Hourly: recompute subscriber_counters and fix any drift."""
+    from weeklyamp.web.deps import get_repo
+    fixed = get_repo().reconcile_subscriber_counters()
+    if fixed:
+        from weeklyamp.core.subscriber_counts import invalidate_cache
+        invalidate_cache()
+
+
+def _cache_maintenance():
+    """Daily: prune rendered markdown and TTS chunks nothing has used lately."""
+    from weeklyamp.web.deps import get_repo
+    from weeklyamp.content.audio import prune_chunk_cache
+    from weeklyamp.content.rendering import PERSISTED_MAX_AGE_DAYS
+    pruned = get_repo().prune_rendered_markdown(PERSISTED_MAX_AGE_DAYS)
+    if pruned:
+        logger.info("cache_maintenance: pruned %d rendered_markdown rows", pruned)
+    pruned = prune_chunk_cache()
+    if pruned:
+        logger.info("cache_maintenance: pruned %d cached TTS chunks", pruned)
 
 
 def _ad_auction():
     """Daily: Run ad marketplace auction for tomorrow's sponsor slots."""
-    try:
-        config = _load_config()
-        if not config.sponsor_portal.enabled:
-            return
-        from weeklyamp.billing.ad_marketplace import AdMarketplace
-        from weeklyamp.db.repository import Repository
-        repo = Repository(config.db_path)
-        marketplace = AdMarketplace(repo, config)
-        results = marketplace.run_daily_auction()
-        logger.info("Ad auction: %d winners", len(results.get("winners", [])))
-    except Exception:
-        logger.exception("Ad auction job failed")
+    config = _load_config()
+    if not config.sponsor_portal.enabled:
+        return
+    from weeklyamp.billing.ad_marketplace import AdMarketplace
+    from weeklyamp.db.repository import Repository
+    repo = Repository(config.db_path)
+    marketplace = AdMarketplace(repo, config)
+    results = marketplace.run_daily_auction()
+    logger.info("Ad auction: %d winners", len(results.get("winners", [])))
 
 
 def stop_scheduler():
@@ -442,3 +456,7 @@ def stop_scheduler():
         _scheduler.shutdown(wait=False)
         logger.info("Background scheduler stopped")
         _scheduler = None
+    from weeklyamp.delivery.webhooks import close_client
+    close_client()
+    from weeklyamp.content.spotify import close_client as close_spotify_client
+    close_spotify_client()
@@ -139,3 +139,55 @@ def test_promo_events_recorded_and_aggregated(repo):
     perf = {(r["target"], r["edition_slug"]): r["clicks"] for r in repo.get_promo_performance()}
     assert perf[("amp", "fan")] == 2
     assert perf[("edge", "artist")] == 1
+
+
+def test_assemble_issues_matches_single_issue_assembly(repo):
+    """Batch assembly of a send day renders each edition exactly as the per-issue path does."""
+    from weeklyamp.content.assembly import assemble_issues, assemble_newsletter
+    from weeklyamp.core.config import load_config
+    config = load_config()
+
+    issue_ids = []
+    for n, edition in enumerate(("fan", "artist", "industry")):
+        issue_id = repo.create_issue_with_schedule(
+            issue_number=300 + n, week_id="2026-W30", send_day="monday", edition_slug=edition
+        )
+        for slug in ("backstage_pass", "coaching"):
+            draft_id = repo.create_draft(issue_id, slug, f"## {edition} {slug}\n\nBody *copy* for {edition}.", ai_model="test")
+            repo.update_draft_status(draft_id, "approved")
+        issue_ids.append(issue_id)
+    guest_draft = repo.get_drafts_for_issue(issue_ids[0])[0]["id"]
+    guest_id = repo.create_guest_article(
+        title="Guest", author_name="Jo Guest", author_bio="Bio", original_url="https://example.com/g",
+        content_full="Guest body.",
+    )
+    repo.update_guest_article(guest_id, draft_id=guest_draft)
+
+    with patch("weeklyamp.content.assembly._generate_welcome_intro", side_effect=lambda issue, *a: f"Welcome {issue['id']}!"):
+        with patch("weeklyamp.content.assembly._generate_ps_closing", return_value="Thanks!"):
+            batch = assemble_issues(repo, issue_ids, config, processes=1)
+            single = {i: assemble_newsletter(repo, i, config) for i in issue_ids}
+
+    assert set(batch["issues"]) == set(issue_ids)
+    for issue_id in issue_ids:
+        built = batch["issues"][issue_id]
+        assert (built["html"], built["plain"]) == single[issue_id]
+        assert set(built["timings"]) == {"sections_s", "intro_s", "ps_s", "finish_s"}
+    assert "Jo Guest" in batch["issues"][issue_ids[0]]["html"]
+    assert batch["timings"]["total_s"] >= batch["timings"]["markdown_s"]
+
+
+def test_assemble_issues_rejects_unknown_issue(repo):
+    from weeklyamp.content.assembly import assemble_issues
+    from weeklyamp.core.config import load_config
+
+    with pytest.raises(ValueError, match="999999"):
+        assemble_issues(repo, [999999], load_config())
+
+
+def test_markdown_to_html_many_pool_matches_inline():
+    from weeklyamp.content.rendering import markdown_to_html, markdown_to_html_many
+
+    texts = [f"# Doc {i}\n\n**bold** <script>x</script> [link](https://e.com/{i})" for i in range(20)]
+    texts.append(texts[0])
+    assert markdown_to_html_many(texts, processes=2) == [markdown_to_html(t) for t in texts]
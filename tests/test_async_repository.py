@@ -0,0 +1,61 @@
+"""Tests for the awaitable repository facade and its event-loop isolation."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from weeklyamp.db.async_repository import AsyncRepository, run_db
+from weeklyamp.db.repository import Repository
+
+
+def test_facade_mirrors_repository_methods(repo):
+    arepo = AsyncRepository(repo)
+
+    async def scenario():
+        issue_id = await arepo.create_issue(1, "First")
+        issue = await arepo.get_issue(issue_id)
+        thread = await run_db(lambda: threading.current_thread().name)
+        return issue, thread
+
+    issue, thread = asyncio.run(scenario())
+    assert issue["title"] == "First"
+    assert thread.startswith("weeklyamp-db")
+    assert arepo.get_issue is arepo.get_issue
+    with pytest.raises(AttributeError):
+        arepo._conn
+
+
+def test_slow_query_does_not_stall_other_requests(client, repo, monkeypatch):
+    """A request stuck in a query that only returns once the other requests
+    are done: on a blocked event loop they could never finish first."""
+    issue_id = repo.create_issue(1, "Load")
+    repo.upsert_subscriber("load@example.com")
+    sub_id = repo.get_subscriber_by_email("load@example.com")["id"]
+    release = threading.Event()
+
+    def slow_get_editions(self):
+        release.wait(timeout=10)
+        return []
+
+    monkeypatch.setattr(Repository, "get_editions", slow_get_editions)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=client.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as ac:
+            slow = asyncio.create_task(ac.get("/api/v1/editions"))
+            await asyncio.sleep(0.05)
+            fast = await asyncio.gather(*(ac.get(f"/t/open/{issue_id}/{sub_id}.gif") for _ in range(20)))
+            slow_pending = not slow.done()
+            release.set()
+            return await slow, fast, slow_pending
+
+    slow, fast, slow_pending = asyncio.run(scenario())
+
+    assert all(r.status_code == 200 for r in fast)
+    assert slow_pending
+    assert slow.status_code == 200 and slow.json() == []
+    assert len(repo.get_tracking_events(issue_id, "open")) == 20
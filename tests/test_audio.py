@@ -0,0 +1,135 @@
+"""Tests for the chunked TTS pipeline (stub provider, no network)."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+
+import pytest
+
+from weeklyamp.content import audio
+from weeklyamp.core.models import AppConfig, AudioConfig
+
+
+def _plain(extra: str = "") -> str:
+    body = " ".join(f"Sentence number {i} about the scene." for i in range(60))
+    return (
+        "Welcome to this week's dispatch.\n\n" + "=" * 40 + "\n"
+        f"=== Spotlight — New Voices ===\n\n{body}\n\n"
+        f"=== Industry News ===\n\nLabels and deals.{extra} {body}\n"
+        + "\n" + "=" * 40 + "\n\nSee you next week.\n"
+    )
+
+
+def test_chunks_respect_limit_and_sections():
+    chunks = audio.build_chunks(_plain(), max_chars=300)
+    assert all(len(c["text"]) <= 300 for c in chunks)
+    assert [c["chapter"] for c in chunks][0] == "Introduction"
+    assert {c["chapter"] for c in chunks} == {"Introduction", "Spotlight — New Voices", "Industry News"}
+    # Nothing is dropped: every sentence survives chunking.
+    joined = " ".join(c["text"] for c in chunks)
+    assert "Sentence number 59 about the scene." in joined
+    assert "=" * 10 not in joined
+
+
+def test_overlong_sentence_is_split_at_whitespace():
+    text = "word " * 200
+    chunks = audio.chunk_text(text, 50)
+    assert all(len(c) <= 50 for c in chunks)
+    assert " ".join(chunks).split() == text.split()
+
+
+def test_render_audio_chapters_and_chunk_cache(tmp_path):
+    provider = audio.StubTTSProvider(max_chars=300)
+    out = tmp_path / "issue.mp3"
+    first = audio.render_audio(_plain(), provider, out, cache_dir=tmp_path / "chunks", max_workers=4)
+
+    # Identical chunks (the two sections share text) are synthesized once.
+    assert first["synthesized"] == provider.calls
+    assert first["synthesized"] == len({c["text"] for c in audio.build_chunks(_plain(), 300)})
+    assert [c["title"] for c in first["chapters"]] == [
+        "Introduction", "Spotlight — New Voices", "Industry News",
+    ]
+    assert first["chapters"][1]["start_ms"] == first["chapters"][0]["end_ms"]
+    data = out.read_bytes()
+    assert data[:3] == b"ID3" and b"CHAP" in data and b"CTOC" in data
+    # Per-chunk durations are whole milliseconds; allow 1 ms per chunk.
+    total = audio.mp3_duration_ms(audio._strip_id3(data))
+    assert abs(total - first["duration_ms"]) <= first["chunks"]
+
+    # Editing one section only re-synthesizes that section's chunks.
+    calls = provider.calls
+    second = audio.render_audio(_plain(" Breaking news!"), provider, out,
+                                cache_dir=tmp_path / "chunks", max_workers=4)
+    industry = [c for c in audio.build_chunks(_plain(), 300) if c["chapter"] == "Industry News"]
+    assert 0 < second["synthesized"] <= len(industry)
+    assert provider.calls - calls == second["synthesized"]
+
+
+def test_failed_chunk_fails_render_but_keeps_cache(tmp_path):
+    class Flaky(audio.StubTTSProvider):
+        def synthesize(self, text):
+            if "Labels" in text:
+                raise RuntimeError("provider down")
+            return super().synthesize(text)
+
+    provider = Flaky(max_chars=300)
+    with pytest.raises(RuntimeError):
+        audio.render_audio(_plain(), provider, tmp_path / "x.mp3", cache_dir=tmp_path / "c")
+    assert not (tmp_path / "x.mp3").exists()
+    assert any((tmp_path / "c").glob("*.mp3"))
+
+
+def test_generate_audio_newsletter_with_stub(repo, tmp_path, monkeypatch):
+    monkeypatch.setattr(audio, "AUDIO_DIR", tmp_path)
+    config = AppConfig(audio=AudioConfig(enabled=True, tts_provider="stub"))
+    issue_id = repo.create_issue(1)
+    repo.save_assembled(issue_id, "<p>x</p>", _plain())
+    repo.update_issue_status(issue_id, "published")
+    assert repo.get_issues_needing_audio() == [issue_id]
+
+    audio_id = audio.generate_audio_newsletter(repo, config, issue_id)
+    assert audio_id
+    row = repo.get_audio_issue(issue_id)
+    assert row["status"] == "complete"
+    assert row["duration_seconds"] > 60
+    assert row["file_size_bytes"] == audio.get_audio_file_path(issue_id).stat().st_size
+    chapters = json.loads(audio.get_chapters_path(issue_id).read_text())
+    assert len(chapters["chapters"]) == 3
+    assert repo.get_issues_needing_audio() == []
+
+
+def test_stale_processing_audio_is_retried(repo):
+    issue_id = repo.create_issue(1)
+    repo.save_assembled(issue_id, "<p>x</p>", _plain())
+    repo.update_issue_status(issue_id, "published")
+    audio_id = repo.create_audio_issue(issue_id, tts_provider="stub")
+    repo.update_audio_issue(audio_id, status="processing")
+    assert repo.get_issues_needing_audio() == []
+
+    # The worker died mid-render: once the row is old enough, retry.
+    conn = repo._conn()
+    conn.execute("UPDATE audio_issues SET created_at = '2000-01-01 00:00:00' WHERE id = ?", (audio_id,))
+    conn.commit()
+    conn.close()
+    assert repo.get_issues_needing_audio() == [issue_id]
+
+
+def test_prune_chunk_cache_keeps_recently_used_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(audio, "AUDIO_DIR", tmp_path)
+    provider = audio.StubTTSProvider(max_chars=300)
+    cache = tmp_path / "chunks"
+    audio.render_audio(_plain(), provider, tmp_path / "a.mp3", cache_dir=cache)
+    old = time.time() - 40 * 86400
+    for path in cache.iterdir():
+        os.utime(path, (old, old))
+    orphan = cache / "orphan.mp3"
+    orphan.write_bytes(b"x")
+    os.utime(orphan, (old, old))
+
+    # Re-rendering reuses (and so touches) every chunk but the orphan.
+    audio.render_audio(_plain(), provider, tmp_path / "a.mp3", cache_dir=cache)
+    assert audio.prune_chunk_cache(max_age_days=30) == 1
+    assert not orphan.exists()
+    assert any(cache.glob("*.mp3"))
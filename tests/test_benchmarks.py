@@ -0,0 +1,39 @@
+"""Smoke test for the send-pipeline benchmark suite."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_quick_run_writes_report_and_compares(tmp_path):
+    out = tmp_path / "bench.json"
+    cmd = [
+        sys.executable, "-m", "benchmarks", "--quick",
+        "--only", "generate_draft", "--only", "inject_tracking_per_recipient", "--only", "send_bulk",
+    ]
+    subprocess.run([*cmd, "--output", str(out)], cwd=ROOT, check=True, capture_output=True, timeout=120)
+
+    report = json.loads(out.read_text())
+    assert report["suite"] == "weeklyamp-send-pipeline"
+    assert report["meta"]["dataset"]["subscribers"] == 60
+    assert report["meta"]["llm_calls"] > 0  # the stub answered, nothing hit the network
+    assert set(report["stages"]) == {"generate_draft", "inject_tracking_per_recipient", "send_bulk"}
+    send = report["stages"]["send_bulk"]
+    assert send["ops"] == 60 and send["median_s"] > 0 and send["ops_per_s"] > 0
+
+    # A baseline that is impossibly fast makes --compare fail the run.
+    for stage in report["stages"].values():
+        stage["median_s"] = 1e-9
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(report))
+    slow = subprocess.run(
+        [*cmd, "--output", str(out), "--compare", str(baseline)],
+        cwd=ROOT, capture_output=True, text=True, timeout=120,
+    )
+    assert slow.returncode == 1
+    assert "REGRESSION send_bulk" in slow.stderr
@@ -0,0 +1,94 @@
+"""Tests for the cross-worker cache invalidation bus."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from weeklyamp.core import cache_bus, feature_flags
+from weeklyamp.db.repository import Repository
+
+
+@pytest.fixture()
+def bus(monkeypatch):
+    """Fresh bus state with a controllable clock."""
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(cache_bus, "time", SimpleNamespace(monotonic=lambda: clock["now"]))
+    monkeypatch.setattr(cache_bus, "_versions", {})
+    monkeypatch.setattr(cache_bus, "_handlers", {})
+    monkeypatch.setattr(cache_bus, "_next_poll", 0.0)
+    cache_bus._dirty.clear()
+    return clock
+
+
+def test_writes_bump_versions_in_their_transaction(repo):
+    repo.set_feature_flag("paid_tiers", True)
+    repo.set_feature_flag("paid_tiers", False)
+    repo.set_admin_setting("admin_password_hash", "x")
+    repo.invalidate_rendered_pages()
+
+    versions = repo.get_cache_versions()
+    assert versions[cache_bus.FEATURE_FLAGS] == 2
+    assert versions[cache_bus.ADMIN_SETTINGS] == 1
+    assert versions[cache_bus.ISSUES] == 1
+
+
+def test_operational_admin_settings_do_not_bump(repo):
+    from weeklyamp.content.promo import PROMO_SETTINGS_KEY
+    from weeklyamp.db.repository import CACHED_ADMIN_SETTINGS
+
+    assert PROMO_SETTINGS_KEY in CACHED_ADMIN_SETTINGS
+    repo.set_admin_setting("ghl_sync_cursor", "{}")
+    repo.set_admin_setting("backup_watermarks", "{}")
+    assert cache_bus.ADMIN_SETTINGS not in repo.get_cache_versions()
+
+    repo.set_admin_setting(PROMO_SETTINGS_KEY, "{}")
+    assert repo.get_cache_versions()[cache_bus.ADMIN_SETTINGS] == 1
+
+
+def test_poll_runs_handlers_only_for_moved_namespaces(repo, bus):
+    calls: list[str] = []
+    cache_bus.subscribe("feature_flags", lambda: calls.append("flags"))
+    cache_bus.subscribe("domains", lambda: calls.append("domains"))
+    repo.set_feature_flag("paid_tiers", True)
+
+    assert cache_bus.poll(repo) == ["feature_flags"]
+    assert calls == ["flags"]
+
+    # Nothing moved, and the interval throttles the next read anyway.
+    repo.bump_cache_version("domains")
+    assert cache_bus.poll(repo) == []
+
+    bus["now"] += cache_bus.POLL_INTERVAL
+    assert cache_bus.poll(repo) == ["domains"]
+    assert calls == ["flags", "domains"]
+
+
+def test_notify_marks_bus_dirty_before_interval(repo, bus):
+    cache_bus.poll(repo)
+    repo.bump_cache_version("issues")
+    assert not cache_bus.due()
+
+    cache_bus._dirty.set()
+    assert cache_bus.due()
+    assert cache_bus.poll(repo) == ["issues"]
+
+
+def test_flag_toggle_in_other_worker_reaches_this_one(tmp_db, bus):
+    worker_a = Repository(tmp_db)
+    worker_b = Repository(tmp_db)
+    cache_bus.subscribe(cache_bus.FEATURE_FLAGS, feature_flags.invalidate_cache)
+    cache_bus.poll(worker_a)
+    worker_a.set_feature_flag("paid_tiers", False)
+    assert feature_flags.enabled("paid_tiers", repo=worker_a) is False
+
+    # Another worker flips it; this process still holds the old value...
+    worker_b.set_feature_flag("paid_tiers", True)
+    assert feature_flags.enabled("paid_tiers", repo=worker_a) is False
+
+    # ...until its next poll sees the version move.
+    bus["now"] += cache_bus.POLL_INTERVAL
+    cache_bus.poll(worker_a)
+    assert feature_flags.enabled("paid_tiers", repo=worker_a) is True
+    feature_flags.invalidate_cache()
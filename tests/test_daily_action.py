@@ -302,3 +302,80 @@ def test_daily_action_edition_is_seeded(da_repo):
     edition = da_repo.get_edition_by_slug(da.EDITION_SLUG)
     assert edition is not None
     assert edition["is_active"] == 1
+
+
+# ---- Bulk send path ----
+
+def test_bulk_streaks_match_per_subscriber_streaks(da_repo, da_config, monkeypatch):
+    for day in (8, 9, 10):
+        issue = da.build_daily_action(da_repo, da_config, date(2026, 8, day))
+        da.mark_done(da_repo, issue["id"], 7, f"2026-08-{day:02d}")
+        if day != 9:
+            da.mark_done(da_repo, issue["id"], 8, f"2026-08-{day:02d}")
+
+    today = date(2026, 8, 10)
+    streaks = da.streaks_for_subscribers(da_repo, [7, 8, 9], today)
+    assert streaks == {
+        sid: da.streak_for_subscriber(da_repo, sid, today) for sid in (7, 8, 9)
+    }
+    assert streaks == {7: 3, 8: 1, 9: 0}
+    # Large recipient lists are queried in chunks of ids.
+    monkeypatch.setattr(da, "_STREAK_CHUNK", 2)
+    assert da.streaks_for_subscribers(da_repo, [7, 8, 9], today) == streaks
+
+
+def test_send_renders_once_per_streak_and_personalizes_links(
+    da_repo, da_config, monkeypatch
+):
+    da_config.daily_action.require_approval = False
+    on_date = date(2026, 8, 10)
+    issue = da.build_daily_action(da_repo, da_config, on_date)
+    da.mark_done(da_repo, issue["id"], 1, "2026-08-10")
+
+    recipients = [
+        {"id": 1, "email": "a@example.com", "unsubscribe_token": "tok-a"},
+        {"id": 2, "email": "b@example.com", "unsubscribe_token": "tok-b"},
+        {"id": 3, "email": "c@example.com", "unsubscribe_token": ""},
+    ]
+    monkeypatch.setattr(da_repo, "get_subscribers_for_edition", lambda slug: recipients)
+
+    streak_calls = []
+    monkeypatch.setattr(
+        da, "streak_for_subscriber",
+        lambda *a, **k: streak_calls.append(a) or 0,
+    )
+    render_calls = []
+    real_render = da.render_daily_action
+
+    def _counting_render(*args, **kwargs):
+        render_calls.append(kwargs.get("streak"))
+        return real_render(*args, **kwargs)
+
+    monkeypatch.setattr(da, "render_daily_action", _counting_render)
+
+    outputs = {}
+
+    def _fake_send_bulk(self, recipients, subject, html_body, plain_text="",
+                        site_domain="", *, personalize=None):
+        for r in recipients:
+            outputs[r["id"]] = personalize(r)
+        return {"sent": len(recipients), "failed": 0, "errors": []}
+
+    monkeypatch.setattr(
+        "weeklyamp.delivery.smtp_sender.SMTPSender.send_bulk", _fake_send_bulk
+    )
+
+    result = da.send_daily_action(da_repo, da_config, on_date)
+    assert result["sent"] == 3
+    assert streak_calls == []
+    assert sorted(render_calls) == [0, 1]
+
+    html_a, text_a = outputs[1]
+    assert f"/daily/done/{issue['id']}?s=tok-a" in html_a
+    assert "?s=tok-a" in text_a
+    assert "1 day in a row" in html_a
+    assert f"/daily/done/{issue['id']}?s=tok-b" in outputs[2][0]
+    assert "in a row" not in outputs[2][0]
+    html_c, _ = outputs[3]
+    assert "?s=" not in html_c
+    assert da._TOKEN_SLOT not in html_c
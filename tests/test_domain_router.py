@@ -260,3 +260,29 @@ def test_invalidate_cache_forces_rebuild(repo, monkeypatch):
     with TestClient(app) as client:
         r2 = client.get("/", headers={"Host": "late.example"})
     assert r2.json()["licensee_id"] == lid
+
+
+def test_cache_bus_handler_registered_once(repo, monkeypatch):
+    """Each app build makes a new middleware; they share one bus handler,
+    and a domains bump still reaches every live instance."""
+    import gc
+    import weakref
+
+    from weeklyamp.core import cache_bus
+
+    before = list(cache_bus._handlers.get(cache_bus.DOMAINS, []))
+    first = DomainRoutingMiddleware(None, config=_white_label_config())
+    second = DomainRoutingMiddleware(None, config=_white_label_config())
+    assert cache_bus._handlers.get(cache_bus.DOMAINS, []) == before
+
+    for middleware in (first, second):
+        middleware._cache_built = True
+    for fn in cache_bus._handlers[cache_bus.DOMAINS]:
+        fn()
+    assert not first._cache_built and not second._cache_built
+
+    # The bus doesn't keep discarded instances alive.
+    ref = weakref.ref(first)
+    del first
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,230 @@
+"""Tests for the materialized public feeds and archive pages."""
+
+from __future__ import annotations
+
+import pytest
+
+from weeklyamp.db.repository import Repository
+
+
+@pytest.fixture()
+def published(tmp_db):
+    repo = Repository(tmp_db)
+    issue_id = repo.create_issue(7, title="Seventh")
+    repo.save_assembled(issue_id, "<p>Issue seven body</p>", "Issue seven plain text")
+    repo.update_issue_status(issue_id, "published")
+    return repo, issue_id
+
+
+def test_feed_served_with_validators_and_304(client, published):
+    resp = client.get("/feed.xml")
+    assert resp.status_code == 200
+    assert "Issue seven plain text" in resp.text
+    etag = resp.headers["etag"]
+    assert resp.headers["last-modified"].endswith("GMT")
+
+    again = client.get("/feed.xml", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+
+    since = client.get("/feed.xml", headers={"If-Modified-Since": resp.headers["last-modified"]})
+    assert since.status_code == 304
+
+
+def test_json_feed_uses_plain_text(client, published):
+    resp = client.get("/feed.json")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/feed+json")
+    item = resp.json()["items"][0]
+    assert item["content_text"] == "Issue seven plain text"
+
+
+def test_publish_invalidates_materialized_pages(client, published):
+    repo, _ = published
+    first = client.get("/feed.xml")
+    etag = first.headers["etag"]
+
+    new_id = repo.create_issue(8, title="Eighth")
+    repo.save_assembled(new_id, "<p>eight</p>", "Issue eight plain text")
+    repo.update_issue_status(new_id, "published")
+
+    resp = client.get("/feed.xml", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert "Issue eight plain text" in resp.text
+    assert resp.headers["etag"] != etag
+
+
+def test_stale_build_is_not_saved_after_invalidation(published):
+    repo, issue_id = published
+    generation = repo.get_rendered_pages_generation()
+    # An invalidating write lands while the page is being built.
+    repo.update_issue_status(issue_id, "assembled")
+
+    assert repo.save_rendered_page("feed:x", "text/xml", "stale", '"e"', "", generation=generation) is False
+    assert repo.get_rendered_page("feed:x") is None
+
+    fresh = repo.get_rendered_pages_generation()
+    assert repo.save_rendered_page("feed:x", "text/xml", "fresh", '"f"', "", generation=fresh) is True
+    assert repo.get_rendered_page("feed:x")["body"] == "fresh"
+
+
+def test_archive_unknown_edition_not_materialized(client, published):
+    repo, _ = published
+
+    def cached_keys() -> list[str]:
+        conn = repo._conn()
+        rows = conn.execute("SELECT cache_key FROM rendered_pages").fetchall()
+        conn.close()
+        return [r["cache_key"] for r in rows]
+
+    assert client.get("/newsletters/archive", params={"edition": "no-such-edition"}).status_code == 200
+    assert cached_keys() == []
+    client.get("/newsletters/archive", params={"edition": "fan"})
+    assert [k.rsplit(":", 1)[1] for k in cached_keys()] == ["fan"]
+
+
+def test_archive_issue_by_number(client, published):
+    resp = client.get("/newsletters/archive/7")
+    assert resp.status_code == 200
+    assert "Issue seven body" in resp.text
+    assert client.get("/newsletters/archive/99").status_code == 404
+
+
+def test_unpublished_issue_not_in_archive(client, tmp_db):
+    repo = Repository(tmp_db)
+    issue_id = repo.create_issue(3)
+    repo.save_assembled(issue_id, "<p>draft</p>", "draft")
+    assert client.get("/newsletters/archive/3").status_code == 404
+    # The 404 is not materialized: publishing makes the page appear.
+    repo.update_issue_status(issue_id, "published")
+    assert client.get("/newsletters/archive/3").status_code == 200
+
+
+def test_get_assembled_for_issues_returns_latest(repo):
+    a = repo.create_issue(1)
+    b = repo.create_issue(2)
+    repo.save_assembled(a, "<p>old</p>", "old")
+    repo.save_assembled(a, "<p>new</p>", "new")
+    result = repo.get_assembled_for_issues([a, b])
+    assert set(result) == {a}
+    assert result[a]["plain_text"] == "new"
+
+
+def _publish(repo, number, title, plain, edition=""):
+    issue_id = repo.create_issue(number, title=title)
+    if edition:
+        conn = repo._conn()
+        conn.execute("UPDATE issues SET edition_slug = ? WHERE id = ?", (edition, issue_id))
+        conn.commit()
+        conn.close()
+    repo.save_assembled(issue_id, f"<p>{plain}</p>", plain)
+    repo.update_issue_status(issue_id, "published")
+    return issue_id
+
+
+def test_search_archive_ranks_and_snippets(repo):
+    _publish(repo, 1, "Touring on a budget", "Vans, gas money and merch tables.")
+    _publish(repo, 2, "Streaming payouts", "Why touring income beats streaming for most artists.")
+    draft = repo.create_issue(3, title="Touring draft")
+    repo.save_assembled(draft, "<p>x</p>", "touring touring touring")
+
+    rows, total = repo.search_archive("touring")
+    assert total == 2
+    # Title match outranks a body match; unpublished issue is excluded.
+    assert [r["issue_number"] for r in rows] == [1, 2]
+    assert Repository.SEARCH_MARK_START + "touring" in rows[1]["snippet"].lower()
+
+    # Stemming: "tours" finds "touring".
+    assert repo.search_archive("tours")[1] == 2
+    # All terms must match.
+    assert repo.search_archive("touring gas")[1] == 1
+
+
+def test_search_archive_reindexes_and_paginates(repo):
+    for n in range(1, 6):
+        _publish(repo, n, f"Issue {n}", "synth pop roundup", edition="fan" if n % 2 else "artist")
+    rows, total = repo.search_archive("synth", edition_slug="fan", limit=2, offset=2)
+    assert total == 3 and len(rows) == 1
+
+    # Re-assembling replaces the indexed text rather than adding to it.
+    issue = repo.get_issue_by_number(1)
+    repo.save_assembled(issue["id"], "<p>jazz</p>", "jazz night")
+    assert repo.search_archive("synth")[1] == 4
+    assert repo.search_archive("jazz")[1] == 1
+    # Punctuation-only / FTS syntax in user input is not an error.
+    assert repo.search_archive('"*') == ([], 0)
+
+
+def test_archive_search_page_escapes_and_highlights(client, tmp_db):
+    repo = Repository(tmp_db)
+    _publish(repo, 4, "Mixing", "Use <script>alert(1)</script> compression wisely.")
+    resp = client.get("/newsletters/archive", params={"q": "compression"})
+    assert resp.status_code == 200
+    assert "<mark>compression</mark>" in resp.text
+    assert "<script>alert(1)</script>" not in resp.text
+    assert "1 result for" in resp.text
+
+
+@pytest.fixture()
+def audio_file(tmp_path, monkeypatch):
+    from weeklyamp.content import audio
+    monkeypatch.setattr(audio, "AUDIO_DIR", tmp_path)
+    data = bytes(range(256)) * 40  # 10,240 bytes
+    (tmp_path / "issue_5.mp3").write_bytes(data)
+    return data
+
+
+def test_audio_range_requests(client, audio_file):
+    full = client.get("/audio/5")
+    assert full.status_code == 200
+    assert full.content == audio_file
+    assert full.headers["accept-ranges"] == "bytes"
+    etag = full.headers["etag"]
+
+    part = client.get("/audio/5", headers={"Range": "bytes=100-199"})
+    assert part.status_code == 206
+    assert part.content == audio_file[100:200]
+    assert part.headers["content-range"] == f"bytes 100-199/{len(audio_file)}"
+
+    tail = client.get("/audio/5", headers={"Range": "bytes=-10"})
+    assert tail.status_code == 206 and tail.content == audio_file[-10:]
+
+    bad = client.get("/audio/5", headers={"Range": "bytes=99999-"})
+    assert bad.status_code == 416
+    assert bad.headers["content-range"] == f"bytes */{len(audio_file)}"
+
+    # A stale If-Range validator gets the whole file.
+    stale = client.get("/audio/5", headers={"Range": "bytes=0-9", "If-Range": '"old"'})
+    assert stale.status_code == 200 and len(stale.content) == len(audio_file)
+
+    assert client.get("/audio/5", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/audio/6").status_code == 404
+
+
+def test_audio_range_on_empty_file_is_not_satisfiable(client, tmp_path, monkeypatch):
+    from weeklyamp.content import audio
+    monkeypatch.setattr(audio, "AUDIO_DIR", tmp_path)
+    (tmp_path / "issue_6.mp3").write_bytes(b"")
+
+    for header in ("bytes=-10", "bytes=0-"):
+        resp = client.get("/audio/6", headers={"Range": header})
+        assert resp.status_code == 416
+        assert resp.headers["content-range"] == "bytes */0"
+
+
+def test_podcast_feed_materialized_and_invalidated(client, tmp_db, audio_file):
+    repo = Repository(tmp_db)
+    issue_id = repo.create_issue(5)
+    audio_id = repo.create_audio_issue(issue_id)
+
+    empty = client.get("/feed/podcast.xml")
+    assert empty.status_code == 200
+    assert "<item>" not in empty.text
+    assert client.get("/feed/podcast.xml", headers={"If-None-Match": empty.headers["etag"]}).status_code == 304
+
+    repo.update_audio_issue(audio_id, audio_url=f"/audio/{issue_id}", status="complete",
+                            file_size_bytes=len(audio_file), duration_seconds=42)
+    resp = client.get("/feed/podcast.xml", headers={"If-None-Match": empty.headers["etag"]})
+    assert resp.status_code == 200
+    assert f'length="{len(audio_file)}"' in resp.text
+    assert "<itunes:duration>42</itunes:duration>" in resp.text
@@ -0,0 +1,202 @@
+"""Tests for the streaming GHL subscriber sync and concurrent push."""
+
+from __future__ import annotations
+
+import functools
+import json
+import threading
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from weeklyamp.core.models import GHLConfig
+from weeklyamp.delivery import ghl
+from weeklyamp.delivery.subscribers import SYNC_CURSOR_KEY, push_subscribers_to_ghl, sync_subscribers
+
+TAG = "newsletter-fan"
+
+
+def _contact(n: int, tags=(TAG,)) -> dict:
+    return {"id": f"c{n}", "email": f"user{n}@example.com", "tags": list(tags)}
+
+
+@pytest.fixture()
+def api(monkeypatch):
+    state = {
+        "contacts": [_contact(n) for n in range(1, 8)] + [_contact(99, tags=("other",))],
+        "requests": [],
+        "throttle": 0,
+        # Real GHL leaves meta empty on the final page.
+        "meta_on_last_page": True,
+    }
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            state["requests"].append(request)
+            if state["throttle"]:
+                state["throttle"] -= 1
+                return httpx.Response(429, headers={"Retry-After": "0"})
+        if request.method == "POST" and request.url.path == "/contacts/":
+            body = json.loads(request.content)
+            if body["email"].startswith("bad"):
+                return httpx.Response(422, json={})
+            return httpx.Response(200, json={"contact": {"id": "ghl-" + body["email"]}})
+        contacts = state["contacts"]
+        limit = int(request.url.params["limit"])
+        after = request.url.params.get("startAfterId", "")
+        start = next((i + 1 for i, c in enumerate(contacts) if c["id"] == after), 0)
+        page = contacts[start:start + limit]
+        meta = {"startAfterId": page[-1]["id"], "startAfter": 1000 + start} if page else {}
+        if start + limit >= len(contacts) and not state["meta_on_last_page"]:
+            meta = {}
+        return httpx.Response(200, json={"contacts": page, "meta": meta})
+
+    monkeypatch.setattr(
+        ghl.httpx, "Client",
+        functools.partial(httpx.Client, transport=httpx.MockTransport(handler)),
+    )
+    monkeypatch.setattr(ghl, "_limiters", {})
+    return state
+
+
+def _config(**kw) -> GHLConfig:
+    return GHLConfig(
+        api_key="k", location_id="loc", edition_tags={"fan": TAG},
+        requests_per_second=1000, burst=50, page_size=3, **kw,
+    )
+
+
+def test_sync_streams_pages_and_saves_cursor(repo, api):
+    result = sync_subscribers(repo, _config())
+
+    assert result == {"synced": 7, "new": 7, "unsubscribed": 0, "total": 7}
+    assert repo.get_subscriber_by_email("user99@example.com") is None
+    assert repo.get_subscriber_by_email("user3@example.com")["ghl_contact_id"] == "c3"
+    cursor = json.loads(repo.get_admin_setting(SYNC_CURSOR_KEY))
+    assert cursor["start_after_id"] == "c99"
+    # Three full pages plus the empty one that ends the listing.
+    assert len(api["requests"]) == 4
+
+
+def test_incremental_sync_only_reads_new_contacts(repo, api):
+    sync_subscribers(repo, _config())
+    api["contacts"].append(_contact(100))
+    api["requests"].clear()
+
+    result = sync_subscribers(repo, _config())
+
+    assert result == {"synced": 1, "new": 1, "unsubscribed": 0, "total": 8}
+    assert api["requests"][0].url.params["startAfterId"] == "c99"
+
+
+def test_cursor_advances_past_final_page_without_meta(repo, api):
+    api["meta_on_last_page"] = False
+    api["contacts"][-1]["dateAdded"] = "2026-10-01T12:00:00.000Z"
+    sync_subscribers(repo, _config())
+    cursor = json.loads(repo.get_admin_setting(SYNC_CURSOR_KEY))
+    assert (cursor["start_after_id"], cursor["start_after"]) == ("c99", "1790856000000")
+
+    api["requests"].clear()
+    result = sync_subscribers(repo, _config())
+
+    # The last page is not read again.
+    assert result["synced"] == 0
+    assert api["requests"][0].url.params["startAfterId"] == "c99"
+
+
+def test_full_sync_ignores_cursor(repo, api):
+    sync_subscribers(repo, _config())
+    result = sync_subscribers(repo, _config(), full=True)
+    assert result == {"synced": 7, "new": 0, "unsubscribed": 0, "total": 7}
+
+
+def test_full_pass_picks_up_changes_to_synced_contacts(repo, api):
+    sync_subscribers(repo, _config())
+    api["contacts"][0]["tags"] = ["other"]            # c1 untagged in GHL
+    api["contacts"][1]["dnd"] = True                  # c2 marked do-not-disturb
+    api["contacts"][2]["email"] = "renamed3@example.com"  # c3 changed email
+
+    # The incremental cursor is past them, so nothing changes...
+    assert sync_subscribers(repo, _config())["unsubscribed"] == 0
+    # ...until a full pass re-reads every contact.
+    result = sync_subscribers(repo, _config(), full=True)
+
+    assert result["unsubscribed"] == 3
+    status = {e: repo.get_subscriber_by_email(e)["status"] for e in (
+        "user1@example.com", "user2@example.com", "user3@example.com", "renamed3@example.com",
+    )}
+    assert status == {
+        "user1@example.com": "unsubscribed", "user2@example.com": "unsubscribed",
+        "user3@example.com": "unsubscribed", "renamed3@example.com": "active",
+    }
+
+
+def test_full_pass_runs_when_due(repo, api, monkeypatch):
+    from weeklyamp.delivery import subscribers
+
+    sync_subscribers(repo, _config())
+    api["requests"].clear()
+    assert sync_subscribers(repo, _config())["synced"] == 0
+    assert "startAfterId" in api["requests"][0].url.params
+
+    # A day later the next run starts over from the first contact.
+    now = subscribers.time.time()
+    monkeypatch.setattr(subscribers.time, "time", lambda: now + 25 * 3600)
+    api["requests"].clear()
+    assert sync_subscribers(repo, _config())["synced"] == 7
+    assert "startAfterId" not in api["requests"][0].url.params
+    assert sync_subscribers(repo, _config())["synced"] == 0
+
+
+def test_sync_route_full_option(client, repo, api, monkeypatch):
+    from weeklyamp.web.routes import subscribers as routes
+
+    calls = []
+    monkeypatch.setattr(routes, "get_config", lambda: SimpleNamespace(ghl=_config()))
+    monkeypatch.setattr(routes, "sync_subscribers", lambda repo, cfg, full=False: calls.append(full) or {
+        "synced": 0, "new": 0, "unsubscribed": 0, "total": 0,
+    })
+    client.get("/subscribers/")
+    headers = {"X-CSRF-Token": client.cookies.get("_csrf", "")}
+    client.post("/subscribers/sync", data={}, headers=headers)
+    client.post("/subscribers/sync", data={"full": "1"}, headers=headers)
+    assert calls == [False, True]
+
+
+def test_sync_retries_after_429(repo, api):
+    api["throttle"] = 2
+    result = sync_subscribers(repo, _config())
+    assert result["synced"] == 7
+
+
+def test_push_is_concurrent_and_writes_ids(repo, api):
+    for email in ("a@example.com", "b@example.com", "bad@example.com"):
+        repo.upsert_subscriber(email)
+    repo.upsert_subscriber("linked@example.com", ghl_contact_id="existing")
+
+    result = push_subscribers_to_ghl(repo, _config(push_concurrency=3))
+
+    assert result == {"pushed": 2, "skipped": 1, "errors": 1}
+    assert repo.get_subscriber_by_email("a@example.com")["ghl_contact_id"] == "ghl-a@example.com"
+    assert repo.get_subscriber_by_email("bad@example.com")["ghl_contact_id"] in ("", None)
+
+
+def test_token_bucket_limits_rate(monkeypatch):
+    clock = {"now": 0.0}
+    slept: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(ghl, "time", SimpleNamespace(monotonic=lambda: clock["now"], sleep=fake_sleep))
+
+    bucket = ghl.TokenBucket(rate=4, capacity=5)
+    for _ in range(13):
+        bucket.acquire()
+
+    # The burst is free; the next eight tokens take two seconds at 4/s.
+    assert clock["now"] == pytest.approx(2.0)
+    assert len(slept) == 8
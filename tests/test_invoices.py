@@ -0,0 +1,71 @@
+"""Tests for sequence-backed invoice numbering and the monthly invoice run."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from weeklyamp.billing.invoices import InvoiceManager
+from weeklyamp.core.models import AppConfig, ArtistNewslettersConfig, LicensingConfig
+
+
+@pytest.fixture()
+def mgr(repo):
+    config = AppConfig(
+        licensing=LicensingConfig(enabled=True),
+        artist_newsletters=ArtistNewslettersConfig(enabled=True),
+    )
+    return InvoiceManager(repo, config)
+
+
+def _licensee(repo, n: int, status: str = "active") -> int:
+    lid = repo.create_licensee(
+        f"Co {n}", f"Contact {n}", f"lic{n}@example.com", "hash",
+        city_market_slug=f"city-{n}", edition_slugs="fan", license_fee_cents=10000,
+    )
+    repo.update_licensee_status(lid, status)
+    return lid
+
+
+def test_invoice_numbers_come_from_per_prefix_sequence(repo):
+    assert repo.next_invoice_number("SUB", "202610") == "SUB-202610-00001"
+    assert repo.next_invoice_number("SUB", "202610") == "SUB-202610-00002"
+    assert repo.next_invoice_number("NEW", "202610") == "NEW-202610-00001"
+
+
+def test_monthly_run_bills_each_active_licensee_once(repo, mgr):
+    paid = _licensee(repo, 1)
+    _licensee(repo, 2)
+    _licensee(repo, 3, status="suspended")
+    repo.create_license_revenue(paid, "2026-09", sponsor_cents=50000, share_pct=20.0)
+    repo.create_license_revenue(paid, "2026-10", sponsor_cents=99900)
+
+    ids = mgr.generate_all_licensee_invoices("2026-09")
+
+    assert len(ids) == 2
+    invoices = {inv["entity_id"]: inv for inv in repo.get_invoices(entity_type="licensee")}
+    assert invoices[paid]["amount_cents"] == 10000 + 10000
+    assert [i["amount_cents"] for i in json.loads(invoices[paid]["line_items_json"])] == [10000, 10000]
+    assert len({inv["invoice_number"] for inv in invoices.values()}) == 2
+
+    # Re-running the job (or billing one licensee by hand) never double-bills.
+    assert mgr.generate_all_licensee_invoices("2026-09") == []
+    assert mgr.generate_licensee_invoice(paid, "2026-09") is None
+    assert len(mgr.generate_all_licensee_invoices("2026-10")) == 2
+
+
+def test_artist_newsletter_run_tiers_by_subscribers(repo, mgr):
+    nid = repo.create_artist_newsletter("Band", "band")
+    repo.update_artist_newsletter(nid, status="active")
+    for n in range(3):
+        repo.add_artist_nl_subscriber(nid, f"fan{n}@example.com")
+
+    ids = mgr.generate_all_artist_newsletter_invoices("2026-09")
+
+    assert len(ids) == 1
+    invoice = repo.get_invoice(ids[0])
+    assert invoice["amount_cents"] == 3000
+    assert invoice["invoice_number"].startswith("ART-")
+    assert "Subscribers: 3" in invoice["line_items_json"]
+    assert mgr.generate_all_artist_newsletter_invoices("2026-09") == []
@@ -0,0 +1,141 @@
+"""Tests for hot-path instrumentation and the /metrics endpoint."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from weeklyamp.core import metrics
+from weeklyamp.core.models import AppConfig
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    metrics.reset()
+    metrics.configure()
+    yield
+    metrics.reset()
+    metrics.configure()
+
+
+def _value(text: str, prefix: str) -> float:
+    """Sum every sample line starting with ``prefix``."""
+    return sum(float(line.rsplit(" ", 1)[1]) for line in text.splitlines() if line.startswith(prefix))
+
+
+def test_render_counters_and_cumulative_histograms():
+    metrics.inc("weeklyamp_smtp_messages_total", 3, outcome="sent")
+    metrics.observe("weeklyamp_smtp_send_duration_seconds", 0.003)
+    metrics.observe("weeklyamp_smtp_send_duration_seconds", 0.2)
+
+    text = metrics.render()
+    assert "# TYPE weeklyamp_smtp_messages_total counter" in text
+    assert 'weeklyamp_smtp_messages_total{outcome="sent"} 3' in text
+    assert 'weeklyamp_smtp_send_duration_seconds_bucket{le="0.001"} 0' in text
+    assert 'weeklyamp_smtp_send_duration_seconds_bucket{le="0.005"} 1' in text
+    assert 'weeklyamp_smtp_send_duration_seconds_bucket{le="0.25"} 2' in text
+    assert 'weeklyamp_smtp_send_duration_seconds_bucket{le="+Inf"} 2' in text
+    assert "weeklyamp_smtp_send_duration_seconds_count 2" in text
+
+
+def test_repository_queries_are_counted_per_scope_and_slow_ones_logged(repo, caplog):
+    metrics.configure(slow_query_ms=0.000001)
+    with caplog.at_level(logging.WARNING, logger="weeklyamp.slow_query"):
+        with metrics.query_scope() as tally:
+            repo.get_issue(1)
+            repo.get_editions()
+
+    assert tally[0] == 2
+    text = metrics.render()
+    assert _value(text, 'weeklyamp_db_queries_total{kind="select"}') >= 2
+    assert _value(text, "weeklyamp_db_slow_queries_total") >= 2
+    assert any("SELECT * FROM issues WHERE id = ?" in r.getMessage() for r in caplog.records)
+
+
+def test_llm_calls_are_timed_by_caller(monkeypatch):
+    from weeklyamp.content import generator
+
+    monkeypatch.setattr(generator, "_generate_anthropic", lambda *a: ("prose", "claude-test", 42))
+    monkeypatch.setattr(generator, "_generate_openai", lambda *a: ("", "gpt-test", 0))
+    config = AppConfig()
+
+    with metrics.llm_caller("writer"):
+        generator.generate_draft_with_usage("prompt", config)
+    config.ai.provider = "openai"
+    generator.generate_draft("prompt", config)
+
+    text = metrics.render()
+    assert _value(text, 'weeklyamp_llm_tokens_total{caller="writer",model="claude-test",provider="anthropic"}') == 42
+    assert 'caller="writer",model="claude-test",outcome="ok",provider="anthropic"' in text
+    assert 'caller="app",model="gpt-test",outcome="error",provider="openai"' in text
+
+
+def test_job_records_outcome_and_queries(repo):
+    with metrics.job("demo"):
+        repo.get_editions()
+    with pytest.raises(RuntimeError):
+        with metrics.job("demo"):
+            raise RuntimeError("boom")
+
+    text = metrics.render()
+    assert 'weeklyamp_job_duration_seconds_count{job="demo",outcome="ok"} 1' in text
+    assert 'weeklyamp_job_duration_seconds_count{job="demo",outcome="error"} 1' in text
+    assert _value(text, 'weeklyamp_job_db_queries_sum{job="demo"}') == 1
+
+
+def test_failing_scheduler_job_is_logged_and_recorded_as_error(monkeypatch, caplog):
+    from weeklyamp.workers import scheduler
+
+    registered = {}
+    monkeypatch.setattr(scheduler, "_scheduler", type("S", (), {
+        "add_job": lambda self, fn, trigger, id, **kw: registered.setdefault(id, fn),
+    })())
+
+    def broken():
+        raise RuntimeError("no repo")
+
+    monkeypatch.setattr("weeklyamp.web.deps.get_repo", broken)
+    scheduler._add_job(scheduler._reconcile_subscriber_counters, "interval", id="subscriber_counters")
+    with caplog.at_level(logging.ERROR, logger="weeklyamp.workers.scheduler"):
+        registered["subscriber_counters"]()  # must not raise
+    assert "subscriber_counters failed" in caplog.text
+
+    text = metrics.render()
+    assert 'weeklyamp_job_duration_seconds_count{job="subscriber_counters",outcome="error"} 1' in text
+    assert 'job="subscriber_counters",outcome="ok"' not in text
+
+
+def test_requests_are_recorded_by_route_template(client):
+    client.get("/health")
+    client.get("/no-such-page")
+
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = resp.text
+    assert 'weeklyamp_http_requests_total{method="GET",route="/health",status="200"} 1' in text
+    assert 'route="unmatched",status="404"' in text
+    assert _value(text, 'weeklyamp_http_request_db_queries_sum{route="/health"}') >= 1
+
+
+def test_mounted_routes_are_labelled_with_their_prefix(client):
+    # Admin routers are mounted lazily, so the route path is relative to the mount.
+    assert client.get("/admin/calculator/").status_code == 200
+
+    text = client.get("/metrics").text
+    assert 'weeklyamp_http_requests_total{method="GET",route="/admin/calculator/",status="200"} 1' in text
+    assert 'route="/",' not in text
+
+
+def test_metrics_endpoint_requires_admin_or_token(client, monkeypatch):
+    import weeklyamp.web.security as sec
+
+    monkeypatch.setattr(sec, "is_authenticated", lambda request: False)
+    monkeypatch.setenv("WEEKLYAMP_METRICS_TOKEN", "scrape-secret")
+
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    resp = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert resp.status_code == 200
+    assert "# TYPE weeklyamp_http_requests_total counter" in resp.text
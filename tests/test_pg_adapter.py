@@ -0,0 +1,110 @@
+"""Tests for the Postgres adapter's statement cache, prepared statements
+and tuple rows. No server is needed: the raw psycopg2 connection is a
+fake that records what would be sent."""
+
+from __future__ import annotations
+
+import psycopg2
+import pytest
+
+from weeklyamp.db import postgres
+from weeklyamp.db.postgres import PgConnection, PgRow
+from weeklyamp.db.repository import _PgConnAdapter, _translate
+
+
+class _FakeCursor:
+    def __init__(self, conn, tuple_rows):
+        self.conn = conn
+        self.tuple_rows = tuple_rows
+        self.description = [("id",), ("name",)]
+        self.rowcount = 1
+
+    def execute(self, sql, params=None):
+        if sql.startswith("PREPARE") and self.conn.refuse_prepare:
+            raise psycopg2.ProgrammingError("could not determine data type of parameter $1")
+        self.conn.sent.append((sql, params))
+
+    def fetchone(self):
+        return (7, "a") if self.tuple_rows else {"id": 7, "name": "a"}
+
+    def fetchall(self):
+        return [(1, "a"), (2, "b")] if self.tuple_rows else [{"id": 1, "name": "a"}]
+
+
+class _FakeRawConn:
+    def __init__(self):
+        self.sent = []
+        self.refuse_prepare = False
+
+    def cursor(self, cursor_factory=None):
+        return _FakeCursor(self, tuple_rows=cursor_factory is None)
+
+
+def _conn(raw):
+    conn = PgConnection.__new__(PgConnection)
+    conn._conn = raw
+    return conn
+
+
+def test_translate_is_cached_and_adds_returning():
+    sql = "INSERT INTO t (a) VALUES (?)"
+    assert _translate(sql) == ("INSERT INTO t (a) VALUES (%s) RETURNING id", True)
+    hits = _translate.cache_info().hits
+    _translate(sql)
+    assert _translate.cache_info().hits == hits + 1
+    assert _translate("SELECT * FROM t WHERE a = ?") == ("SELECT * FROM t WHERE a = %s", False)
+
+
+def test_hot_statement_prepared_once_per_connection(monkeypatch):
+    monkeypatch.setattr(postgres, "_PREPARE_THRESHOLD", 2)
+    monkeypatch.setattr(postgres, "_statement_uses", {})
+    raw = _FakeRawConn()
+    conn = _conn(raw)
+    sql = "SELECT * FROM t WHERE a = %s AND b LIKE '%%x'"
+    name, pg_sql = postgres._prepared_form(sql)
+    assert pg_sql == "SELECT * FROM t WHERE a = $1 AND b LIKE '%x'"
+
+    for _ in range(3):
+        conn.execute(sql, (1,))
+
+    sent = [s for s, _ in raw.sent]
+    assert sent[0] == sql
+    assert sent.count(f"PREPARE {name} AS {pg_sql}") == 1
+    assert sent.count(f"EXECUTE {name} (%s)") == 2
+    # Unparameterized statements are never prepared.
+    conn.execute("SELECT 1")
+    assert raw.sent[-1] == ("SELECT 1", None)
+
+
+def test_unpreparable_statement_falls_back(monkeypatch):
+    monkeypatch.setattr(postgres, "_PREPARE_THRESHOLD", 1)
+    monkeypatch.setattr(postgres, "_statement_uses", {})
+    monkeypatch.setattr(postgres, "_unpreparable", set())
+    raw = _FakeRawConn()
+    raw.refuse_prepare = True
+    conn = _conn(raw)
+
+    conn.execute("SELECT %s", (1,))
+    conn.execute("SELECT %s", (1,))
+
+    sent = [s for s, _ in raw.sent]
+    assert "ROLLBACK TO SAVEPOINT weeklyamp_prepare" in sent
+    assert sent.count("SAVEPOINT weeklyamp_prepare") == 1
+    assert sent[-1] == "SELECT %s"
+
+
+def test_tuple_rows_read_like_dicts(monkeypatch):
+    monkeypatch.setattr(postgres, "_TUPLE_ROWS", True)
+    conn = _conn(_FakeRawConn())
+
+    rows = conn.execute("SELECT id, name FROM t").fetchall()
+    assert isinstance(rows[0], PgRow)
+    assert type(rows[0]) is type(rows[1])
+    assert rows[1]["name"] == "b" and rows[1][0] == 2
+    assert dict(rows[0]) == {"id": 1, "name": "a"}
+    assert "id" in rows[0] and rows[0].get("missing") is None
+
+    cur = _PgConnAdapter(conn).execute("INSERT INTO t (name) VALUES (?)", ("a",))
+    assert cur.lastrowid == 7
+    with pytest.raises(KeyError):
+        rows[0]["missing"]
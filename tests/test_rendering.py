@@ -0,0 +1,98 @@
+"""Tests for the content-hash keyed markdown render cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from weeklyamp.content import rendering
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    rendering.clear_cache()
+    yield
+    rendering.clear_cache()
+
+
+@pytest.fixture()
+def render_calls(monkeypatch):
+    """Count real markdown + bleach conversions."""
+    calls: list[str] = []
+    real = rendering._render
+
+    def counting(text):
+        calls.append(text)
+        return real(text)
+
+    monkeypatch.setattr(rendering, "_render", counting)
+    return calls
+
+
+def test_draft_writes_persist_whole_and_body_renderings(repo):
+    issue_id = repo.create_issue(issue_number=1)
+    content = "## Headline\n\nFirst *draft*."
+    draft_id = repo.create_draft(issue_id, "backstage_pass", content)
+
+    whole, body = rendering.content_hash(content), rendering.content_hash("First *draft*.")
+    stored = repo.get_rendered_markdown([whole, body])
+    assert stored[body] == "<p>First <em>draft</em>.</p>"
+    assert "<h2>Headline</h2>" in stored[whole]
+
+    repo.update_draft_content(draft_id, "Edited <script>alert(1)</script>")
+    edited = repo.get_rendered_markdown([rendering.content_hash("Edited <script>alert(1)</script>")])
+    assert list(edited.values()) == ["<p>Edited alert(1)</p>"]
+
+
+def test_many_prefers_cache_then_persisted_rows_and_saves_misses(repo, render_calls):
+    repo.save_rendered_markdown([(rendering.content_hash("stored"), "<p>from db</p>")])
+
+    assert rendering.markdown_to_html_many(["stored", "fresh", "fresh"], processes=1, repo=repo) == [
+        "<p>from db</p>", "<p>fresh</p>", "<p>fresh</p>",
+    ]
+    assert render_calls == ["fresh"]
+    assert repo.get_rendered_markdown([rendering.content_hash("fresh")])
+
+    rendering.markdown_to_html("fresh")
+    rendering.markdown_to_html_many(["stored", "fresh"], repo=repo)
+    assert render_calls == ["fresh"]
+
+
+def test_cache_is_bounded_lru(monkeypatch, render_calls):
+    monkeypatch.setattr(rendering, "_CACHE_SIZE", 2)
+    rendering.markdown_to_html("a")
+    rendering.markdown_to_html("b")
+    rendering.markdown_to_html("a")  # refresh a; b is now oldest
+    rendering.markdown_to_html("c")
+    rendering.markdown_to_html("a")
+    rendering.markdown_to_html("b")
+    assert render_calls == ["a", "b", "c", "b"]
+
+
+def test_review_page_uses_renderings_saved_with_the_draft(client, tmp_db, render_calls):
+    from weeklyamp.db.repository import Repository
+
+    repo = Repository(tmp_db)
+    issue_id = repo.create_issue(issue_number=999)
+    repo.create_draft(issue_id, "backstage_pass", "Persisted **review** body.")
+    rendering.clear_cache()
+    render_calls.clear()
+
+    resp = client.get("/review/")
+    assert resp.status_code == 200
+    assert "Persisted <strong>review</strong> body." in resp.text
+    assert render_calls == []
+
+
+def test_prune_drops_old_persisted_renderings(repo):
+    old, recent = rendering.content_hash("old"), rendering.content_hash("recent")
+    repo.save_rendered_markdown([(old, "<p>old</p>"), (recent, "<p>recent</p>")])
+    conn = repo._conn()
+    conn.execute("UPDATE rendered_markdown SET created_at = '2020-01-01 00:00:00' WHERE content_hash = ?", (old,))
+    conn.commit()
+    conn.close()
+
+    assert repo.prune_rendered_markdown(rendering.PERSISTED_MAX_AGE_DAYS) == 1
+    assert repo.get_rendered_markdown([old, recent]) == {recent: "<p>recent</p>"}
+    # Still-used content is rendered and stored again on its next use.
+    rendering.markdown_to_html_many(["old"], processes=1, repo=repo)
+    assert repo.get_rendered_markdown([old]) == {old: "<p>old</p>"}
@@ -0,0 +1,106 @@
+"""Tests for the anonymous public-page response cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from weeklyamp.web.middleware.response_cache import ResponseCache, _Entry
+
+
+@pytest.fixture()
+def anon_client(client, monkeypatch):
+    """The app client with an admin password set, so requests are anonymous."""
+    import weeklyamp.web.security as sec
+    monkeypatch.setenv("WEEKLYAMP_ADMIN_HASH", sec.hash_password("test-password"))
+    sec._cached_admin_hash = None
+    return client
+
+
+def _entry(tags=("site",), size=10) -> _Entry:
+    return _Entry(
+        body=b"x" * size, gzipped=None, headers=[], etag='"e"',
+        last_modified="", expires=float("inf"), tags=tags,
+    )
+
+
+def test_anonymous_page_is_served_from_cache_with_etag(anon_client):
+    first = anon_client.get("/samples")
+    second = anon_client.get("/samples")
+
+    assert first.status_code == 200
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.text == first.text
+    assert second.headers["content-encoding"] == "gzip"
+    assert "Cookie" in second.headers["vary"]
+
+    revalidated = anon_client.get("/samples", headers={"If-None-Match": first.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+
+def test_cache_key_includes_host(anon_client):
+    anon_client.get("/samples")
+    other = anon_client.get("/samples", headers={"Host": "tenant.example.com"})
+    assert other.headers["x-cache"] == "MISS"
+
+
+def test_authenticated_and_uncached_routes_bypass(anon_client, monkeypatch):
+    assert "x-cache" not in anon_client.get("/health").headers
+
+    # A forged session cookie is still anonymous.
+    anon_client.cookies.set("_session", "not-a-valid-session")
+    assert anon_client.get("/samples").headers["x-cache"] == "MISS"
+
+    # With auth disabled every visitor counts as an admin: never cached.
+    import weeklyamp.web.security as sec
+    monkeypatch.delenv("WEEKLYAMP_ADMIN_HASH")
+    sec._cached_admin_hash = None
+    assert "x-cache" not in anon_client.get("/samples").headers
+
+
+def test_issue_write_invalidates_archive(anon_client, repo):
+    anon_client.get("/newsletters/archive")
+    assert anon_client.get("/newsletters/archive").headers["x-cache"] == "HIT"
+
+    repo.invalidate_rendered_pages()
+
+    assert anon_client.get("/newsletters/archive").headers["x-cache"] == "MISS"
+
+
+def test_store_evicts_lru_and_drops_by_tag():
+    cache = ResponseCache(max_entries=2)
+    cache.put(("h", "/a", ""), _entry(("issues",)))
+    cache.put(("h", "/b", ""), _entry())
+    cache.get(("h", "/a", ""))
+    cache.put(("h", "/c", ""), _entry())
+
+    assert cache.get(("h", "/b", "")) is None
+    assert cache.invalidate("issues") == 1
+    assert cache.invalidate() == 1
+    assert len(cache) == 0
+
+
+def test_store_respects_byte_budget():
+    cache = ResponseCache(max_entries=10, max_bytes=25)
+    for path in ("/a", "/b", "/c"):
+        cache.put(("h", path, ""), _entry(size=10))
+
+    assert len(cache) == 2
+    assert cache.get(("h", "/a", "")) is None
+
+
+def test_content_change_listeners_run_after_commit(repo, monkeypatch):
+    from weeklyamp.db import repository
+
+    issue_id = repo.create_issue(5)
+    seen: list[str] = []
+    # A listener that re-reads must see the committed write.
+    monkeypatch.setattr(
+        repository, "_content_change_listeners",
+        [lambda: seen.append(repository.Repository(repo.db_path).get_issue(issue_id)["status"])],
+    )
+
+    repo.update_issue_status(issue_id, "published")
+
+    assert seen == ["published"]
@@ -0,0 +1,73 @@
+"""Tests for scene-graph entity extraction and batch indexing."""
+
+from __future__ import annotations
+
+import re
+
+from weeklyamp.analytics import scene_graph as sg
+
+
+def test_city_matcher_matches_per_city_regex():
+    cities = {"York", "New York", "Kansas", "Kansas City", "St. Louis", "Rio de Janeiro", "Austin"}
+    matcher = sg._CityMatcher(cities)
+    text = ("From new york to Kansas City, then St. Louis and Rio De Janeiro; "
+            "Austinite fans skip Austin's queue.")
+    expected = {c for c in cities if re.search(r"\b" + re.escape(c) + r"\b", text, re.IGNORECASE)}
+    assert set(matcher.find(text)) == expected
+    assert matcher.find("Nowhere special") == []
+
+
+def test_tagged_artists_attributed_to_their_section():
+    html = (
+        "<h2>Spotlight</h2><p><strong>Maya Rivers</strong> played live at The Rialto tonight "
+        "in Tucson.</p>"
+        "<h2>Industry News</h2><p>Catalog deals via <a href='#'>Big Label Group</a>, "
+        "produced by Sam Hollis.</p>"
+    )
+    entities = sg.extract_entities_from_html(html)
+    by_section = {}
+    for e in entities:
+        by_section.setdefault(e["section_slug"], set()).add((e["name"], e["entity_type"]))
+
+    assert ("Maya Rivers", "artist") in by_section["spotlight"]
+    assert ("Tucson", "city") in by_section["spotlight"]
+    assert ("Maya Rivers", "artist") not in by_section["industry-news"]
+    assert ("Big Label Group", "artist") in by_section["industry-news"]
+    assert ("Big Label Group", "artist") not in by_section["spotlight"]
+
+
+def test_index_issues_parallel_matches_single(repo):
+    html = "<h2>Scene</h2><p><b>Neon Choir</b> live at The Fillmore tonight in Denver.</p>"
+    ids = []
+    for n in range(1, 4):
+        issue_id = repo.create_issue(n)
+        repo.save_assembled(issue_id, html, "")
+        ids.append(issue_id)
+    missing = repo.create_issue(9)
+
+    single = sg.index_issue(repo, ids[0])
+    batch = sg.index_issues(repo, ids + [missing], workers=2)
+
+    assert batch[ids[0]] == single
+    assert all(batch[i] == single for i in ids)
+    assert batch[missing] == {"entities_found": 0, "connections_found": 0}
+    assert single["entities_found"] >= 3
+
+
+def test_index_issues_falls_back_inline_when_pool_fails(repo, monkeypatch):
+    import concurrent.futures
+
+    def broken_pool(*args, **kwargs):
+        raise OSError("no processes here")
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", broken_pool)
+    html = "<h2>Scene</h2><p><b>Neon Choir</b> live at The Fillmore tonight in Denver.</p>"
+    ids = []
+    for n in range(1, 3):
+        issue_id = repo.create_issue(n)
+        repo.save_assembled(issue_id, html, "")
+        ids.append(issue_id)
+
+    batch = sg.index_issues(repo, ids, workers=2)
+
+    assert all(batch[i]["entities_found"] >= 3 for i in ids)
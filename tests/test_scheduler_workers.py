@@ -7,8 +7,9 @@ so the highest-value tests are:
   1. start_scheduler is gated correctly by WEEKLYAMP_WORKERS_ENABLED
   2. When enabled, the expected jobs are registered
   3. stop_scheduler is safe to call when nothing is running
-  4. Each job swallows exceptions (the scheduler must never crash on a
-     bad job — better to log + continue than to take down all jobs)
+  4. A failing job is caught by the `_add_job` wrapper (the scheduler must
+     never crash on a bad job — better to log + continue than to take
+     down all jobs)
   5. Each feature-flagged job is a no-op when its flag is off
 """
 
@@ -119,9 +120,18 @@ def _cfg(**overrides):
     return base
 
 
+def _run_registered(fn):
+    """Register ``fn`` through ``_add_job`` and run it the way the scheduler would."""
+    registered = {}
+    fake = SimpleNamespace(add_job=lambda run, trigger, id, **kw: registered.setdefault(id, run))
+    with patch.object(scheduler_mod, "_scheduler", fake):
+        scheduler_mod._add_job(fn, "interval", id="job")
+    registered["job"]()
+
+
 def test_research_fetch_swallows_exceptions():
     with patch("weeklyamp.web.deps.get_repo", side_effect=RuntimeError("boom")):
-        scheduler_mod._research_fetch()  # must not raise
+        _run_registered(scheduler_mod._research_fetch)  # must not raise
 
 
 def test_welcome_queue_noop_when_disabled():
@@ -136,7 +146,7 @@ def test_welcome_queue_noop_when_disabled():
 
 def test_welcome_queue_swallows_exceptions():
     with patch("weeklyamp.web.deps.get_config", side_effect=RuntimeError("boom")):
-        scheduler_mod._welcome_queue()  # must not raise
+        _run_registered(scheduler_mod._welcome_queue)  # must not raise
 
 
 def test_scheduled_sends_noop_when_disabled():
@@ -152,7 +162,7 @@ def test_scheduled_sends_swallows_exceptions():
     fake_cfg = _cfg(scheduler=SimpleNamespace(enabled=True))
     with patch("weeklyamp.web.deps.get_config", return_value=fake_cfg), \
          patch("weeklyamp.web.deps.get_repo", side_effect=RuntimeError("boom")):
-        scheduler_mod._scheduled_sends()  # must not raise
+        _run_registered(scheduler_mod._scheduled_sends)  # must not raise
 
 
 def test_marketing_outreach_noop_when_not_autonomous():
@@ -167,7 +177,7 @@ def test_marketing_outreach_swallows_exceptions():
     fake_cfg = _cfg(agents=SimpleNamespace(default_autonomy="autonomous"))
     with patch("weeklyamp.web.deps.get_config", return_value=fake_cfg), \
          patch("weeklyamp.web.deps.get_repo", side_effect=RuntimeError("boom")):
-        scheduler_mod._marketing_outreach()  # must not raise
+        _run_registered(scheduler_mod._marketing_outreach)  # must not raise
 
 
 def test_billing_dunning_noop_when_disabled():
@@ -180,4 +190,4 @@ def test_billing_dunning_noop_when_disabled():
 
 def test_billing_dunning_swallows_exceptions():
     with patch.object(scheduler_mod, "_load_config", side_effect=RuntimeError("boom"), create=True):
-        scheduler_mod._billing_dunning()  # must not raise
+        _run_registered(scheduler_mod._billing_dunning)  # must not raise
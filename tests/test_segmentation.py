@@ -0,0 +1,116 @@
+"""Tests for set-based engagement segmentation."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from weeklyamp.content.segmentation import SegmentationEngine
+from weeklyamp.core.models import AppConfig
+
+
+def _ago(days: float, iso: bool = False) -> str:
+    dt = datetime.now(timezone.utc) - timedelta(days=days)
+    # Tracking rows are written with isoformat(); subscribed_at with CURRENT_TIMESTAMP.
+    return dt.isoformat() if iso else dt.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _subscriber(conn, email: str, joined_days_ago: float, status: str = "active") -> int:
+    return conn.execute(
+        "INSERT INTO subscribers (email, status, subscribed_at) VALUES (?, ?, ?)",
+        (email, status, _ago(joined_days_ago)),
+    ).lastrowid
+
+
+def _events(conn, sub_id: int, issue_id: int, opens: int, clicks: int, days_ago: float) -> None:
+    rows = [(sub_id, issue_id, "open", _ago(days_ago, iso=True))] * opens
+    rows += [(sub_id, issue_id, "click", _ago(days_ago, iso=True))] * clicks
+    conn.executemany(
+        "INSERT INTO email_tracking_events (subscriber_id, issue_id, event_type, created_at) VALUES (?, ?, ?, ?)",
+        rows,
+    )
+
+
+@pytest.fixture()
+def engine(repo):
+    return SegmentationEngine(repo, AppConfig())
+
+
+@pytest.fixture()
+def subs(repo):
+    issue_id = repo.create_issue(1, "One")
+    conn = repo._conn()
+    ids = {
+        "power": _subscriber(conn, "power@x.com", 100),
+        "casual": _subscriber(conn, "casual@x.com", 100),
+        "at_risk": _subscriber(conn, "risk@x.com", 100),
+        "dormant": _subscriber(conn, "dormant@x.com", 100),
+        "new": _subscriber(conn, "new@x.com", 3),
+        "gone": _subscriber(conn, "gone@x.com", 100, status="unsubscribed"),
+    }
+    _events(conn, ids["power"], issue_id, opens=5, clicks=5, days_ago=2)
+    _events(conn, ids["casual"], issue_id, opens=5, clicks=0, days_ago=10)
+    _events(conn, ids["at_risk"], issue_id, opens=30, clicks=0, days_ago=20)
+    _events(conn, ids["dormant"], issue_id, opens=1, clicks=0, days_ago=60)
+    _events(conn, ids["gone"], issue_id, opens=9, clicks=9, days_ago=1)
+    conn.commit()
+    conn.close()
+    ids["issue"] = issue_id
+    return ids
+
+
+def _members(repo) -> dict[int, tuple[str, int, float]]:
+    """subscriber id -> (segment name, member row id, score)."""
+    conn = repo._conn()
+    rows = conn.execute(
+        """SELECT m.id, m.subscriber_id, m.score, s.name FROM subscriber_segment_members m
+           JOIN subscriber_segments s ON s.id = m.segment_id"""
+    ).fetchall()
+    conn.close()
+    return {r["subscriber_id"]: (r["name"], r["id"], r["score"]) for r in rows}
+
+
+def test_full_run_classifies_from_rollup(engine, repo, subs):
+    result = engine.compute_engagement_segments()
+
+    assert result == {"power_readers": 1, "casual_readers": 1, "at_risk": 1, "dormant": 1, "new_subscribers": 1}
+    members = _members(repo)
+    assert members[subs["power"]][0] == "Power Readers"
+    assert members[subs["power"]][2] == 20.0
+    assert members[subs["casual"]][0] == "Casual Readers"
+    assert members[subs["at_risk"]][0] == "At Risk"
+    assert members[subs["dormant"]][0] == "Dormant"
+    assert members[subs["new"]][0] == "New Subscribers"
+    assert subs["gone"] not in members
+
+    # A repeat run with nothing new rewrites no membership rows.
+    assert engine.compute_engagement_segments() == result
+    assert _members(repo) == members
+
+
+def test_incremental_run_reclassifies_only_changed(engine, repo, subs):
+    engine.compute_engagement_segments()
+    before = _members(repo)
+
+    conn = repo._conn()
+    _events(conn, subs["dormant"], subs["issue"], opens=4, clicks=6, days_ago=0)
+    conn.execute("UPDATE subscribers SET status = 'unsubscribed' WHERE id = ?", (subs["casual"],))
+    late = _subscriber(conn, "late@x.com", 0)
+    conn.commit()
+    conn.close()
+
+    result = engine.compute_engagement_segments(incremental=True)
+
+    after = _members(repo)
+    assert after[subs["dormant"]][0] == "Power Readers"
+    assert after[subs["dormant"]][2] == 23.0  # rollup kept the earlier open
+    assert subs["casual"] not in after
+    assert after[late][0] == "New Subscribers"
+    # Untouched memberships keep their rows.
+    for key in ("power", "at_risk", "new"):
+        assert after[subs[key]] == before[subs[key]]
+    assert result == {"power_readers": 2, "casual_readers": 0, "at_risk": 1, "dormant": 0, "new_subscribers": 2}
+
+    # Incremental and full runs agree.
+    assert engine.compute_engagement_segments() == result
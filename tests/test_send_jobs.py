@@ -0,0 +1,166 @@
+"""Tests for background send jobs: progress, cancellation and dedupe."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from weeklyamp.core.models import AppConfig, EmailConfig
+from weeklyamp.delivery import send_jobs, smtp_sender
+
+_HTML = '<p>Hello</p><a href="{{ unsubscribe_url }}">unsubscribe</a>'
+
+
+@pytest.fixture()
+def config():
+    return AppConfig(email=EmailConfig(
+        enabled=True, smtp_host="smtp.example.com", smtp_user="user", smtp_password="pass",
+        from_address="newsletter@example.com",
+    ))
+
+
+@pytest.fixture()
+def server(monkeypatch):
+    """Mocked SMTP server; batches of two with no pause between them."""
+    monkeypatch.setattr(smtp_sender, "_BATCH_SIZE", 2)
+    monkeypatch.setattr(smtp_sender, "_BATCH_DELAY", 0)
+    server = MagicMock()
+    with patch("weeklyamp.delivery.smtp_sender.smtplib.SMTP", return_value=server):
+        yield server
+
+
+@pytest.fixture()
+def issue(repo):
+    issue_id = repo.create_issue(1, "First")
+    repo.save_assembled(issue_id, _HTML, "plain text " * 30)
+    for n in range(5):
+        repo.upsert_subscriber(f"fan{n}@example.com")
+    return repo.get_issue(issue_id)
+
+
+def _enqueue(repo, issue) -> int:
+    job_id, _ = send_jobs.enqueue_send_job(repo, issue, repo.get_assembled(issue["id"]), "Weekly Amp #1 is here")
+    return job_id
+
+
+def test_job_sends_and_records_metrics(repo, config, server, issue):
+    job_id = _enqueue(repo, issue)
+
+    result = send_jobs.run_send_job(repo, config, job_id)
+
+    assert result["sent"] == 5
+    assert server.send_message.call_count == 5
+    job = repo.get_send_job(job_id)
+    assert (job["state"], job["total"], job["sent"], job["failed"]) == ("done", 5, 5, 0)
+    assert job["finished_at"]
+    assert repo.get_issue(issue["id"])["status"] == "published"
+    assert send_jobs.job_stats(job)["percent"] == 100
+
+
+def test_cancel_stops_after_current_batch(repo, config, server, issue):
+    job_id = _enqueue(repo, issue)
+    server.send_message.side_effect = lambda msg: repo.request_send_job_cancel(job_id)
+
+    result = send_jobs.run_send_job(repo, config, job_id)
+
+    assert result["cancelled"] is True
+    assert server.send_message.call_count == 2
+    job = repo.get_send_job(job_id)
+    assert (job["state"], job["sent"]) == ("cancelled", 2)
+    # A finished job can no longer be cancelled.
+    assert repo.request_send_job_cancel(job_id) is False
+
+
+def test_preflight_blocker_fails_job(repo, config, server):
+    issue_id = repo.create_issue(1)
+    repo.save_assembled(issue_id, "<p>No opt-out link</p>")
+    repo.upsert_subscriber("fan@example.com")
+    job_id = _enqueue(repo, repo.get_issue(issue_id))
+
+    assert send_jobs.run_send_job(repo, config, job_id) is None
+    job = repo.get_send_job(job_id)
+    assert job["state"] == "failed"
+    assert "unsubscribe" in job["error"]
+    server.send_message.assert_not_called()
+
+
+def test_enqueue_reuses_active_job(repo, issue):
+    assembled = repo.get_assembled(issue["id"])
+    first = send_jobs.enqueue_send_job(repo, issue, assembled, "Subject")
+    second = send_jobs.enqueue_send_job(repo, issue, assembled, "Subject")
+
+    assert first == (first[0], True)
+    assert second == (first[0], False)
+
+
+def test_only_one_active_job_per_issue(repo, issue):
+    assembled = repo.get_assembled(issue["id"])
+    first = repo.create_send_job(issue["id"], assembled["id"])
+
+    # A racing publish that skipped the lookup still can't insert a second.
+    assert repo.create_send_job(issue["id"], assembled["id"]) is None
+    repo.finish_send_job(first, "done")
+    assert repo.create_send_job(issue["id"], assembled["id"]) not in (None, first)
+
+
+def test_job_runs_once(repo, config, server, issue):
+    job_id = _enqueue(repo, issue)
+
+    assert repo.claim_send_job(job_id) is True
+    # A second runner for the same job loses the claim and sends nothing.
+    assert send_jobs.run_send_job(repo, config, job_id) is None
+    server.send_message.assert_not_called()
+
+
+def test_cancelling_a_queued_job_finishes_it(repo, config, server, issue):
+    job_id = _enqueue(repo, issue)
+
+    assert repo.request_send_job_cancel(job_id) is True
+    assert repo.get_send_job(job_id)["state"] == "cancelled"
+    assert send_jobs.run_send_job(repo, config, job_id) is None
+    server.send_message.assert_not_called()
+    # The issue can be queued again.
+    assert send_jobs.enqueue_send_job(repo, issue, repo.get_assembled(issue["id"]), "S")[1] is True
+
+
+def test_sweep_finishes_jobs_whose_runner_died(repo, issue):
+    job_id = _enqueue(repo, issue)
+    repo.claim_send_job(job_id)
+    other = repo.create_issue(2)
+    repo.save_assembled(other, _HTML)
+    cancelled_id = _enqueue(repo, repo.get_issue(other))
+    repo.claim_send_job(cancelled_id)
+    repo.request_send_job_cancel(cancelled_id)
+    third = repo.create_issue(3)
+    repo.save_assembled(third, _HTML)
+    queued_id = _enqueue(repo, repo.get_issue(third))
+
+    assert send_jobs.sweep_stale_send_jobs(repo) == 0
+
+    conn = repo._conn()
+    conn.execute("UPDATE send_jobs SET heartbeat_at = '2020-01-01 00:00:00', created_at = '2020-01-01 00:00:00'")
+    conn.commit()
+    conn.close()
+    assert send_jobs.sweep_stale_send_jobs(repo) == 3
+    states = {j: repo.get_send_job(j)["state"] for j in (job_id, cancelled_id, queued_id)}
+    assert states == {job_id: "failed", cancelled_id: "cancelled", queued_id: "failed"}
+    assert "stopped responding" in repo.get_send_job(job_id)["error"]
+
+
+def test_status_and_cancel_routes(client, repo, issue):
+    job_id = _enqueue(repo, issue)
+
+    status = client.get(f"/publish/jobs/{job_id}")
+    assert status.status_code == 200
+    assert f'hx-get="/publish/jobs/{job_id}"' in status.text
+
+    client.get("/publish/")
+    cancelled = client.post(
+        f"/publish/jobs/{job_id}/cancel", headers={"X-CSRF-Token": client.cookies.get("_csrf", "")},
+    )
+    assert cancelled.status_code == 200
+    # Still queued, so it's cancelled outright rather than flagged.
+    assert "Send cancelled" in cancelled.text
+    assert repo.get_send_job(job_id)["state"] == "cancelled"
+    assert "not found" in client.get("/publish/jobs/999").text
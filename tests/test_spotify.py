@@ -0,0 +1,100 @@
+"""Tests for the pooled Spotify client and incremental release scan."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from weeklyamp.content import spotify as sp
+from weeklyamp.core.models import SpotifyConfig
+
+
+def _album(album_id: str, date: str, group: str) -> dict:
+    return {"id": album_id, "name": album_id.upper(), "release_date": date, "album_group": group}
+
+
+# Newest first per include_group, as Spotify returns them.
+CATALOG = {
+    "art1": {
+        "album": [_album("a3", "2024-06-01", "album"), _album("a2", "2023-01-10", "album"),
+                  _album("a1", "2020", "album")],
+        "single": [_album("s2", "2024-05", "single"), _album("s1", "2022-02-02", "single")],
+    },
+    "art2": {"album": [_album("b1", "2021-03-03", "album")], "single": []},
+}
+
+
+@pytest.fixture()
+def api(monkeypatch):
+    calls: list[httpx.Request] = []
+    state = {"throttle": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.url.host == "accounts.spotify.com":
+            return httpx.Response(200, json={"access_token": "tok", "expires_in": 3600})
+        if state["throttle"]:
+            state["throttle"] -= 1
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        parts = request.url.path.split("/")
+        artist = parts[3]
+        if artist == "broken":
+            return httpx.Response(404, json={})
+        groups = request.url.params["include_groups"].split(",")
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params.get("offset", 0))
+        items = [a for g in groups for a in CATALOG[artist][g]]
+        page = items[offset:offset + limit]
+        has_next = offset + limit < len(items)
+        return httpx.Response(200, json={"items": page, "next": "more" if has_next else None})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(sp, "_get_client", lambda: client)
+    monkeypatch.setattr(sp, "_cooldown_until", 0.0)
+    return calls, state
+
+
+def _client(**kw) -> sp.SpotifyClient:
+    return sp.SpotifyClient(SpotifyConfig(enabled=True, client_id="id", client_secret="s", **kw))
+
+
+def test_retry_after_on_429(api):
+    calls, state = api
+    state["throttle"] = 2
+    albums = _client().get_artist_albums("art2")
+    assert [a["id"] for a in albums] == ["b1"]
+    assert sum(1 for c in calls if c.url.host == "api.spotify.com") == 3
+
+
+def test_429_gives_up_after_max_retries(api):
+    _, state = api
+    state["throttle"] = 10
+    with pytest.raises(httpx.HTTPStatusError):
+        _client(max_retries=1).get_artist_albums("art2")
+
+
+def test_albums_since_pages_until_older(api):
+    calls, _ = api
+    albums = _client().get_albums_since("art1", "2024-01-01", page_size=1)
+    assert [a["id"] for a in albums] == ["a3", "s2"]
+    # album group: a3 (fresh, next page), a2 (older → stop); single: s2, s1 (stop).
+    assert sum(1 for c in calls if c.url.host == "api.spotify.com") == 4
+
+
+def test_scan_releases_is_incremental(repo, api):
+    calls, _ = api
+    client = _client(scan_concurrency=4)
+
+    first = sp.scan_releases(client, repo, ["art1", "art2", "broken", "art1"])
+    assert first == {"artists": 3, "synced": 2, "failed": 1, "releases": 6}
+    marks = repo.get_spotify_release_watermarks()
+    assert marks == {"art1": "2024-06-01", "art2": "2021-03-03"}
+    # Scanning never creates nameless artist cache rows.
+    assert repo.search_spotify_cache("") == []
+    assert repo.get_spotify_artist("art1") is None
+
+    calls.clear()
+    second = sp.scan_releases(client, repo, ["art1", "art2"])
+    # Only releases on the watermark date are re-read; nothing older.
+    assert second["releases"] == 2
+    assert repo.get_spotify_release_watermarks() == marks
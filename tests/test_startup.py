@@ -0,0 +1,45 @@
+"""Tests for fingerprinted startup and lazily imported admin routes."""
+
+from __future__ import annotations
+
+from starlette.routing import Mount
+
+from weeklyamp.core import database
+from weeklyamp.core.database import get_startup_state, prepare_database
+from weeklyamp.web.lazy_routes import LazyRouter
+
+
+def test_second_boot_skips_schema_and_seed(tmp_path):
+    db = str(tmp_path / "boot.db")
+
+    assert prepare_database(db, features={"paid_tiers": False}) == {"schema": True, "seed": True}
+    assert set(get_startup_state(db)) == {"schema", "seed"}
+    assert prepare_database(db, features={"paid_tiers": False}) == {"schema": False, "seed": False}
+
+    # New flag defaults (or sources, or seed data) re-seed without re-running the schema.
+    assert prepare_database(db, features={"paid_tiers": True}) == {"schema": False, "seed": True}
+
+
+def test_seed_data_change_and_seed_off(tmp_path, monkeypatch):
+    db = str(tmp_path / "boot.db")
+    assert prepare_database(db, seed=False) == {"schema": True, "seed": False}
+    assert "seed" not in get_startup_state(db)
+
+    prepare_database(db)
+    # Editing a seed list re-seeds without a manual version bump.
+    monkeypatch.setattr(database, "DEFAULT_AGENTS", database.DEFAULT_AGENTS[:-1])
+    assert prepare_database(db) == {"schema": False, "seed": True}
+    assert prepare_database(db, force=True) == {"schema": True, "seed": True}
+
+
+def test_admin_router_imported_on_first_request(client):
+    mount = next(r for r in client.app.routes if isinstance(r, Mount) and r.path == "/admin/calculator")
+    assert isinstance(mount.app, LazyRouter)
+    assert not mount.app.loaded
+
+    resp = client.get("/admin/calculator/")
+
+    assert resp.status_code == 200
+    assert mount.app.loaded
+    assert client.get("/admin/calculator").status_code == 200
+    assert client.get("/admin/calculator/missing").status_code == 404
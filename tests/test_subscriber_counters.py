@@ -0,0 +1,91 @@
+"""Tests for the trigger-maintained subscriber counters and their cache."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from weeklyamp.core import subscriber_counts
+
+
+def _scan_counts(repo) -> tuple[int, dict[str, int]]:
+    conn = repo._conn()
+    total = conn.execute("SELECT COUNT(*) AS c FROM subscribers WHERE status = 'active'").fetchone()["c"]
+    rows = conn.execute(
+        "SELECT ne.slug AS slug, COUNT(s.id) AS c FROM newsletter_editions ne "
+        "LEFT JOIN subscriber_editions se ON se.edition_id = ne.id "
+        "LEFT JOIN subscribers s ON s.id = se.subscriber_id AND s.status = 'active' "
+        "GROUP BY ne.slug"
+    ).fetchall()
+    conn.close()
+    return total, {r["slug"]: r["c"] for r in rows}
+
+
+def _assert_counters_match(repo) -> None:
+    total, by_edition = _scan_counts(repo)
+    assert repo.get_subscriber_count() == total
+    assert repo.get_subscriber_counts_by_edition() == by_edition
+    for slug, count in by_edition.items():
+        assert repo.get_subscriber_count([slug]) == count
+
+
+def test_counters_follow_subscribe_status_and_link_changes(repo):
+    a = repo.subscribe_to_editions("a@example.com", ["fan", "artist"])
+    repo.subscribe_to_editions("b@example.com", ["fan"])
+    repo.upsert_subscriber("c@example.com", status="active")
+    _assert_counters_match(repo)
+    assert repo.get_subscriber_count(["fan"]) == 2
+    assert repo.get_subscriber_count(["fan", "artist"]) == 2
+
+    conn = repo._conn()
+    conn.execute("UPDATE subscribers SET status = 'unsubscribed' WHERE id = ?", (a,))
+    conn.commit()
+    conn.close()
+    _assert_counters_match(repo)
+    assert repo.get_subscriber_count(["artist"]) == 0
+
+    # Re-subscribing flips the status back through the upsert path.
+    repo.subscribe_to_editions("a@example.com", ["industry"])
+    _assert_counters_match(repo)
+
+    conn = repo._conn()
+    conn.execute("DELETE FROM subscriber_editions WHERE subscriber_id = ?", (a,))
+    conn.execute("DELETE FROM subscribers WHERE id = ?", (a,))
+    conn.commit()
+    conn.close()
+    _assert_counters_match(repo)
+
+
+def test_bulk_import_keeps_counters_exact(repo):
+    repo.import_subscribers([(f"u{n}@example.com", "", "fan") for n in range(25)])
+    repo.import_subscribers([(f"u{n}@example.com", "", "artist") for n in range(10)])
+    _assert_counters_match(repo)
+    assert repo.get_subscriber_count() == 25
+
+
+def test_reconcile_repairs_drift(repo):
+    repo.subscribe_to_editions("a@example.com", ["fan"])
+    conn = repo._conn()
+    conn.execute("UPDATE subscriber_counters SET active_count = 99")
+    conn.commit()
+    conn.close()
+
+    assert repo.reconcile_subscriber_counters() > 0
+    _assert_counters_match(repo)
+    assert repo.reconcile_subscriber_counters() == 0
+
+
+def test_cached_count_serves_from_memory_within_ttl(repo, monkeypatch):
+    subscriber_counts.invalidate_cache()
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(subscriber_counts, "time", SimpleNamespace(monotonic=lambda: clock["now"]))
+
+    repo.subscribe_to_editions("a@example.com", ["fan"])
+    assert subscriber_counts.cached_subscriber_count(repo) == 1
+
+    repo.subscribe_to_editions("b@example.com", ["fan"])
+    assert subscriber_counts.cached_subscriber_count(repo) == 1
+    assert subscriber_counts.cached_subscriber_count(repo, "fan") == 2
+
+    clock["now"] += subscriber_counts.DEFAULT_TTL_SECONDS + 1
+    assert subscriber_counts.cached_subscriber_count(repo) == 2
+    subscriber_counts.invalidate_cache()
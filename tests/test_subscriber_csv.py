@@ -0,0 +1,117 @@
+"""Tests for the streaming subscriber CSV export and chunked import."""
+
+from __future__ import annotations
+
+import csv
+import io
+
+from weeklyamp.db.repository import Repository
+from weeklyamp.export.subscriber_csv import (
+    import_subscribers_csv,
+    iter_subscribers_csv,
+    write_subscribers_csv,
+)
+
+
+def _edition_emails(repo: Repository, slug: str) -> set[str]:
+    return {s["email"] for s in repo.get_subscribers_for_edition(slug)}
+
+
+def test_import_chunks_dedupes_and_reports_progress(repo):
+    repo.subscribe_to_editions("old@example.com", ["fan"], first_name="Old")
+    lines = [
+        "Email,First Name,edition\n",
+        "A@example.com,Alice,artist\n",
+        "b@example.com,Bob,\n",
+        "not-an-email,Nope,fan\n",
+        "a@example.com,Again,fan\n",
+        "B@example.com,Bob,fan\n",
+        "old@example.com,,fan\n",
+        "c@example.com,Cat,no-such-edition\n",
+    ]
+    updates: list[dict] = []
+
+    stats = import_subscribers_csv(repo, lines, default_edition="fan", chunk_size=2, progress=updates.append)
+
+    assert stats == {"rows": 7, "imported": 5, "new": 3, "skipped": 1, "duplicates": 1, "errors": 0}
+    assert [u["imported"] for u in updates] == [2, 4, 5]
+    # A second row for the same email adds its edition rather than being dropped.
+    assert _edition_emails(repo, "artist") == {"a@example.com"}
+    assert _edition_emails(repo, "fan") == {"a@example.com", "b@example.com", "old@example.com"}
+    # A blank first name never overwrites the stored one.
+    assert repo.get_subscriber_by_email("old@example.com")["first_name"] == "Old"
+    # Unknown edition still creates the subscriber, like subscribe_to_editions.
+    assert repo.get_subscriber_by_email("c@example.com") is not None
+
+
+def test_import_isolates_failing_rows(repo, monkeypatch):
+    real = Repository.import_subscribers
+
+    def flaky(self, rows, source_channel="csv_import"):
+        if any(email.startswith("boom") for email, _, _ in rows):
+            raise RuntimeError("constraint")
+        return real(self, rows, source_channel)
+
+    monkeypatch.setattr(Repository, "import_subscribers", flaky)
+    lines = ["email\n", "ok1@example.com\n", "boom@example.com\n", "ok2@example.com\n"]
+
+    stats = import_subscribers_csv(repo, lines, chunk_size=10)
+
+    assert stats["imported"] == 2
+    assert stats["errors"] == 1
+
+
+def test_export_streams_in_batches(repo):
+    for n in range(5):
+        repo.subscribe_to_editions(f"user{n}@example.com", ["fan"])
+    repo.upsert_subscriber("gone@example.com", status="inactive")
+
+    chunks = list(iter_subscribers_csv(repo, columns=["email", "status"], batch_size=2))
+
+    assert len(chunks) == 3
+    rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+    assert [r["email"] for r in rows] == [f"user{n}@example.com" for n in range(5)]
+
+    buf = io.StringIO()
+    assert write_subscribers_csv(repo, buf, statuses=("active", "inactive"), batch_size=4) == 6
+    assert "gone@example.com" in buf.getvalue()
+
+
+def test_export_empty_table_writes_header(repo):
+    assert "".join(iter_subscribers_csv(repo, columns=["email", "status"])) == "email,status\r\n"
+
+
+def test_export_route_streams_csv(client):
+    client.post("/subscribe", data={"email": "fan@example.com", "editions": "fan"})
+
+    resp = client.get("/subscribers/export")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert resp.text.splitlines()[0] == "email,status,source_channel,subscribed_at"
+
+
+def test_import_route_runs_in_background_and_reports_status(client):
+    body = "email,first_name\nnew1@example.com,New\nnew2@example.com,\n"
+    client.get("/subscribers/import")
+
+    def _upload(text: str) -> str:
+        resp = client.post(
+            "/subscribers/import",
+            data={"edition_slug": "fan"},
+            files={"csv_file": ("subs.csv", text.encode(), "text/csv")},
+            headers={"X-CSRF-Token": client.cookies.get("_csrf", "")},
+        )
+        assert resp.status_code == 200
+        return resp.text.split("/subscribers/import/status/")[1].split('"')[0]
+
+    job_id = _upload(body)
+    other_job = _upload("email\nnew3@example.com\n")
+
+    # Each import keeps its own status.
+    status = client.get(f"/subscribers/import/status/{job_id}")
+    assert "Imported 2 subscribers (2 new)" in status.text
+    assert "Imported 1 subscribers (1 new)" in client.get(f"/subscribers/import/status/{other_job}").text
+    assert "not found" in client.get("/subscribers/import/status/999999").text
+    # A finished import's row is removed once its result has been shown.
+    assert "not found" in client.get(f"/subscribers/import/status/{job_id}").text
@@ -0,0 +1,83 @@
+"""Tests for per-issue tracked links and the short-id click redirect."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from weeklyamp.core.models import EmailConfig, TrackingConfig
+from weeklyamp.delivery.smtp_sender import SMTPSender
+from weeklyamp.delivery.tracking import SUBSCRIBER_SLOT, TrackingProcessor
+from weeklyamp.web.routes import tracking as tracking_routes
+
+_HTML = (
+    "<html><body>"
+    '<a href="https://band.example.com/tour?ref=nl">Tour</a>'
+    '<a href="https://band.example.com/tour?ref=nl">Tour again</a>'
+    '<a href="mailto:hi@example.com">Mail</a>'
+    '<a href="{{ unsubscribe_url }}">Unsubscribe</a>'
+    "</BODY></html>"
+)
+
+
+@pytest.fixture()
+def issue_id(repo):
+    return repo.create_issue(1, "First")
+
+
+def test_prepare_registers_each_link_once(repo, issue_id):
+    proc = TrackingProcessor(TrackingConfig(open_tracking=True, click_tracking=True), repo)
+
+    html = proc.prepare_issue_html(
+        _HTML, issue_id, "https://site.example.com/",
+        utm={"utm_source": "newsletter", "utm_medium": "email", "utm_campaign": "issue-1"},
+    )
+
+    links = repo.register_issue_links(issue_id, [])
+    assert list(links) == [
+        "https://band.example.com/tour?ref=nl&utm_source=newsletter&utm_medium=email&utm_campaign=issue-1",
+    ]
+    link_id = next(iter(links.values()))
+    assert html.count(f'href="https://site.example.com/t/c/{link_id}/{SUBSCRIBER_SLOT}"') == 2
+    assert 'href="mailto:hi@example.com"' in html
+    assert 'href="{{ unsubscribe_url }}"' in html
+    assert f"/t/open/{issue_id}/{SUBSCRIBER_SLOT}.gif" in html.split("</BODY>")[0]
+
+    # Preparing the issue again keeps the ids links were sent with.
+    assert proc.prepare_issue_html(_HTML, issue_id, "https://site.example.com") == html.replace(
+        "?ref=nl&utm_source=newsletter&utm_medium=email&utm_campaign=issue-1", "?ref=nl",
+    ).replace(f"/t/c/{link_id}/", f"/t/c/{link_id + 1}/")
+
+
+def test_tracking_off_leaves_html_unchanged(repo, issue_id):
+    assert TrackingProcessor(TrackingConfig(), repo).prepare_issue_html(_HTML, issue_id, "https://s") == _HTML
+
+
+def test_send_bulk_fills_subscriber_slot():
+    config = EmailConfig(enabled=True, smtp_host="smtp.example.com", from_address="nl@example.com")
+    server = MagicMock()
+    with patch("weeklyamp.delivery.smtp_sender.smtplib.SMTP", return_value=server):
+        SMTPSender(config).send_bulk(
+            [{"id": 7, "email": "a@example.com"}, {"id": 8, "email": "b@example.com"}],
+            "Subject", f'<a href="https://s/t/c/1/{SUBSCRIBER_SLOT}">x</a> unsubscribe',
+        )
+
+    bodies = [
+        next(p for p in call.args[0].walk() if p.get_content_type() == "text/html").get_payload(decode=True).decode()
+        for call in server.send_message.call_args_list
+    ]
+    assert ["/t/c/1/7" in bodies[0], "/t/c/1/8" in bodies[1]] == [True, True]
+    assert SUBSCRIBER_SLOT not in "".join(bodies)
+
+
+def test_short_link_redirects_and_records_click(client, repo, issue_id, monkeypatch):
+    monkeypatch.setattr(tracking_routes, "_links", {})
+    link_id = repo.register_issue_links(issue_id, ["https://band.example.com/"])["https://band.example.com/"]
+
+    resp = client.get(f"/t/c/{link_id}/42", follow_redirects=False)
+
+    assert resp.status_code == 302
+    assert resp.headers["location"] == "https://band.example.com/"
+    assert tracking_routes._links[link_id] == (issue_id, "https://band.example.com/")
+    assert client.get("/t/c/999/42", follow_redirects=False).headers["location"] == "/"
@@ -0,0 +1,108 @@
+"""Tests for the outbound webhook outbox and dispatcher.
+
+HTTP never leaves the process: the shared delivery client is swapped for
+an ``httpx.MockTransport`` so each test decides how the endpoint answers.
+"""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from weeklyamp.core.models import WebhookConfig
+from weeklyamp.delivery import webhooks as wh_mod
+from weeklyamp.delivery.webhooks import WebhookManager
+
+
+@pytest.fixture()
+def manager(repo):
+    cfg = WebhookConfig(enabled=True, max_retries=2, retry_base_seconds=0)
+    repo.create_webhook("a", "https://a.example.com/hook", event_types="issue.published", secret="s3")
+    repo.create_webhook("b", "https://b.example.com/hook", event_types="*")
+    conn = repo._conn()
+    conn.execute("UPDATE webhooks SET is_active = 1")
+    conn.commit()
+    conn.close()
+    return WebhookManager(repo, cfg)
+
+
+@pytest.fixture()
+def endpoint(monkeypatch):
+    """Route deliveries to a handler; returns the list of requests seen."""
+    seen: list[httpx.Request] = []
+    state = {"status": 200}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(state["status"], text="ok")
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(wh_mod, "_get_client", lambda _n: client)
+    yield seen, state
+    client.close()
+
+
+def test_fire_event_only_queues(manager, endpoint):
+    seen, _ = endpoint
+    queued = manager.fire_event("issue.published", {"issue_id": 1})
+    assert len(queued) == 2
+    assert seen == []
+    assert {r["status"] for r in manager.get_outbox()} == {"pending"}
+
+
+def test_fire_event_respects_event_filter(manager):
+    queued = manager.fire_event("subscriber.created", {"id": 1})
+    assert [q["webhook_id"] for q in queued] == [2]
+
+
+def test_deliver_pending_posts_signed_payloads_and_logs(manager, endpoint, repo):
+    seen, _ = endpoint
+    manager.fire_event("issue.published", {"issue_id": 7})
+
+    summary = manager.deliver_pending()
+
+    assert summary == {"delivered": 2, "retrying": 0, "dead": 0}
+    assert len(seen) == 2
+    signed = next(r for r in seen if r.url.host == "a.example.com")
+    assert json.loads(signed.content) == {"issue_id": 7}
+    assert signed.headers["X-WeeklyAmp-Event"] == "issue.published"
+    assert signed.headers["X-WeeklyAmp-Signature"]
+    assert {r["status"] for r in manager.get_outbox()} == {"delivered"}
+    assert len(repo.get_webhook_log()) == 2
+
+
+def test_claimed_rows_are_not_delivered_twice(manager, endpoint):
+    seen, _ = endpoint
+    manager.fire_event("issue.published", {"issue_id": 1})
+    manager.deliver_pending()
+    assert manager.deliver_pending() == {"delivered": 0, "retrying": 0, "dead": 0}
+    assert len(seen) == 2
+
+
+def test_failures_retry_then_dead_letter(manager, endpoint):
+    seen, state = endpoint
+    state["status"] = 500
+    manager.fire_event("subscriber.created", {"id": 1})
+
+    assert manager.deliver_pending()["retrying"] == 1
+    assert manager.deliver_pending()["retrying"] == 1
+    assert manager.deliver_pending()["dead"] == 1
+    assert manager.deliver_pending() == {"delivered": 0, "retrying": 0, "dead": 0}
+    assert len(seen) == 3
+
+    dead = manager.get_outbox("dead")
+    assert len(dead) == 1
+    assert dead[0]["attempts"] == 3
+    assert "HTTP 500" in dead[0]["last_error"]
+
+    state["status"] = 204
+    assert manager.retry_dead(dead[0]["id"]) is True
+    assert manager.deliver_pending()["delivered"] == 1
+
+
+def test_disabled_manager_is_a_noop(repo, endpoint):
+    mgr = WebhookManager(repo, WebhookConfig(enabled=False))
+    assert mgr.fire_event("issue.published", {}) == []
+    assert mgr.deliver_pending() == {"delivered": 0, "retrying": 0, "dead": 0}